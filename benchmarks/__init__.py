@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Performance benchmarks for pyqa's orchestration hot paths.
+
+Run ``python -m benchmarks --size small --output results.json`` from the
+repository root and pass ``--compare baseline.json`` to flag regressions
+against results recorded on another commit.
+"""
+
+from __future__ import annotations
+
+from .harness import BenchmarkCase, BenchmarkResult, compare_results, load_results, measure, write_results
+from .synthetic import SIZES, SyntheticRepo, SyntheticRepoSpec, generate_repository
+
+__all__ = [
+    "SIZES",
+    "BenchmarkCase",
+    "BenchmarkResult",
+    "SyntheticRepo",
+    "SyntheticRepoSpec",
+    "compare_results",
+    "generate_repository",
+    "load_results",
+    "measure",
+    "write_results",
+]
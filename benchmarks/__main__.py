@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Command-line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from .harness import DEFAULT_REGRESSION_THRESHOLD, compare_results, load_results, measure, write_results
+from .synthetic import SIZES, generate_repository
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    """Return parsed command-line arguments.
+
+    Args:
+        argv: Arguments excluding the program name; ``None`` reads ``sys.argv``.
+
+    Returns:
+        argparse.Namespace: Parsed options.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--size", choices=sorted(SIZES), default="small", help="Synthetic repository size.")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark.")
+    parser.add_argument("--only", action="append", default=[], help="Run benchmarks whose name starts with PREFIX.")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this path.")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative median slowdown reported as a regression (default: %(default)s).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Generate a synthetic repository, run the benchmarks and report results.
+
+    Args:
+        argv: Arguments excluding the program name; ``None`` reads ``sys.argv``.
+
+    Returns:
+        int: ``1`` when a comparison found regressions, otherwise ``0``.
+    """
+
+    from .suites import build_cases
+
+    args = _parse_args(argv)
+    spec = SIZES[args.size]
+    with tempfile.TemporaryDirectory(prefix="pyqa-bench-") as scratch:
+        workdir = Path(scratch)
+        repo = generate_repository(workdir / "repo", spec)
+        cases = [
+            case
+            for case in build_cases(repo, workdir / "work")
+            if not args.only or case.name.startswith(tuple(args.only))
+        ]
+        results = []
+        for case in cases:
+            result = measure(case, rounds=args.rounds)
+            results.append(result)
+            sys.stdout.write(
+                f"{result.name:<24} median {result.median_s * 1000:10.2f} ms  min {result.min_s * 1000:10.2f} ms\n"
+            )
+
+    if args.output is not None:
+        write_results(
+            args.output,
+            results,
+            metadata={"size": args.size, "files": len(repo.files), "issues": len(repo.issues), "rounds": args.rounds},
+        )
+    if args.compare is None:
+        return 0
+    comparisons = compare_results(
+        load_results(args.compare),
+        {result.name: result for result in results},
+        threshold=args.threshold,
+    )
+    for comparison in comparisons:
+        marker = "REGRESSED" if comparison.regressed else "ok"
+        sys.stdout.write(f"{comparison.name:<24} x{comparison.ratio:6.2f}  {marker}\n")
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Timing, persistence and comparison helpers for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+RESULTS_FORMAT_VERSION: Final[int] = 1
+DEFAULT_REGRESSION_THRESHOLD: Final[float] = 0.10
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    """Benchmark whose ``run`` callable is timed once per round.
+
+    Attributes:
+        name: Stable identifier used to compare results across commits.
+        run: Callable receiving the value returned by ``setup``.
+        setup: Optional untimed callable producing fresh input for each round.
+    """
+
+    name: str
+    run: Callable[[object], object]
+    setup: Callable[[], object] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """Timing statistics, in seconds, for one benchmark."""
+
+    name: str
+    rounds: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    max_s: float
+    stdev_s: float
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkComparison:
+    """Median timing of one benchmark relative to a baseline run."""
+
+    name: str
+    baseline_s: float
+    current_s: float
+    ratio: float
+    regressed: bool
+
+
+def measure(case: BenchmarkCase, *, rounds: int, warmup: int = 1) -> BenchmarkResult:
+    """Return timing statistics for ``case``.
+
+    Args:
+        case: Benchmark to time.
+        rounds: Number of timed rounds.
+        warmup: Untimed rounds executed first to populate caches.
+
+    Returns:
+        BenchmarkResult: Statistics over the timed rounds.
+    """
+
+    samples: list[float] = []
+    for index in range(warmup + max(rounds, 1)):
+        argument = case.setup() if case.setup is not None else None
+        start = time.perf_counter()
+        case.run(argument)
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            samples.append(elapsed)
+    return BenchmarkResult(
+        name=case.name,
+        rounds=len(samples),
+        min_s=min(samples),
+        median_s=statistics.median(samples),
+        mean_s=statistics.fmean(samples),
+        max_s=max(samples),
+        stdev_s=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def write_results(path: Path, results: Iterable[BenchmarkResult], *, metadata: Mapping[str, object]) -> None:
+    """Persist ``results`` as JSON for offline comparison.
+
+    Args:
+        path: Destination file.
+        results: Benchmark results to store.
+        metadata: Extra run details (synthetic repository size, etc.).
+    """
+
+    payload = {
+        "version": RESULTS_FORMAT_VERSION,
+        "environment": environment_metadata(),
+        "metadata": dict(metadata),
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, BenchmarkResult]:
+    """Return benchmark results previously written by :func:`write_results`.
+
+    Args:
+        path: Results file.
+
+    Returns:
+        dict[str, BenchmarkResult]: Results keyed by benchmark name.
+
+    Raises:
+        ValueError: If the file was produced by an incompatible format version.
+    """
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark results version {payload.get('version')!r}")
+    return {entry["name"]: BenchmarkResult(**entry) for entry in payload["results"]}
+
+
+def compare_results(
+    baseline: Mapping[str, BenchmarkResult],
+    current: Mapping[str, BenchmarkResult],
+    *,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[BenchmarkComparison]:
+    """Compare median timings of benchmarks present in both runs.
+
+    Args:
+        baseline: Results of the reference run.
+        current: Results of the run under test.
+        threshold: Relative slowdown above which a benchmark counts as regressed.
+
+    Returns:
+        list[BenchmarkComparison]: One entry per shared benchmark, sorted by name.
+    """
+
+    comparisons: list[BenchmarkComparison] = []
+    for name in sorted(baseline.keys() & current.keys()):
+        before = baseline[name].median_s
+        after = current[name].median_s
+        ratio = after / before if before else float("inf")
+        comparisons.append(
+            BenchmarkComparison(
+                name=name,
+                baseline_s=before,
+                current_s=after,
+                ratio=ratio,
+                regressed=ratio > 1 + threshold,
+            ),
+        )
+    return comparisons
+
+
+def environment_metadata() -> dict[str, str]:
+    """Return details identifying where and on which commit results were taken.
+
+    Returns:
+        dict[str, str]: Commit, interpreter, platform and timestamp.
+    """
+
+    return {
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def _git_commit() -> str:
+    """Return the current git commit, or ``"unknown"`` outside a checkout.
+
+    Returns:
+        str: Commit hash of ``HEAD``.
+    """
+
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip() or "unknown"
+
+
+__all__ = [
+    "DEFAULT_REGRESSION_THRESHOLD",
+    "BenchmarkCase",
+    "BenchmarkComparison",
+    "BenchmarkResult",
+    "compare_results",
+    "environment_metadata",
+    "load_results",
+    "measure",
+    "write_results",
+]
@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Benchmarks covering the orchestrator's hot paths on a synthetic repository."""
+
+from __future__ import annotations
+
+import subprocess
+from collections import defaultdict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final
+
+from pyqa.analysis.annotations.engine import AnnotationEngine
+from pyqa.analysis.bootstrap import ANNOTATION_PROVIDER_SERVICE_KEY
+from pyqa.analysis.treesitter import TreeSitterContextResolver
+from pyqa.cache.result_store import CacheRequest, ResultCache
+from pyqa.config import Config
+from pyqa.core.models import Diagnostic, RawDiagnostic, RunResult, ToolOutcome
+from pyqa.core.runtime import ServiceContainer
+from pyqa.diagnostics import build_severity_rules, dedupe_outcomes
+from pyqa.diagnostics.pipeline import DiagnosticPipeline
+from pyqa.discovery import build_default_discovery
+from pyqa.interfaces.diagnostics import DiagnosticPipelineRequest
+from pyqa.orchestration.orchestrator import Orchestrator, OrchestratorOverrides
+from pyqa.parsers.base import JsonParser
+from pyqa.parsers.python import parse_pylint, parse_ruff
+from pyqa.reporting.presenters.emitters import write_json_report, write_pr_summary, write_sarif_report
+from pyqa.tools.base import DeferredCommand, Tool, ToolAction, ToolContext
+from pyqa.tools.registry import ToolRegistry
+
+from .harness import BenchmarkCase
+from .synthetic import SyntheticRepo
+
+FAKE_RUFF: Final[str] = "ruff"
+FAKE_PYLINT: Final[str] = "pylint"
+_PYTHON_SUFFIXES: Final[tuple[str, ...]] = (".py",)
+
+
+def build_cases(repo: SyntheticRepo, workdir: Path) -> list[BenchmarkCase]:
+    """Return every benchmark for ``repo``.
+
+    Args:
+        repo: Generated repository under measurement.
+        workdir: Scratch directory for caches and report files.
+
+    Returns:
+        list[BenchmarkCase]: Benchmarks in execution order.
+    """
+
+    cfg = Config()
+    cfg.execution.cache_enabled = False
+    context = ToolContext(cfg=cfg, root=repo.root, files=repo.python_files)
+    ruff_parser = JsonParser(transform=parse_ruff)
+    pylint_parser = JsonParser(transform=parse_pylint)
+    ruff_lines = (repo.ruff_payload(),)
+    pylint_lines = (repo.pylint_payload(),)
+    raw_ruff = tuple(ruff_parser.parse(ruff_lines, (), context=context))
+    raw_pylint = tuple(pylint_parser.parse(pylint_lines, (), context=context))
+    pipeline = DiagnosticPipeline()
+    severity_rules = build_severity_rules(cfg.severity_rules)
+
+    def _diagnostics(tool: str, raw: Sequence[RawDiagnostic | Diagnostic]) -> list[Diagnostic]:
+        request = DiagnosticPipelineRequest(
+            tool_name=tool,
+            candidates=raw,
+            severity_rules=severity_rules,
+            suppression_patterns=(),
+            project_root=repo.root,
+        )
+        return list(pipeline.run(request))
+
+    ruff_diagnostics = _diagnostics(FAKE_RUFF, raw_ruff)
+    pylint_diagnostics = _diagnostics(FAKE_PYLINT, raw_pylint)
+
+    def _run_result(_: object = None) -> RunResult:
+        return RunResult(
+            root=repo.root,
+            files=list(repo.files),
+            outcomes=[
+                _outcome(FAKE_RUFF, [diag.model_copy() for diag in ruff_diagnostics]),
+                _outcome(FAKE_PYLINT, [diag.model_copy() for diag in pylint_diagnostics]),
+            ],
+        )
+
+    cache_dir = workdir / "result-cache"
+    cache_entries = _cache_entries(repo, ruff_diagnostics)
+    reports_dir = workdir / "reports"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+
+    def _store_cache(_: object) -> None:
+        cache = ResultCache(cache_dir)
+        for request, outcome in cache_entries:
+            cache.store(request, outcome=outcome)
+
+    def _load_cache(_: object) -> None:
+        cache = ResultCache(cache_dir)
+        for request, _outcome_value in cache_entries:
+            cache.load(request)
+
+    def _annotate(result: object) -> None:
+        _annotation_engine().annotate_run(_as_run_result(result))
+
+    def _resolve_context(diagnostics: object) -> None:
+        TreeSitterContextResolver().annotate(_as_diagnostics(diagnostics), root=repo.root)
+
+    def _dedupe(result: object) -> None:
+        dedupe_outcomes(_as_run_result(result), cfg.dedupe, annotation_provider=_annotation_engine())
+
+    def _emit_reports(result: object) -> None:
+        run_result = _as_run_result(result)
+        write_json_report(run_result, reports_dir / "report.json")
+        write_sarif_report(run_result, reports_dir / "report.sarif")
+        write_pr_summary(run_result, reports_dir / "summary.md")
+
+    orchestrator = _stub_orchestrator(repo)
+
+    return [
+        BenchmarkCase("discovery", lambda _: build_default_discovery().run(cfg.file_discovery, repo.root)),
+        BenchmarkCase("parse.ruff_json", lambda _: ruff_parser.parse(ruff_lines, (), context=context)),
+        BenchmarkCase("diagnostic_pipeline", lambda _: _diagnostics(FAKE_RUFF, raw_ruff)),
+        BenchmarkCase("result_cache.store", _store_cache),
+        BenchmarkCase("result_cache.load", _load_cache),
+        BenchmarkCase("dedupe_outcomes", _dedupe, setup=_run_result),
+        BenchmarkCase(
+            "treesitter.context",
+            _resolve_context,
+            setup=lambda: [diag.model_copy() for diag in ruff_diagnostics],
+        ),
+        BenchmarkCase("annotation", _annotate, setup=_run_result),
+        BenchmarkCase("report_emitters", _emit_reports, setup=_run_result),
+        BenchmarkCase("orchestrator.run", lambda _: orchestrator.run(cfg, root=repo.root)),
+    ]
+
+
+def _outcome(tool: str, diagnostics: list[Diagnostic]) -> ToolOutcome:
+    """Return a completed lint outcome for ``tool``.
+
+    Args:
+        tool: Tool name.
+        diagnostics: Diagnostics reported by the tool.
+
+    Returns:
+        ToolOutcome: Outcome with a failing exit status.
+    """
+
+    return ToolOutcome(
+        tool=tool,
+        action="lint",
+        returncode=1,
+        stdout=[],
+        stderr=[],
+        diagnostics=diagnostics,
+    )
+
+
+def _cache_entries(
+    repo: SyntheticRepo,
+    diagnostics: Sequence[Diagnostic],
+) -> list[tuple[CacheRequest, ToolOutcome]]:
+    """Return one cache request per Python file with that file's diagnostics.
+
+    Args:
+        repo: Generated repository.
+        diagnostics: Diagnostics spread across the repository.
+
+    Returns:
+        list[tuple[CacheRequest, ToolOutcome]]: Requests paired with outcomes to store.
+    """
+
+    by_file: dict[str, list[Diagnostic]] = defaultdict(list)
+    for diagnostic in diagnostics:
+        if diagnostic.file:
+            by_file[diagnostic.file].append(diagnostic)
+    entries: list[tuple[CacheRequest, ToolOutcome]] = []
+    for path in repo.python_files:
+        key = path.relative_to(repo.root).as_posix()
+        request = CacheRequest(
+            tool=FAKE_RUFF,
+            action="lint",
+            command=(FAKE_RUFF, "check", key),
+            files=(path,),
+            token="benchmark",
+        )
+        entries.append((request, _outcome(FAKE_RUFF, by_file.get(key, []))))
+    return entries
+
+
+def _stub_orchestrator(repo: SyntheticRepo) -> Orchestrator:
+    """Return an orchestrator whose tools replay the synthetic JSON reports.
+
+    Args:
+        repo: Generated repository.
+
+    Returns:
+        Orchestrator: Orchestrator running fake Ruff and Pylint tools.
+    """
+
+    payloads = {FAKE_RUFF: repo.ruff_payload(), FAKE_PYLINT: repo.pylint_payload()}
+    registry = ToolRegistry()
+    for name, transform in ((FAKE_RUFF, parse_ruff), (FAKE_PYLINT, parse_pylint)):
+        registry.register(
+            Tool(
+                name=name,
+                actions=(
+                    ToolAction(
+                        name="lint",
+                        command=DeferredCommand((name,)),
+                        append_files=False,
+                        parser=JsonParser(transform=transform),
+                    ),
+                ),
+                file_extensions=_PYTHON_SUFFIXES,
+                runtime="binary",
+            ),
+        )
+
+    def _runner(cmd: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(cmd, returncode=1, stdout=payloads[cmd[0]], stderr="")
+
+    services = ServiceContainer()
+    services.register(ANNOTATION_PROVIDER_SERVICE_KEY, lambda _services: _annotation_engine())
+    return Orchestrator(
+        registry=registry,
+        discovery=_StaticDiscovery(repo.files),
+        overrides=OrchestratorOverrides(runner=_runner, services=services),
+    )
+
+
+class _StaticDiscovery:
+    """Discovery strategy returning the generated files."""
+
+    def __init__(self, files: Sequence[Path]) -> None:
+        """Store the files returned by :meth:`run`.
+
+        Args:
+            files: Generated repository files.
+        """
+
+        self._files = list(files)
+
+    def run(self, *_args: object, **_kwargs: object) -> list[Path]:
+        """Return the generated files.
+
+        Args:
+            *_args: Ignored discovery arguments.
+            **_kwargs: Ignored discovery keyword arguments.
+
+        Returns:
+            list[Path]: Generated repository files.
+        """
+
+        return list(self._files)
+
+
+def _annotation_engine() -> AnnotationEngine:
+    """Return an annotation engine that never loads or downloads a spaCy model.
+
+    Returns:
+        AnnotationEngine: Engine backed by a fresh Tree-sitter resolver.
+    """
+
+    return AnnotationEngine(context_resolver=TreeSitterContextResolver(), loader=_without_spacy)
+
+
+def _without_spacy(_model: str) -> None:
+    """Return no spaCy pipeline so timings exclude model loading.
+
+    Args:
+        _model: Requested spaCy model name.
+    """
+
+
+def _as_run_result(value: object) -> RunResult:
+    """Narrow a setup value to :class:`RunResult`.
+
+    Args:
+        value: Value produced by a benchmark ``setup`` callable.
+
+    Returns:
+        RunResult: ``value`` itself.
+
+    Raises:
+        TypeError: If ``value`` is not a run result.
+    """
+
+    if not isinstance(value, RunResult):
+        raise TypeError(f"expected RunResult, got {type(value).__name__}")
+    return value
+
+
+def _as_diagnostics(value: object) -> list[Diagnostic]:
+    """Narrow a setup value to a list of diagnostics.
+
+    Args:
+        value: Value produced by a benchmark ``setup`` callable.
+
+    Returns:
+        list[Diagnostic]: ``value`` itself.
+
+    Raises:
+        TypeError: If ``value`` is not a list of diagnostics.
+    """
+
+    if not isinstance(value, list):
+        raise TypeError(f"expected list of diagnostics, got {type(value).__name__}")
+    return value
+
+
+__all__ = ["FAKE_PYLINT", "FAKE_RUFF", "build_cases"]
@@ -0,0 +1,366 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Deterministic synthetic repositories used by the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+_LINE_LIMIT: Final[int] = 88
+_FUNCTIONS_PER_MODULE: Final[int] = 6
+_STDLIB_MODULES: Final[tuple[str, ...]] = ("os", "re", "sys", "json", "math", "typing", "pathlib", "random")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticRepoSpec:
+    """Describe the shape of a generated repository.
+
+    Attributes:
+        python_files: Number of Python modules to generate.
+        javascript_files: Number of JavaScript files to generate.
+        yaml_files: Number of YAML documents to generate.
+        issues_per_file: Lint issues injected into each Python module.
+        packages: Number of Python packages the modules are spread across.
+        seed: Seed of the pseudo-random generator; equal specs yield equal trees.
+    """
+
+    python_files: int = 200
+    javascript_files: int = 50
+    yaml_files: int = 20
+    issues_per_file: int = 5
+    packages: int = 10
+    seed: int = 0
+
+
+SIZES: Final[Mapping[str, SyntheticRepoSpec]] = MappingProxyType(
+    {
+        "tiny": SyntheticRepoSpec(python_files=8, javascript_files=2, yaml_files=2, issues_per_file=3, packages=2),
+        "small": SyntheticRepoSpec(),
+        "medium": SyntheticRepoSpec(python_files=1_000, javascript_files=250, yaml_files=100, packages=25),
+        "large": SyntheticRepoSpec(
+            python_files=5_000,
+            javascript_files=1_000,
+            yaml_files=400,
+            issues_per_file=8,
+            packages=60,
+        ),
+    },
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticIssue:
+    """Lint issue injected into a generated Python module."""
+
+    path: Path
+    line: int
+    column: int
+    code: str
+    message: str
+    symbol: str
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticRepo:
+    """Generated repository together with the issues it contains."""
+
+    root: Path
+    spec: SyntheticRepoSpec
+    python_files: tuple[Path, ...]
+    javascript_files: tuple[Path, ...]
+    yaml_files: tuple[Path, ...]
+    issues: tuple[SyntheticIssue, ...]
+
+    @property
+    def files(self) -> tuple[Path, ...]:
+        """Return every generated file.
+
+        Returns:
+            tuple[Path, ...]: Python, JavaScript and YAML files.
+        """
+
+        return (*self.python_files, *self.javascript_files, *self.yaml_files)
+
+    def ruff_payload(self) -> str:
+        """Return a Ruff-style JSON report covering every injected issue.
+
+        Returns:
+            str: JSON array as printed by ``ruff check --output-format json``.
+        """
+
+        return json.dumps(
+            [
+                {
+                    "filename": issue.path.relative_to(self.root).as_posix(),
+                    "code": issue.code,
+                    "message": issue.message,
+                    "location": {"row": issue.line, "column": issue.column},
+                }
+                for issue in self.issues
+            ],
+        )
+
+    def pylint_payload(self) -> str:
+        """Return a Pylint-style JSON report overlapping the Ruff findings.
+
+        Returns:
+            str: JSON array as printed by ``pylint --output-format json``.
+        """
+
+        return json.dumps(
+            [
+                {
+                    "type": "warning",
+                    "path": issue.path.relative_to(self.root).as_posix(),
+                    "line": issue.line,
+                    "column": issue.column,
+                    "symbol": issue.symbol,
+                    "message": issue.message,
+                }
+                for issue in self.issues
+            ],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _IssueTemplate:
+    """Source line pattern that triggers a known diagnostic."""
+
+    code: str
+    symbol: str
+    message: str
+    line: str
+
+
+_ISSUE_TEMPLATES: Final[tuple[_IssueTemplate, ...]] = (
+    _IssueTemplate(
+        "F841",
+        "unused-variable",
+        "Local variable `unused_{index}` is assigned to but never used",
+        "    unused_{index} = value * {index}",
+    ),
+    _IssueTemplate(
+        "E501",
+        "line-too-long",
+        "Line too long ({length} > 88)",
+        "    # {filler}",
+    ),
+    _IssueTemplate(
+        "F811",
+        "function-redefined",
+        "Redefinition of unused `helper_{index}`",
+        "    helper_{index} = None",
+    ),
+    _IssueTemplate(
+        "E711",
+        "singleton-comparison",
+        "Comparison to `None` should be `cond is None`",
+        "    flag_{index} = value == None",
+    ),
+)
+
+
+def generate_repository(root: Path, spec: SyntheticRepoSpec) -> SyntheticRepo:
+    """Write a deterministic synthetic repository below ``root``.
+
+    Args:
+        root: Empty or missing directory receiving the generated tree.
+        spec: Shape of the repository.
+
+    Returns:
+        SyntheticRepo: Paths of the generated files and the injected issues.
+    """
+
+    rng = random.Random(spec.seed)
+    root = root.resolve()
+    root.mkdir(parents=True, exist_ok=True)
+    python_files: list[Path] = []
+    issues: list[SyntheticIssue] = []
+    packages = max(spec.packages, 1)
+    for package_index in range(packages):
+        package_dir = root / "src" / f"pkg_{package_index}"
+        package_dir.mkdir(parents=True, exist_ok=True)
+        (package_dir / "__init__.py").write_text('"""Generated package."""\n', encoding="utf-8")
+    for index in range(spec.python_files):
+        path = root / "src" / f"pkg_{index % packages}" / f"module_{index}.py"
+        source, file_issues = _python_module(path, index, spec.issues_per_file, packages, rng)
+        path.write_text(source, encoding="utf-8")
+        python_files.append(path)
+        issues.extend(file_issues)
+    javascript_files = [
+        _write(root / "web" / f"widget_{index}.js", _javascript_module(index, rng))
+        for index in range(spec.javascript_files)
+    ]
+    yaml_files = [
+        _write(root / "config" / f"service_{index}.yaml", _yaml_document(index, rng))
+        for index in range(spec.yaml_files)
+    ]
+    return SyntheticRepo(
+        root=root,
+        spec=spec,
+        python_files=tuple(python_files),
+        javascript_files=tuple(javascript_files),
+        yaml_files=tuple(yaml_files),
+        issues=tuple(issues),
+    )
+
+
+def _write(path: Path, content: str) -> Path:
+    """Write ``content`` to ``path``, creating parent directories.
+
+    Args:
+        path: Destination file.
+        content: Text to write.
+
+    Returns:
+        Path: ``path`` for convenience.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _python_module(
+    path: Path,
+    index: int,
+    issue_count: int,
+    packages: int,
+    rng: random.Random,
+) -> tuple[str, list[SyntheticIssue]]:
+    """Return the source of a generated module and the issues it contains.
+
+    Args:
+        path: Destination of the module (recorded on each issue).
+        index: Module number.
+        issue_count: Issues to inject into function bodies.
+        packages: Number of generated packages, used for cross-package imports.
+        rng: Seeded random generator.
+
+    Returns:
+        tuple[str, list[SyntheticIssue]]: Module source and injected issues.
+    """
+
+    lines = [
+        '"""Generated module used for benchmarking."""',
+        "",
+        "from __future__ import annotations",
+        "",
+        f"import {rng.choice(_STDLIB_MODULES)}",
+    ]
+    if index:
+        lines.append(f"from pkg_{(index - 1) % packages} import module_{index - 1}")
+    lines.append("")
+    slots = sorted(rng.sample(range(_FUNCTIONS_PER_MODULE * 4), min(issue_count, _FUNCTIONS_PER_MODULE * 4)))
+    issues: list[SyntheticIssue] = []
+    for function in range(_FUNCTIONS_PER_MODULE):
+        lines.extend(
+            ("", f"def function_{function}(value: int) -> int:", f'    """Return a value derived from {function}."""')
+        )
+        for statement in range(4):
+            slot = function * 4 + statement
+            if slots and slots[0] == slot:
+                slots.pop(0)
+                template = _ISSUE_TEMPLATES[rng.randrange(len(_ISSUE_TEMPLATES))]
+                text = _render_issue_line(template, slot)
+                lines.append(text)
+                issues.append(
+                    SyntheticIssue(
+                        path=path,
+                        line=len(lines),
+                        column=5,
+                        code=template.code,
+                        message=template.message.format(index=slot, length=len(text)),
+                        symbol=template.symbol,
+                    ),
+                )
+            else:
+                lines.append(f"    value = value + {rng.randint(1, 99)}")
+        lines.append("    return value")
+    lines.extend(
+        (
+            "",
+            "",
+            f"class Service{index}:",
+            '    """Generated service class."""',
+            "",
+            "    def run(self, value: int) -> int:",
+            '        """Return the doubled value."""',
+            "        return function_0(value) * 2",
+            "",
+        ),
+    )
+    return "\n".join(lines), issues
+
+
+def _render_issue_line(template: _IssueTemplate, slot: int) -> str:
+    """Return the offending source line for ``template``.
+
+    Args:
+        template: Issue template to render.
+        slot: Statement slot used to name generated symbols.
+
+    Returns:
+        str: Source line triggering the template's diagnostic.
+    """
+
+    filler = "x" * (_LINE_LIMIT + slot % 20)
+    return template.line.format(index=slot, filler=filler)
+
+
+def _javascript_module(index: int, rng: random.Random) -> str:
+    """Return a small JavaScript module.
+
+    Args:
+        index: File number.
+        rng: Seeded random generator.
+
+    Returns:
+        str: JavaScript source.
+    """
+
+    constant = rng.randint(1, 1_000)
+    return (
+        f"var unused{index} = {constant};\n"
+        f"function widget{index}(value) {{\n"
+        f"  if (value == {constant}) {{ return value; }}\n"
+        "  return value * 2;\n"
+        "}\n"
+        f"module.exports = widget{index};\n"
+    )
+
+
+def _yaml_document(index: int, rng: random.Random) -> str:
+    """Return a small YAML document.
+
+    Args:
+        index: File number.
+        rng: Seeded random generator.
+
+    Returns:
+        str: YAML source.
+    """
+
+    return (
+        f"name: service-{index}\n"
+        f"replicas: {rng.randint(1, 5)}\n"
+        "ports:\n"
+        f"  - {8000 + index}\n"
+        "env:\n"
+        f"  LEVEL: {rng.choice(('debug', 'info', 'warning'))}\n"
+    )
+
+
+__all__ = [
+    "SIZES",
+    "SyntheticIssue",
+    "SyntheticRepo",
+    "SyntheticRepoSpec",
+    "generate_repository",
+]
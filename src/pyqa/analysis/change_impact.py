@@ -7,11 +7,16 @@ from __future__ import annotations
 import re
 import subprocess
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Final
 
 from ..core.models import Diagnostic, RunResult
+from ..discovery.git import GitDiscovery
 from ..interfaces.analysis import ContextResolver
+from ..interfaces.discovery import FileDiscoveryConfig
 from .services import resolve_context_resolver
 from .warnings import record_tool_warning
 
@@ -21,10 +26,147 @@ _NEAR_CHANGE_RADIUS: Final[int] = 3
 _DEV_NULL_SENTINEL: Final[str] = "/dev/null"
 
 
+@dataclass(frozen=True, slots=True)
+class ChangeScope:
+    """Describe the files and line ranges touched by a Git diff.
+
+    Attributes:
+        root: Repository root the diff paths are relative to.
+        lines: Changed line numbers keyed by POSIX paths relative to ``root``.
+        whole_files: Relative paths that are new to the working tree and
+            therefore considered changed in their entirety.
+    """
+
+    root: Path
+    lines: Mapping[str, frozenset[int]] = field(default_factory=dict)
+    whole_files: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_changes(
+        cls,
+        root: Path,
+        changes: Mapping[str, Iterable[int]],
+        *,
+        whole_files: Iterable[str] = (),
+    ) -> ChangeScope:
+        """Return a scope built from raw changed-line mappings.
+
+        Args:
+            root: Repository root the change keys are relative to.
+            changes: Changed line numbers keyed by relative path.
+            whole_files: Relative paths considered changed in full.
+
+        Returns:
+            ChangeScope: Immutable scope describing ``changes``.
+        """
+
+        frozen = {path: frozenset(values) for path, values in changes.items()}
+        return cls(
+            root=root,
+            lines=MappingProxyType(frozen),
+            whole_files=frozenset(whole_files) - frozen.keys(),
+        )
+
+    def relative_key(self, path: Path | str) -> str | None:
+        """Return the diff key for ``path`` or ``None`` when outside the root.
+
+        Args:
+            path: Absolute or root-relative path to normalise.
+
+        Returns:
+            str | None: POSIX path relative to :attr:`root` when resolvable.
+        """
+
+        candidate = Path(path)
+        if not candidate.is_absolute():
+            return candidate.as_posix()
+        try:
+            return candidate.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return None
+
+    def paths(self) -> tuple[Path, ...]:
+        """Return absolute paths for every file touched by the diff.
+
+        Returns:
+            tuple[Path, ...]: Sorted absolute paths covered by the scope.
+        """
+
+        keys = sorted(set(self.lines) | self.whole_files)
+        return tuple((self.root / key).resolve() for key in keys)
+
+    def contains(self, path: Path | str) -> bool:
+        """Return whether ``path`` was touched by the diff.
+
+        Args:
+            path: Absolute or root-relative path to check.
+
+        Returns:
+            bool: ``True`` when the file appears in the diff.
+        """
+
+        key = self.relative_key(path)
+        return key is not None and (key in self.lines or key in self.whole_files)
+
+    def as_changes(self) -> dict[str, set[int]]:
+        """Return a mutable mapping compatible with :func:`apply_change_impact`.
+
+        Returns:
+            dict[str, set[int]]: Changed line numbers keyed by relative path.
+        """
+
+        return {path: set(values) for path, values in self.lines.items() if values}
+
+
+def build_change_scope(config: FileDiscoveryConfig, root: Path) -> ChangeScope:
+    """Return the change scope implied by the discovery configuration.
+
+    The diff reference is resolved exactly as :class:`GitDiscovery` resolves
+    it, so the scope always agrees with the files discovery selected.
+
+    Args:
+        config: Discovery configuration describing the diff baseline.
+        root: Repository root used for Git execution.
+
+    Returns:
+        ChangeScope: Files and line numbers touched relative to the baseline.
+    """
+
+    discovery = GitDiscovery()
+    if config.pre_commit:
+        diff_args: tuple[str, ...] = ("--cached",)
+    else:
+        diff_ref = discovery.resolve_diff_ref(config, root)
+        diff_args = (diff_ref,) if diff_ref else ()
+    changes = _collect_changed_lines(root, diff_args=diff_args)
+    untracked: list[str] = []
+    if config.include_untracked:
+        untracked = [_posix_key(path, root) for path in discovery.discover_untracked(root)]
+    return ChangeScope.from_changes(root, changes, whole_files=untracked)
+
+
+def _posix_key(path: Path, root: Path) -> str:
+    """Return ``path`` relative to ``root`` using POSIX separators.
+
+    Args:
+        path: Absolute path reported by Git discovery.
+        root: Repository root used as the anchor.
+
+    Returns:
+        str: Relative POSIX path, or the absolute path when outside ``root``.
+    """
+
+    try:
+        return path.relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
 def apply_change_impact(
     result: RunResult,
     *,
     context_resolver: ContextResolver | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Add impact metadata to diagnostics inside ``result``.
 
@@ -33,8 +175,10 @@ def apply_change_impact(
         context_resolver: Optional context resolver used to identify affected
             functions from the diff. When omitted, the registered service
             implementation is resolved.
+        scope: Optional pre-computed change scope; avoids a second ``git diff``
+            when incremental discovery already collected the changed lines.
     """
-    changes = _collect_changed_lines(result.root)
+    changes = scope.as_changes() if scope is not None else _collect_changed_lines(result.root)
     if not changes:
         return
 
@@ -94,11 +238,13 @@ def _classify_impact(
     return "stale"
 
 
-def _collect_changed_lines(root: Path) -> dict[str, set[int]]:
+def _collect_changed_lines(root: Path, *, diff_args: tuple[str, ...] = ()) -> dict[str, set[int]]:
     """Return a mapping of files to changed line numbers from Git diff output.
 
     Args:
         root: Repository root directory used for diff execution.
+        diff_args: Additional ``git diff`` arguments such as a base reference
+            or ``--cached``.
 
     Returns:
         dict[str, set[int]]: Changed line numbers keyed by file path.
@@ -106,7 +252,7 @@ def _collect_changed_lines(root: Path) -> dict[str, set[int]]:
 
     try:
         completed = subprocess.run(
-            ["git", "diff", "--unified=0", "--no-color"],
+            ["git", "diff", "--unified=0", "--no-color", *diff_args, "--"],
             cwd=root,
             check=False,
             capture_output=True,
@@ -135,9 +281,13 @@ def _collect_changed_lines(root: Path) -> dict[str, set[int]]:
         if hunk and file_path:
             start = int(hunk.group(1)) if hunk.group(1) else 0
             length = int(hunk.group(2)) if hunk.group(2) else 1
-            for offset in range(max(length, 1)):
+            if length == 0:
+                # Pure deletions are reported against the preceding line.
+                lines[file_path].add(max(start, 1))
+                continue
+            for offset in range(length):
                 lines[file_path].add(start + offset)
     return {path: data for path, data in lines.items() if data}
 
 
-__all__ = ["apply_change_impact"]
+__all__ = ["ChangeScope", "apply_change_impact", "build_change_scope"]
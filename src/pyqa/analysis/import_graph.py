@@ -0,0 +1,365 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Reverse-dependency import graph used to expand change sets to their importers."""
+
+from __future__ import annotations
+
+import ast
+import json
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+IMPORT_GRAPH_FILE: Final[str] = "import-graph.json"
+PYTHON_SUFFIXES: Final[frozenset[str]] = frozenset({".py", ".pyi"})
+_GRAPH_FORMAT_VERSION: Final[int] = 1
+_INIT_STEM: Final[str] = "__init__"
+_RELATIVE_PREFIX: Final[str] = "."
+_WILDCARD: Final[str] = "*"
+_EMPTY: Final[frozenset[Path]] = frozenset()
+
+
+@dataclass(frozen=True, slots=True)
+class FileImports:
+    """Import statements recorded for one file, keyed by its stat signature.
+
+    Attributes:
+        mtime_ns: Modification time observed when the file was parsed.
+        size: File size observed when the file was parsed.
+        imports: Imported module specs; relative specs keep their leading dots.
+    """
+
+    mtime_ns: int
+    size: int
+    imports: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportGraph:
+    """Map each project file to the files that import it directly."""
+
+    root: Path
+    importers: Mapping[Path, frozenset[Path]]
+
+    def direct_importers(self, path: Path) -> frozenset[Path]:
+        """Return files importing ``path`` directly.
+
+        Args:
+            path: Resolved file path.
+
+        Returns:
+            frozenset[Path]: Files with an import statement resolving to ``path``.
+        """
+
+        return self.importers.get(path, _EMPTY)
+
+    def dependents(self, paths: Iterable[Path]) -> tuple[Path, ...]:
+        """Return files that transitively import any of ``paths``.
+
+        Args:
+            paths: Resolved files whose importers are requested.
+
+        Returns:
+            tuple[Path, ...]: Sorted importers, excluding ``paths`` themselves.
+        """
+
+        seeds = set(paths)
+        seen: set[Path] = set(seeds)
+        queue = deque(seeds)
+        while queue:
+            for importer in self.importers.get(queue.popleft(), _EMPTY):
+                if importer not in seen:
+                    seen.add(importer)
+                    queue.append(importer)
+        return tuple(sorted(seen - seeds))
+
+
+def build_import_graph(
+    root: Path,
+    files: Iterable[Path],
+    *,
+    cache_dir: Path | None = None,
+    removed: Iterable[Path] = (),
+) -> ImportGraph:
+    """Return the import graph of the Python files among ``files``.
+
+    Only files whose size or modification time changed since the previous
+    build are re-parsed; the per-file import lists are persisted in
+    ``cache_dir`` when provided.
+
+    Args:
+        root: Resolved project root.
+        files: Resolved project files; non-Python files are ignored.
+        cache_dir: Optional directory holding the persisted graph.
+        removed: Resolved Python files deleted from the working tree. They
+            have no imports of their own but remain import targets, so files
+            still importing them show up as their importers.
+
+    Returns:
+        ImportGraph: Reverse-dependency graph of the project.
+    """
+
+    python_files = sorted({path for path in files if path.suffix in PYTHON_SUFFIXES})
+    previous = load_file_imports(cache_dir) if cache_dir is not None else {}
+    records: dict[str, FileImports] = {}
+    for path in python_files:
+        key = _relative_key(path, root)
+        record = _refresh_record(path, previous.get(key))
+        if record is not None:
+            records[key] = record
+    if cache_dir is not None and records != previous:
+        save_file_imports(cache_dir, records)
+    removed_keys = {_relative_key(path, root) for path in removed if path.suffix in PYTHON_SUFFIXES}
+    return _link(root, records, removed_keys - records.keys())
+
+
+def expand_with_dependents(
+    changed: Sequence[Path],
+    files: Iterable[Path],
+    root: Path,
+    *,
+    cache_dir: Path | None = None,
+    removed: Sequence[Path] = (),
+) -> list[Path]:
+    """Return ``changed`` extended with every project file that transitively imports it.
+
+    Args:
+        changed: Resolved files reported as changed.
+        files: Every resolved project file the graph should cover.
+        root: Resolved project root.
+        cache_dir: Optional directory holding the persisted graph.
+        removed: Resolved files the diff deleted or renamed away. Their
+            importers are added so broken imports get re-checked; the removed
+            paths themselves are never returned.
+
+    Returns:
+        list[Path]: Sorted union of ``changed`` and their dependents.
+    """
+
+    seeds = [*changed, *removed]
+    if not any(path.suffix in PYTHON_SUFFIXES for path in seeds):
+        return sorted(set(changed))
+    graph = build_import_graph(root, files, cache_dir=cache_dir, removed=removed)
+    return sorted({*changed, *graph.dependents(seeds)} - set(removed))
+
+
+def load_file_imports(cache_dir: Path) -> dict[str, FileImports]:
+    """Use this helper to read the persisted per-file import lists.
+
+    Args:
+        cache_dir: Directory that may contain the persisted graph.
+
+    Returns:
+        dict[str, FileImports]: Records keyed by root-relative POSIX path.
+    """
+
+    try:
+        data = json.loads((cache_dir / IMPORT_GRAPH_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _GRAPH_FORMAT_VERSION:
+        return {}
+    entries = data.get("files")
+    if not isinstance(entries, dict):
+        return {}
+    records: dict[str, FileImports] = {}
+    for key, entry in entries.items():
+        if not isinstance(entry, list) or len(entry) != 3:
+            continue
+        mtime_ns, size, imports = entry
+        if isinstance(mtime_ns, int) and isinstance(size, int) and isinstance(imports, list):
+            records[str(key)] = FileImports(mtime_ns=mtime_ns, size=size, imports=tuple(map(str, imports)))
+    return records
+
+
+def save_file_imports(cache_dir: Path, records: Mapping[str, FileImports]) -> None:
+    """Use this helper to persist per-file import lists into ``cache_dir``.
+
+    Args:
+        cache_dir: Directory receiving the persisted graph.
+        records: Records keyed by root-relative POSIX path.
+    """
+
+    payload = {
+        "version": _GRAPH_FORMAT_VERSION,
+        "files": {key: [record.mtime_ns, record.size, list(record.imports)] for key, record in records.items()},
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / IMPORT_GRAPH_FILE).write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        return
+
+
+def _relative_key(path: Path, root: Path) -> str:
+    """Return the persisted key for ``path``.
+
+    Args:
+        path: Resolved file path.
+        root: Resolved project root.
+
+    Returns:
+        str: POSIX path relative to ``root`` (absolute when outside it).
+    """
+
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _refresh_record(path: Path, cached: FileImports | None) -> FileImports | None:
+    """Return the import record for ``path``, re-parsing only when it changed.
+
+    Args:
+        path: Resolved Python file.
+        cached: Record persisted by a previous build, if any.
+
+    Returns:
+        FileImports | None: Current record, or ``None`` when the file vanished.
+    """
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+        return cached
+    try:
+        source = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    return FileImports(mtime_ns=stat.st_mtime_ns, size=stat.st_size, imports=_collect_imports(source))
+
+
+def _collect_imports(source: str) -> tuple[str, ...]:
+    """Return the module specs imported anywhere in ``source``.
+
+    Args:
+        source: Python source text.
+
+    Returns:
+        tuple[str, ...]: Sorted specs; ``from pkg import name`` records both
+        ``pkg`` and ``pkg.name`` because ``name`` may be a submodule.
+    """
+
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return ()
+    specs: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            specs.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = _RELATIVE_PREFIX * node.level + (node.module or "")
+            if node.module:
+                specs.add(base)
+            separator = "." if node.module else ""
+            specs.update(f"{base}{separator}{alias.name}" for alias in node.names if alias.name != _WILDCARD)
+    return tuple(sorted(specs))
+
+
+def _module_variants(key: str) -> tuple[tuple[tuple[str, ...], bool], ...]:
+    """Return the dotted-name parts ``key`` is importable as.
+
+    Files are importable relative to the project root and relative to their
+    top-level directory (covering ``src`` layouts).
+
+    Args:
+        key: Root-relative POSIX path of a Python file.
+
+    Returns:
+        tuple[tuple[tuple[str, ...], bool], ...]: Module parts paired with a
+        flag indicating whether the file is a package ``__init__``.
+    """
+
+    parts = tuple(Path(key).with_suffix("").parts)
+    is_package = bool(parts) and parts[-1] == _INIT_STEM
+    if is_package:
+        parts = parts[:-1]
+    variants = [(parts, is_package)]
+    if len(parts) > 1:
+        variants.append((parts[1:], is_package))
+    return tuple((variant, package) for variant, package in variants if variant)
+
+
+def _resolve_spec(spec: str, packages: Iterable[tuple[str, ...]]) -> set[str]:
+    """Return absolute module names ``spec`` may refer to.
+
+    Args:
+        spec: Imported module spec, possibly relative.
+        packages: Candidate packages of the importing file.
+
+    Returns:
+        set[str]: Absolute dotted module names.
+    """
+
+    stripped = spec.lstrip(_RELATIVE_PREFIX)
+    level = len(spec) - len(stripped)
+    suffix = tuple(stripped.split(".")) if stripped else ()
+    if level == 0:
+        return {spec}
+    resolved: set[str] = set()
+    for package in packages:
+        if level - 1 > len(package):
+            continue
+        target = (*package[: len(package) - (level - 1)], *suffix)
+        if target:
+            resolved.add(".".join(target))
+    return resolved
+
+
+def _link(root: Path, records: Mapping[str, FileImports], removed: Iterable[str] = ()) -> ImportGraph:
+    """Return the reverse-dependency graph for ``records``.
+
+    Args:
+        root: Resolved project root.
+        records: Import records keyed by root-relative POSIX path.
+        removed: Root-relative keys of deleted files kept as import targets.
+
+    Returns:
+        ImportGraph: Graph mapping imported files to their importers.
+    """
+
+    modules: dict[str, set[Path]] = defaultdict(set)
+    for key in removed:
+        for parts, _is_package in _module_variants(key):
+            modules[".".join(parts)].add(root / key)
+    packages_by_key: dict[str, list[tuple[str, ...]]] = {}
+    for key in records:
+        path = root / key
+        packages: list[tuple[str, ...]] = []
+        for parts, is_package in _module_variants(key):
+            modules[".".join(parts)].add(path)
+            packages.append(parts if is_package else parts[:-1])
+        packages_by_key[key] = packages
+
+    importers: dict[Path, set[Path]] = defaultdict(set)
+    for key, record in records.items():
+        importer = root / key
+        for spec in record.imports:
+            for name in _resolve_spec(spec, packages_by_key[key]):
+                segments = name.split(".")
+                for depth in range(1, len(segments) + 1):
+                    for target in modules.get(".".join(segments[:depth]), ()):
+                        if target != importer:
+                            importers[target].add(importer)
+    return ImportGraph(
+        root=root,
+        importers=MappingProxyType({target: frozenset(sources) for target, sources in importers.items()}),
+    )
+
+
+__all__ = [
+    "IMPORT_GRAPH_FILE",
+    "FileImports",
+    "ImportGraph",
+    "build_import_graph",
+    "expand_with_dependents",
+    "load_file_imports",
+    "save_file_imports",
+]
@@ -9,13 +9,15 @@ import os
 from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
-from typing import Final, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
-from ..interfaces.cache import CacheProvider
-from ..interfaces.serialization import SerializableValue
 from .in_memory import memoize, ttl_cache
-from .providers import DirectoryCacheProvider, InMemoryCacheProvider
+
+if TYPE_CHECKING:  # pragma: no cover - import-time assistance only
+    from ..interfaces.cache import CacheProvider
+    from ..interfaces.serialization import SerializableValue
 
 ProviderKind = Literal["memory", "directory"]
 _PROVIDER_ENV_VAR: Final[str] = "PYQA_CACHE_PROVIDER"
@@ -115,12 +117,15 @@ def create_cache_provider(settings: CacheProviderSettings | None = None) -> Cach
     """
 
     resolved = resolve_cache_provider_settings(settings)
+    # Providers pull in the result models; importing them on first use keeps
+    # lightweight consumers of ``pyqa.cache.in_memory`` cheap to import.
+    providers = import_module("pyqa.cache.providers")
     if resolved.kind == _MEMORY_KIND:
-        return InMemoryCacheProvider()
+        return providers.InMemoryCacheProvider()
 
     if resolved.directory is None:
         raise ValueError("CacheProviderSettings.directory must be set for directory-backed providers")
-    provider = DirectoryCacheProvider(resolved.directory)
+    provider = providers.DirectoryCacheProvider(resolved.directory)
     return provider
 
 
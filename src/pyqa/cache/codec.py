@@ -0,0 +1,492 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Versioned binary codec for cached tool outcomes and parser candidates.
+
+An encoded entry is a fixed preamble followed by two ``marshal`` sections:
+
+* the *header* holds the owning tool plus the file states and file metrics
+  used to validate and annotate a cache hit;
+* the *body* holds the outcome or parser candidates in a columnar layout in
+  which every string (paths, tools, codes, messages) is interned once.
+
+:func:`decode_entry` only unmarshals the header. The body is hydrated when
+:meth:`EncodedEntry.outcome` or :meth:`EncodedEntry.candidates` is called, so
+stale entries are rejected without touching their diagnostics, and hydrated
+diagnostics are hydrated without re-validation because they were validated
+before they were stored.
+
+``marshal`` is not safe against maliciously crafted input, so the codec is
+only used for the local cache directory; the remote tier keeps its JSON format.
+"""
+
+from __future__ import annotations
+
+import marshal  # nosec B302 suppression_valid: Decodes only entries written by this process' own cache directory.
+import struct
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Final, cast
+
+from ..core.metrics import FileMetrics
+from ..core.models import Diagnostic, RawDiagnostic, ToolExitCategory, ToolOutcome
+from ..core.severity import Severity
+from ..interfaces.core import JsonValue
+from ..interfaces.metrics import FileMetricsProtocol
+
+CODEC_MAGIC: Final[bytes] = b"PQAC"
+CODEC_VERSION: Final[int] = 2
+_PREAMBLE: Final[struct.Struct] = struct.Struct("<4sBBI")
+_NONE_INDEX: Final[int] = -1
+_KIND_OUTCOME: Final[int] = 1
+_KIND_CANDIDATES: Final[int] = 2
+_CANDIDATE_RAW: Final[int] = 0
+_CANDIDATE_DIAGNOSTIC: Final[int] = 1
+
+type FileStateRecord = tuple[str, int, int]
+type DiagnosticCandidate = RawDiagnostic | Diagnostic
+type _Column = tuple[int | None | tuple[int, ...] | dict[str, JsonValue], ...]
+type _Columns = tuple[_Column, ...]
+type _OutcomeBody = tuple[int, str, str, int, tuple[str, ...], tuple[str, ...], bool, str, tuple[str, ...], _Columns]
+type _CandidateBody = tuple[int, tuple[str, ...], tuple[int, ...], _Columns, _Columns]
+
+_DIAGNOSTIC_FIELDS: Final[tuple[str, ...]] = (
+    "file",
+    "line",
+    "column",
+    "severity",
+    "message",
+    "tool",
+    "code",
+    "group",
+    "function",
+    "hints",
+    "tags",
+    "meta",
+)
+_RAW_FIELDS: Final[tuple[str, ...]] = (
+    "file",
+    "line",
+    "column",
+    "severity",
+    "message",
+    "code",
+    "tool",
+    "group",
+    "function",
+)
+
+
+class CodecError(ValueError):
+    """Raised when a payload was not written by this codec version."""
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedEntry:
+    """Decoded cache entry header with a lazily hydrated body.
+
+    Attributes:
+        tool: Tool (or parser cache namespace) that owns the entry.
+        files: ``(path, mtime_ns, size)`` records of the files the entry covers.
+        file_metrics: Metrics recorded for those files keyed by normalised path.
+        body: Marshalled columnar body.
+    """
+
+    tool: str
+    files: tuple[FileStateRecord, ...]
+    file_metrics: Mapping[str, FileMetrics]
+    body: bytes
+
+    def outcome(self) -> ToolOutcome:
+        """Hydrate and return the cached tool outcome.
+
+        Returns:
+            ToolOutcome: Outcome reconstructed from the body.
+
+        Raises:
+            CodecError: If the body does not hold an outcome.
+        """
+
+        body = cast(_OutcomeBody, _load_body(self.body, _KIND_OUTCOME))
+        try:
+            _, tool, action, returncode, stdout, stderr, cached, exit_category, strings, columns = body
+            diagnostics = _diagnostics_from_columns((*strings, None), columns)
+            category = ToolExitCategory(exit_category)
+        except (TypeError, ValueError, IndexError, KeyError) as exc:
+            raise CodecError("malformed outcome body") from exc
+        return ToolOutcome.model_construct(
+            tool=tool,
+            action=action,
+            returncode=returncode,
+            stdout=list(stdout),
+            stderr=list(stderr),
+            diagnostics=diagnostics,
+            cached=cached,
+            exit_category=category,
+        )
+
+    def candidates(self) -> tuple[DiagnosticCandidate, ...]:
+        """Hydrate and return cached parser candidates.
+
+        Returns:
+            tuple[DiagnosticCandidate, ...]: Raw and structured diagnostics in parser order.
+
+        Raises:
+            CodecError: If the body does not hold parser candidates.
+        """
+
+        body = cast(_CandidateBody, _load_body(self.body, _KIND_CANDIDATES))
+        try:
+            _, strings, kinds, raw_columns, diagnostic_columns = body
+            table = (*strings, None)
+            raw_items = iter(_raw_from_columns(table, raw_columns))
+            diagnostic_items = iter(_diagnostics_from_columns(table, diagnostic_columns))
+            return tuple(next(raw_items) if kind == _CANDIDATE_RAW else next(diagnostic_items) for kind in kinds)
+        except (TypeError, ValueError, IndexError, KeyError, StopIteration) as exc:
+            raise CodecError("malformed candidate body") from exc
+
+
+class _StringTable:
+    """Intern strings into a shared table addressed by integer indices."""
+
+    __slots__ = ("_indices", "strings")
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+
+        self.strings: list[str] = []
+        self._indices: dict[str, int] = {}
+
+    def index(self, value: str | None) -> int:
+        """Return the table index of ``value``, adding it when new.
+
+        Args:
+            value: String to intern, or ``None``.
+
+        Returns:
+            int: Table index, or ``-1`` for ``None``.
+        """
+
+        if value is None:
+            return _NONE_INDEX
+        found = self._indices.get(value)
+        if found is None:
+            found = len(self.strings)
+            self._indices[value] = found
+            self.strings.append(value)
+        return found
+
+
+def encode_outcome_entry(
+    outcome: ToolOutcome,
+    *,
+    files: Sequence[FileStateRecord],
+    file_metrics: Mapping[str, FileMetricsProtocol] | None = None,
+    tool: str | None = None,
+) -> bytes:
+    """Return the binary cache entry for ``outcome``.
+
+    Args:
+        outcome: Outcome to persist.
+        files: ``(path, mtime_ns, size)`` records validating the entry.
+        file_metrics: Optional metrics keyed by normalised path.
+        tool: Owner recorded in the header; defaults to ``outcome.tool``.
+
+    Returns:
+        bytes: Encoded entry.
+    """
+
+    table = _StringTable()
+    columns = _diagnostic_columns(outcome.diagnostics, table)
+    body: _OutcomeBody = (
+        _KIND_OUTCOME,
+        outcome.tool,
+        outcome.action,
+        outcome.returncode,
+        tuple(outcome.stdout),
+        tuple(outcome.stderr),
+        outcome.cached,
+        outcome.exit_category.value,
+        tuple(table.strings),
+        columns,
+    )
+    return _pack(tool or outcome.tool, files, file_metrics, body)
+
+
+def encode_candidates_entry(candidates: Sequence[DiagnosticCandidate], *, tool: str = "") -> bytes:
+    """Return the binary cache entry for parser ``candidates``.
+
+    Args:
+        candidates: Raw and structured diagnostics produced by a parser.
+        tool: Owner recorded in the header.
+
+    Returns:
+        bytes: Encoded entry.
+    """
+
+    table = _StringTable()
+    kinds = tuple(_CANDIDATE_RAW if isinstance(item, RawDiagnostic) else _CANDIDATE_DIAGNOSTIC for item in candidates)
+    raw_columns = _raw_columns([item for item in candidates if isinstance(item, RawDiagnostic)], table)
+    diagnostic_columns = _diagnostic_columns([item for item in candidates if isinstance(item, Diagnostic)], table)
+    body: _CandidateBody = (_KIND_CANDIDATES, tuple(table.strings), kinds, raw_columns, diagnostic_columns)
+    return _pack(tool, (), None, body)
+
+
+def decode_entry(payload: bytes) -> EncodedEntry:
+    """Decode the header of ``payload`` and defer the body.
+
+    Args:
+        payload: Bytes produced by one of the ``encode_*`` helpers.
+
+    Returns:
+        EncodedEntry: Entry whose body is hydrated on demand.
+
+    Raises:
+        CodecError: If ``payload`` has a foreign magic, version or layout.
+    """
+
+    if len(payload) < _PREAMBLE.size:
+        raise CodecError("truncated cache entry")
+    magic, version, marshal_version, header_length = _PREAMBLE.unpack_from(payload)
+    if magic != CODEC_MAGIC or version != CODEC_VERSION or marshal_version != marshal.version:
+        raise CodecError("unsupported cache entry version")
+    header_end = _PREAMBLE.size + header_length
+    try:
+        tool, files, metrics = marshal.loads(payload[_PREAMBLE.size : header_end])  # nosec B302
+        file_states = tuple((str(path), int(mtime_ns), int(size)) for path, mtime_ns, size in files)
+        file_metrics = {
+            str(path): FileMetrics(line_count=int(line_count), suppressions=dict(suppressions))
+            for path, line_count, suppressions in metrics
+        }
+    except (EOFError, TypeError, ValueError) as exc:
+        raise CodecError("malformed cache entry header") from exc
+    for metric in file_metrics.values():
+        metric.ensure_labels()
+    return EncodedEntry(tool=str(tool), files=file_states, file_metrics=file_metrics, body=payload[header_end:])
+
+
+def _pack(
+    tool: str,
+    files: Sequence[FileStateRecord],
+    file_metrics: Mapping[str, FileMetricsProtocol] | None,
+    body: _OutcomeBody | _CandidateBody,
+) -> bytes:
+    """Return the preamble, header and body concatenated.
+
+    Args:
+        tool: Owner stored in the header.
+        files: File state records stored in the header.
+        file_metrics: Optional metrics stored in the header.
+        body: Columnar body tuple.
+
+    Returns:
+        bytes: Encoded entry.
+    """
+
+    metrics = tuple(
+        (path, metric.line_count, dict(metric.suppressions)) for path, metric in (file_metrics or {}).items()
+    )
+    header = marshal.dumps((tool, tuple(files), metrics))
+    return b"".join(
+        (
+            _PREAMBLE.pack(CODEC_MAGIC, CODEC_VERSION, marshal.version, len(header)),
+            header,
+            marshal.dumps(body),
+        ),
+    )
+
+
+def _load_body(body: bytes, kind: int) -> tuple[object, ...]:
+    """Unmarshal ``body`` and check that it holds ``kind``.
+
+    Args:
+        body: Marshalled body bytes.
+        kind: Expected body kind marker.
+
+    Returns:
+        tuple[object, ...]: Body tuple whose first element is ``kind``.
+
+    Raises:
+        CodecError: If the body cannot be read or holds another kind.
+    """
+
+    try:
+        value = marshal.loads(body)  # nosec B302
+    except (EOFError, TypeError, ValueError) as exc:
+        raise CodecError("malformed cache entry body") from exc
+    if not isinstance(value, tuple) or not value or value[0] != kind:
+        raise CodecError("unexpected cache entry body")
+    return value
+
+
+def _diagnostic_columns(diagnostics: Sequence[Diagnostic], table: _StringTable) -> _Columns:
+    """Return ``diagnostics`` as interned columns.
+
+    Args:
+        diagnostics: Diagnostics to encode.
+        table: String table receiving interned values.
+
+    Returns:
+        _Columns: One tuple per :class:`Diagnostic` field.
+    """
+
+    return (
+        tuple(table.index(item.file) for item in diagnostics),
+        tuple(item.line for item in diagnostics),
+        tuple(item.column for item in diagnostics),
+        tuple(table.index(item.severity.value) for item in diagnostics),
+        tuple(table.index(item.message) for item in diagnostics),
+        tuple(table.index(item.tool) for item in diagnostics),
+        tuple(table.index(item.code) for item in diagnostics),
+        tuple(table.index(item.group) for item in diagnostics),
+        tuple(table.index(item.function) for item in diagnostics),
+        tuple(tuple(table.index(hint) for hint in item.hints) for item in diagnostics),
+        tuple(tuple(table.index(tag) for tag in item.tags) for item in diagnostics),
+        tuple(dict(item.meta) for item in diagnostics),
+    )
+
+
+def _raw_columns(candidates: Sequence[RawDiagnostic], table: _StringTable) -> _Columns:
+    """Return raw parser ``candidates`` as interned columns.
+
+    Args:
+        candidates: Raw diagnostics to encode.
+        table: String table receiving interned values.
+
+    Returns:
+        _Columns: One tuple per :class:`RawDiagnostic` field.
+    """
+
+    return (
+        tuple(table.index(item.file) for item in candidates),
+        tuple(item.line for item in candidates),
+        tuple(item.column for item in candidates),
+        tuple(table.index(_severity_text(item.severity)) for item in candidates),
+        tuple(isinstance(item.severity, Severity) for item in candidates),
+        tuple(table.index(item.message) for item in candidates),
+        tuple(table.index(item.code) for item in candidates),
+        tuple(table.index(item.tool) for item in candidates),
+        tuple(table.index(item.group) for item in candidates),
+        tuple(table.index(item.function) for item in candidates),
+    )
+
+
+def _diagnostics_from_columns(table: tuple[str | None, ...], columns: _Columns) -> list[Diagnostic]:
+    """Return diagnostics rebuilt from interned ``columns``.
+
+    Args:
+        table: Interned strings followed by ``None`` so ``-1`` maps to ``None``.
+        columns: Columns produced by :func:`_diagnostic_columns`.
+
+    Returns:
+        list[Diagnostic]: Diagnostics built without re-validation.
+    """
+
+    files, lines, column_numbers, severities, messages, tools, codes, groups, functions, hints, tags, metas = columns
+    severity_of = {index: Severity(table[index]) for index in set(cast(Sequence[int], severities))}
+    rows = zip(
+        _resolve(table, files),
+        lines,
+        column_numbers,
+        map(severity_of.__getitem__, cast(Sequence[int], severities)),
+        _resolve(table, messages),
+        _resolve(table, tools),
+        _resolve(table, codes),
+        _resolve(table, groups),
+        _resolve(table, functions),
+        (_strings(table, indices) for indices in hints),
+        (_strings(table, indices) for indices in tags),
+        metas,
+        strict=True,
+    )
+    return [Diagnostic.model_construct(**dict(zip(_DIAGNOSTIC_FIELDS, row, strict=True))) for row in rows]
+
+
+def _raw_from_columns(table: tuple[str | None, ...], columns: _Columns) -> Iterator[RawDiagnostic]:
+    """Yield raw diagnostics rebuilt from interned ``columns``.
+
+    Args:
+        table: Interned strings followed by ``None`` so ``-1`` maps to ``None``.
+        columns: Columns produced by :func:`_raw_columns`.
+
+    Yields:
+        RawDiagnostic: Raw diagnostics built without re-validation.
+    """
+
+    files, lines, column_numbers, severities, severity_enums, messages, codes, tools, groups, functions = columns
+    severity_texts = _resolve(table, severities)
+    severity_values = (
+        Severity(text) if is_enum and text is not None else text
+        for text, is_enum in zip(severity_texts, severity_enums, strict=True)
+    )
+    rows = zip(
+        _resolve(table, files),
+        lines,
+        column_numbers,
+        severity_values,
+        _resolve(table, messages),
+        _resolve(table, codes),
+        _resolve(table, tools),
+        _resolve(table, groups),
+        _resolve(table, functions),
+        strict=True,
+    )
+    for row in rows:
+        yield RawDiagnostic.model_construct(**dict(zip(_RAW_FIELDS, row, strict=True)))
+
+
+def _resolve(table: tuple[str | None, ...], indices: _Column) -> Iterator[str | None]:
+    """Return an iterator mapping a column of table ``indices`` to strings.
+
+    Args:
+        table: Interned strings followed by ``None`` so ``-1`` maps to ``None``.
+        indices: Column of table indices.
+
+    Returns:
+        Iterator[str | None]: Resolved values in column order.
+    """
+
+    return map(table.__getitem__, cast(Sequence[int], indices))
+
+
+def _strings(table: tuple[str | None, ...], indices: object) -> tuple[str, ...]:
+    """Return the interned strings addressed by ``indices``.
+
+    Args:
+        table: Interned string table.
+        indices: Tuple of table indices.
+
+    Returns:
+        tuple[str, ...]: Resolved strings.
+    """
+
+    if not indices:
+        return ()
+    return tuple(cast(Iterator[str], _resolve(table, cast(tuple[int, ...], indices))))
+
+
+def _severity_text(value: Severity | str | None) -> str | None:
+    """Return the textual form of a raw diagnostic severity.
+
+    Args:
+        value: Severity enum, tool-native severity string or ``None``.
+
+    Returns:
+        str | None: Severity text suitable for interning.
+    """
+
+    if isinstance(value, Severity):
+        return value.value
+    return value
+
+
+__all__ = [
+    "CODEC_MAGIC",
+    "CODEC_VERSION",
+    "CodecError",
+    "DiagnosticCandidate",
+    "EncodedEntry",
+    "FileStateRecord",
+    "decode_entry",
+    "encode_candidates_entry",
+    "encode_outcome_entry",
+]
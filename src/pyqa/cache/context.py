@@ -6,19 +6,26 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final, cast
 
-from ..interfaces.cache import CacheTokenBuilder as CacheTokenBuilderProtocol
-from ..interfaces.cache import CacheVersionStore as CacheVersionStoreProtocol
 from ..interfaces.cache import (
+    BufferedResultCache,
     ResultCacheFactory,
     ResultCacheProtocol,
 )
+from ..interfaces.cache import CacheTokenBuilder as CacheTokenBuilderProtocol
+from ..interfaces.cache import CacheVersionStore as CacheVersionStoreProtocol
 from ..interfaces.config import Config as ConfigProtocol
+from .maintenance import CacheBudget, GcReport, ToolCacheUsage, maybe_collect_garbage, record_usage
+from .manifest import record_recent
+from .prepared_commands import load_prepared_commands, prepared_command_key, save_prepared_commands
+from .remote import REMOTE_CACHE_TOKEN_ENV, REMOTE_CACHE_URL_ENV, RemoteCacheSettings, wrap_remote_cache
 from .result_store import CachedEntry, CacheRequest, ResultCache
+from .tool_inputs import ToolInputFingerprints
 from .tool_versions import load_versions as _load_versions
 from .tool_versions import save_versions as _save_versions
 
@@ -35,6 +42,46 @@ class CacheContext:
     versions: dict[str, str]
     version_store: CacheVersionStoreProtocol | None = None
     versions_dirty: bool = False
+    run_versions: dict[str, str] = field(default_factory=dict)
+    prepared_commands: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    prepared_commands_dirty: bool = False
+    tool_inputs: ToolInputFingerprints | None = None
+    budget: CacheBudget | None = None
+    lookups: dict[tuple[str, str, tuple[str, ...]], bool] = field(default_factory=dict)
+
+    def token_for(self, tool_name: str) -> str | None:
+        """Return the cache token for ``tool_name`` including its config inputs.
+
+        Args:
+            tool_name: Name of the tool whose outcomes are cached.
+
+        Returns:
+            str | None: Run token extended with the fingerprint of the tool's
+            declared configuration files and environment variables, or ``None``
+            when caching is disabled.
+        """
+
+        if self.token is None or self.tool_inputs is None:
+            return self.token
+        digest = self.tool_inputs.digest(tool_name)
+        return self.token if digest is None else f"{self.token}|{digest}"
+
+    def version_for(self, tool_name: str) -> str | None:
+        """Return the version ``tool_name`` resolved to during this run.
+
+        Versions recorded by earlier runs are not returned: the tool may have
+        been upgraded since, and the remote cache must never serve outcomes
+        produced by a different version.
+
+        Args:
+            tool_name: Name of the tool whose outcomes are cached.
+
+        Returns:
+            str | None: Version reported by the prepared command, or ``None``
+            when the tool has not been prepared yet or reports no version.
+        """
+
+        return self.run_versions.get(tool_name)
 
     def load_cached_outcome(
         self,
@@ -56,16 +103,58 @@ class CacheContext:
             CachedEntryProtocol | None: Cached response when valid, otherwise ``None``.
         """
 
-        if self.cache is None or self.token is None:
+        token = self.token_for(tool_name)
+        if self.cache is None or token is None:
             return None
         request = CacheRequest(
             tool=tool_name,
             action=action_name,
             command=tuple(cmd),
             files=tuple(Path(path) for path in files),
-            token=self.token,
+            token=token,
+            version=self.version_for(tool_name),
         )
-        return self.cache.load(request)
+        entry = self.cache.load(request)
+        self.lookups[(tool_name, action_name, request.command)] = entry is not None
+        return entry
+
+    def usage(self) -> dict[str, ToolCacheUsage]:
+        """Return per-tool hit and miss counters for this run's lookups.
+
+        Repeated lookups of the same invocation, such as the pre-provisioning
+        probe followed by the regular lookup, count once.
+
+        Returns:
+            dict[str, ToolCacheUsage]: Counters keyed by tool name.
+        """
+
+        usage: dict[str, ToolCacheUsage] = {}
+        for (tool_name, _, _), hit in self.lookups.items():
+            counters = usage.setdefault(tool_name, ToolCacheUsage())
+            if hit:
+                counters.hits += 1
+            else:
+                counters.misses += 1
+        return usage
+
+    def persist_usage(self) -> None:
+        """Use this helper to add this run's lookup counters to the usage manifest."""
+
+        if self.cache is None or not self.lookups:
+            return
+        record_usage(self.cache_dir, self.usage())
+        self.lookups.clear()
+
+    def collect_garbage(self) -> GcReport | None:
+        """Evict cache entries beyond the configured budget, at most once per interval.
+
+        Returns:
+            GcReport | None: Summary of the collection, or ``None`` when skipped.
+        """
+
+        if self.cache is None or self.budget is None:
+            return None
+        return maybe_collect_garbage(self.cache_dir, self.budget)
 
     def persist_versions(self) -> None:
         """Use this helper to persist tool versions when the context is marked dirty."""
@@ -75,6 +164,67 @@ class CacheContext:
         self.version_store.save(self.cache_dir, self.versions)
         self.versions_dirty = False
 
+    def resolve_prepared_command(
+        self,
+        *,
+        tool_name: str,
+        action_name: str,
+        cmd: Sequence[str],
+    ) -> tuple[str, ...] | None:
+        """Return the prepared command ``cmd`` resolved to on a previous run.
+
+        This lets callers probe the result cache before provisioning a tool.
+
+        Args:
+            tool_name: Name of the tool owning the action.
+            action_name: Action identifier.
+            cmd: Command built from the catalog definition, before preparation.
+
+        Returns:
+            tuple[str, ...] | None: Previously prepared command, or ``None`` when unknown.
+        """
+
+        if self.cache is None or self.token is None:
+            return None
+        return self.prepared_commands.get(prepared_command_key(tool_name, action_name, self.token, cmd))
+
+    def remember_prepared_command(
+        self,
+        *,
+        tool_name: str,
+        action_name: str,
+        cmd: Sequence[str],
+        prepared: Sequence[str],
+    ) -> None:
+        """Record that ``cmd`` was prepared into ``prepared`` for later pre-checks.
+
+        Args:
+            tool_name: Name of the tool owning the action.
+            action_name: Action identifier.
+            cmd: Command built from the catalog definition, before preparation.
+            prepared: Command produced by the command preparer.
+        """
+
+        if self.cache is None or self.token is None:
+            return
+        key = prepared_command_key(tool_name, action_name, self.token, cmd)
+        if record_recent(self.prepared_commands, key, tuple(prepared)):
+            self.prepared_commands_dirty = True
+
+    def persist_prepared_commands(self) -> None:
+        """Use this helper to persist the prepared command manifest when dirty."""
+
+        if not self.prepared_commands_dirty:
+            return
+        save_prepared_commands(self.cache_dir, self.prepared_commands)
+        self.prepared_commands_dirty = False
+
+    def flush(self) -> None:
+        """Block until buffered cache writes (for example remote uploads) complete."""
+
+        if isinstance(self.cache, BufferedResultCache):
+            self.cache.flush()
+
 
 class DefaultCacheTokenBuilder(CacheTokenBuilderProtocol):
     """Generate cache tokens from lint configuration."""
@@ -204,6 +354,10 @@ class DefaultCacheContextFactory:
             return CacheContext(cache=None, token=None, cache_dir=cache_dir, versions={}, version_store=None)
 
         cache: ResultCacheProtocol = self.result_cache_factory(cache_dir)
+        remote_url = config.execution.remote_cache_url or os.environ.get(REMOTE_CACHE_URL_ENV)
+        if remote_url:
+            settings = RemoteCacheSettings(url=remote_url, token=os.environ.get(REMOTE_CACHE_TOKEN_ENV))
+            cache = wrap_remote_cache(cache, settings, root=root)
         token: str = self.token_builder.build_token(config)
         versions: dict[str, str] = self.version_store.load(cache_dir)
         return CacheContext(
@@ -212,6 +366,11 @@ class DefaultCacheContextFactory:
             cache_dir=cache_dir,
             versions=versions,
             version_store=self.version_store,
+            prepared_commands=load_prepared_commands(cache_dir),
+            budget=CacheBudget.from_limits(
+                max_size_mb=config.execution.cache_max_size_mb,
+                max_age_days=config.execution.cache_max_age_days,
+            ),
         )
 
 
@@ -259,6 +418,7 @@ def update_tool_version(context: CacheContext, tool_name: str, version: str | No
 
     if not version:
         return
+    context.run_versions[tool_name] = version
     if context.versions.get(tool_name) == version:
         return
     context.versions[tool_name] = version
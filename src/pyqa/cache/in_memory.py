@@ -10,25 +10,24 @@ mirrors ``functools`` caches.
 
 from __future__ import annotations
 
+import sys
 import time
 from collections import OrderedDict
 from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Future
 from dataclasses import dataclass
 from functools import partial, update_wrapper
-from threading import Lock
+from threading import Lock, get_ident
 from types import MethodType
-from typing import Final, Generic, ParamSpec, TypeVar, cast
-
-ArgT = TypeVar("ArgT")
-KwargT = TypeVar("KwargT")
-InstanceT = TypeVar("InstanceT")
-HashableCandidate = TypeVar("HashableCandidate", bound=Hashable)
+from typing import Final, ParamSpec, TypeVar, cast
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 CacheKey = Hashable
 
+_DEFAULT_OBJECT_SIZE: Final[int] = 64
+
 
 @dataclass(frozen=True, slots=True)
 class CacheInfo:
@@ -38,11 +37,47 @@ class CacheInfo:
         current_size: Number of cached entries currently stored.
         hits: Number of cache hits that have occurred.
         maxsize: Configured maximum cache capacity, ``None`` when unbounded.
+        misses: Number of calls that had to compute a fresh value.
+        evictions: Entries dropped to honour ``maxsize`` or ``max_bytes``.
+        expirations: Entries dropped because their TTL elapsed.
+        current_bytes: Approximate memory held by cached values.
+        max_bytes: Configured approximate byte budget, ``None`` when unbounded.
     """
 
     current_size: int
     hits: int
     maxsize: int | None
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    current_bytes: int = 0
+    max_bytes: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _CachePolicy:
+    """Describe the bounds applied to a memoized callable."""
+
+    maxsize: int | None = None
+    max_bytes: int | None = None
+    ttl_seconds: float | None = None
+
+
+@dataclass(slots=True)
+class _CacheEntry[R]:
+    """Store a cached value alongside its size estimate and expiry."""
+
+    value: R
+    size: int
+    expires_at: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class _InFlight[R]:
+    """Track a computation other callers can wait on instead of repeating it."""
+
+    future: Future[R]
+    owner: int
 
 
 def _build_cache_key(args: tuple[Hashable, ...], kwargs: Mapping[str, Hashable]) -> CacheKey:
@@ -61,7 +96,7 @@ def _build_cache_key(args: tuple[Hashable, ...], kwargs: Mapping[str, Hashable])
     return args + (tuple(sorted(kwargs.items())),)
 
 
-def _ensure_hashable(value: HashableCandidate, *, label: str) -> HashableCandidate:
+def _ensure_hashable[HashableCandidate: Hashable](value: HashableCandidate, *, label: str) -> HashableCandidate:
     """Return ``value`` ensuring it is hashable for cache key construction.
 
     Args:
@@ -80,7 +115,7 @@ def _ensure_hashable(value: HashableCandidate, *, label: str) -> HashableCandida
     raise TypeError(f"{label} must be hashable to participate in caching")
 
 
-def _hashable_args(args: tuple[ArgT, ...]) -> tuple[Hashable, ...]:
+def _hashable_args[ArgT](args: tuple[ArgT, ...]) -> tuple[Hashable, ...]:
     """Convert positional arguments into a hashable tuple for cache keys.
 
     Args:
@@ -93,7 +128,7 @@ def _hashable_args(args: tuple[ArgT, ...]) -> tuple[Hashable, ...]:
     return tuple(_ensure_hashable(arg, label=f"positional argument {index}") for index, arg in enumerate(args))
 
 
-def _hashable_kwargs(kwargs: Mapping[str, KwargT]) -> dict[str, Hashable]:
+def _hashable_kwargs[KwargT](kwargs: Mapping[str, KwargT]) -> dict[str, Hashable]:
     """Convert keyword arguments into hashable values for cache keys.
 
     Args:
@@ -106,22 +141,60 @@ def _hashable_kwargs(kwargs: Mapping[str, KwargT]) -> dict[str, Hashable]:
     return {key: _ensure_hashable(value, label=f"keyword argument '{key}'") for key, value in kwargs.items()}
 
 
-class _MemoizedCallable(Generic[P, R]):
-    """Implement an optional-size LRU cache for callables."""
+def _approximate_size(value: object) -> int:
+    """Return a cheap estimate of the memory retained by ``value``.
+
+    Containers contribute their own footprint plus the shallow size of their
+    direct members; deeper nesting is ignored to keep the estimate O(n).
+
+    Args:
+        value: Cached value to measure.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+
+    size = sys.getsizeof(value, _DEFAULT_OBJECT_SIZE)
+    if isinstance(value, (str, bytes, bytearray)):
+        return size
+    if isinstance(value, Mapping):
+        return size + sum(
+            sys.getsizeof(key, _DEFAULT_OBJECT_SIZE) + sys.getsizeof(item, _DEFAULT_OBJECT_SIZE)
+            for key, item in value.items()
+        )
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return size + sum(sys.getsizeof(item, _DEFAULT_OBJECT_SIZE) for item in value)
+    return size
+
+
+class _MemoizedCallable[**P, R]:
+    """Implement a single-flight, size- and TTL-bounded LRU cache for callables.
+
+    Concurrent callers missing on the same key wait for the first caller's
+    computation instead of repeating it. ``None`` results are cached like any
+    other value, while exceptions are propagated to every waiter and never
+    cached.
+    """
 
-    def __init__(self, func: Callable[P, R], maxsize: int | None) -> None:
+    def __init__(self, func: Callable[P, R], policy: _CachePolicy) -> None:
         """Initialise the memoized callable wrapper.
 
         Args:
             func: Callable whose results should be memoized.
-            maxsize: Maximum number of cache entries allowed, ``None`` for unbounded caches.
+            policy: Entry, byte, and TTL bounds applied to the cache.
         """
 
         self._func = func
-        self._maxsize = maxsize
-        self._store: OrderedDict[CacheKey, R] = OrderedDict()
+        self._policy = policy
+        self._store: OrderedDict[CacheKey, _CacheEntry[R]] = OrderedDict()
+        self._inflight: dict[CacheKey, _InFlight[R]] = {}
         self._lock = Lock()
         self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._bytes = 0
+        self._next_sweep = 0.0
         update_wrapper(self, func)
 
     # suppression_valid: lint=internal-signatures because decorators must keep functools APIs while exposing __call__.
@@ -139,108 +212,150 @@ class _MemoizedCallable(Generic[P, R]):
         hashable_args = _hashable_args(args)
         hashable_kwargs = _hashable_kwargs(kwargs)
         cache_key = _build_cache_key(hashable_args, hashable_kwargs)
+        caller = get_ident()
         with self._lock:
-            cached = self._store.get(cache_key)
-            if cached is not None:
-                self._store.move_to_end(cache_key)
+            now = time.monotonic()
+            entry = self._lookup(cache_key, now)
+            if entry is not None:
                 self._hits += 1
-                return cached
-        result = self._func(*args, **kwargs)
-        with self._lock:
-            self._store[cache_key] = result
-            if self._maxsize is not None and len(self._store) > self._maxsize:
-                self._store.popitem(last=False)
-        return result
-
-    def __get__(self, instance: InstanceT | None, owner: type[InstanceT] | None = None) -> Callable[P, R]:
-        """Return a descriptor-aware callable bound to ``instance``.
+                return entry.value
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                self._misses += 1
+                pending = _InFlight(future=Future(), owner=caller)
+                self._inflight[cache_key] = pending
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            if pending.owner == caller:
+                # Re-entrant call for a key this thread is already computing.
+                return self._func(*args, **kwargs)
+            return pending.future.result()
+        return self._compute(cache_key, pending, args, kwargs)
+
+    def _compute(
+        self,
+        cache_key: CacheKey,
+        pending: _InFlight[R],
+        args: tuple[object, ...],
+        kwargs: Mapping[str, object],
+    ) -> R:
+        """Compute the value for ``cache_key`` and publish it to waiters.
 
         Args:
-            instance: Instance owning the decorated callable.
-            owner: Owning class of the descriptor (unused).
+            cache_key: Key being computed.
+            pending: In-flight record other callers are waiting on.
+            args: Positional arguments forwarded to the wrapped callable.
+            kwargs: Keyword arguments forwarded to the wrapped callable.
 
         Returns:
-            Callable[..., R]: Callable that preserves the memoization behaviour.
-        """
+            R: Freshly computed result.
 
-        if instance is None:
-            return self
-        return cast(Callable[P, R], MethodType(self, instance))
-
-    def cache_clear(self) -> None:
-        """Reset cached entries and hit tracking."""
+        Raises:
+            BaseException: Re-raises any failure from the wrapped callable after
+                waking waiting callers.
+        """
 
+        func = cast(Callable[..., R], self._func)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+            pending.future.set_exception(exc)
+            raise
         with self._lock:
-            self._store.clear()
-            self._hits = 0
+            self._inflight.pop(cache_key, None)
+            self._store_entry(cache_key, result, time.monotonic())
+        pending.future.set_result(result)
+        return result
 
-    def cache_info(self) -> tuple[int, int, int | None]:
-        """Return cache metadata mirroring ``functools.lru_cache`` semantics.
+    def _lookup(self, cache_key: CacheKey, now: float) -> _CacheEntry[R] | None:
+        """Return the live entry for ``cache_key`` while holding the lock.
+
+        Args:
+            cache_key: Key to look up.
+            now: Current monotonic timestamp.
 
         Returns:
-            tuple[int, int, int | None]: Tuple of ``(current_size, currsize, maxsize)``.
+            _CacheEntry[R] | None: Cached entry, or ``None`` when absent or expired.
         """
 
-        metadata = self.cache_metadata()
-        return metadata.current_size, metadata.current_size, metadata.maxsize
+        entry = self._store.get(cache_key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at < now:
+            self._discard(cache_key)
+            self._expirations += 1
+            return None
+        self._store.move_to_end(cache_key)
+        return entry
 
-    def cache_metadata(self) -> CacheInfo:
-        """Return cache metadata in a ``CacheInfo`` payload including hits.
+    def _store_entry(self, cache_key: CacheKey, value: R, now: float) -> None:
+        """Insert ``value`` and enforce the cache bounds while holding the lock.
 
-        Returns:
-            CacheInfo: Cache metadata including current cache size, hits, and
-            configured max size.
+        Args:
+            cache_key: Key associated with ``value``.
+            value: Result to cache.
+            now: Current monotonic timestamp.
         """
 
-        with self._lock:
-            return CacheInfo(current_size=len(self._store), hits=self._hits, maxsize=self._maxsize)
+        policy = self._policy
+        if cache_key in self._store:
+            self._discard(cache_key)
+        size = _approximate_size(value) if policy.max_bytes is not None else 0
+        if policy.max_bytes is not None and size > policy.max_bytes:
+            self._evictions += 1
+            return
+        expires_at = now + policy.ttl_seconds if policy.ttl_seconds is not None else None
+        self._store[cache_key] = _CacheEntry(value=value, size=size, expires_at=expires_at)
+        self._bytes += size
+        if policy.ttl_seconds is not None and now >= self._next_sweep:
+            self._sweep_expired(now)
+            self._next_sweep = now + policy.ttl_seconds
+        while self._over_capacity():
+            oldest = next(iter(self._store))
+            self._discard(oldest)
+            self._evictions += 1
+
+    def _sweep_expired(self, now: float) -> None:
+        """Drop every expired entry while holding the lock.
 
+        Args:
+            now: Current monotonic timestamp.
+        """
 
-class _TTLCacheCallable(Generic[P, R]):
-    """Implement a time-to-live cache policy for callables."""
+        expired = [key for key, entry in self._store.items() if entry.expires_at is not None and entry.expires_at < now]
+        for key in expired:
+            self._discard(key)
+        self._expirations += len(expired)
 
-    def __init__(self, func: Callable[P, R], ttl_seconds: float) -> None:
-        """Initialise the TTL cache wrapper.
+    def _over_capacity(self) -> bool:
+        """Return whether the cache exceeds its entry or byte budget.
 
-        Args:
-            func: Callable whose results should be cached.
-            ttl_seconds: Time-to-live window in seconds for cached entries.
+        Returns:
+            bool: ``True`` when the oldest entry should be evicted.
         """
 
-        self._func = func
-        self._ttl_seconds = ttl_seconds
-        self._store: dict[CacheKey, tuple[float, R]] = {}
-        self._lock = Lock()
-        update_wrapper(self, func)
+        policy = self._policy
+        if not self._store:
+            return False
+        if policy.maxsize is not None and len(self._store) > policy.maxsize:
+            return True
+        return policy.max_bytes is not None and self._bytes > policy.max_bytes
 
-    # suppression_valid: lint=internal-signatures because decorators must expose descriptors for compatibility.
-    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
-        """Invoke the wrapped callable applying TTL caching semantics.
+    def _discard(self, cache_key: CacheKey) -> None:
+        """Remove ``cache_key`` and release its byte accounting.
 
         Args:
-            *args: Positional arguments forwarded to the wrapped callable.
-            **kwargs: Keyword arguments forwarded to the wrapped callable.
-
-        Returns:
-            R: Result produced by the wrapped callable.
+            cache_key: Key to remove.
         """
 
-        hashable_args = _hashable_args(args)
-        hashable_kwargs = _hashable_kwargs(kwargs)
-        cache_key = _build_cache_key(hashable_args, hashable_kwargs)
-        now = time.monotonic()
-        with self._lock:
-            entry = self._store.get(cache_key)
-            if entry is not None:
-                expires_at, value = entry
-                if expires_at >= now:
-                    return value
-        result = self._func(*args, **kwargs)
-        with self._lock:
-            self._store[cache_key] = (now + self._ttl_seconds, result)
-        return result
+        entry = self._store.pop(cache_key)
+        self._bytes -= entry.size
 
-    def __get__(self, instance: InstanceT | None, owner: type[InstanceT] | None = None) -> Callable[P, R]:
+    def __get__[InstanceT](self, instance: InstanceT | None, owner: type[InstanceT] | None = None) -> Callable[P, R]:
         """Return a descriptor-aware callable bound to ``instance``.
 
         Args:
@@ -248,7 +363,7 @@ class _TTLCacheCallable(Generic[P, R]):
             owner: Owning class of the descriptor (unused).
 
         Returns:
-            Callable[..., R]: Callable preserving TTL cache semantics.
+            Callable[..., R]: Callable that preserves the memoization behaviour.
         """
 
         if instance is None:
@@ -256,68 +371,101 @@ class _TTLCacheCallable(Generic[P, R]):
         return cast(Callable[P, R], MethodType(self, instance))
 
     def cache_clear(self) -> None:
-        """Reset cached TTL values."""
+        """Reset cached entries and statistics."""
 
         with self._lock:
             self._store.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+            self._bytes = 0
 
+    def cache_info(self) -> tuple[int, int, int | None]:
+        """Return cache metadata mirroring ``functools.lru_cache`` semantics.
+
+        Returns:
+            tuple[int, int, int | None]: Tuple of ``(current_size, currsize, maxsize)``.
+        """
+
+        metadata = self.cache_metadata()
+        return metadata.current_size, metadata.current_size, metadata.maxsize
+
+    def cache_metadata(self) -> CacheInfo:
+        """Return cache metadata in a ``CacheInfo`` payload including statistics.
+
+        Returns:
+            CacheInfo: Cache size, hit/miss/eviction counters, and configured bounds.
+        """
 
-def memoize(maxsize: int | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """Return a decorator implementing an optional-size LRU cache.
+        with self._lock:
+            return CacheInfo(
+                current_size=len(self._store),
+                hits=self._hits,
+                maxsize=self._policy.maxsize,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                current_bytes=self._bytes,
+                max_bytes=self._policy.max_bytes,
+            )
+
+
+def memoize(
+    maxsize: int | None = None,
+    *,
+    max_bytes: int | None = None,
+    ttl_seconds: float | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Return a decorator implementing a single-flight, optionally bounded LRU cache.
 
     Args:
         maxsize: Maximum number of entries to retain. ``None`` disables the cap.
+        max_bytes: Approximate byte budget for cached values. ``None`` disables the cap.
+        ttl_seconds: Optional lifetime after which entries are recomputed.
 
     Returns:
         Callable[[Callable[P, R]], Callable[P, R]]: Decorator preserving cache helpers.
     """
 
-    decorator = partial(_apply_memoize, maxsize=maxsize)
+    policy = _CachePolicy(maxsize=maxsize, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+    decorator = partial(_apply_memoize, policy=policy)
     return cast(Callable[[Callable[P, R]], Callable[P, R]], decorator)
 
 
-def ttl_cache(ttl_seconds: float) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """Return a decorator implementing a simple TTL cache.
+def ttl_cache(
+    ttl_seconds: float,
+    *,
+    maxsize: int | None = None,
+    max_bytes: int | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Return a decorator implementing a TTL cache that sweeps expired entries.
 
     Args:
         ttl_seconds: Number of seconds a cached value remains valid.
+        maxsize: Optional maximum number of entries to retain.
+        max_bytes: Optional approximate byte budget for cached values.
 
     Returns:
         Callable[[Callable[P, R]], Callable[P, R]]: Decorator preserving TTL helpers.
     """
 
-    decorator = partial(_apply_ttl_cache, ttl_seconds=ttl_seconds)
-    return cast(Callable[[Callable[P, R]], Callable[P, R]], decorator)
+    return memoize(maxsize, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
 
 
-def _apply_memoize(func: Callable[P, R], *, maxsize: int | None) -> Callable[P, R]:
+def _apply_memoize[**P, R](func: Callable[P, R], *, policy: _CachePolicy) -> Callable[P, R]:
     """Return a memoized callable wrapping ``func``.
 
     Args:
         func: Callable receiving memoization.
-        maxsize: Maximum cache capacity for the wrapped callable.
+        policy: Entry, byte, and TTL bounds for the wrapped callable.
 
     Returns:
         Callable[P, R]: Memoized callable with cache helpers attached.
     """
 
-    memoized = _MemoizedCallable(func, maxsize)
+    memoized = _MemoizedCallable(func, policy)
     return cast(Callable[P, R], memoized)
 
 
-def _apply_ttl_cache(func: Callable[P, R], *, ttl_seconds: float) -> Callable[P, R]:
-    """Return a TTL-cached callable wrapping ``func``.
-
-    Args:
-        func: Callable receiving TTL caching semantics.
-        ttl_seconds: Cache lifetime in seconds.
-
-    Returns:
-        Callable[P, R]: TTL cached callable with helper APIs.
-    """
-
-    ttl_wrapped = _TTLCacheCallable(func, ttl_seconds)
-    return cast(Callable[P, R], ttl_wrapped)
-
-
 __all__: Final = ["memoize", "ttl_cache", "CacheInfo"]
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Persist full-run diagnostics so incremental runs can report untouched files."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, cast
+
+from ..core.models import RunResult, ToolExitCategory, ToolOutcome
+from ..core.serialization import deserialize_outcome, serialize_outcome
+from ..interfaces.analysis import ChangeScopeView
+from ..interfaces.core import JsonValue
+
+BASELINE_DIRNAME: Final[str] = "incremental"
+BASELINE_FILENAME: Final[str] = "baseline.json"
+_BASELINE_VERSION: Final[int] = 1
+_VERSION_KEY: Final[str] = "version"
+_OUTCOMES_KEY: Final[str] = "outcomes"
+_KEY_SEPARATOR: Final[str] = ":"
+
+
+def baseline_path(cache_dir: Path) -> Path:
+    """Return the location of the incremental baseline beneath ``cache_dir``.
+
+    Args:
+        cache_dir: Cache directory configured for the run.
+
+    Returns:
+        Path: File storing the most recent full-run diagnostics.
+    """
+
+    return cache_dir / BASELINE_DIRNAME / BASELINE_FILENAME
+
+
+@dataclass(slots=True)
+class IncrementalBaseline:
+    """Diagnostics captured by the most recent full lint run, keyed per action."""
+
+    path: Path
+    outcomes: dict[str, ToolOutcome] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, cache_dir: Path) -> IncrementalBaseline:
+        """Load the baseline stored in ``cache_dir``.
+
+        Missing or unreadable baselines yield an empty instance so callers can
+        treat the first incremental run like any other.
+
+        Args:
+            cache_dir: Cache directory configured for the run.
+
+        Returns:
+            IncrementalBaseline: Baseline populated from disk when available.
+        """
+
+        path = baseline_path(cache_dir)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path=path)
+        if not isinstance(payload, Mapping) or payload.get(_VERSION_KEY) != _BASELINE_VERSION:
+            return cls(path=path)
+        entries = payload.get(_OUTCOMES_KEY)
+        if not isinstance(entries, list):
+            return cls(path=path)
+        outcomes: dict[str, ToolOutcome] = {}
+        for entry in entries:
+            if not isinstance(entry, Mapping):
+                continue
+            outcome = deserialize_outcome(cast(Mapping[str, JsonValue], entry))
+            outcomes[_outcome_key(outcome)] = outcome
+        return cls(path=path, outcomes=outcomes)
+
+    def record(self, outcomes: Sequence[ToolOutcome]) -> None:
+        """Replace the stored diagnostics for each action present in ``outcomes``.
+
+        Args:
+            outcomes: Outcomes produced by a full (non-incremental) run.
+        """
+
+        for outcome in outcomes:
+            self.outcomes[_outcome_key(outcome)] = outcome.model_copy(deep=True)
+
+    def merge_into(self, result: RunResult, scope: ChangeScopeView) -> int:
+        """Append baseline diagnostics for files outside ``scope`` to ``result``.
+
+        Diagnostics for files touched by the diff are never carried over: the
+        incremental run has just re-linted those files in full. Actions that
+        did not run at all (for example because no changed file matched their
+        extensions) are appended as cached outcomes. Outcomes that gain carried
+        diagnostics report a diagnostic failure, so a clean incremental result
+        never hides stored errors.
+
+        Args:
+            result: Incremental run result to enrich in place.
+            scope: Change scope the incremental run was restricted to.
+
+        Returns:
+            int: Number of diagnostics carried over from the baseline.
+        """
+
+        current = {_outcome_key(outcome): outcome for outcome in result.outcomes}
+        carried = 0
+        for key, stored in self.outcomes.items():
+            untouched = [
+                diag.model_copy(deep=True)
+                for diag in stored.diagnostics
+                if diag.file and not scope.contains(diag.file) and (result.root / diag.file).exists()
+            ]
+            if not untouched:
+                continue
+            carried += len(untouched)
+            target = current.get(key)
+            if target is not None:
+                target.diagnostics.extend(untouched)
+                _mark_diagnostic_failure(target)
+                continue
+            placeholder = stored.model_copy(deep=True)
+            placeholder.stdout = []
+            placeholder.stderr = []
+            placeholder.diagnostics = untouched
+            placeholder.cached = True
+            placeholder.returncode = 0
+            _mark_diagnostic_failure(placeholder)
+            result.outcomes.append(placeholder)
+        return carried
+
+    def save(self) -> None:
+        """Atomically persist the baseline to :attr:`path`."""
+
+        entries: list[JsonValue] = [
+            cast(JsonValue, serialize_outcome(self.outcomes[key])) for key in sorted(self.outcomes)
+        ]
+        payload = {_VERSION_KEY: _BASELINE_VERSION, _OUTCOMES_KEY: entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.path.with_suffix(".tmp")
+            staging.write_text(json.dumps(payload), encoding="utf-8")
+            staging.replace(self.path)
+        except OSError:
+            return
+
+
+def _mark_diagnostic_failure(outcome: ToolOutcome) -> None:
+    """Flag ``outcome`` as failing when it carries diagnostics but exited cleanly.
+
+    Tool failures keep their original return code and category.
+
+    Args:
+        outcome: Outcome whose diagnostics were just extended.
+    """
+
+    if outcome.diagnostics and outcome.returncode == 0:
+        outcome.returncode = 1
+        outcome.exit_category = ToolExitCategory.DIAGNOSTIC
+
+
+def _outcome_key(outcome: ToolOutcome) -> str:
+    """Return the baseline key for ``outcome``.
+
+    Args:
+        outcome: Tool outcome to index.
+
+    Returns:
+        str: ``tool:action`` identifier.
+    """
+
+    return f"{outcome.tool}{_KEY_SEPARATOR}{outcome.action}"
+
+
+__all__ = ["BASELINE_DIRNAME", "BASELINE_FILENAME", "IncrementalBaseline", "baseline_path"]
@@ -0,0 +1,449 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Garbage collection, usage counters and disk statistics for cache directories.
+
+Every content-addressed entry written beneath a cache directory is named after
+a SHA-256 digest: result and parser entries (``.bin``), directory-provider and
+legacy result entries (``.json``) and remote server entries (``.json.gz``).
+Entries are evicted least-recently-used first; :class:`ResultCache` and the
+remote server refresh an entry's modification time on every hit so the most
+recent of its access and modification times approximates its last use even on
+``noatime`` mounts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+from .codec import CodecError, decode_entry
+
+CACHE_USAGE_FILE: Final[str] = "cache-usage.json"
+GC_MARKER_FILE: Final[str] = ".last-gc"
+GC_INTERVAL_SECONDS: Final[float] = 3600.0
+BYTES_PER_MB: Final[int] = 1024 * 1024
+SECONDS_PER_DAY: Final[int] = 86400
+JSON_ENTRY_LABEL: Final[str] = "(json)"
+REMOTE_ENTRY_LABEL: Final[str] = "(remote)"
+UNREADABLE_ENTRY_LABEL: Final[str] = "(unreadable)"
+_ENTRY_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[0-9a-f]{64}\.(bin|json|json\.gz)$")
+_BINARY_SUFFIX: Final[str] = "bin"
+_JSON_SUFFIX: Final[str] = "json"
+# Runtime installs live under ``ToolCacheLayout.tools_root`` and are pruned by catalog reference instead.
+_SKIPPED_SUBDIRS: Final[frozenset[str]] = frozenset({"tools"})
+_HITS_FIELD: Final[str] = "hits"
+_MISSES_FIELD: Final[str] = "misses"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheBudget:
+    """Describe how much the entries of a cache directory may grow.
+
+    Attributes:
+        max_bytes: Total entry size kept after collection; ``None`` is unlimited.
+        max_age_seconds: Entries unused for longer are evicted; ``None`` keeps them.
+    """
+
+    max_bytes: int | None = None
+    max_age_seconds: float | None = None
+
+    @classmethod
+    def from_limits(cls, *, max_size_mb: int, max_age_days: int) -> CacheBudget:
+        """Return a budget from configuration limits where ``0`` means unlimited.
+
+        Args:
+            max_size_mb: Size budget in megabytes.
+            max_age_days: Age budget in days.
+
+        Returns:
+            CacheBudget: Budget expressed in bytes and seconds.
+        """
+
+        return cls(
+            max_bytes=max_size_mb * BYTES_PER_MB if max_size_mb > 0 else None,
+            max_age_seconds=float(max_age_days * SECONDS_PER_DAY) if max_age_days > 0 else None,
+        )
+
+    @property
+    def unlimited(self) -> bool:
+        """Return whether the budget never evicts anything.
+
+        Returns:
+            bool: ``True`` when neither a size nor an age limit is set.
+        """
+
+        return self.max_bytes is None and self.max_age_seconds is None
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntryFile:
+    """Describe one content-addressed entry file on disk.
+
+    Attributes:
+        path: Location of the entry.
+        size: Size of the entry in bytes.
+        last_used: Most recent of the access and modification times (epoch seconds).
+    """
+
+    path: Path
+    size: int
+    last_used: float
+
+
+@dataclass(slots=True)
+class GcReport:
+    """Summarise a garbage collection pass.
+
+    Attributes:
+        scanned: Number of entries inspected.
+        removed: Number of entries evicted (or that would be, for dry runs).
+        freed_bytes: Bytes released by the evicted entries.
+        remaining_bytes: Bytes still held by the surviving entries.
+    """
+
+    scanned: int = 0
+    removed: int = 0
+    freed_bytes: int = 0
+    remaining_bytes: int = 0
+
+
+@dataclass(slots=True)
+class ToolCacheUsage:
+    """Hit and miss counters recorded for a tool's cache lookups."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the fraction of lookups served from the cache.
+
+        Returns:
+            float | None: Hit rate in ``[0, 1]``, or ``None`` before any lookup.
+        """
+
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Describe the contents and effectiveness of a cache directory.
+
+    Attributes:
+        entries: Number of entries stored.
+        entry_bytes: Bytes held by those entries.
+        entries_by_tool: Entry counts keyed by tool (or entry-kind label).
+        usage: Recorded lookup counters keyed by tool.
+    """
+
+    entries: int
+    entry_bytes: int
+    entries_by_tool: dict[str, int] = field(default_factory=dict)
+    usage: dict[str, ToolCacheUsage] = field(default_factory=dict)
+
+
+def iter_cache_entries(cache_dir: Path) -> Iterator[CacheEntryFile]:
+    """Yield the content-addressed entry files stored beneath ``cache_dir``.
+
+    Args:
+        cache_dir: Cache directory to scan recursively.
+
+    Yields:
+        CacheEntryFile: Entry files in no particular order.
+    """
+
+    pending = [cache_dir]
+    while pending:
+        try:
+            scanner = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with scanner:
+            for item in scanner:
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        if item.name not in _SKIPPED_SUBDIRS or Path(item.path).parent != cache_dir:
+                            pending.append(Path(item.path))
+                        continue
+                    if not _ENTRY_PATTERN.match(item.name):
+                        continue
+                    info = item.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                yield CacheEntryFile(
+                    path=Path(item.path),
+                    size=info.st_size,
+                    last_used=max(info.st_atime, info.st_mtime),
+                )
+
+
+def collect_garbage(
+    cache_dir: Path,
+    budget: CacheBudget,
+    *,
+    now: float | None = None,
+    dry_run: bool = False,
+) -> GcReport:
+    """Evict expired entries, then least-recently-used ones until within budget.
+
+    Args:
+        cache_dir: Cache directory to collect.
+        budget: Size and age limits to enforce.
+        now: Reference time in epoch seconds; defaults to the current time.
+        dry_run: When ``True`` report what would be evicted without deleting.
+
+    Returns:
+        GcReport: Summary of the collection pass.
+    """
+
+    reference = time.time() if now is None else now
+    entries = sorted(iter_cache_entries(cache_dir), key=lambda entry: entry.last_used)
+    report = GcReport(scanned=len(entries))
+    total = sum(entry.size for entry in entries)
+    cutoff = reference - budget.max_age_seconds if budget.max_age_seconds is not None else None
+    for entry in entries:
+        expired = cutoff is not None and entry.last_used < cutoff
+        oversized = budget.max_bytes is not None and total > budget.max_bytes
+        if not (expired or oversized):
+            # Entries are sorted oldest first, so nothing later is expired either.
+            break
+        if not dry_run and not _remove_entry(entry.path):
+            continue
+        report.removed += 1
+        report.freed_bytes += entry.size
+        total -= entry.size
+    report.remaining_bytes = total
+    return report
+
+
+def maybe_collect_garbage(
+    cache_dir: Path,
+    budget: CacheBudget,
+    *,
+    now: float | None = None,
+    interval: float = GC_INTERVAL_SECONDS,
+) -> GcReport | None:
+    """Collect ``cache_dir`` unless a collection ran within ``interval`` seconds.
+
+    The marker file is claimed before collecting, so concurrent runs sharing
+    a cache directory rarely scan it twice.
+
+    Args:
+        cache_dir: Cache directory to collect.
+        budget: Size and age limits to enforce.
+        now: Reference time in epoch seconds; defaults to the current time.
+        interval: Minimum number of seconds between collections.
+
+    Returns:
+        GcReport | None: Summary of the collection, or ``None`` when skipped.
+    """
+
+    if budget.unlimited or not cache_dir.is_dir():
+        return None
+    reference = time.time() if now is None else now
+    marker = cache_dir / GC_MARKER_FILE
+    try:
+        if reference - marker.stat().st_mtime < interval:
+            return None
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return None
+    try:
+        marker.touch()
+        os.utime(marker, (reference, reference))
+    except OSError:
+        return None
+    return collect_garbage(cache_dir, budget, now=reference)
+
+
+def touch_entry(path: Path) -> None:
+    """Mark the entry at ``path`` as just used, ignoring filesystem errors.
+
+    Args:
+        path: Entry file served from the cache.
+    """
+
+    try:
+        os.utime(path)
+    except OSError:
+        return
+
+
+def path_size(path: Path) -> int:
+    """Return the number of bytes stored in the file or tree at ``path``.
+
+    Args:
+        path: File or directory to measure; symlinks are not followed.
+
+    Returns:
+        int: Total size in bytes, or ``0`` when ``path`` does not exist.
+    """
+
+    try:
+        info = path.lstat()
+    except OSError:
+        return 0
+    if not path.is_dir() or path.is_symlink():
+        return info.st_size
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(directory, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def load_usage(cache_dir: Path) -> dict[str, ToolCacheUsage]:
+    """Return the lookup counters recorded in ``cache_dir``.
+
+    Args:
+        cache_dir: Directory that may contain the usage manifest.
+
+    Returns:
+        dict[str, ToolCacheUsage]: Counters keyed by tool name.
+    """
+
+    path = cache_dir / CACHE_USAGE_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, Mapping):
+        return {}
+    usage: dict[str, ToolCacheUsage] = {}
+    for tool, counters in data.items():
+        if not isinstance(tool, str) or not isinstance(counters, Mapping):
+            continue
+        hits = counters.get(_HITS_FIELD)
+        misses = counters.get(_MISSES_FIELD)
+        if isinstance(hits, int) and isinstance(misses, int):
+            usage[tool] = ToolCacheUsage(hits=hits, misses=misses)
+    return usage
+
+
+def record_usage(cache_dir: Path, run_usage: Mapping[str, ToolCacheUsage]) -> None:
+    """Add ``run_usage`` to the counters recorded in ``cache_dir``.
+
+    Args:
+        cache_dir: Directory where the usage manifest is stored.
+        run_usage: Counters gathered during the current run.
+    """
+
+    if not run_usage:
+        return
+    usage = load_usage(cache_dir)
+    for tool, counters in run_usage.items():
+        merged = usage.setdefault(tool, ToolCacheUsage())
+        merged.hits += counters.hits
+        merged.misses += counters.misses
+    payload = {
+        tool: {_HITS_FIELD: counters.hits, _MISSES_FIELD: counters.misses} for tool, counters in sorted(usage.items())
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / CACHE_USAGE_FILE).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    except OSError:
+        return
+
+
+def cache_stats(cache_dir: Path) -> CacheStats:
+    """Return entry counts, disk usage and hit rates for ``cache_dir``.
+
+    Binary entries are attributed to the tool recorded in their header; other
+    entries are grouped under a label describing their format.
+
+    Args:
+        cache_dir: Cache directory to inspect.
+
+    Returns:
+        CacheStats: Statistics describing the directory.
+    """
+
+    entries = 0
+    entry_bytes = 0
+    by_tool: dict[str, int] = {}
+    for entry in iter_cache_entries(cache_dir):
+        entries += 1
+        entry_bytes += entry.size
+        label = _entry_label(entry.path)
+        by_tool[label] = by_tool.get(label, 0) + 1
+    return CacheStats(
+        entries=entries,
+        entry_bytes=entry_bytes,
+        entries_by_tool=dict(sorted(by_tool.items())),
+        usage=load_usage(cache_dir),
+    )
+
+
+def _entry_label(path: Path) -> str:
+    """Return the tool or format label used to group ``path`` in statistics.
+
+    Args:
+        path: Entry file matching the content-addressed naming scheme.
+
+    Returns:
+        str: Tool recorded in a binary entry, or a format label.
+    """
+
+    match = _ENTRY_PATTERN.match(path.name)
+    suffix = match.group(1) if match else ""
+    if suffix == _JSON_SUFFIX:
+        return JSON_ENTRY_LABEL
+    if suffix != _BINARY_SUFFIX:
+        return REMOTE_ENTRY_LABEL
+    try:
+        return decode_entry(path.read_bytes()).tool or UNREADABLE_ENTRY_LABEL
+    except (OSError, CodecError):
+        return UNREADABLE_ENTRY_LABEL
+
+
+def _remove_entry(path: Path) -> bool:
+    """Delete the entry at ``path``.
+
+    Args:
+        path: Entry file to delete.
+
+    Returns:
+        bool: ``True`` when the entry is gone, ``False`` when deletion failed.
+    """
+
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        return False
+    return True
+
+
+__all__ = [
+    "BYTES_PER_MB",
+    "CACHE_USAGE_FILE",
+    "GC_INTERVAL_SECONDS",
+    "GC_MARKER_FILE",
+    "JSON_ENTRY_LABEL",
+    "REMOTE_ENTRY_LABEL",
+    "SECONDS_PER_DAY",
+    "UNREADABLE_ENTRY_LABEL",
+    "CacheBudget",
+    "CacheEntryFile",
+    "CacheStats",
+    "GcReport",
+    "ToolCacheUsage",
+    "cache_stats",
+    "collect_garbage",
+    "iter_cache_entries",
+    "load_usage",
+    "maybe_collect_garbage",
+    "path_size",
+    "record_usage",
+    "touch_entry",
+]
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Bounded JSON manifests whose entries are ordered from least to most recently recorded."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from itertools import islice
+from pathlib import Path
+
+
+def record_recent[ValueT](entries: dict[str, ValueT], key: str, value: ValueT) -> bool:
+    """Store ``value`` under ``key`` as the most recently recorded entry.
+
+    Args:
+        entries: Manifest entries ordered from least to most recently recorded.
+        key: Entry key.
+        value: Value to record.
+
+    Returns:
+        bool: ``True`` when ``entries`` changed and the manifest should be saved.
+    """
+
+    if entries.get(key) == value:
+        return False
+    entries.pop(key, None)
+    entries[key] = value
+    return True
+
+
+def load_manifest(path: Path) -> dict[str, object]:
+    """Return the raw entries stored in the manifest at ``path``.
+
+    Args:
+        path: Manifest file that may not exist yet.
+
+    Returns:
+        dict[str, object]: Decoded entries in file order, or an empty mapping
+        when the file is missing, unreadable or not a JSON object.
+    """
+
+    if not path.is_file():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {key: value for key, value in data.items() if isinstance(key, str)}
+
+
+def save_manifest(path: Path, entries: Mapping[str, object], *, max_entries: int) -> None:
+    """Write the ``max_entries`` most recently recorded ``entries`` to ``path``.
+
+    Args:
+        path: Manifest file to write; its parent directory is created on demand.
+        entries: JSON-serialisable entries ordered from least to most recently recorded.
+        max_entries: Maximum number of entries kept in the manifest.
+
+    Raises:
+        OSError: If the manifest cannot be written.
+    """
+
+    retained = islice(entries.items(), max(len(entries) - max_entries, 0), None)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(retained)), encoding="utf-8")
+
+
+__all__ = [
+    "load_manifest",
+    "record_recent",
+    "save_manifest",
+]
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Persist the prepared command each catalog command resolved to last run."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Final
+
+from .manifest import load_manifest, save_manifest
+
+_PREPARED_COMMANDS_FILE: Final[str] = "prepared-commands.json"
+_FIELD_SEPARATOR: Final[str] = "\0"
+MAX_PREPARED_COMMANDS: Final[int] = 1024
+
+
+def prepared_command_key(tool: str, action: str, token: str, command: Sequence[str]) -> str:
+    """Return the key identifying an unprepared catalog command.
+
+    Args:
+        tool: Tool name.
+        action: Action name.
+        token: Cache token derived from configuration.
+        command: Command built from the catalog definition before provisioning.
+
+    Returns:
+        str: Hex digest used as the manifest key.
+    """
+
+    material = _FIELD_SEPARATOR.join((tool, action, token, *command))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def load_prepared_commands(cache_dir: Path) -> dict[str, tuple[str, ...]]:
+    """Use this helper to read the prepared command manifest from ``cache_dir``.
+
+    Args:
+        cache_dir: Directory location that may contain the manifest.
+
+    Returns:
+        dict[str, tuple[str, ...]]: Prepared commands keyed by :func:`prepared_command_key`.
+    """
+
+    return {
+        key: tuple(value)
+        for key, value in load_manifest(cache_dir / _PREPARED_COMMANDS_FILE).items()
+        if isinstance(value, list) and all(isinstance(arg, str) for arg in value)
+    }
+
+
+def save_prepared_commands(cache_dir: Path, commands: Mapping[str, Sequence[str]]) -> None:
+    """Use this helper to write the prepared command manifest into ``cache_dir``.
+
+    Args:
+        cache_dir: Directory where the manifest should be stored.
+        commands: Prepared commands keyed by :func:`prepared_command_key`, oldest
+            first; only the newest :data:`MAX_PREPARED_COMMANDS` are written.
+    """
+
+    save_manifest(
+        cache_dir / _PREPARED_COMMANDS_FILE,
+        {key: list(value) for key, value in commands.items()},
+        max_entries=MAX_PREPARED_COMMANDS,
+    )
+
+
+__all__ = [
+    "MAX_PREPARED_COMMANDS",
+    "load_prepared_commands",
+    "prepared_command_key",
+    "save_prepared_commands",
+]
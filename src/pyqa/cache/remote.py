@@ -0,0 +1,629 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Content-addressed remote result cache shared between CI runners."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import http.client
+import json
+import queue
+import re
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, cast
+from urllib.parse import urlsplit
+
+from ..core.metrics import FileMetrics
+from ..core.models import ToolOutcome
+from ..core.serialization import deserialize_outcome, serialize_outcome
+from ..interfaces.cache import BufferedResultCache, CandidateCache, ResultCacheProtocol
+from ..interfaces.core import JsonValue
+from ..interfaces.metrics import FileMetricsProtocol
+from .codec import DiagnosticCandidate
+from .in_memory import memoize
+from .result_store import CachedEntry, CacheRequest
+
+REMOTE_CACHE_URL_ENV: Final[str] = "PYQA_REMOTE_CACHE_URL"
+REMOTE_CACHE_TOKEN_ENV: Final[str] = "PYQA_REMOTE_CACHE_TOKEN"
+ENTRIES_ROUTE: Final[str] = "/v1/entries/"
+BATCH_ROUTE: Final[str] = "/v1/batch"
+HEALTH_ROUTE: Final[str] = "/v1/health"
+BATCH_ENTRIES_KEY: Final[str] = "entries"
+GZIP_ENCODING: Final[str] = "gzip"
+JSON_CONTENT_TYPE: Final[str] = "application/json"
+_KEY_VERSION: Final[bytes] = b"pyqa-remote-v2"
+_FIELD_SEPARATOR: Final[bytes] = b"\0"
+_OUTCOME_FIELD: Final[str] = "outcome"
+_METRICS_FIELD: Final[str] = "file_metrics"
+_HTTPS_SCHEME: Final[str] = "https"
+_HTTP_OK: Final[int] = 200
+_HTTP_NO_CONTENT: Final[int] = 204
+_HTTP_NOT_FOUND: Final[int] = 404
+_HASH_CHUNK_SIZE: Final[int] = 1 << 20
+_DIGEST_MEMO_SIZE: Final[int] = 16384
+_RETRYABLE_ERRORS: Final[tuple[type[BaseException], ...]] = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class RemoteCacheError(RuntimeError):
+    """Raised when the remote cache responds unexpectedly or is unreachable."""
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteCacheSettings:
+    """Describe how to reach a remote result cache.
+
+    Attributes:
+        url: Base URL of the cache server, e.g. ``http://cache:8765``.
+        token: Optional bearer token sent with every request.
+        timeout: Socket timeout applied to each request in seconds.
+        pool_size: Maximum number of idle keep-alive connections retained.
+        batch_size: Number of buffered uploads sent per batch request.
+        max_failures: Consecutive transport failures tolerated before the
+            remote tier is disabled for the rest of the run.
+    """
+
+    url: str
+    token: str | None = None
+    timeout: float = 5.0
+    pool_size: int = 4
+    batch_size: int = 32
+    max_failures: int = 3
+
+
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections to a single host."""
+
+    def __init__(self, url: str, *, size: int, timeout: float) -> None:
+        """Initialise the pool for ``url``.
+
+        Args:
+            url: Base URL whose scheme, host, and port identify the server.
+            size: Maximum number of idle connections to retain.
+            timeout: Socket timeout applied to new connections.
+
+        Raises:
+            ValueError: If ``url`` does not name an HTTP(S) host.
+        """
+
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", _HTTPS_SCHEME} or not parts.hostname:
+            raise ValueError(f"remote cache URL must be an http(s) URL: {url!r}")
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=max(size, 1))
+
+    def path(self, route: str) -> str:
+        """Return the request path for ``route`` beneath the base URL.
+
+        Args:
+            route: Route beginning with ``/``.
+
+        Returns:
+            str: Absolute request path.
+        """
+
+        return f"{self._prefix}{route}"
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPConnection]:
+        """Yield a pooled connection, returning it when the caller succeeds.
+
+        Yields:
+            http.client.HTTPConnection: Connection ready for a request.
+        """
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open a new connection to the configured host.
+
+        Returns:
+            http.client.HTTPConnection: Unconnected HTTP(S) connection object.
+        """
+
+        if self._scheme == _HTTPS_SCHEME:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+
+
+class RemoteCacheClient:
+    """Minimal HTTP client for the ``pyqa cache serve`` protocol."""
+
+    def __init__(self, settings: RemoteCacheSettings) -> None:
+        """Initialise the client.
+
+        Args:
+            settings: Connection settings for the remote cache.
+        """
+
+        self.settings = settings
+        self._pool = _ConnectionPool(settings.url, size=settings.pool_size, timeout=settings.timeout)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the decompressed payload stored under ``key``.
+
+        Args:
+            key: Content-addressed cache key.
+
+        Returns:
+            bytes | None: JSON payload bytes, or ``None`` when the key is unknown.
+
+        Raises:
+            RemoteCacheError: If the server fails or cannot be reached.
+        """
+
+        status, body = self._request("GET", ENTRIES_ROUTE + key)
+        if status == _HTTP_NOT_FOUND:
+            return None
+        if status != _HTTP_OK:
+            raise RemoteCacheError(f"remote cache GET returned HTTP {status}")
+        return body
+
+    def put_many(self, entries: Mapping[str, bytes]) -> None:
+        """Upload ``entries`` in a single compressed batch request.
+
+        Args:
+            entries: JSON payload bytes keyed by content-addressed cache key.
+
+        Raises:
+            RemoteCacheError: If the server rejects the batch or cannot be reached.
+        """
+
+        if not entries:
+            return
+        document = {BATCH_ENTRIES_KEY: {key: json.loads(payload) for key, payload in entries.items()}}
+        body = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        status, _ = self._request("POST", BATCH_ROUTE, body=body)
+        if status not in {_HTTP_OK, _HTTP_NO_CONTENT}:
+            raise RemoteCacheError(f"remote cache batch upload returned HTTP {status}")
+
+    def close(self) -> None:
+        """Release pooled connections."""
+
+        self._pool.close()
+
+    def _request(self, method: str, route: str, *, body: bytes | None = None) -> tuple[int, bytes]:
+        """Issue ``method`` against ``route``, retrying once on stale keep-alives.
+
+        Args:
+            method: HTTP method.
+            route: Route beneath the configured base URL.
+            body: Optional uncompressed request body.
+
+        Returns:
+            tuple[int, bytes]: Response status and decompressed body.
+
+        Raises:
+            RemoteCacheError: If the request cannot be completed.
+        """
+
+        headers = {"Accept-Encoding": GZIP_ENCODING}
+        payload = None
+        if body is not None:
+            payload = gzip.compress(body)
+            headers.update({"Content-Type": JSON_CONTENT_TYPE, "Content-Encoding": GZIP_ENCODING})
+        if self.settings.token:
+            headers["Authorization"] = f"Bearer {self.settings.token}"
+        for attempt in range(2):
+            try:
+                with self._pool.connection() as conn:
+                    conn.request(method, self._pool.path(route), body=payload, headers=headers)
+                    response = conn.getresponse()
+                    raw = response.read()
+                    encoding = response.getheader("Content-Encoding")
+                    return response.status, gzip.decompress(raw) if encoding == GZIP_ENCODING and raw else raw
+            except _RETRYABLE_ERRORS as exc:
+                if attempt:
+                    raise RemoteCacheError(str(exc)) from exc
+            except (OSError, http.client.HTTPException, EOFError) as exc:
+                raise RemoteCacheError(str(exc)) from exc
+        raise RemoteCacheError(f"remote cache {method} {route} failed")
+
+
+@memoize(maxsize=_DIGEST_MEMO_SIZE)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """Return the SHA-256 of ``path``; cached per (mtime, size) snapshot.
+
+    Args:
+        path: Absolute file path.
+        mtime_ns: Modification time used to invalidate the memoized digest.
+        size: File size used to invalidate the memoized digest.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+
+    _ = (mtime_ns, size)
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def remote_cache_key(request: CacheRequest, root: Path) -> str | None:
+    """Return the content-addressed key identifying ``request`` across machines.
+
+    The key covers the tool, its resolved version, the action, cache token, the
+    command with the project root stripped, and the root-relative path plus
+    content hash of every input file. Checkouts at different absolute paths
+    therefore share entries, while runners with different tool versions do not.
+
+    Args:
+        request: Cache request issued by the orchestrator.
+        root: Project root used to relativise paths.
+
+    Returns:
+        str | None: Hex key, or ``None`` when the tool version is unknown or an
+        input file cannot be read.
+    """
+
+    if request.version is None:
+        return None
+    root_prefix = _root_prefix_pattern(str(root))
+    digest = hashlib.sha256(_KEY_VERSION)
+    for part in (request.tool, request.version, request.action, request.token):
+        digest.update(_FIELD_SEPARATOR + part.encode("utf-8"))
+    for arg in request.command:
+        digest.update(_FIELD_SEPARATOR + root_prefix.sub(".", arg).encode("utf-8"))
+    entries: list[tuple[str, str]] = []
+    for file_path in request.files:
+        resolved = file_path if file_path.is_absolute() else root / file_path
+        try:
+            stat = resolved.stat()
+            content_hash = _file_digest(str(resolved), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+        try:
+            label = resolved.relative_to(root).as_posix()
+        except ValueError:
+            label = resolved.as_posix()
+        entries.append((label, content_hash))
+    for label, content_hash in sorted(entries):
+        digest.update(_FIELD_SEPARATOR + label.encode("utf-8") + _FIELD_SEPARATOR + content_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
+@memoize(maxsize=8)
+def _root_prefix_pattern(root_text: str) -> re.Pattern[str]:
+    """Return a pattern matching ``root_text`` where it prefixes a whole path.
+
+    The root only matches at the start of an argument or after ``=``, ``:`` or
+    ``,`` (as in ``--config=/repo/setup.cfg``), and only when followed by a path
+    separator or the end of the argument, so ``/a/b`` never rewrites ``/a/bc``.
+
+    Args:
+        root_text: Absolute project root.
+
+    Returns:
+        re.Pattern[str]: Compiled prefix pattern.
+    """
+
+    return re.compile(rf"(?<![^=:,]){re.escape(root_text)}(?=$|[/\\])")
+
+
+@dataclass(slots=True)
+class RemoteCacheStats:
+    """Counters describing remote cache traffic for a run."""
+
+    hits: int = 0
+    misses: int = 0
+    uploads: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class _UploadQueue:
+    """Write-behind queue drained by a single background uploader."""
+
+    pending: queue.Queue[tuple[str, bytes]] = field(default_factory=queue.Queue)
+    worker: threading.Thread | None = None
+
+
+class RemoteResultCache(BufferedResultCache, CandidateCache):
+    """Layer a shared remote cache behind a local :class:`ResultCacheProtocol`.
+
+    Reads consult the local cache first and fall back to the remote server,
+    writing remote hits through to the local cache. Writes land locally right
+    away and are uploaded in compressed batches by a background thread; call
+    :meth:`flush` before the process exits. Transport failures never fail the
+    run: after ``max_failures`` consecutive errors the remote tier is disabled.
+    """
+
+    def __init__(self, local: ResultCacheProtocol, client: RemoteCacheClient, *, root: Path) -> None:
+        """Initialise the layered cache.
+
+        Args:
+            local: Local cache consulted first and populated on remote hits.
+            client: HTTP client used to talk to the remote server.
+            root: Project root used to build machine-independent keys.
+        """
+
+        self._local = local
+        self._client = client
+        self._root = root.resolve()
+        self._uploads = _UploadQueue()
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._disabled = False
+        self.stats = RemoteCacheStats()
+
+    def load(self, request: CacheRequest) -> CachedEntry | None:
+        """Return a cached entry from the local cache or the remote server.
+
+        Args:
+            request: Cache request describing the tool invocation.
+
+        Returns:
+            CachedEntry | None: Cached entry when either tier has it.
+        """
+
+        entry = self._local.load(request)
+        if entry is not None or not self._enabled():
+            return entry
+        key = remote_cache_key(request, self._root)
+        if key is None:
+            return None
+        try:
+            payload = self._client.get(key)
+        except RemoteCacheError:
+            self._record_failure()
+            return None
+        self._record_success()
+        entry = _decode_entry(payload) if payload is not None else None
+        with self._lock:
+            if entry is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        if entry is not None:
+            self._local.store(request, outcome=entry.outcome, file_metrics=entry.file_metrics)
+        return entry
+
+    def store(
+        self,
+        request: CacheRequest,
+        *,
+        outcome: ToolOutcome,
+        file_metrics: Mapping[str, FileMetricsProtocol] | None = None,
+    ) -> None:
+        """Persist ``outcome`` locally and queue it for remote upload.
+
+        Args:
+            request: Cache request describing the tool invocation.
+            outcome: Outcome produced by the tool.
+            file_metrics: Optional metrics associated with the outcome.
+        """
+
+        self._local.store(request, outcome=outcome, file_metrics=file_metrics)
+        if not self._enabled():
+            return
+        key = remote_cache_key(request, self._root)
+        if key is None:
+            return
+        self._uploads.pending.put((key, _encode_entry(outcome, file_metrics)))
+        self._ensure_uploader()
+
+    def load_candidates(self, request: CacheRequest) -> tuple[DiagnosticCandidate, ...] | None:
+        """Return parser candidates from the local cache.
+
+        Parser candidates are derived from tool output that the remote tier
+        already shares, so they are kept local.
+
+        Args:
+            request: Cache request identifying the parser invocation.
+
+        Returns:
+            tuple[DiagnosticCandidate, ...] | None: Cached candidates, if any.
+        """
+
+        if isinstance(self._local, CandidateCache):
+            return self._local.load_candidates(request)
+        return None
+
+    def store_candidates(self, request: CacheRequest, candidates: Sequence[DiagnosticCandidate]) -> None:
+        """Persist parser candidates in the local cache.
+
+        Args:
+            request: Cache request identifying the parser invocation.
+            candidates: Raw and structured diagnostics produced by the parser.
+        """
+
+        if isinstance(self._local, CandidateCache):
+            self._local.store_candidates(request, candidates)
+
+    def flush(self) -> None:
+        """Wait until every queued upload has been sent or dropped."""
+
+        self._uploads.pending.join()
+
+    def close(self) -> None:
+        """Flush pending uploads and release pooled connections."""
+
+        self.flush()
+        self._client.close()
+
+    def _ensure_uploader(self) -> None:
+        """Start the background uploader thread when it is not running."""
+
+        with self._lock:
+            worker = self._uploads.worker
+            if worker is not None and worker.is_alive():
+                return
+            worker = threading.Thread(target=self._drain_uploads, name="pyqa-remote-cache", daemon=True)
+            self._uploads.worker = worker
+            worker.start()
+
+    def _drain_uploads(self) -> None:
+        """Upload queued entries in batches until the process exits."""
+
+        pending = self._uploads.pending
+        batch_size = max(self._client.settings.batch_size, 1)
+        while True:
+            key, payload = pending.get()
+            batch = {key: payload}
+            taken = 1
+            while taken < batch_size:
+                try:
+                    key, payload = pending.get_nowait()
+                except queue.Empty:
+                    break
+                batch[key] = payload
+                taken += 1
+            try:
+                if self._enabled():
+                    self._client.put_many(batch)
+                    self._record_success()
+                    with self._lock:
+                        self.stats.uploads += len(batch)
+            except RemoteCacheError:
+                self._record_failure()
+            finally:
+                for _ in range(taken):
+                    pending.task_done()
+
+    def _enabled(self) -> bool:
+        """Return whether the remote tier is still active.
+
+        Returns:
+            bool: ``False`` once the failure budget is exhausted.
+        """
+
+        with self._lock:
+            return not self._disabled
+
+    def _record_failure(self) -> None:
+        """Count a transport failure and disable the remote tier when exhausted."""
+
+        with self._lock:
+            self.stats.errors += 1
+            self._failures += 1
+            if self._failures >= self._client.settings.max_failures:
+                self._disabled = True
+
+    def _record_success(self) -> None:
+        """Reset the consecutive failure counter."""
+
+        with self._lock:
+            self._failures = 0
+
+
+def _encode_entry(outcome: ToolOutcome, file_metrics: Mapping[str, FileMetricsProtocol] | None) -> bytes:
+    """Return the JSON payload uploaded for ``outcome``.
+
+    Args:
+        outcome: Tool outcome to serialise.
+        file_metrics: Optional per-file metrics.
+
+    Returns:
+        bytes: Compact UTF-8 JSON document.
+    """
+
+    metrics = {
+        path: FileMetrics(line_count=metric.line_count, suppressions=dict(metric.suppressions)).to_payload()
+        for path, metric in (file_metrics or {}).items()
+    }
+    document = {_OUTCOME_FIELD: serialize_outcome(outcome), _METRICS_FIELD: metrics}
+    return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_entry(payload: bytes) -> CachedEntry | None:
+    """Return the cached entry encoded in ``payload``.
+
+    Args:
+        payload: JSON document produced by :func:`_encode_entry`.
+
+    Returns:
+        CachedEntry | None: Decoded entry, or ``None`` when the payload is malformed.
+    """
+
+    try:
+        document = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(document, Mapping):
+        return None
+    raw_outcome = document.get(_OUTCOME_FIELD)
+    if not isinstance(raw_outcome, Mapping):
+        return None
+    outcome = deserialize_outcome(cast(Mapping[str, JsonValue], raw_outcome))
+    outcome.cached = True
+    raw_metrics = document.get(_METRICS_FIELD)
+    metrics: dict[str, FileMetricsProtocol] = {}
+    if isinstance(raw_metrics, Mapping):
+        for path, metric_payload in raw_metrics.items():
+            if isinstance(path, str) and isinstance(metric_payload, Mapping):
+                metric = FileMetrics.from_payload(cast(Mapping[str, JsonValue], metric_payload))
+                metric.ensure_labels()
+                metrics[path] = metric
+    return CachedEntry(outcome=outcome, file_metrics=metrics)
+
+
+def wrap_remote_cache(
+    local: ResultCacheProtocol,
+    settings: RemoteCacheSettings,
+    *,
+    root: Path,
+) -> RemoteResultCache:
+    """Return ``local`` layered behind the remote cache described by ``settings``.
+
+    Args:
+        local: Local result cache.
+        settings: Remote connection settings.
+        root: Project root used for machine-independent keys.
+
+    Returns:
+        RemoteResultCache: Layered read-through/write-behind cache.
+    """
+
+    return RemoteResultCache(local, RemoteCacheClient(settings), root=root)
+
+
+__all__ = [
+    "BATCH_ROUTE",
+    "ENTRIES_ROUTE",
+    "HEALTH_ROUTE",
+    "REMOTE_CACHE_TOKEN_ENV",
+    "REMOTE_CACHE_URL_ENV",
+    "RemoteCacheClient",
+    "RemoteCacheError",
+    "RemoteCacheSettings",
+    "RemoteCacheStats",
+    "RemoteResultCache",
+    "remote_cache_key",
+    "wrap_remote_cache",
+]
@@ -0,0 +1,371 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Self-hosted HTTP server backing the remote result cache."""
+
+from __future__ import annotations
+
+import errno
+import gzip
+import hmac
+import json
+import os
+import re
+import tempfile
+import zlib
+from collections.abc import Mapping
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Final, cast
+
+from .maintenance import touch_entry
+from .remote import BATCH_ENTRIES_KEY, BATCH_ROUTE, ENTRIES_ROUTE, GZIP_ENCODING, HEALTH_ROUTE, JSON_CONTENT_TYPE
+
+DEFAULT_HOST: Final[str] = "127.0.0.1"
+DEFAULT_PORT: Final[int] = 8765
+MAX_BODY_BYTES: Final[int] = 64 * 1024 * 1024
+_KEY_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[0-9a-f]{64}$")
+_SHARD_WIDTH: Final[int] = 2
+_ENTRY_SUFFIX: Final[str] = ".json.gz"
+_GZIP_WBITS: Final[int] = 16 + zlib.MAX_WBITS
+_STORAGE_FULL_ERRNOS: Final[frozenset[int]] = frozenset({errno.ENOSPC, errno.EDQUOT})
+
+
+class RemoteCacheStore:
+    """Content-addressed, sharded on-disk store of compressed cache payloads."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialise the store rooted at ``directory``.
+
+        Args:
+            directory: Directory receiving cache entries; created on demand.
+        """
+
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def read(self, key: str) -> bytes | None:
+        """Return the gzip-compressed payload stored under ``key``.
+
+        Reads refresh the entry's modification time so ``pyqa cache gc`` evicts
+        the store least-recently-used first.
+
+        Args:
+            key: Hex SHA-256 cache key.
+
+        Returns:
+            bytes | None: Compressed payload, or ``None`` when absent.
+        """
+
+        path = self._entry_path(key)
+        try:
+            payload = path.read_bytes()
+        except OSError:
+            return None
+        touch_entry(path)
+        return payload
+
+    def write(self, key: str, compressed: bytes) -> None:
+        """Atomically persist a gzip-compressed payload under ``key``.
+
+        Args:
+            key: Hex SHA-256 cache key.
+            compressed: Gzip-compressed JSON payload.
+        """
+
+        target = self._entry_path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(compressed)
+            os.replace(tmp_name, target)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the sharded path for ``key``.
+
+        Args:
+            key: Hex SHA-256 cache key.
+
+        Returns:
+            Path: Location of the entry file.
+        """
+
+        return self.directory / key[:_SHARD_WIDTH] / f"{key}{_ENTRY_SUFFIX}"
+
+
+def is_valid_key(key: str) -> bool:
+    """Return whether ``key`` is a well-formed cache key.
+
+    Args:
+        key: Candidate key extracted from a request path.
+
+    Returns:
+        bool: ``True`` for lowercase hex SHA-256 digests.
+    """
+
+    return bool(_KEY_PATTERN.match(key))
+
+
+class RemoteCacheServer(ThreadingHTTPServer):
+    """Threaded HTTP server exposing a :class:`RemoteCacheStore`."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], store: RemoteCacheStore, *, token: str | None = None) -> None:
+        """Bind the server to ``address``.
+
+        Args:
+            address: Host and port to listen on; port ``0`` picks a free port.
+            store: Backing store for cache entries.
+            token: Optional bearer token required on every request.
+        """
+
+        super().__init__(address, _RemoteCacheHandler)
+        self.store = store
+        self.token = token
+
+
+class _RemoteCacheHandler(BaseHTTPRequestHandler):
+    """Serve the ``/v1`` remote cache protocol."""
+
+    protocol_version = "HTTP/1.1"
+    server: RemoteCacheServer
+
+    def do_GET(self) -> None:
+        """Return a stored entry or the health probe."""
+
+        if not self._authorised():
+            return
+        if self.path == HEALTH_ROUTE:
+            self._respond(HTTPStatus.OK, b'{"status":"ok"}')
+            return
+        key = self._entry_key()
+        if key is None:
+            return
+        compressed = self.server.store.read(key)
+        if compressed is None:
+            self._respond(HTTPStatus.NOT_FOUND)
+            return
+        self._respond(HTTPStatus.OK, compressed, compressed=True)
+
+    def do_PUT(self) -> None:
+        """Store a single entry."""
+
+        if not self._authorised():
+            return
+        key = self._entry_key()
+        if key is None:
+            return
+        body = self._read_body()
+        if body is None:
+            return
+        if self._write_entries({key: gzip.compress(body)}):
+            self._respond(HTTPStatus.NO_CONTENT)
+
+    def do_POST(self) -> None:
+        """Store a batch of entries."""
+
+        if not self._authorised():
+            return
+        if self.path != BATCH_ROUTE:
+            self._respond(HTTPStatus.NOT_FOUND)
+            return
+        body = self._read_body()
+        if body is None:
+            return
+        try:
+            document = json.loads(body)
+        except ValueError:
+            self._respond(HTTPStatus.BAD_REQUEST)
+            return
+        entries = document.get(BATCH_ENTRIES_KEY) if isinstance(document, Mapping) else None
+        if not isinstance(entries, Mapping) or not all(is_valid_key(str(key)) for key in entries):
+            self._respond(HTTPStatus.BAD_REQUEST)
+            return
+        compressed = {
+            key: gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+            for key, payload in cast(Mapping[str, object], entries).items()
+        }
+        if self._write_entries(compressed):
+            self._respond(HTTPStatus.NO_CONTENT)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence per-request logging.
+
+        Args:
+            format: Printf-style format string supplied by the base class.
+            *args: Format arguments.
+        """
+
+        _ = (format, args)
+
+    def _authorised(self) -> bool:
+        """Return whether the request carries the configured bearer token.
+
+        Returns:
+            bool: ``True`` when no token is configured or the token matches.
+        """
+
+        expected = self.server.token
+        if not expected:
+            return True
+        supplied = self.headers.get("Authorization", "")
+        if hmac.compare_digest(supplied, f"Bearer {expected}"):
+            return True
+        self._discard_body()
+        self._respond(HTTPStatus.UNAUTHORIZED)
+        return False
+
+    def _entry_key(self) -> str | None:
+        """Return the entry key from the path, responding with 404 when invalid.
+
+        Returns:
+            str | None: Validated key, or ``None`` after an error response.
+        """
+
+        key = self.path[len(ENTRIES_ROUTE) :] if self.path.startswith(ENTRIES_ROUTE) else ""
+        if is_valid_key(key):
+            return key
+        self._discard_body()
+        self._respond(HTTPStatus.NOT_FOUND)
+        return None
+
+    def _read_body(self) -> bytes | None:
+        """Return the decompressed request body, enforcing the size limit.
+
+        The limit applies to the compressed and the decompressed body alike,
+        so small gzip bombs are rejected without being inflated.
+
+        Returns:
+            bytes | None: Request body, or ``None`` after an error response.
+        """
+
+        length = self._content_length()
+        if length is None:
+            self.close_connection = True
+            status = HTTPStatus.LENGTH_REQUIRED if "Content-Length" not in self.headers else HTTPStatus.BAD_REQUEST
+            self._respond(status)
+            return None
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._respond(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return None
+        raw = self.rfile.read(length)
+        if self.headers.get("Content-Encoding") != GZIP_ENCODING:
+            return raw
+        decompressor = zlib.decompressobj(_GZIP_WBITS)
+        try:
+            body = decompressor.decompress(raw, MAX_BODY_BYTES + 1)
+        except zlib.error:
+            self._respond(HTTPStatus.BAD_REQUEST)
+            return None
+        if len(body) > MAX_BODY_BYTES or decompressor.unconsumed_tail:
+            self._respond(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return None
+        if not decompressor.eof:
+            self._respond(HTTPStatus.BAD_REQUEST)
+            return None
+        return body
+
+    def _content_length(self) -> int | None:
+        """Return the declared request body length.
+
+        Returns:
+            int | None: Body length, or ``None`` when the header is missing,
+            malformed or negative.
+        """
+
+        raw = self.headers.get("Content-Length")
+        if raw is None:
+            return None
+        try:
+            length = int(raw)
+        except ValueError:
+            return None
+        return length if length >= 0 else None
+
+    def _discard_body(self) -> None:
+        """Consume any unread request body so the connection can be reused."""
+
+        length = self._content_length()
+        if length is None:
+            self.close_connection = "Content-Length" in self.headers
+        elif 0 < length <= MAX_BODY_BYTES:
+            self.rfile.read(length)
+        elif length:
+            self.close_connection = True
+
+    def _write_entries(self, entries: Mapping[str, bytes]) -> bool:
+        """Persist compressed ``entries``, responding with a 5xx status on failure.
+
+        Args:
+            entries: Gzip-compressed payloads keyed by entry key.
+
+        Returns:
+            bool: ``True`` when every entry was written.
+        """
+
+        try:
+            for key, compressed in entries.items():
+                self.server.store.write(key, compressed)
+        except OSError as exc:
+            full = exc.errno in _STORAGE_FULL_ERRNOS
+            self._respond(HTTPStatus.INSUFFICIENT_STORAGE if full else HTTPStatus.INTERNAL_SERVER_ERROR)
+            return False
+        return True
+
+    def _respond(self, status: HTTPStatus, body: bytes = b"", *, compressed: bool = False) -> None:
+        """Send a response with ``body``.
+
+        Args:
+            status: HTTP status to send.
+            body: Response body bytes.
+            compressed: Whether ``body`` is already gzip-compressed.
+        """
+
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", JSON_CONTENT_TYPE)
+        if compressed:
+            self.send_header("Content-Encoding", GZIP_ENCODING)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def create_server(
+    directory: Path,
+    *,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    token: str | None = None,
+) -> RemoteCacheServer:
+    """Return a bound (but not yet serving) remote cache server.
+
+    Args:
+        directory: Directory used to persist cache entries.
+        host: Interface to bind.
+        port: Port to bind; ``0`` selects a free port.
+        token: Optional bearer token required from clients.
+
+    Returns:
+        RemoteCacheServer: Server ready for ``serve_forever``.
+    """
+
+    return RemoteCacheServer((host, port), RemoteCacheStore(directory), token=token)
+
+
+__all__ = [
+    "DEFAULT_HOST",
+    "DEFAULT_PORT",
+    "MAX_BODY_BYTES",
+    "RemoteCacheServer",
+    "RemoteCacheStore",
+    "create_server",
+    "is_valid_key",
+]
@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Fingerprint the configuration inputs each tool reads outside the linted files."""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import re
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+_GLOB_MAGIC: Final[re.Pattern[str]] = re.compile(r"[*?\[]")
+_FIELD_SEPARATOR: Final[str] = "\0"
+_ABSENT: Final[str] = "-"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolInputSpec:
+    """Configuration inputs declared for a single tool.
+
+    Attributes:
+        files: File names or glob patterns, relative to the project root or absolute.
+            Bare names (without a directory part) also match in every directory
+            between the project root and a linted file.
+        env: Environment variables whose values influence the tool's output.
+    """
+
+    files: tuple[str, ...] = ()
+    env: tuple[str, ...] = ()
+
+
+class ToolInputFingerprints:
+    """Lazily hash the declared inputs of each tool once per run.
+
+    File digests are shared between tools, so a ``pyproject.toml`` read by
+    several linters is hashed a single time. Nested configuration files such as
+    a package-level ``.eslintrc.json`` are picked up from the ancestor
+    directories of the linted files; each directory is listed once per run.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        specs: Mapping[str, ToolInputSpec],
+        *,
+        files: Iterable[Path] = (),
+        environ: Mapping[str, str] | None = None,
+    ) -> None:
+        """Bind the fingerprints to ``root`` and the declared ``specs``.
+
+        Args:
+            root: Project root that relative patterns are resolved against.
+            specs: Declared inputs keyed by tool name.
+            files: Files linted in this run; their ancestor directories up to
+                ``root`` are searched for bare configuration file names.
+            environ: Environment consulted for variables; defaults to ``os.environ``.
+        """
+
+        self._root = root
+        self._specs = {name: spec for name, spec in specs.items() if spec.files or spec.env}
+        self._environ = os.environ if environ is None else environ
+        self._directories = _ancestor_directories(root, files)
+        self._file_digests: dict[Path, str] = {}
+        self._listings: dict[Path, tuple[str, ...]] = {}
+        self._tool_digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, tool_name: str) -> str | None:
+        """Return the fingerprint of the inputs declared for ``tool_name``.
+
+        Args:
+            tool_name: Name of the tool whose inputs should be fingerprinted.
+
+        Returns:
+            str | None: Hex digest, or ``None`` when the tool declares no inputs.
+        """
+
+        spec = self._specs.get(tool_name)
+        if spec is None:
+            return None
+        with self._lock:
+            cached = self._tool_digests.get(tool_name)
+        if cached is not None:
+            return cached
+        fields: list[str] = []
+        for pattern in sorted(set(spec.files)):
+            fields.append(pattern)
+            for path in self._expand(pattern):
+                label = path.relative_to(self._root) if path.is_relative_to(self._root) else path
+                fields.extend(("", label.as_posix(), self._file_digest(path)))
+        for name in sorted(set(spec.env)):
+            value = self._environ.get(name)
+            fields.extend((name, _ABSENT if value is None else f"={value}"))
+        result = hashlib.sha256(_FIELD_SEPARATOR.join(fields).encode("utf-8")).hexdigest()
+        with self._lock:
+            self._tool_digests[tool_name] = result
+        return result
+
+    def _expand(self, pattern: str) -> list[Path]:
+        """Return the files matched by ``pattern`` in a stable order.
+
+        Args:
+            pattern: File name or glob pattern.
+
+        Returns:
+            list[Path]: Existing files matched by ``pattern``.
+        """
+
+        candidate = Path(pattern)
+        if len(candidate.parts) == 1 and not candidate.is_absolute():
+            return [
+                directory / name
+                for directory in self._directories
+                for name in self._listing(directory)
+                if fnmatch.fnmatchcase(name, pattern)
+            ]
+        if not _GLOB_MAGIC.search(pattern):
+            resolved = candidate if candidate.is_absolute() else self._root / candidate
+            return [resolved] if resolved.is_file() else []
+        if candidate.is_absolute():
+            anchor = Path(candidate.anchor)
+            matches = anchor.glob(str(candidate.relative_to(anchor)))
+        else:
+            matches = self._root.glob(pattern)
+        return sorted(path for path in matches if path.is_file())
+
+    def _listing(self, directory: Path) -> tuple[str, ...]:
+        """Return the memoised, sorted names of the files in ``directory``.
+
+        Args:
+            directory: Directory whose entries should be listed.
+
+        Returns:
+            tuple[str, ...]: Names of the regular files in ``directory``.
+        """
+
+        with self._lock:
+            cached = self._listings.get(directory)
+        if cached is not None:
+            return cached
+        try:
+            with os.scandir(directory) as entries:
+                names = tuple(sorted(entry.name for entry in entries if entry.is_file()))
+        except OSError:
+            names = ()
+        with self._lock:
+            self._listings[directory] = names
+        return names
+
+    def _file_digest(self, path: Path) -> str:
+        """Return the memoised content digest of ``path``.
+
+        Args:
+            path: File whose contents should be hashed.
+
+        Returns:
+            str: Hex digest of the contents, or a marker when the file is unreadable.
+        """
+
+        with self._lock:
+            cached = self._file_digests.get(path)
+        if cached is not None:
+            return cached
+        try:
+            with path.open("rb") as handle:
+                digest = hashlib.file_digest(handle, "sha256").hexdigest()
+        except OSError:
+            digest = _ABSENT
+        with self._lock:
+            self._file_digests[path] = digest
+        return digest
+
+
+def _ancestor_directories(root: Path, files: Iterable[Path]) -> tuple[Path, ...]:
+    """Return ``root`` plus every directory between it and one of ``files``.
+
+    Args:
+        root: Project root bounding the search.
+        files: Linted files; paths outside ``root`` are ignored.
+
+    Returns:
+        tuple[Path, ...]: Sorted directories, always including ``root``.
+    """
+
+    directories = {root}
+    for path in files:
+        candidate = path if path.is_absolute() else root / path
+        if not candidate.is_relative_to(root):
+            continue
+        directory = candidate.parent
+        while directory not in directories and directory.is_relative_to(root):
+            directories.add(directory)
+            directory = directory.parent
+    return tuple(sorted(directories))
+
+
+__all__ = ["ToolInputFingerprints", "ToolInputSpec"]
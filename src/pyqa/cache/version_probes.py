@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Persist version-probe output keyed by the identity of the probed executable."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Final
+
+from .manifest import load_manifest, record_recent, save_manifest
+
+_VERSION_PROBES_FILE: Final[str] = "version-probes.json"
+_FIELD_SEPARATOR: Final[str] = "\0"
+MAX_VERSION_PROBES: Final[int] = 512
+_INTERPRETER_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^(?:python[\d.]*|pypy[\d.]*|node|nodejs|ruby|perl|php)(?:\.exe)?$",
+    re.IGNORECASE,
+)
+_INLINE_CODE_FLAGS: Final[frozenset[str]] = frozenset({"-c", "-m", "-e", "--eval", "-p", "--print"})
+
+
+@dataclass(frozen=True, slots=True)
+class VersionProbeResult:
+    """Captured output of a version command."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def version_probe_key(command: Sequence[str], *, env: Mapping[str, str] | None = None) -> str | None:
+    """Return the cache key identifying ``command`` and the executable it runs.
+
+    The key combines the resolved executable path with its size and
+    modification time, so upgrading or replacing a tool invalidates the entry.
+    Probes that run inline code or a module through an interpreter (such as
+    ``python -c "...version('pyupgrade')"``) report on files the key cannot
+    see, so they are never cached.
+
+    Args:
+        command: Version command whose first element names the executable.
+        env: Environment the probe runs with; its ``PATH`` locates the
+            executable exactly as the subprocess would. Defaults to ``os.environ``.
+
+    Returns:
+        str | None: Hex digest, or ``None`` when the executable cannot be found
+        or the probe runs code through an interpreter.
+    """
+
+    if not command or _runs_inline_code(command):
+        return None
+    located = shutil.which(command[0], path=os.pathsep.join(os.get_exec_path(env)))
+    if located is None:
+        return None
+    try:
+        resolved = os.path.realpath(located)
+        stat_result = os.stat(resolved)
+    except OSError:
+        return None
+    material = _FIELD_SEPARATOR.join(
+        (resolved, str(stat_result.st_size), str(stat_result.st_mtime_ns), *command[1:]),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _runs_inline_code(command: Sequence[str]) -> bool:
+    """Return whether ``command`` asks an interpreter to run inline code or a module.
+
+    Args:
+        command: Version command whose first element names the executable.
+
+    Returns:
+        bool: ``True`` when the probe's output depends on more than the executable.
+    """
+
+    if _INTERPRETER_PATTERN.match(Path(command[0]).name) is None:
+        return False
+    return any(arg in _INLINE_CODE_FLAGS for arg in command[1:])
+
+
+class VersionProbeCache:
+    """Thread-safe manifest of version-probe results stored under a cache directory.
+
+    Only successful probes are recorded, so a tool that failed once (missing
+    dependency, broken install) is probed again on the next run.
+    """
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        """Load previously recorded probes from ``cache_dir``.
+
+        Args:
+            cache_dir: Directory holding the manifest; ``None`` keeps the cache in memory.
+        """
+
+        self._path = cache_dir / _VERSION_PROBES_FILE if cache_dir is not None else None
+        self._entries = _load_entries(self._path) if self._path is not None else {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def get(self, key: str) -> VersionProbeResult | None:
+        """Return the recorded probe for ``key`` when present.
+
+        Args:
+            key: Key produced by :func:`version_probe_key`.
+
+        Returns:
+            VersionProbeResult | None: Cached probe output.
+        """
+
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, result: VersionProbeResult) -> None:
+        """Record ``result`` under ``key`` when the probe succeeded.
+
+        Args:
+            key: Key produced by :func:`version_probe_key`.
+            result: Probe output to remember; non-zero exits are ignored.
+        """
+
+        if result.returncode != 0:
+            return
+        with self._lock:
+            if record_recent(self._entries, key, result):
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the newest :data:`MAX_VERSION_PROBES` probes when any were added since loading."""
+
+        with self._lock:
+            if self._path is None or not self._dirty:
+                return
+            entries = {key: asdict(result) for key, result in self._entries.items()}
+            try:
+                save_manifest(self._path, entries, max_entries=MAX_VERSION_PROBES)
+            except OSError:
+                return
+            self._dirty = False
+
+
+def _load_entries(path: Path) -> dict[str, VersionProbeResult]:
+    """Return probe results stored at ``path``.
+
+    Args:
+        path: Manifest file that may not exist yet.
+
+    Returns:
+        dict[str, VersionProbeResult]: Results keyed by :func:`version_probe_key`.
+    """
+
+    entries: dict[str, VersionProbeResult] = {}
+    for key, value in load_manifest(path).items():
+        if not isinstance(value, dict):
+            continue
+        returncode = value.get("returncode")
+        stdout = value.get("stdout")
+        stderr = value.get("stderr")
+        if returncode == 0 and isinstance(stdout, str) and isinstance(stderr, str):
+            entries[key] = VersionProbeResult(returncode=returncode, stdout=stdout, stderr=stderr)
+    return entries
+
+
+__all__ = [
+    "MAX_VERSION_PROBES",
+    "VersionProbeCache",
+    "VersionProbeResult",
+    "version_probe_key",
+]
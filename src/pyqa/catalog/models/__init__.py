@@ -42,6 +42,7 @@ StrategyReference = _model_references.StrategyReference
 StrategyType = _model_strategy.StrategyType
 SuppressionsDefinition = _model_diagnostics.SuppressionsDefinition
 ToolBehaviour = _model_tool.ToolBehaviour
+ToolCacheInputs = _model_tool.ToolCacheInputs
 ToolComponents = _model_tool.ToolComponents
 ToolDefinition = _model_tool.ToolDefinition
 ToolFiles = _model_tool.ToolFiles
@@ -80,6 +81,7 @@ __all__ = (
     "StrategyType",
     "SuppressionsDefinition",
     "ToolBehaviour",
+    "ToolCacheInputs",
     "ToolComponents",
     "ToolDefinition",
     "ToolFiles",
@@ -10,7 +10,7 @@ from .plan import (
     CleanPlanItem,
     CleanPlanner,
 )
-from .runner import CleanResult, sparkly_clean
+from .runner import CleanResult, format_size, sparkly_clean
 
 __all__ = [
     "CleanPlan",
@@ -18,5 +18,6 @@ __all__ = [
     "CleanPlanner",
     "CleanResult",
     "PROTECTED_DIRECTORIES",
+    "format_size",
     "sparkly_clean",
 ]
@@ -4,19 +4,24 @@
 
 from __future__ import annotations
 
+import glob
+import os
+import re
 import shutil
+import stat
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final
 
 from pyqa.config import CleanConfig
-from pyqa.core.config.constants import PYQA_LINT_DIR_NAME
+from pyqa.core.config.constants import ALWAYS_EXCLUDE_DIRS, PYQA_LINT_DIR_NAME
 from pyqa.core.logging import info, warn
-from pyqa.discovery.utils import iter_paths
 from pyqa.platform.workspace import is_pyqa_lint_workspace
 
 PROTECTED_DIRECTORIES: Final[set[str]] = {".git", ".hg", ".svn"}
+_PRUNED_DIRECTORIES: Final[frozenset[str]] = frozenset(ALWAYS_EXCLUDE_DIRS | PROTECTED_DIRECTORIES)
+_RECURSIVE_PREFIX: Final[str] = "**/"
 
 
 @dataclass(slots=True)
@@ -24,6 +29,7 @@ class CleanPlanItem:
     """Describe a single filesystem path scheduled for cleanup."""
 
     path: Path
+    size: int = 0
 
 
 @dataclass(slots=True)
@@ -43,6 +49,16 @@ class CleanPlan:
 
         return [item.path for item in self.items]
 
+    @property
+    def total_bytes(self) -> int:
+        """Return the number of bytes reclaimed when the plan executes.
+
+        Returns:
+            int: Sum of the on-disk sizes of every planned item.
+        """
+
+        return sum(item.size for item in self.items)
+
 
 class CleanPlanner:
     """Build a cleanup plan from configuration and overrides."""
@@ -94,63 +110,198 @@ class CleanPlanner:
         skip_pyqa_lint = not is_pyqa_lint_workspace(root)
 
         info("✨ Cleaning repository temporary files...", use_emoji=True)
-        collected, ignored_pyqa_lint = _collect_matches_from_directory(
-            root,
-            patterns,
-            root=root,
-            skip_pyqa_lint=skip_pyqa_lint,
-        )
-
+        scan = _CleanScan(_PatternMatcher.compile(patterns), root=root, skip_pyqa_lint=skip_pyqa_lint)
+        scan.walk(root)
         for tree in trees:
             base_dir = (root / tree).resolve()
-            if not base_dir.exists():
+            if not base_dir.is_dir() or scan.covers(base_dir):
                 continue
             info(f"🧹 Cleaning {tree}/ ...", use_emoji=True)
-            tree_items, tree_ignored = _collect_matches_from_directory(
-                base_dir,
-                patterns,
-                root=root,
-                skip_pyqa_lint=skip_pyqa_lint,
+            scan.walk(base_dir)
+
+        items = sorted(scan.collected.values(), key=lambda item: item.path)
+        return CleanPlan(items=items, ignored_pyqa_lint=_dedupe_paths(scan.ignored_pyqa_lint))
+
+
+@dataclass(frozen=True, slots=True)
+class _PatternMatcher:
+    """Match directory entries against every cleanup pattern at once.
+
+    Patterns without a separator are combined into a single expression tested
+    against the entry name. Patterns spanning several segments are anchored to
+    the right of the entry path relative to the scanned base, mirroring
+    ``Path.glob`` evaluated from every directory in the walk.
+    """
+
+    name: re.Pattern[str] | None
+    path: re.Pattern[str] | None
+    directory_name: re.Pattern[str] | None
+    directory_path: re.Pattern[str] | None
+
+    @classmethod
+    def compile(cls, patterns: Iterable[str]) -> _PatternMatcher:
+        """Return a matcher combining ``patterns``.
+
+        Args:
+            patterns: Glob patterns evaluated relative to each scanned directory.
+
+        Returns:
+            _PatternMatcher: Matcher with one compiled expression per pattern kind.
+        """
+
+        groups: dict[tuple[bool, bool], list[str]] = {
+            (False, False): [],
+            (False, True): [],
+            (True, False): [],
+            (True, True): [],
+        }
+        for pattern in patterns:
+            directory_only = pattern.endswith("/")
+            normalised = pattern.rstrip("/")
+            while normalised.startswith(_RECURSIVE_PREFIX):
+                normalised = normalised[len(_RECURSIVE_PREFIX) :]
+            if not normalised or normalised.startswith("/"):
+                continue
+            spans_segments = "/" in normalised
+            expression = glob.translate(
+                f"{_RECURSIVE_PREFIX}{normalised}" if spans_segments else normalised,
+                recursive=True,
+                include_hidden=True,
+                seps="/",
             )
-            collected.update(tree_items)
-            ignored_pyqa_lint.extend(tree_ignored)
+            groups[(directory_only, spans_segments)].append(expression)
+        return cls(
+            name=_combine(groups[(False, False)]),
+            path=_combine(groups[(False, True)]),
+            directory_name=_combine(groups[(True, False)]),
+            directory_path=_combine(groups[(True, True)]),
+        )
+
+    def matches(self, name: str, relative: str, *, is_dir: bool) -> bool:
+        """Return whether an entry matches any configured pattern.
 
-        if skip_pyqa_lint:
-            ignored_pyqa_lint.extend(_discover_pyqa_lint_directories(root))
+        Args:
+            name: Entry name.
+            relative: POSIX path of the entry relative to the scanned base.
+            is_dir: Whether the entry is a directory.
 
-        items = sorted(collected.values(), key=lambda item: item.path)
-        return CleanPlan(items=items, ignored_pyqa_lint=_dedupe_paths(ignored_pyqa_lint))
+        Returns:
+            bool: ``True`` when the entry should be cleaned.
+        """
 
+        if self.name is not None and self.name.match(name):
+            return True
+        if self.path is not None and self.path.match(relative):
+            return True
+        if not is_dir:
+            return False
+        if self.directory_name is not None and self.directory_name.match(name):
+            return True
+        return self.directory_path is not None and self.directory_path.match(relative) is not None
 
-def _collect_matches_from_directory(
-    base: Path,
-    patterns: Sequence[str],
-    *,
-    root: Path,
-    skip_pyqa_lint: bool,
-) -> tuple[dict[Path, CleanPlanItem], list[Path]]:
-    """Collect filesystem matches within ``base`` using ``patterns``.
+
+def _combine(expressions: Sequence[str]) -> re.Pattern[str] | None:
+    """Return a single expression matching any of ``expressions``.
 
     Args:
-        base: Directory scanned for pattern matches.
-        patterns: Glob patterns evaluated relative to ``base``.
-        root: Repository root used when evaluating protected directories.
-        skip_pyqa_lint: When ``True`` ignore matches inside pyqa_lint directories.
+        expressions: Anchored regular expressions produced by :func:`glob.translate`.
 
     Returns:
-        tuple[dict[Path, CleanPlanItem], list[Path]]: Mapping of matched paths
-        to plan items alongside skipped pyqa_lint directories.
+        re.Pattern[str] | None: Combined expression, or ``None`` when empty.
     """
 
-    collected: dict[Path, CleanPlanItem] = {}
-    ignored: list[Path] = []
-    for directory, _subdirs, _files in iter_paths(base):
-        for match in _match_patterns(directory, patterns):
-            if _should_skip_pyqa_lint(match, root, skip_pyqa_lint):
-                ignored.append(match)
+    if not expressions:
+        return None
+    return re.compile("|".join(f"(?:{expression})" for expression in expressions))
+
+
+class _CleanScan:
+    """Collect cleanup targets with a single pruned ``os.scandir`` walk."""
+
+    def __init__(self, matcher: _PatternMatcher, *, root: Path, skip_pyqa_lint: bool) -> None:
+        """Initialise the scan state.
+
+        Args:
+            matcher: Compiled cleanup patterns.
+            root: Repository root anchoring pyqa_lint detection.
+            skip_pyqa_lint: When ``True`` ignore matches inside pyqa_lint directories.
+        """
+
+        self._matcher = matcher
+        self._root = root
+        self._skip_pyqa_lint = skip_pyqa_lint
+        self._visited: set[str] = set()
+        self.collected: dict[Path, CleanPlanItem] = {}
+        self.ignored_pyqa_lint: list[Path] = []
+
+    def covers(self, directory: Path) -> bool:
+        """Return whether ``directory`` was already scanned or scheduled for removal.
+
+        Args:
+            directory: Resolved directory path.
+
+        Returns:
+            bool: ``True`` when an earlier walk descended into ``directory`` or
+            a collected item contains it.
+        """
+
+        if os.fspath(directory) in self._visited:
+            return True
+        return any(directory.is_relative_to(path) for path in self.collected)
+
+    def walk(self, base: Path) -> None:
+        """Scan ``base`` and record matches without descending into them.
+
+        Matched directories, protected directories and the always-excluded
+        directories are not entered, so every directory is read at most once
+        across the root and tree walks.
+
+        Args:
+            base: Resolved directory scanned for cleanup targets.
+        """
+
+        stack: list[tuple[str, str]] = [(os.fspath(base), "")]
+        while stack:
+            directory, relative = stack.pop()
+            if directory in self._visited:
                 continue
-            collected[match] = CleanPlanItem(path=match)
-    return collected, ignored
+            self._visited.add(directory)
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            for entry in entries:
+                entry_relative = f"{relative}{entry.name}"
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if entry.name in PROTECTED_DIRECTORIES:
+                    continue
+                if self._matcher.matches(entry.name, entry_relative, is_dir=is_dir):
+                    self._record(Path(entry.path), is_dir=is_dir)
+                    continue
+                if not is_dir:
+                    continue
+                if entry.name == PYQA_LINT_DIR_NAME and self._skip_pyqa_lint:
+                    self.ignored_pyqa_lint.append(Path(entry.path))
+                if entry.name not in _PRUNED_DIRECTORIES:
+                    stack.append((entry.path, f"{entry_relative}/"))
+
+    def _record(self, path: Path, *, is_dir: bool) -> None:
+        """Record ``path`` as a cleanup target unless pyqa_lint rules forbid it.
+
+        Args:
+            path: Matched filesystem entry.
+            is_dir: Whether the entry is a directory.
+        """
+
+        if _should_skip_pyqa_lint(path, self._root, self._skip_pyqa_lint):
+            self.ignored_pyqa_lint.append(path)
+            return
+        size = _tree_size(path) if is_dir else _entry_size(path)
+        self.collected[path] = CleanPlanItem(path=path, size=size)
 
 
 def _merge_unique(primary: Sequence[str], extras: Sequence[str]) -> list[str]:
@@ -176,48 +327,6 @@ def _merge_unique(primary: Sequence[str], extras: Sequence[str]) -> list[str]:
     return merged
 
 
-def _is_protected(path: Path, root: Path) -> bool:
-    """Return ``True`` when ``path`` resides in protected directories.
-
-    Args:
-        path: Candidate filesystem path.
-        root: Repository root used to compute relative segments.
-
-    Returns:
-        bool: ``True`` if the path is inside protected directories; ``False``
-        otherwise.
-    """
-
-    try:
-        relative = path.relative_to(root)
-    except ValueError:
-        relative = path
-    return any(part in PROTECTED_DIRECTORIES for part in relative.parts)
-
-
-def _match_patterns(base: Path, patterns: Iterable[str]) -> set[Path]:
-    """Collect paths under ``base`` that match any of the provided patterns.
-
-    Args:
-        base: Directory searched for pattern matches.
-        patterns: Iterable of glob patterns evaluated against ``base``.
-
-    Returns:
-        set[Path]: Resolved paths matching the provided patterns.
-    """
-
-    matches: set[Path] = set()
-    for pattern in patterns:
-        for match_path in base.glob(pattern):
-            resolved = match_path.resolve()
-            if resolved == base or not resolved.exists():
-                continue
-            if _is_protected(resolved, base):
-                continue
-            matches.add(resolved)
-    return matches
-
-
 def _should_skip_pyqa_lint(path: Path, root: Path, skip_pyqa_lint: bool) -> bool:
     """Determine whether ``path`` should be skipped due to pyqa_lint rules.
 
@@ -266,22 +375,49 @@ def _dedupe_paths(paths: Iterable[Path]) -> list[Path]:
     return ordered
 
 
-def _discover_pyqa_lint_directories(root: Path) -> list[Path]:
-    """Identify pyqa_lint directories under ``root`` for reporting purposes.
+def _entry_size(path: Path) -> int:
+    """Return the size of a single file or symlink without following it.
 
     Args:
-        root: Repository root scanned for pyqa_lint directories.
+        path: Filesystem entry.
 
     Returns:
-        list[Path]: Directories named ``PYQA_LINT_DIR_NAME`` that reside under
-        ``root``.
+        int: Size in bytes, or ``0`` when the entry vanished.
     """
 
     try:
-        candidates = list(root.rglob(PYQA_LINT_DIR_NAME))
+        return path.lstat().st_size
     except OSError:
-        return []
-    return [candidate for candidate in candidates if candidate.is_dir() and candidate.is_relative_to(root)]
+        return 0
+
+
+def _tree_size(path: Path) -> int:
+    """Return the cumulative size of every file below ``path``.
+
+    Args:
+        path: Directory whose contents are measured; symlinks are not followed.
+
+    Returns:
+        int: Size in bytes of the files beneath ``path``.
+    """
+
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as iterator:
+                for entry in iterator:
+                    try:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if stat.S_ISDIR(entry_stat.st_mode):
+                        stack.append(entry.path)
+                    else:
+                        total += entry_stat.st_size
+        except OSError:
+            continue
+    return total
 
 
 def remove_path(path: Path) -> None:
@@ -305,8 +441,6 @@ __all__ = [
     "CleanPlanItem",
     "CleanPlanner",
     "PROTECTED_DIRECTORIES",
-    "_collect_matches_from_directory",
-    "_discover_pyqa_lint_directories",
     "_dedupe_paths",
     "remove_path",
 ]
@@ -4,15 +4,22 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Final
 
 from pyqa.config import CleanConfig
 from pyqa.core.logging import ok
 
 from .plan import CleanPlan, CleanPlanner, remove_path
 
+DEFAULT_REMOVAL_WORKERS: Final[int] = min(8, os.cpu_count() or 1)
+_SIZE_UNITS: Final[tuple[str, ...]] = ("B", "KiB", "MiB", "GiB")
+_SIZE_STEP: Final[int] = 1024
+
 
 @dataclass(slots=True)
 class CleanResult:
@@ -21,6 +28,7 @@ class CleanResult:
     removed: list[Path] = field(default_factory=list)
     skipped: list[Path] = field(default_factory=list)
     ignored_pyqa_lint: list[Path] = field(default_factory=list)
+    reclaimed_bytes: int = 0
 
     def register_removed(self, path: Path) -> None:
         """Record that ``path`` was removed during cleaning.
@@ -57,6 +65,7 @@ def sparkly_clean(
     extra_patterns: Sequence[str] | None = None,
     extra_trees: Sequence[str] | None = None,
     dry_run: bool = False,
+    workers: int = DEFAULT_REMOVAL_WORKERS,
 ) -> CleanResult:
     """Remove temporary artefacts under ``root`` based on configuration and overrides.
 
@@ -66,9 +75,11 @@ def sparkly_clean(
         extra_patterns: Optional glob patterns appended to configured values.
         extra_trees: Optional directory roots appended to configured tree list.
         dry_run: When ``True`` report the plan without removing files.
+        workers: Upper bound on the threads deleting planned paths.
 
     Returns:
-        CleanResult: Summary describing removed, skipped, and ignored paths.
+        CleanResult: Summary describing removed, skipped, and ignored paths
+        together with the bytes reclaimed (or reclaimable in dry-run mode).
     """
 
     planner = CleanPlanner(
@@ -77,23 +88,46 @@ def sparkly_clean(
     )
     plan: CleanPlan = planner.plan(root, config)
 
-    result = CleanResult(ignored_pyqa_lint=list(plan.ignored_pyqa_lint))
-    for item in plan.items:
-        path = item.path
-        if dry_run:
-            result.register_skipped(path)
-            continue
-        remove_path(path)
-        result.register_removed(path)
-
+    result = CleanResult(ignored_pyqa_lint=list(plan.ignored_pyqa_lint), reclaimed_bytes=plan.total_bytes)
+    paths = plan.paths
     if dry_run:
+        for path in paths:
+            result.register_skipped(path)
         ok(
-            f"Dry run complete; {len(result.skipped)} paths would be removed",
+            f"Dry run complete; {len(result.skipped)} paths would be removed "
+            f"({format_size(result.reclaimed_bytes)})",
             use_emoji=True,
         )
+        return result
+
+    if workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths)), thread_name_prefix="pyqa-clean") as pool:
+            list(pool.map(remove_path, paths))
     else:
-        ok(f"Removed {len(result.removed)} paths", use_emoji=True)
+        for path in paths:
+            remove_path(path)
+    for path in paths:
+        result.register_removed(path)
+    ok(f"Removed {len(result.removed)} paths ({format_size(result.reclaimed_bytes)} reclaimed)", use_emoji=True)
     return result
 
 
-__all__ = ["CleanResult", "sparkly_clean"]
+def format_size(size: int) -> str:
+    """Return ``size`` formatted with a binary unit suffix.
+
+    Args:
+        size: Number of bytes.
+
+    Returns:
+        str: Human-readable size such as ``"12.5 MiB"``.
+    """
+
+    value = float(size)
+    for unit in _SIZE_UNITS[:-1]:
+        if value < _SIZE_STEP:
+            return f"{value:.0f} {unit}" if unit == _SIZE_UNITS[0] else f"{value:.1f} {unit}"
+        value /= _SIZE_STEP
+    return f"{value:.1f} {_SIZE_UNITS[-1]}"
+
+
+__all__ = ["DEFAULT_REMOVAL_WORKERS", "CleanResult", "format_size", "sparkly_clean"]
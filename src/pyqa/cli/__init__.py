@@ -5,15 +5,48 @@
 
 from __future__ import annotations
 
-from typing import Final
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
 
-from ..config import Config
 from .app import app
-from .core.config_builder import build_config
-from .core.options import LintOptions
+
+if TYPE_CHECKING:  # pragma: no cover - import-time assistance only
+    from ..config import Config
+    from .core.config_builder import build_config
+    from .core.options import LintOptions
 
 __all__: Final[list[str]] = ["LintOptions", "app", "build_config", "_build_config"]
 
+# Configuration models are expensive to import; load them only when requested
+# so ``pyqa --help`` and lazily dispatched commands stay fast.
+_EXPORT_MAP: Final[dict[str, tuple[str, str]]] = {
+    "LintOptions": ("pyqa.cli.core.options", "LintOptions"),
+    "build_config": ("pyqa.cli.core.config_builder", "build_config"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import configuration helpers on demand.
+
+    Args:
+        name: Symbol requested from the ``pyqa.cli`` package.
+
+    Returns:
+        Any: Attribute retrieved from the target module.
+
+    Raises:
+        AttributeError: Raised when ``name`` is not exported by this package.
+    """
+
+    try:
+        module_name, attribute = _EXPORT_MAP[name]
+    except KeyError as exc:  # pragma: no cover - mirrors default behaviour
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+
+    value = getattr(import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
 
 def _build_config(*, options: LintOptions) -> Config:
     """Return a configuration derived from ``options``.
@@ -26,4 +59,7 @@ def _build_config(*, options: LintOptions) -> Config:
         Config: Configuration object produced by :func:`build_config`.
     """
 
-    return build_config(options)
+    # Deferred for the same reason as the lazy exports above.
+    from .core.config_builder import build_config as build
+
+    return build(options)
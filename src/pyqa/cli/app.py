@@ -6,10 +6,21 @@ from __future__ import annotations
 
 from pyqa.cli.protocols import TyperAdapter
 
-from .commands import register_commands
+from .commands import BUILTIN_COMMANDS, register_plugin_commands
+from .core.lazy_commands import lazy_group_class
 from .core.typer_ext import TyperAppConfig, create_typer
 
-app = create_typer(config=TyperAppConfig(help_text="Polyglot lint orchestrator."))
-register_commands(TyperAdapter(app))
+app = create_typer(
+    config=TyperAppConfig(help_text="Polyglot lint orchestrator."),
+    group_cls=lazy_group_class(BUILTIN_COMMANDS),
+)
+
+
+@app.callback()
+def _root() -> None:
+    """Polyglot lint orchestrator."""
+
+
+register_plugin_commands(TyperAdapter(app))
 
 __all__ = ["app"]
@@ -6,26 +6,64 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
+from importlib import import_module
+from typing import Final, Protocol, cast
 
 import typer
 
 from ...cli.protocols import TyperAdapter, TyperLike
 from ...plugins import load_cli_plugins as _discover_cli_plugins
-from . import (
-    banned,
-    clean,
-    config,
-    doctor,
-    hooks,
-    install,
-    lint,
-    quality,
-    security,
-    tool_info,
-    update,
+from ..core.lazy_commands import LazyCommandSpec
+
+__all__ = ["BUILTIN_COMMANDS", "load_cli_plugins", "register_commands", "register_plugin_commands"]
+
+_PACKAGE: Final[str] = __name__
+
+BUILTIN_COMMANDS: Final[tuple[LazyCommandSpec, ...]] = (
+    LazyCommandSpec("lint", f"{_PACKAGE}.lint", "Typer entry point for the ``pyqa lint`` command."),
+    LazyCommandSpec(
+        "install",
+        f"{_PACKAGE}.install",
+        "Install development dependencies and optional typing artefacts.",
+    ),
+    LazyCommandSpec("config", f"{_PACKAGE}.config", "Inspect, validate, and document configuration layers."),
+    LazyCommandSpec("security-scan", f"{_PACKAGE}.security", "Run security scans across the project."),
+    LazyCommandSpec(
+        "check-banned-words",
+        f"{_PACKAGE}.banned",
+        "Scan commit message text for banned words or phrases.",
+    ),
+    LazyCommandSpec("tool-info", f"{_PACKAGE}.tool_info", "Typer entry point mirroring :func:`run_tool_info`."),
+    LazyCommandSpec(
+        "check-quality",
+        f"{_PACKAGE}.quality",
+        "Run repository quality checks (license headers, schema, hygiene).",
+    ),
+    LazyCommandSpec("update", f"{_PACKAGE}.update", "Update dependencies across detected workspaces."),
+    LazyCommandSpec("sparkly-clean", f"{_PACKAGE}.clean", "Remove temporary build/cache artefacts."),
+    LazyCommandSpec(
+        "install-hooks",
+        f"{_PACKAGE}.hooks",
+        "Install pyqa-lint git hooks (pre-commit, pre-push, commit-msg).",
+    ),
+    LazyCommandSpec(
+        "doctor",
+        f"{_PACKAGE}.doctor",
+        "Execute the doctor diagnostics command via the Typer entry point.",
+    ),
+    LazyCommandSpec("cache", f"{_PACKAGE}.cache", "Serve and maintain the lint result cache."),
 )
 
-__all__ = ["register_commands", "load_cli_plugins"]
+
+class _CommandPackage(Protocol):
+    """Command package exposing the standard ``register`` hook."""
+
+    def register(self, app: TyperLike) -> None:
+        """Register the package's command(s) on ``app``.
+
+        Args:
+            app: Typer-compatible application receiving the registration.
+        """
 
 
 def load_cli_plugins() -> Sequence[Callable[[TyperLike], None]]:
@@ -43,33 +81,40 @@ def register_commands(
     *,
     plugins: Sequence[Callable[[TyperLike], None]] | None = None,
 ) -> None:
-    """Register built-in and plugin CLI commands on ``app``.
+    """Eagerly register built-in and plugin CLI commands on ``app``.
+
+    The ``pyqa`` entry point defers built-in commands through
+    :func:`pyqa.cli.core.lazy_commands.lazy_group_class` instead; this helper
+    serves embedders that need every command attached up front.
+
+    Args:
+        app: Typer-compatible application receiving command registrations.
+        plugins: Optional sequence of plugin factories to invoke. When ``None``
+            entry points from ``pyqa.cli.plugins`` are loaded automatically.
+    """
+
+    cli_app: TyperLike = TyperAdapter(app) if isinstance(app, typer.Typer) else app
+    for spec in BUILTIN_COMMANDS:
+        cast(_CommandPackage, import_module(spec.module)).register(cli_app)
+    register_plugin_commands(cli_app, plugins=plugins)
+
+
+def register_plugin_commands(
+    app: TyperLike,
+    *,
+    plugins: Sequence[Callable[[TyperLike], None]] | None = None,
+) -> None:
+    """Register plugin CLI commands on ``app``.
 
     Args:
         app: Typer-compatible application receiving command registrations.
         plugins: Optional sequence of plugin factories to invoke. When ``None``
             entry points from ``pyqa.cli.plugins`` are loaded automatically.
     """
-    if isinstance(app, typer.Typer):
-        cli_app: TyperLike = TyperAdapter(app)
-    else:
-        cli_app = app
-
-    lint.register(cli_app)
-    install.register(cli_app)
-    config.register(cli_app)
-    security.register(cli_app)
-    banned.register(cli_app)
-    tool_info.register(cli_app)
-    quality.register(cli_app)
-    update.register(cli_app)
-    clean.register(cli_app)
-    hooks.register(cli_app)
-    doctor.register(cli_app)
 
     if plugins is not None:
         plugin_factories: Sequence[Callable[[TyperLike], None]] = plugins
     else:
         plugin_factories = load_cli_plugins()
     for register_plugin in plugin_factories:
-        register_plugin(cli_app)
+        register_plugin(app)
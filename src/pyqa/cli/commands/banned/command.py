@@ -4,13 +4,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Annotated
 
 import typer
 
 from pyqa.cli.protocols import TyperAdapter
 
-from ....compliance.banned import BannedWordChecker
+from ....compliance.banned import BannedWordChecker, BannedWordHit
 from ...core.shared import Depends
 from ...core.typer_ext import TyperAppConfig, create_typer
 from .models import BannedCLIOptions, build_banned_options
@@ -39,31 +40,41 @@ def check_banned_words(
     if text is None and commit_messages_file is None:
         raise typer.BadParameter("Provide either a commit messages file or --text.")
 
-    lines: list[str]
-    if text is not None:
-        lines = text.splitlines()
-    else:
-        file_path = commit_messages_file
-        if file_path is None or not file_path.is_file():
-            raise typer.BadParameter("Commit messages file not found or unreadable")
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-
     checker = BannedWordChecker(
         root=options.root,
         personal_list=options.personal_list,
         repo_list=options.repo_list,
     )
-    matches = checker.scan(lines)
+    if text is not None:
+        hits = checker.scan_hits(text.splitlines())
+    else:
+        file_path = commit_messages_file
+        if file_path is None or not file_path.is_file():
+            raise typer.BadParameter("Commit messages file not found or unreadable")
+        hits = checker.scan_file(file_path)
 
-    if not matches:
+    if not hits:
         typer.echo("✅ No banned words found")
         raise typer.Exit(code=0)
 
     typer.echo("❌ Banned words/phrases detected:")
-    seen: set[str] = set()
-    for match in matches:
-        if match in seen:
-            continue
-        seen.add(match)
-        typer.echo(f"  • {match}")
+    for term, line_numbers in _group_hits(hits).items():
+        label = "line" if len(line_numbers) == 1 else "lines"
+        typer.echo(f"  • {term} ({label} {', '.join(str(number) for number in line_numbers)})")
     raise typer.Exit(code=1)
+
+
+def _group_hits(hits: Sequence[BannedWordHit]) -> dict[str, list[int]]:
+    """Return line numbers for each banned term in first-occurrence order.
+
+    Args:
+        hits: Term occurrences reported by the checker.
+
+    Returns:
+        dict[str, list[int]]: Mapping of terms to the lines containing them.
+    """
+
+    grouped: dict[str, list[int]] = {}
+    for hit in hits:
+        grouped.setdefault(hit.term, []).append(hit.line)
+    return grouped
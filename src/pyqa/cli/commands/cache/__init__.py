@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Cache management CLI command package."""
+
+from __future__ import annotations
+
+from pyqa.cli.protocols import TyperLike
+
+from .command import cache_app
+
+__all__ = ["register"]
+
+
+def register(app: TyperLike) -> None:
+    """Attach cache subcommands to ``app``.
+
+    Args:
+        app: Typer-compatible application receiving the cache command group.
+    """
+
+    app.add_typer(cache_app, name="cache")
@@ -0,0 +1,276 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Commands for serving and maintaining the lint result cache."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Final
+
+import typer
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from pyqa.cache.maintenance import (
+    CacheBudget,
+    CacheStats,
+    cache_stats,
+    collect_garbage,
+    path_size,
+)
+from pyqa.cache.remote import REMOTE_CACHE_TOKEN_ENV
+from pyqa.cache.server import DEFAULT_HOST, DEFAULT_PORT, create_server
+from pyqa.clean import format_size
+from pyqa.cli.protocols import TyperAdapter
+from pyqa.core.environment.tool_env import (
+    CommandPreparer,
+    ToolCacheLayout,
+    cache_layout,
+    prune_runtime_cache,
+)
+
+from ....tools.builtins import initialize_registry
+from ....tools.registry import DEFAULT_REGISTRY
+from ...core._config_loading import load_config_result
+from ...core.shared import CLIError, CLILogger, build_cli_logger, register_command
+from ...core.typer_ext import TyperAppConfig, create_typer
+
+_CACHE_TY = create_typer(config=TyperAppConfig(name="cache", help_text="Serve and maintain the lint result cache."))
+cache_app = TyperAdapter(_CACHE_TY)
+
+DEFAULT_REMOTE_DIRECTORY: Final[Path] = Path(".lint-cache") / "remote"
+_ROOT_HELP: Final[str] = "Project root whose cache should be inspected."
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheSettings:
+    """Cache location and budget resolved from the project configuration."""
+
+    cache_dir: Path
+    max_size_mb: int
+    max_age_days: int
+
+
+def _load_cache_settings(root: Path, *, logger: CLILogger) -> _CacheSettings:
+    """Return the cache settings configured for ``root``.
+
+    Args:
+        root: Project root used to load configuration.
+        logger: CLI logger used to report configuration failures.
+
+    Returns:
+        _CacheSettings: Absolute cache directory and configured budgets.
+    """
+
+    resolved_root = root.resolve()
+    execution = load_config_result(resolved_root, logger=logger).config.execution
+    cache_dir = execution.cache_dir if execution.cache_dir.is_absolute() else resolved_root / execution.cache_dir
+    return _CacheSettings(
+        cache_dir=cache_dir,
+        max_size_mb=execution.cache_max_size_mb,
+        max_age_days=execution.cache_max_age_days,
+    )
+
+
+@register_command(
+    cache_app,
+    name="serve",
+    help_text="Serve a shared remote result cache over HTTP.",
+)
+def cache_serve(
+    host: Annotated[str, typer.Option(DEFAULT_HOST, "--host", help="Interface to bind.")],
+    port: Annotated[int, typer.Option(DEFAULT_PORT, "--port", min=0, max=65535, help="Port to listen on.")],
+    directory: Annotated[
+        Path,
+        typer.Option(DEFAULT_REMOTE_DIRECTORY, "--directory", help="Directory used to store cache entries."),
+    ],
+    token: Annotated[
+        str | None,
+        typer.Option(
+            None,
+            "--token",
+            envvar=REMOTE_CACHE_TOKEN_ENV,
+            help="Bearer token clients must present (defaults to $PYQA_REMOTE_CACHE_TOKEN).",
+        ),
+    ],
+) -> None:
+    """Serve cache entries until interrupted.
+
+    Args:
+        host: Interface to bind.
+        port: Port to listen on.
+        directory: Directory used to persist entries.
+        token: Optional bearer token required from clients.
+    """
+
+    logger = build_cli_logger(emoji=True)
+    server = create_server(directory.resolve(), host=host, port=port, token=token)
+    bound_host, bound_port = server.server_address[:2]
+    logger.ok(f"Serving remote cache from {directory} on http://{bound_host!s}:{bound_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.ok("Remote cache server stopped")
+    finally:
+        server.server_close()
+
+
+@register_command(
+    cache_app,
+    name="stats",
+    help_text="Report cache hit rates, per-tool entries and disk usage.",
+)
+def cache_stats_command(
+    root: Annotated[Path, typer.Option(Path.cwd(), "--root", "-r", help=_ROOT_HELP)],
+) -> None:
+    """Print result cache and tool runtime usage for ``root``.
+
+    Args:
+        root: Project root whose cache should be inspected.
+    """
+
+    logger = build_cli_logger(emoji=True)
+    settings = _load_cache_settings(root, logger=logger)
+    stats = cache_stats(settings.cache_dir)
+    logger.echo(f"Cache directory: {settings.cache_dir}")
+    logger.echo(f"Result entries: {stats.entries} ({format_size(stats.entry_bytes)})")
+    console = Console()
+    console.print(_tool_table(stats))
+    console.print(_runtime_table(cache_layout(settings.cache_dir)))
+
+
+@register_command(
+    cache_app,
+    name="gc",
+    help_text="Evict least recently used cache entries beyond the size and age budgets.",
+)
+def cache_gc(
+    root: Annotated[Path, typer.Option(Path.cwd(), "--root", "-r", help=_ROOT_HELP)],
+    max_size_mb: Annotated[
+        int | None,
+        typer.Option(None, "--max-size-mb", min=0, help="Size budget in MiB (0 disables; defaults to config)."),
+    ],
+    max_age_days: Annotated[
+        int | None,
+        typer.Option(None, "--max-age-days", min=0, help="Evict entries unused for this many days (0 disables)."),
+    ],
+    dry_run: Annotated[bool, typer.Option(False, "--dry-run", help="Report evictions without deleting.")],
+) -> None:
+    """Collect garbage in the result cache of ``root``.
+
+    Args:
+        root: Project root whose cache should be collected.
+        max_size_mb: Optional override for ``execution.cache_max_size_mb``.
+        max_age_days: Optional override for ``execution.cache_max_age_days``.
+        dry_run: When ``True`` only report what would be evicted.
+    """
+
+    logger = build_cli_logger(emoji=True)
+    settings = _load_cache_settings(root, logger=logger)
+    budget = CacheBudget.from_limits(
+        max_size_mb=settings.max_size_mb if max_size_mb is None else max_size_mb,
+        max_age_days=settings.max_age_days if max_age_days is None else max_age_days,
+    )
+    report = collect_garbage(settings.cache_dir, budget, dry_run=dry_run)
+    verb = "Would evict" if dry_run else "Evicted"
+    logger.ok(
+        f"{verb} {report.removed} of {report.scanned} entries ({format_size(report.freed_bytes)}); "
+        f"{format_size(report.remaining_bytes)} remaining",
+    )
+
+
+@register_command(
+    cache_app,
+    name="prune",
+    help_text="Remove cached tool runtimes the catalog no longer references.",
+)
+def cache_prune(
+    root: Annotated[Path, typer.Option(Path.cwd(), "--root", "-r", help=_ROOT_HELP)],
+    dry_run: Annotated[bool, typer.Option(False, "--dry-run", help="Report stale runtimes without deleting.")],
+) -> None:
+    """Prune runtime installs under the tool cache of ``root``.
+
+    Args:
+        root: Project root whose tool cache should be pruned.
+        dry_run: When ``True`` only report what would be removed.
+
+    Raises:
+        CLIError: If the tool catalog could not be loaded.
+    """
+
+    logger = build_cli_logger(emoji=True)
+    settings = _load_cache_settings(root, logger=logger)
+    initialize_registry(registry=DEFAULT_REGISTRY)
+    tools = tuple(DEFAULT_REGISTRY.tools())
+    if not tools:
+        logger.fail("Tool catalog is empty; refusing to prune every cached runtime")
+        raise CLIError("Tool catalog is empty")
+    referenced = CommandPreparer().cache_slugs(tools)
+    result = prune_runtime_cache(cache_layout(settings.cache_dir), referenced, dry_run=dry_run)
+    verb = "Would remove" if dry_run else "Removed"
+    for path in result.removed:
+        logger.echo(f"{verb} {path}")
+    logger.ok(f"{verb} {len(result.removed)} stale runtime paths ({format_size(result.freed_bytes)})")
+
+
+def _tool_table(stats: CacheStats) -> Table:
+    """Build the per-tool entry and hit-rate table for ``stats``.
+
+    Args:
+        stats: Result cache statistics.
+
+    Returns:
+        Table: Rich table with one row per tool.
+    """
+
+    table = Table(title="Result Cache", box=box.SIMPLE, expand=True)
+    table.add_column("Tool", style="bold")
+    table.add_column("Entries", justify="right")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit rate", justify="right")
+    for tool in sorted(stats.entries_by_tool.keys() | stats.usage.keys()):
+        usage = stats.usage.get(tool)
+        rate = usage.hit_rate if usage else None
+        table.add_row(
+            tool,
+            str(stats.entries_by_tool.get(tool, 0)),
+            str(usage.hits) if usage else "-",
+            str(usage.misses) if usage else "-",
+            "-" if rate is None else f"{rate:.0%}",
+        )
+    return table
+
+
+def _runtime_table(layout: ToolCacheLayout) -> Table:
+    """Build the disk usage table for the tool runtime cache.
+
+    Args:
+        layout: Tool cache layout to measure.
+
+    Returns:
+        Table: Rich table with one row per runtime cache directory.
+    """
+
+    table = Table(title="Tool Runtimes", box=box.SIMPLE, expand=True)
+    table.add_column("Runtime", style="bold")
+    table.add_column("Path", overflow="fold")
+    table.add_column("Size", justify="right")
+    directories = {
+        "uv": layout.uv_dir,
+        "node": layout.node_cache_dir,
+        "npm": layout.npm_cache_dir,
+        "go": layout.go.cache_dir,
+        "lua": layout.lua.cache_dir,
+        "rust": layout.rust.cache_dir,
+        "perl": layout.perl.cache_dir,
+    }
+    for name, directory in directories.items():
+        table.add_row(name, str(directory), format_size(path_size(directory)) if directory.exists() else "-")
+    return table
+
+
+__all__ = ["cache_app", "cache_gc", "cache_prune", "cache_serve", "cache_stats_command"]
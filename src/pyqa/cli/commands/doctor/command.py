@@ -5,8 +5,11 @@
 from __future__ import annotations
 
 import importlib
+import os
 import platform
 import shutil
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from importlib import metadata as importlib_metadata
 from pathlib import Path
@@ -25,11 +28,14 @@ from pyqa.core.config.loader import ConfigLoader, ConfigLoadResult
 from pyqa.interfaces.config import Config as ConfigProtocol
 
 from ....analysis.treesitter import TreeSitterContextResolver
+from ....cache.version_probes import VersionProbeCache
 from ....config import ConfigError
-from ....core.runtime.process import CommandOptions, run_command
+from ....core.runtime.process import TIMEOUT_RETURNCODE
 from ....tools.builtins import initialize_registry
 from ....tools.registry import DEFAULT_REGISTRY
-from ...core.utils import ToolAvailability, ToolStatus, check_tool_status
+from ...core.utils import ToolAvailability, ToolStatus, check_tool_status, run_version_probe
+
+PROBE_WORKERS: Final[int] = min(16, (os.cpu_count() or 1) * 2)
 
 
 @dataclass(slots=True)
@@ -81,11 +87,15 @@ def run_doctor(root: Path, *, console: Console | None = None) -> int:
 
     initialize_registry(registry=DEFAULT_REGISTRY)
 
-    _render_environment_section(console)
-    _render_grammar_section(console)
-    _render_configuration_section(console, load_result)
     config_view = cast(ConfigProtocol, load_result.config)
-    unhealthy = _render_tooling_section(console, config_view)
+    probes = VersionProbeCache(_probe_cache_dir(root, config_view))
+    try:
+        _render_environment_section(console, probes)
+        _render_grammar_section(console)
+        _render_configuration_section(console, load_result)
+        unhealthy = _render_tooling_section(console, config_view, probes)
+    finally:
+        probes.save()
     _render_summary(console, unhealthy)
     return 1 if unhealthy else 0
 
@@ -142,11 +152,45 @@ def _load_configuration(root: Path, console: Console) -> ConfigLoadResult | None
         return None
 
 
-def _render_environment_section(console: Console) -> None:
+def _probe_cache_dir(root: Path, config: ConfigProtocol) -> Path:
+    """Return the directory holding the persistent version-probe cache.
+
+    Args:
+        root: Project root supplied to the doctor command.
+        config: Loaded configuration providing the cache directory.
+
+    Returns:
+        Path: Absolute cache directory for ``root``.
+    """
+
+    cache_dir = config.execution.cache_dir
+    return cache_dir if cache_dir.is_absolute() else root.resolve() / cache_dir
+
+
+def _probe_concurrently[ItemT, ResultT](probe: Callable[[ItemT], ResultT], items: Iterable[ItemT]) -> list[ResultT]:
+    """Run ``probe`` for every item on a bounded thread pool, preserving order.
+
+    Args:
+        probe: Blocking probe applied to each item.
+        items: Items to probe.
+
+    Returns:
+        list[ResultT]: Probe results in the order of ``items``.
+    """
+
+    pending = list(items)
+    if len(pending) <= 1:
+        return [probe(item) for item in pending]
+    with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(pending)), thread_name_prefix="pyqa-doctor") as pool:
+        return list(pool.map(probe, pending))
+
+
+def _render_environment_section(console: Console, probes: VersionProbeCache) -> None:
     """Render environment diagnostics (interpreters, tools) to ``console``.
 
     Args:
         console: Rich console used for displaying the environment table.
+        probes: Version-probe cache shared by the doctor run.
     """
 
     table = Table(title="Environment", box=box.SIMPLE, expand=True)
@@ -154,7 +198,7 @@ def _render_environment_section(console: Console) -> None:
     table.add_column("Status", style="bold")
     table.add_column("Details", overflow="fold")
 
-    for check in _collect_environment_checks():
+    for check in _collect_environment_checks(probes):
         style = "green" if check.ok else "red"
         table.add_row(check.name, f"[{style}]{check.status}[/]", check.detail or "-")
 
@@ -234,19 +278,20 @@ TOOL_STATUS_STYLE: Final[dict[ToolAvailability, str]] = {
 }
 
 
-def _render_tooling_section(console: Console, config: ConfigProtocol) -> bool:
+def _render_tooling_section(console: Console, config: ConfigProtocol, probes: VersionProbeCache) -> bool:
     """Render tooling availability and return ``True`` when issues are detected.
 
     Args:
         console: Rich console used for rendering the table.
         config: Loaded configuration providing override information.
+        probes: Version-probe cache shared by the doctor run.
 
     Returns:
         bool: ``True`` when any tool is considered unhealthy.
 
     """
 
-    summaries = _collect_tool_summaries(config)
+    summaries = _collect_tool_summaries(config, probes)
     table = Table(title="Tooling Status", box=box.SIMPLE, expand=True)
     table.add_column("Tool", style="bold")
     table.add_column("Runtime")
@@ -296,9 +341,15 @@ def _render_summary(console: Console, unhealthy: bool) -> None:
     )
 
 
-def _collect_environment_checks() -> list[EnvironmentCheck]:
+def _collect_environment_checks(probes: VersionProbeCache | None = None) -> list[EnvironmentCheck]:
     """Collect environment checks for interpreters and external tools.
 
+    Programs are probed concurrently; the result order follows
+    :data:`PROGRAM_PROBES`.
+
+    Args:
+        probes: Optional version-probe cache reused across doctor runs.
+
     Returns:
         list[EnvironmentCheck]: Ordered checks describing interpreter and
         executable availability.
@@ -313,18 +364,21 @@ def _collect_environment_checks() -> list[EnvironmentCheck]:
             detail=platform.python_version(),
         ),
     )
-    checks.extend(_probe_program(name, required) for name, required in PROGRAM_PROBES)
+    checks.extend(
+        _probe_concurrently(lambda probe: _probe_program(probe[0], probe[1], probes=probes), PROGRAM_PROBES),
+    )
     checks.append(_probe_module("tree_sitter_languages", optional=False))
     checks.append(_probe_module("tree_sitter", optional=True))
     return checks
 
 
-def _probe_program(executable: str, required: bool) -> EnvironmentCheck:
+def _probe_program(executable: str, required: bool, *, probes: VersionProbeCache | None = None) -> EnvironmentCheck:
     """Probe the availability of ``executable`` on ``PATH``.
 
     Args:
         executable: Program name to locate.
         required: Whether the program is mandatory for healthy status.
+        probes: Optional version-probe cache reused across doctor runs.
 
     Returns:
         EnvironmentCheck: Check result detailing program location or missing state.
@@ -332,7 +386,7 @@ def _probe_program(executable: str, required: bool) -> EnvironmentCheck:
 
     path = shutil.which(executable)
     if path:
-        version = _capture_version(executable)
+        version = _capture_version(executable, probes=probes)
         detail = version or path
         return EnvironmentCheck(name=executable, status=STATUS_OK, ok=True, detail=detail)
     status = STATUS_MISSING if required else STATUS_MISSING_OPTIONAL
@@ -364,11 +418,12 @@ def _probe_module(module: str, optional: bool) -> EnvironmentCheck:
     return EnvironmentCheck(name=module, status=STATUS_OK, ok=True, detail="Import successful")
 
 
-def _collect_tool_summaries(config: ConfigProtocol) -> list[ToolSummary]:
+def _collect_tool_summaries(config: ConfigProtocol, probes: VersionProbeCache | None = None) -> list[ToolSummary]:
     """Collect tooling availability summaries for doctor output.
 
     Args:
         config: Loaded configuration providing tool overrides.
+        probes: Optional version-probe cache reused across doctor runs.
 
     Returns:
         list[ToolSummary]: Ordered summaries of tool availability and versions.
@@ -376,8 +431,9 @@ def _collect_tool_summaries(config: ConfigProtocol) -> list[ToolSummary]:
 
     summaries: list[ToolSummary] = []
     overrides = set(config.tool_settings.keys())
-    for tool in sorted(DEFAULT_REGISTRY.tools(), key=lambda item: item.name):
-        status = check_tool_status(tool)
+    tools = sorted(DEFAULT_REGISTRY.tools(), key=lambda item: item.name)
+    statuses = _probe_concurrently(lambda tool: check_tool_status(tool, cache=probes), tools)
+    for tool, status in zip(tools, statuses, strict=True):
         summary = ToolSummary(
             status=status,
             runtime=tool.runtime,
@@ -396,19 +452,20 @@ def _collect_grammar_statuses() -> list[GrammarStatus]:
     """
 
     resolver = TreeSitterContextResolver()
-    statuses: list[GrammarStatus] = []
-    for language, grammar in sorted(resolver.grammar_modules().items()):
-        module_name = f"tree_sitter_{grammar.replace('-', '_')}"
-        available, version = _resolve_grammar_module(module_name)
-        statuses.append(
-            GrammarStatus(
-                language=language,
-                module=module_name,
-                available=available,
-                version=version,
-            ),
+    grammars = sorted(resolver.grammar_modules().items())
+    module_names = [f"tree_sitter_{grammar.replace('-', '_')}" for _language, grammar in grammars]
+    resolved = _probe_concurrently(_resolve_grammar_module, module_names)
+    return [
+        GrammarStatus(
+            language=language,
+            module=module_name,
+            available=available,
+            version=version,
+        )
+        for (language, _grammar), module_name, (available, version) in zip(
+            grammars, module_names, resolved, strict=True
         )
-    return statuses
+    ]
 
 
 def _resolve_grammar_module(module_name: str) -> tuple[bool, str | None]:
@@ -448,11 +505,12 @@ def _grammar_version(module_name: str, module: ModuleType) -> str | None:
         return getattr(module, "__version__", None)
 
 
-def _capture_version(executable: str) -> str | None:
+def _capture_version(executable: str, *, probes: VersionProbeCache | None = None) -> str | None:
     """Capture the version string for ``executable`` when available.
 
     Args:
         executable: Program name to execute with version flags.
+        probes: Optional version-probe cache reused across doctor runs.
 
     Returns:
         str | None: First line of version output, or ``None`` if detection fails.
@@ -464,12 +522,11 @@ def _capture_version(executable: str) -> str | None:
         [executable, "version"],
     ):
         try:
-            completed = run_command(
-                candidate,
-                options=CommandOptions(capture_output=True, check=False),
-            )
+            completed = run_version_probe(candidate, cache=probes)
         except (OSError, ValueError):
             continue
+        if completed.returncode == TIMEOUT_RETURNCODE:
+            return None
         output = completed.stdout.strip() or completed.stderr.strip()
         if output:
             first_line = output.splitlines()[0]
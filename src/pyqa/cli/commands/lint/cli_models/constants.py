@@ -40,11 +40,26 @@ FILTER_HELP: Final[str] = "Filter stdout/stderr from TOOL using regex (TOOL:patt
 OUTPUT_MODE_HELP: Final[str] = "Output mode: concise, pretty, or raw."
 REPORT_JSON_HELP: Final[str] = "Write JSON report to the provided path."
 SARIF_HELP: Final[str] = "Write SARIF 2.1.0 report to the provided path."
+REPORT_COMPACT_HELP: Final[str] = (
+    "Write JSON/SARIF reports without indentation. Paths ending in .gz are always gzip-compressed."
+)
+STREAM_HELP: Final[str] = "Print concise diagnostics as each tool finishes (before cross-tool deduplication)."
+MAX_DIAGNOSTICS_HELP: Final[str] = "Print at most N concise diagnostics and summarise the remainder."
+PROFILE_HELP: Final[str] = (
+    "Profile the run: write a Chrome/Perfetto trace to the provided path and print per-phase timings."
+)
 PR_SUMMARY_OUT_HELP: Final[str] = "Write a Markdown PR summary of diagnostics."
 PR_SUMMARY_MIN_SEVERITY_HELP: Final[str] = "Lowest severity for PR summary (error, warning, notice, note)."
 PR_SUMMARY_TEMPLATE_HELP: Final[str] = "Custom format string for PR summary entries."
 JOBS_HELP: Final[str] = "Max parallel jobs (defaults to 75% of available CPU cores)."
 CACHE_DIR_HELP: Final[str] = "Cache directory for tool results."
+REMOTE_CACHE_HELP: Final[str] = (
+    "Base URL of a shared remote result cache (for example one started with 'pyqa cache serve')."
+)
+TOOL_SERVERS_HELP: Final[str] = "Route supported tools through persistent daemon clients (for example eslint_d)."
+PYTHON_WORKERS_HELP: Final[str] = (
+    "Run Python tools installed alongside pyqa in forked workers that imported the tool once."
+)
 USE_LOCAL_LINTERS_HELP: Final[str] = "Force vendored linters even if compatible system versions exist."
 STRICT_CONFIG_HELP: Final[str] = "Treat configuration warnings (unknown keys, etc.) as errors."
 LINE_LENGTH_HELP: Final[str] = "Global preferred maximum line length applied to supported tools."
@@ -69,6 +84,7 @@ __all__ = [
     "BANDIT_CONFIDENCE_HELP",
     "BANDIT_SEVERITY_HELP",
     "CACHE_DIR_HELP",
+    "REMOTE_CACHE_HELP",
     "CACHE_HELP",
     "CHECK_DI_HELP",
     "CHECK_INTERFACES_HELP",
@@ -87,6 +103,7 @@ __all__ = [
     "LINE_LENGTH_HELP",
     "MAX_ARGUMENTS_HELP",
     "MAX_COMPLEXITY_HELP",
+    "MAX_DIAGNOSTICS_HELP",
     "MISSING_HELP",
     "NORMAL_PRESET_HELP",
     "OUTPUT_MODE_HELP",
@@ -96,9 +113,11 @@ __all__ = [
     "PR_SUMMARY_TEMPLATE_HELP",
     "PYTHON_HYGIENE_HELP",
     "PYTHON_VERSION_HELP",
+    "PYTHON_WORKERS_HELP",
     "PYQA_PYTHON_HYGIENE_HELP",
     "PYQA_RULES_HELP",
     "PYLINT_FAIL_UNDER_HELP",
+    "REPORT_COMPACT_HELP",
     "REPORT_JSON_HELP",
     "RootOption",
     "SARIF_HELP",
@@ -107,8 +126,10 @@ __all__ = [
     "SHOW_VALID_SUPPRESSIONS_HELP",
     "SIGNATURES_HELP",
     "SQL_DIALECT_HELP",
+    "STREAM_HELP",
     "STRICT_CONFIG_HELP",
     "TOOL_INFO_HELP",
+    "TOOL_SERVERS_HELP",
     "TYPE_CHECKING_HELP",
     "TYPING_HELP",
     "USE_LOCAL_LINTERS_HELP",
@@ -14,13 +14,17 @@ from ..params import LintOutputParams, LintReportingParams, LintSummaryParams
 from .coercion import _coerce_output_mode, _coerce_pr_summary_severity
 from .constants import (
     ADVICE_HELP,
+    MAX_DIAGNOSTICS_HELP,
     OUTPUT_MODE_CONCISE,
     OUTPUT_MODE_HELP,
     PR_SUMMARY_MIN_SEVERITY_HELP,
     PR_SUMMARY_OUT_HELP,
     PR_SUMMARY_TEMPLATE_HELP,
+    PROFILE_HELP,
+    REPORT_COMPACT_HELP,
     REPORT_JSON_HELP,
     SARIF_HELP,
+    STREAM_HELP,
 )
 from .models import LintOutputToggles
 
@@ -84,6 +88,13 @@ def _reporting_params_dependency(
     report_json: Annotated[Path | None, typer.Option(None, help=REPORT_JSON_HELP)],
     sarif_out: Annotated[Path | None, typer.Option(None, help=SARIF_HELP)],
     pr_summary_out: Annotated[Path | None, typer.Option(None, help=PR_SUMMARY_OUT_HELP)],
+    report_compact: Annotated[bool, typer.Option(False, "--report-compact", help=REPORT_COMPACT_HELP)],
+    profile: Annotated[Path | None, typer.Option(None, "--profile", help=PROFILE_HELP)],
+    stream: Annotated[bool, typer.Option(False, "--stream", help=STREAM_HELP)],
+    max_diagnostics: Annotated[
+        int | None,
+        typer.Option(None, "--max-diagnostics", min=1, help=MAX_DIAGNOSTICS_HELP),
+    ],
 ) -> LintReportingParams:
     """Return reporting parameters determining diagnostic artifact output.
 
@@ -93,6 +104,10 @@ def _reporting_params_dependency(
         report_json: Optional JSON report destination.
         sarif_out: Optional SARIF output path.
         pr_summary_out: Optional PR summary output path.
+        report_compact: Whether machine-readable reports omit indentation.
+        profile: Optional Chrome trace destination enabling run profiling.
+        stream: Whether concise diagnostics print as each tool finishes.
+        max_diagnostics: Optional cap on the number of concise diagnostics printed.
 
     Returns:
         LintReportingParams: Structured reporting options.
@@ -104,6 +119,10 @@ def _reporting_params_dependency(
         report_json=report_json,
         sarif_out=sarif_out,
         pr_summary_out=pr_summary_out,
+        report_compact=report_compact,
+        profile_out=profile,
+        stream=stream,
+        max_diagnostics=max_diagnostics,
     )
 
 
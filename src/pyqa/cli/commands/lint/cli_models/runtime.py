@@ -11,16 +11,29 @@ import typer
 
 from ....core.shared import Depends
 from ..params import LintExecutionRuntimeParams, RuntimeCacheParams, RuntimeConcurrencyParams
-from .constants import CACHE_DIR_HELP, JOBS_HELP, STRICT_CONFIG_HELP, USE_LOCAL_LINTERS_HELP
+from .constants import (
+    CACHE_DIR_HELP,
+    JOBS_HELP,
+    PYTHON_WORKERS_HELP,
+    REMOTE_CACHE_HELP,
+    STRICT_CONFIG_HELP,
+    TOOL_SERVERS_HELP,
+    USE_LOCAL_LINTERS_HELP,
+)
 
 
 def _runtime_concurrency_dependency(
     jobs: Annotated[int | None, typer.Option(None, "--jobs", "-j", min=1, help=JOBS_HELP)],
-    bail: Annotated[bool, typer.Option(False, "--bail", help="Exit on first tool failure.")],
+    bail: Annotated[
+        bool,
+        typer.Option(False, "--bail", help="Exit on first tool failure, stopping tools that are still running."),
+    ],
     use_local_linters: Annotated[
         bool,
         typer.Option(False, "--use-local-linters", help=USE_LOCAL_LINTERS_HELP),
     ],
+    tool_servers: Annotated[bool, typer.Option(False, "--tool-servers", help=TOOL_SERVERS_HELP)],
+    python_workers: Annotated[bool, typer.Option(False, "--python-workers", help=PYTHON_WORKERS_HELP)],
 ) -> RuntimeConcurrencyParams:
     """Return concurrency parameters controlling parallel execution.
 
@@ -28,29 +41,39 @@ def _runtime_concurrency_dependency(
         jobs: Optional explicit job count provided by the user.
         bail: Flag indicating whether execution should abort on first failure.
         use_local_linters: Whether vendored linters should be preferred.
+        tool_servers: Whether supported tools run through persistent daemon clients.
+        python_workers: Whether Python tools run in pre-imported forked workers.
 
     Returns:
         RuntimeConcurrencyParams: Structured concurrency parameters.
     """
 
-    return RuntimeConcurrencyParams(jobs=jobs, bail=bail, use_local_linters=use_local_linters)
+    return RuntimeConcurrencyParams(
+        jobs=jobs,
+        bail=bail,
+        use_local_linters=use_local_linters,
+        tool_servers=tool_servers,
+        python_workers=python_workers,
+    )
 
 
 def _runtime_cache_dependency(
     no_cache: Annotated[bool, typer.Option(False, help="Disable on-disk result caching.")],
     cache_dir: Annotated[Path, typer.Option(Path(".lint-cache"), "--cache-dir", help=CACHE_DIR_HELP)],
+    remote_cache: Annotated[str | None, typer.Option(None, "--remote-cache", help=REMOTE_CACHE_HELP)],
 ) -> RuntimeCacheParams:
     """Return runtime cache parameters derived from CLI options.
 
     Args:
         no_cache: Flag indicating whether caching should be disabled.
         cache_dir: Directory used to persist cached results.
+        remote_cache: Optional base URL of a shared remote result cache.
 
     Returns:
         RuntimeCacheParams: Structured cache settings for lint execution.
     """
 
-    return RuntimeCacheParams(no_cache=no_cache, cache_dir=cache_dir)
+    return RuntimeCacheParams(no_cache=no_cache, cache_dir=cache_dir, remote_cache=remote_cache)
 
 
 def _execution_runtime_dependency(
@@ -76,6 +99,9 @@ def _execution_runtime_dependency(
         cache_dir=cache.cache_dir,
         use_local_linters=concurrency.use_local_linters,
         strict_config=strict_config,
+        remote_cache=cache.remote_cache,
+        tool_servers=concurrency.tool_servers,
+        python_workers=concurrency.python_workers,
     )
 
 
@@ -82,10 +82,26 @@ def _git_params_dependency(
     diff_ref: Annotated[str, typer.Option("HEAD", help="Git ref for change detection.")],
     include_untracked: Annotated[bool, typer.Option(True, help="Include untracked files during git discovery.")],
     base_branch: Annotated[str | None, typer.Option(None, help="Base branch for merge-base diffing.")],
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            False,
+            "--incremental",
+            help="Lint only changed files and merge cached diagnostics for untouched files (implies --changed-only).",
+        ),
+    ],
     no_lint_tests: Annotated[
         bool,
         typer.Option(False, "--no-lint-tests", help="Exclude paths containing 'tests' from linting."),
     ],
+    with_dependents: Annotated[
+        bool,
+        typer.Option(
+            False,
+            "--with-dependents",
+            help="Also lint modules that transitively import a changed file (implies --changed-only).",
+        ),
+    ],
 ) -> LintGitParams:
     """Return git-related discovery parameters derived from CLI input.
 
@@ -94,18 +110,22 @@ def _git_params_dependency(
         diff_ref: Git reference used for change detection.
         include_untracked: Whether to include untracked files.
         base_branch: Base branch used to compute merge-base diffs.
+        incremental: Whether to restrict analysis to changed files.
         no_lint_tests: Flag indicating whether test directories are excluded.
+        with_dependents: Whether to expand changed files to their transitive importers.
 
     Returns:
         LintGitParams: Structured git discovery parameters.
     """
 
     return LintGitParams(
-        changed_only=changed_only,
+        changed_only=changed_only or incremental or with_dependents,
         diff_ref=diff_ref,
         include_untracked=include_untracked,
         base_branch=base_branch,
         no_lint_tests=no_lint_tests,
+        incremental=incremental,
+        with_dependents=with_dependents,
     )
 
 
@@ -18,12 +18,15 @@ from pyqa.orchestration.selection_context import PHASE_ORDER, UnknownToolRequest
 from pyqa.runtime.console.manager import detect_tty
 
 from ....config import ConfigError
+from ....core.runtime.profiling import Profiler, profile_span, profiling
 from ....linting.registry import iter_internal_linters
 from ....platform.workspace import is_pyqa_lint_workspace
+from ....reporting.presenters import StreamingConcisePresenter
 from ...core.config_builder import build_config
 from ...core.runtime import ServiceResolutionError
 from ...core.shared import Depends, build_cli_logger
 from .cli_models import _build_lint_cli_inputs
+from .cli_models.constants import OUTPUT_MODE_CONCISE
 from .meta import (
     MetaActionOutcome,
     handle_initial_meta_actions,
@@ -32,7 +35,7 @@ from .meta import (
 from .params import LintCLIInputs
 from .preparation import PROVIDED_FLAG_INTERNAL_LINTERS, PreparedLintState, prepare_lint_state
 from .progress import ExecutionProgressController
-from .reporting import handle_reporting
+from .reporting import handle_reporting, write_profile_report
 from .runtime import LintRuntimeContext, build_lint_runtime_context
 
 LintPhaseLiteral = PhaseLiteral
@@ -76,6 +79,29 @@ def _execute_lint(
     _activate_internal_linters(state)
     early_meta = handle_initial_meta_actions(state)
     _exit_if_handled(early_meta)
+    profile_out = state.artifacts.profile_out
+    if profile_out is None:
+        _run_lint_runtime(state)
+        return
+    with profiling(Profiler()) as profiler:
+        try:
+            _run_lint_runtime(state)
+        finally:
+            write_profile_report(
+                profiler,
+                profile_out,
+                color=not inputs.output.rendering.no_color,
+                logger=logger,
+            )
+
+
+def _run_lint_runtime(state: PreparedLintState) -> None:
+    """Build the runtime context, handle runtime meta actions, and lint.
+
+    Args:
+        state: Prepared lint state derived from CLI inputs.
+    """
+
     runtime = _build_runtime_context(state)
     runtime_meta = handle_runtime_meta_actions(runtime, phase_order=PHASE_SORT_ORDER)
     _exit_if_handled(runtime_meta)
@@ -191,7 +217,8 @@ def _build_runtime_context(state: PreparedLintState) -> LintRuntimeContext:
         typer.BadParameter: If configuration loading fails.
     """
     try:
-        config = build_config(state.options)
+        with profile_span("config"):
+            config = build_config(state.options)
     except (ValueError, ConfigError) as exc:
         raise typer.BadParameter(str(exc)) from exc
 
@@ -225,6 +252,10 @@ def _run_lint_pipeline(runtime: LintRuntimeContext) -> None:
         progress_factory=Progress,
     )
     controller.install(runtime.hooks)
+    annotation_provider = _resolve_annotation_provider(runtime)
+    streamer = _build_streaming_presenter(runtime, annotation_provider)
+    if streamer is not None:
+        streamer.install(runtime.hooks)
 
     try:
         result = runtime.orchestrator.run(config, root=runtime.state.root)
@@ -241,24 +272,61 @@ def _run_lint_pipeline(runtime: LintRuntimeContext) -> None:
         controller.console.print(final_summary)
     controller.stop()
 
-    annotation_provider: AnnotationProvider | None = None
-    if runtime.services is not None:
-        try:
-            annotation_provider = cast(
-                AnnotationProvider,
-                runtime.services.resolve("annotation_provider"),
-            )
-        except ServiceResolutionError:
-            annotation_provider = None
-
-    handle_reporting(
-        result,
-        config,
-        runtime.state.artifacts,
-        logger=runtime.state.logger,
+    with profile_span("rendering"):
+        handle_reporting(
+            result,
+            config,
+            runtime.state.artifacts,
+            logger=runtime.state.logger,
+            annotation_provider=annotation_provider,
+            streamer=streamer,
+        )
+    raise typer.Exit(code=1 if issues_present else 0)
+
+
+def _resolve_annotation_provider(runtime: LintRuntimeContext) -> AnnotationProvider | None:
+    """Return the annotation provider registered with the runtime services.
+
+    Args:
+        runtime: Prepared runtime context exposing the service container.
+
+    Returns:
+        AnnotationProvider | None: Registered provider, or ``None`` when unavailable.
+    """
+
+    if runtime.services is None:
+        return None
+    try:
+        return cast(AnnotationProvider, runtime.services.resolve("annotation_provider"))
+    except ServiceResolutionError:
+        return None
+
+
+def _build_streaming_presenter(
+    runtime: LintRuntimeContext,
+    annotation_provider: AnnotationProvider | None,
+) -> StreamingConcisePresenter | None:
+    """Return a streaming presenter when ``--stream`` applies to this run.
+
+    Streaming only affects the concise output mode; quiet runs and the
+    pretty/raw modes keep rendering once the orchestrator finishes.
+
+    Args:
+        runtime: Prepared runtime context containing the output configuration.
+        annotation_provider: Provider used to highlight streamed messages.
+
+    Returns:
+        StreamingConcisePresenter | None: Presenter to install, or ``None`` when disabled.
+    """
+
+    output = runtime.config.output
+    if not output.stream or output.quiet or output.output != OUTPUT_MODE_CONCISE:
+        return None
+    return StreamingConcisePresenter(
+        output,
+        runtime.state.root,
         annotation_provider=annotation_provider,
     )
-    raise typer.Exit(code=1 if issues_present else 0)
 
 
 def _handle_unknown_only_error(logger: CLILoggerView, exc: UnknownToolRequestedError) -> None:
@@ -126,6 +126,10 @@ class LintReportingParams:
     report_json: Path | None
     sarif_out: Path | None
     pr_summary_out: Path | None
+    report_compact: bool = False
+    profile_out: Path | None = None
+    stream: bool = False
+    max_diagnostics: int | None = None
 
 
 @dataclass(slots=True)
@@ -514,6 +518,7 @@ class LintOutputArtifacts:
     report_json: Path | None
     sarif_out: Path | None
     pr_summary_out: Path | None
+    profile_out: Path | None = None
 
 
 @dataclass(slots=True)
@@ -523,6 +528,8 @@ class RuntimeConcurrencyParams:
     jobs: int | None
     bail: bool
     use_local_linters: bool
+    tool_servers: bool = False
+    python_workers: bool = False
 
 
 @dataclass(slots=True)
@@ -531,6 +538,7 @@ class RuntimeCacheParams:
 
     no_cache: bool
     cache_dir: Path
+    remote_cache: str | None = None
 
 
 @dataclass(slots=True)
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import copy
 import os
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
@@ -14,6 +15,8 @@ from typing import Final
 import typer
 
 from pyqa.core.config.constants import PYQA_LINT_DIR_NAME
+from pyqa.interfaces.analysis import ChangeScopeView
+from pyqa.interfaces.discovery import FileInventoryView
 from pyqa.interfaces.linting import CLILogger as CLILoggerView
 from pyqa.linting.suppressions import SuppressionRegistry
 from pyqa.platform.workspace import is_pyqa_lint_workspace
@@ -95,6 +98,9 @@ class PreparedLintState:
     artifacts: LintOutputArtifacts
     suppressions: SuppressionRegistry | None
     _presentation: tuple[CLIDisplayOptions, CLILoggerView]
+    change_scope: ChangeScopeView | None
+    file_inventory: FileInventoryView | None
+    run_cache: dict[str, object]
 
     def __init__(self, params: PreparedLintStateParams) -> None:
         """Initialize the prepared lint state container.
@@ -110,6 +116,9 @@ class PreparedLintState:
         self.artifacts = params.artifacts
         self.suppressions = params.suppressions
         self._presentation = params.presentation
+        self.change_scope = None
+        self.file_inventory = None
+        self.run_cache = {}
 
     def has_meta_flag(self, flag: str) -> bool:
         """Return ``True`` when ``flag`` is present on the meta options.
@@ -123,6 +132,36 @@ class PreparedLintState:
 
         return bool(getattr(self.meta, flag, False))
 
+    def with_change_scope(self, change_scope: ChangeScopeView) -> PreparedLintState:
+        """Return a shallow copy of the state restricted to ``change_scope``.
+
+        Args:
+            change_scope: Incremental change scope the copy should carry.
+
+        Returns:
+            PreparedLintState: Copy sharing every other attribute, including
+            ``run_cache``, with ``self``.
+        """
+
+        scoped = copy.copy(self)
+        scoped.change_scope = change_scope
+        return scoped
+
+    def with_file_inventory(self, file_inventory: FileInventoryView) -> PreparedLintState:
+        """Return a shallow copy of the state carrying ``file_inventory``.
+
+        Args:
+            file_inventory: Inventory built by the orchestrator for this run.
+
+        Returns:
+            PreparedLintState: Copy sharing every other attribute, including
+            ``run_cache``, with ``self``.
+        """
+
+        scoped = copy.copy(self)
+        scoped.file_inventory = file_inventory
+        return scoped
+
     def iter_ignored_pyqa_lint(self) -> tuple[str, ...]:
         """Return immutable view of ``PY_QA`` discovery exclusions.
 
@@ -362,6 +401,8 @@ def _build_git_options(git_params: LintGitParams, no_lint_tests: bool) -> LintGi
         include_untracked=git_params.include_untracked,
         base_branch=git_params.base_branch,
         no_lint_tests=no_lint_tests,
+        incremental=git_params.incremental,
+        with_dependents=git_params.with_dependents,
     )
 
 
@@ -419,6 +460,9 @@ def _build_output_bundle(
             pr_summary_limit=output.summary.pr_summary_limit,
             pr_summary_min_severity=output.summary.pr_summary_min_severity,
             pr_summary_template=output.summary.pr_summary_template,
+            report_compact=output.reporting.report_compact,
+            stream=output.reporting.stream,
+            max_diagnostics=output.reporting.max_diagnostics,
         ),
     )
 
@@ -478,6 +522,9 @@ def _build_runtime_options(
         cache_dir=cache_dir,
         use_local_linters=use_local_linters,
         strict_config=runtime.strict_config,
+        remote_cache=runtime.remote_cache,
+        tool_servers=runtime.tool_servers,
+        python_workers=runtime.python_workers,
     )
 
 
@@ -603,6 +650,7 @@ def _resolve_artifacts(
         report_json=_normalize(reporting.report_json),
         sarif_out=_normalize(reporting.sarif_out),
         pr_summary_out=_normalize(reporting.pr_summary_out),
+        profile_out=_normalize(reporting.profile_out),
     )
 
 
@@ -825,6 +873,8 @@ def _collect_provided_flags(
         "diff_ref",
         "include_untracked",
         "base_branch",
+        "incremental",
+        "with_dependents",
         "paths_from_stdin",
         "dirs",
         "exclude",
@@ -850,10 +900,16 @@ def _collect_provided_flags(
         "bail",
         "no_cache",
         "cache_dir",
+        "remote_cache",
+        "tool_servers",
+        "python_workers",
         "pr_summary_out",
         "pr_summary_limit",
         "pr_summary_min_severity",
         "pr_summary_template",
+        "report_compact",
+        "stream",
+        "max_diagnostics",
         PROVIDED_FLAG_USE_LOCAL_LINTERS,
         "line_length",
         "max_complexity",
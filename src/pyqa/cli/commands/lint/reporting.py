@@ -5,15 +5,19 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from pyqa.core.models import RunResult
 from pyqa.interfaces.config import Config as ConfigProtocol
 from pyqa.interfaces.linting import CLILogger as CLILoggerView
 from pyqa.interfaces.linting import LintOutputArtifacts
 
 from ....analysis.providers import NullAnnotationProvider
+from ....core.runtime.profiling import Profiler
 from ....interfaces.analysis import AnnotationProvider
 from ....reporting import render
 from ....reporting.output.highlighting import set_annotation_provider as set_highlighting_annotation_provider
+from ....reporting.presenters import StreamingConcisePresenter
 from ....reporting.presenters.emitters import (
     PRSummaryOptions,
 )
@@ -23,6 +27,7 @@ from ....reporting.presenters.emitters import (
     write_pr_summary,
     write_sarif_report,
 )
+from ....reporting.presenters.profile import emit_profile_summary
 
 
 def handle_reporting(
@@ -32,6 +37,7 @@ def handle_reporting(
     *,
     logger: CLILoggerView | None = None,
     annotation_provider: AnnotationProvider | None = None,
+    streamer: StreamingConcisePresenter | None = None,
 ) -> None:
     """Render console output and emit optional artifacts for ``pyqa lint``.
 
@@ -41,6 +47,8 @@ def handle_reporting(
         artifacts: Filesystem destinations for optional report artifacts.
         logger: Optional CLI logger used to report emitted artifact paths.
         annotation_provider: Optional annotation provider used to augment reporting.
+        streamer: Streaming presenter that already printed the diagnostics, when
+            ``--stream`` was active; only its footer is rendered here.
 
     This function renders console output and may write reporting artifacts.
     """
@@ -48,13 +56,16 @@ def handle_reporting(
     provider = annotation_provider or NullAnnotationProvider()
     set_highlighting_annotation_provider(provider)
     set_emitter_annotation_provider(provider)
-    render(result, config.output, annotation_provider=provider)
+    if streamer is not None:
+        streamer.finish(result)
+    else:
+        render(result, config.output, annotation_provider=provider)
     if artifacts.report_json:
-        write_json_report(result, artifacts.report_json)
+        write_json_report(result, artifacts.report_json, compact=config.output.report_compact)
         if logger:
             logger.ok(f"Saved JSON report to {artifacts.report_json}")
     if artifacts.sarif_out:
-        write_sarif_report(result, artifacts.sarif_out)
+        write_sarif_report(result, artifacts.sarif_out, compact=config.output.report_compact)
         if logger:
             logger.ok(f"Saved SARIF report to {artifacts.sarif_out}")
     if artifacts.pr_summary_out:
@@ -68,4 +79,32 @@ def handle_reporting(
             logger.ok(f"Saved PR summary to {artifacts.pr_summary_out}")
 
 
-__all__ = ["handle_reporting"]
+def write_profile_report(
+    profiler: Profiler,
+    destination: Path,
+    *,
+    color: bool,
+    logger: CLILoggerView | None = None,
+) -> None:
+    """Print the profiling summary and write the Chrome trace for ``--profile``.
+
+    Args:
+        profiler: Profiler that recorded the run's spans.
+        destination: Chrome trace output path.
+        color: Whether the summary tables should be styled.
+        logger: Optional CLI logger used to report the trace path.
+    """
+
+    emit_profile_summary(profiler.summary(), color=color)
+    try:
+        profiler.write_chrome_trace(destination)
+    except OSError as exc:
+        if logger:
+            message = f"Unable to write profile trace to {destination}: {exc}"
+            logger.fail(message)
+        return
+    if logger:
+        logger.ok(f"Saved profile trace to {destination}")
+
+
+__all__ = ["handle_reporting", "write_profile_report"]
@@ -18,6 +18,7 @@ from ....analysis.bootstrap import register_analysis_services
 from ....catalog.model_catalog import CatalogSnapshot
 from ....core.environment.tool_env.models import PreparedCommand
 from ....core.models import RunResult, ToolOutcome
+from ....core.runtime.profiling import profile_span
 from ....discovery import build_default_discovery
 from ....discovery.base import SupportsDiscovery
 from ....interfaces.orchestration import ExecutionPipeline, OrchestratorHooks
@@ -357,7 +358,8 @@ def build_lint_runtime_context(
     """
 
     deps = dependencies or DEFAULT_LINT_DEPENDENCIES
-    catalog_snapshot = deps.catalog_initializer(deps.registry)
+    with profile_span("catalog"):
+        catalog_snapshot = deps.catalog_initializer(deps.registry)
     ensure_internal_tools_registered(registry=deps.registry, state=state, config=config)
     configure_internal_tool_defaults(registry=deps.registry, state=state)
     hooks = OrchestratorHooks()
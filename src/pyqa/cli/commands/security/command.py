@@ -51,6 +51,7 @@ def security_scan_command(
         root=root_path,
         use_emoji=use_emoji,
         use_bandit=options.use_bandit,
+        jobs=options.jobs,
     )
     result = scanner.run(list(target_files))
     exit_code = _report_security_findings(result, use_emoji=use_emoji)
@@ -35,6 +35,16 @@ NO_BANDIT_OPTION = Annotated[
     bool,
     typer.Option(False, "--no-bandit", help="Skip running bandit static analysis."),
 ]
+JOBS_OPTION = Annotated[
+    int | None,
+    typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker processes used to scan files (defaults to 75% of CPUs).",
+    ),
+]
 NO_EMOJI_OPTION = Annotated[
     bool,
     typer.Option(False, "--no-emoji", help="Disable emoji in output."),
@@ -50,6 +60,7 @@ class SecurityCLIOptions:
     staged: bool
     use_bandit: bool
     use_emoji: bool
+    jobs: int | None = None
 
 
 def _normalise_files(paths: list[Path] | None) -> tuple[Path, ...]:
@@ -71,6 +82,7 @@ def build_security_options(
     staged: STAGED_OPTION,
     no_bandit: NO_BANDIT_OPTION,
     no_emoji: NO_EMOJI_OPTION,
+    jobs: JOBS_OPTION,
 ) -> SecurityCLIOptions:
     """Construct ``SecurityCLIOptions`` from Typer parameters.
 
@@ -80,6 +92,7 @@ def build_security_options(
         staged: Flag indicating whether staged files should be scanned.
         no_bandit: Flag disabling Bandit analysis when ``True``.
         no_emoji: Flag disabling emoji output when ``True``.
+        jobs: Optional worker process count for file scanning.
 
     Returns:
         SecurityCLIOptions: Structured CLI options for the security scan.
@@ -91,6 +104,7 @@ def build_security_options(
         staged=staged,
         use_bandit=not no_bandit,
         use_emoji=not no_emoji,
+        jobs=jobs,
     )
 
 
@@ -101,5 +115,6 @@ __all__ = [
     "ROOT_OPTION",
     "STAGED_OPTION",
     "NO_BANDIT_OPTION",
+    "JOBS_OPTION",
     "NO_EMOJI_OPTION",
 ]
@@ -11,6 +11,7 @@ from typing import Final, cast
 from pyqa.core.config.loader import ConfigError, ConfigLoader, FieldUpdate
 from pyqa.interfaces.config import Config as ConfigProtocol
 
+from ....cache.version_probes import VersionProbeCache
 from ....catalog.model_catalog import CatalogSnapshot
 from ....catalog.model_tool import ToolDefinition
 from ....tools.base import Tool
@@ -128,8 +129,11 @@ def prepare_context(inputs: ToolInfoInputs, *, logger: CLILogger) -> ToolInfoCon
     config_data = load_configuration(inputs, logger=logger)
     snapshot = resolve_catalog_snapshot(inputs)
     tool = resolve_tool(inputs, logger=logger)
-    status = check_tool_status(tool)
     config_model = config_data.config
+    cache_dir = config_model.execution.cache_dir
+    probes = VersionProbeCache(cache_dir if cache_dir.is_absolute() else inputs.root.resolve() / cache_dir)
+    status = check_tool_status(tool, cache=probes)
+    probes.save()
     tool_settings = config_model.tool_settings
     overrides = dict(tool_settings.get(tool.name, {}) or {})
     catalog_tool = find_catalog_tool(tool.name, snapshot)
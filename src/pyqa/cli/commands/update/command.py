@@ -19,6 +19,7 @@ from pyqa.runtime.installers.update import (
     DEFAULT_STRATEGIES,
     CommandRunner,
     UpdateResult,
+    UpdateStateStore,
     Workspace,
     WorkspaceDiscovery,
     WorkspacePlanner,
@@ -26,7 +27,8 @@ from pyqa.runtime.installers.update import (
     ensure_lint_install,
 )
 
-from ....core.logging import fail, ok, warn
+from ....config import default_parallel_jobs
+from ....core.logging import fail, info, ok, warn
 from ....core.runtime.process import CommandOptions, run_command
 from ...core.shared import Depends
 from ...core.typer_ext import TyperAppConfig, create_typer
@@ -118,7 +120,20 @@ def _run_update(options: UpdateOptions) -> None:
         raise typer.Exit(code=0)
 
     runner: CommandRunner = _default_runner
-    updater = WorkspaceUpdater(runner=runner, dry_run=options.dry_run, use_emoji=options.use_emoji)
+    cache_dir = load_result.config.execution.cache_dir
+    state = UpdateStateStore.load(
+        cache_dir if cache_dir.is_absolute() else options.root / cache_dir,
+        root=options.root,
+    )
+    updater = WorkspaceUpdater(
+        runner=runner,
+        dry_run=options.dry_run,
+        use_emoji=options.use_emoji,
+        jobs=options.jobs or default_parallel_jobs(),
+        manager_limits=update_config.manager_concurrency,
+        state=state,
+        force=options.force,
+    )
     if not options.skip_lint_install:
         ensure_lint_install(options.root, runner, dry_run=options.dry_run)
 
@@ -297,6 +312,12 @@ def _emit_update_summary(result: UpdateResult, *, dry_run: bool, use_emoji: bool
         )
         raise typer.Exit(code=0)
 
+    if result.unchanged:
+        info(
+            f"Skipped {len(result.unchanged)} workspace(s) with unchanged manifests.",
+            use_emoji=use_emoji,
+        )
+
     if result.failures:
         fail(
             f"Dependency updates failed for {len(result.failures)} workspace(s)",
@@ -46,6 +46,24 @@ DRY_RUN_OPTION = Annotated[
         help="Print planned commands without executing.",
     ),
 ]
+JOBS_OPTION = Annotated[
+    int | None,
+    typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of workspaces updated concurrently (defaults to 75% of CPUs).",
+    ),
+]
+FORCE_OPTION = Annotated[
+    bool,
+    typer.Option(
+        False,
+        "--force",
+        help="Update every workspace even when its manifests are unchanged since the last update.",
+    ),
+]
 EMOJI_OPTION = Annotated[
     bool,
     typer.Option(True, "--emoji/--no-emoji", help="Toggle emoji output."),
@@ -61,6 +79,8 @@ class UpdateOptions:
     skip_lint_install: bool
     dry_run: bool
     use_emoji: bool
+    jobs: int | None = None
+    force: bool = False
 
 
 def build_update_options(
@@ -69,6 +89,8 @@ def build_update_options(
     skip_lint_install: SKIP_LINT_OPTION,
     dry_run: DRY_RUN_OPTION,
     emoji: EMOJI_OPTION,
+    jobs: JOBS_OPTION,
+    force: FORCE_OPTION,
 ) -> UpdateOptions:
     """Construct ``UpdateOptions`` from Typer parameters.
 
@@ -78,6 +100,8 @@ def build_update_options(
         skip_lint_install: Flag disabling lint install bootstrapping.
         dry_run: Flag indicating whether commands should be executed.
         emoji: Flag controlling emoji usage in CLI output.
+        jobs: Optional cap on concurrently updated workspaces.
+        force: Flag bypassing the unchanged-manifest skip cache.
 
     Returns:
         UpdateOptions: Structured CLI options for dependency updates.
@@ -89,6 +113,8 @@ def build_update_options(
         skip_lint_install=skip_lint_install,
         dry_run=dry_run,
         use_emoji=emoji,
+        jobs=jobs,
+        force=force,
     )
 
 
@@ -100,4 +126,6 @@ __all__ = [
     "SKIP_LINT_OPTION",
     "DRY_RUN_OPTION",
     "EMOJI_OPTION",
+    "FORCE_OPTION",
+    "JOBS_OPTION",
 ]
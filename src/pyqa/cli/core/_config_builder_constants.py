@@ -10,8 +10,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Final, Literal
 
-from ...catalog.metadata import catalog_general_suppressions
-from ...testing.suppressions import flatten_test_suppressions
+from ...cache import memoize
 
 
 class LintOptionKey(str, Enum):
@@ -29,6 +28,8 @@ class LintOptionKey(str, Enum):
     DIFF_REF = "diff_ref"
     INCLUDE_UNTRACKED = "include_untracked"
     BASE_BRANCH = "base_branch"
+    INCREMENTAL = "incremental"
+    WITH_DEPENDENTS = "with_dependents"
     DIRS = "dirs"
     PATHS = "paths"
     EXCLUDE = "exclude"
@@ -46,6 +47,9 @@ class LintOptionKey(str, Enum):
     PR_SUMMARY_LIMIT = "pr_summary_limit"
     PR_SUMMARY_MIN_SEVERITY = "pr_summary_min_severity"
     PR_SUMMARY_TEMPLATE = "pr_summary_template"
+    REPORT_COMPACT = "report_compact"
+    STREAM = "stream"
+    MAX_DIAGNOSTICS = "max_diagnostics"
     ONLY = "only"
     LANGUAGE = "language"
     FIX_ONLY = "fix_only"
@@ -54,6 +58,9 @@ class LintOptionKey(str, Enum):
     JOBS = "jobs"
     NO_CACHE = "no_cache"
     CACHE_DIR = "cache_dir"
+    REMOTE_CACHE = "remote_cache"
+    TOOL_SERVERS = "tool_servers"
+    PYTHON_WORKERS = "python_workers"
     USE_LOCAL_LINTERS = "use_local_linters"
     LINE_LENGTH = "line_length"
     SQL_DIALECT = "sql_dialect"
@@ -128,6 +135,10 @@ def build_default_tool_filters() -> dict[str, list[str]]:
         dict[str, list[str]]: Mapping of tool identifiers to filtered console noise patterns.
     """
 
+    # Loading the catalog dominates CLI start-up, so defer it until filters are needed.
+    from ...catalog.metadata import catalog_general_suppressions
+    from ...testing.suppressions import flatten_test_suppressions
+
     merged: dict[str, list[str]] = {tool: list(patterns) for tool, patterns in _BASE_TOOL_FILTERS.items()}
     for tool, test_patterns in flatten_test_suppressions().items():
         _extend_filter_patterns(merged, tool, test_patterns)
@@ -168,7 +179,35 @@ def _extend_filter_patterns(
         target[tool] = additions
 
 
-DEFAULT_TOOL_FILTERS: Final[dict[str, list[str]]] = build_default_tool_filters()
+@memoize(maxsize=1)
+def default_tool_filters() -> dict[str, list[str]]:
+    """Return the default tool filters, building them on first use.
+
+    Returns:
+        dict[str, list[str]]: Shared mapping of tool identifiers to filter
+        patterns; callers must copy before mutating.
+    """
+
+    return build_default_tool_filters()
+
+
+def __getattr__(name: str) -> dict[str, list[str]]:
+    """Resolve ``DEFAULT_TOOL_FILTERS`` lazily so importing this module stays cheap.
+
+    Args:
+        name: Attribute requested from the module.
+
+    Returns:
+        dict[str, list[str]]: Default tool filters for ``DEFAULT_TOOL_FILTERS``.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily computed attribute.
+    """
+
+    if name == "DEFAULT_TOOL_FILTERS":
+        return default_tool_filters()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 DEFAULT_EXCLUDES: Final[tuple[Path, ...]] = (
     Path(".venv"),
@@ -204,7 +243,7 @@ __all__ = [
     "SummarySeverity",
     "_ALLOWED_OUTPUT_MODES",
     "_ALLOWED_SUMMARY_SEVERITIES",
-    "DEFAULT_TOOL_FILTERS",
+    "default_tool_filters",
     "DEFAULT_EXCLUDES",
     "FILE_DISCOVERY_SECTION",
     "OUTPUT_SECTION",
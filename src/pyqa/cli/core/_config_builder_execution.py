@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from pathlib import Path
-from typing import Final, TypedDict
+from typing import TypedDict
 
 from ...config import ExecutionConfig
 from ._config_builder_constants import LintOptionKey
@@ -27,6 +27,9 @@ class ExecutionOverrides(TypedDict):
     jobs: int | None
     cache_enabled: bool
     cache_dir: Path
+    remote_cache_url: str | None
+    tool_servers: bool
+    python_workers: bool
     use_local_linters: bool
     line_length: int
     sql_dialect: str
@@ -58,6 +61,9 @@ def apply_execution_overrides(
             "jobs": overrides["jobs"],
             "cache_enabled": overrides["cache_enabled"],
             "cache_dir": overrides["cache_dir"],
+            "remote_cache_url": overrides["remote_cache_url"],
+            "tool_servers": overrides["tool_servers"],
+            "python_workers": overrides["python_workers"],
             "use_local_linters": overrides["use_local_linters"],
             "line_length": overrides["line_length"],
             "sql_dialect": overrides["sql_dialect"],
@@ -93,8 +99,6 @@ def collect_execution_overrides(
 
     bail_value = select_flag(runtime_options.bail, current.bail, LintOptionKey.BAIL, provided)
     jobs_value = select_value(runtime_options.jobs, current.jobs, LintOptionKey.JOBS, provided)
-    if bail_value:
-        jobs_value = SERIAL_JOB_COUNT
 
     cache_dir = (
         resolve_path(project_root, runtime_options.cache_dir).resolve()
@@ -127,6 +131,24 @@ def collect_execution_overrides(
             provided,
         ),
         "cache_dir": cache_dir,
+        "remote_cache_url": select_value(
+            runtime_options.remote_cache,
+            current.remote_cache_url,
+            LintOptionKey.REMOTE_CACHE,
+            provided,
+        ),
+        "tool_servers": select_flag(
+            runtime_options.tool_servers,
+            current.tool_servers,
+            LintOptionKey.TOOL_SERVERS,
+            provided,
+        ),
+        "python_workers": select_flag(
+            runtime_options.python_workers,
+            current.python_workers,
+            LintOptionKey.PYTHON_WORKERS,
+            provided,
+        ),
         "use_local_linters": select_flag(
             runtime_options.use_local_linters,
             current.use_local_linters,
@@ -155,12 +177,8 @@ def collect_execution_overrides(
     return overrides
 
 
-SERIAL_JOB_COUNT: Final[int] = 1
-
-
 __all__ = [
     "ExecutionOverrides",
     "apply_execution_overrides",
     "collect_execution_overrides",
-    "SERIAL_JOB_COUNT",
 ]
@@ -56,6 +56,8 @@ def apply_file_discovery_overrides(
         "diff_ref": overrides.scalars["diff_ref"],
         "include_untracked": overrides.flags["include_untracked"],
         "base_branch": overrides.scalars["base_branch"],
+        "incremental": overrides.flags["incremental"],
+        "with_dependents": overrides.flags["with_dependents"],
     }
     return model_clone(current, updates=updates)
 
@@ -127,6 +129,18 @@ def collect_file_discovery_overrides(
             LintOptionKey.INCLUDE_UNTRACKED,
             provided,
         ),
+        "incremental": select_flag(
+            git_options.incremental,
+            current.incremental,
+            LintOptionKey.INCREMENTAL,
+            provided,
+        ),
+        "with_dependents": select_flag(
+            git_options.with_dependents,
+            current.with_dependents,
+            LintOptionKey.WITH_DEPENDENTS,
+            provided,
+        ),
     }
     scalars_payload: dict[str, str | None] = {
         "diff_ref": select_value(
@@ -13,13 +13,13 @@ from ...config import OutputConfig
 from ._config_builder_constants import (
     _ALLOWED_OUTPUT_MODES,
     _ALLOWED_SUMMARY_SEVERITIES,
-    DEFAULT_TOOL_FILTERS,
     FILTER_PATTERN_SEPARATOR,
     FILTER_SPEC_FORMAT,
     FILTER_SPEC_SEPARATOR,
     LintOptionKey,
     OutputMode,
     SummarySeverity,
+    default_tool_filters,
 )
 from ._config_builder_shared import resolve_optional_path, select_flag, select_value
 from .options import LintOptions, ToolFilters
@@ -41,6 +41,9 @@ class OutputOverrides(TypedDict):
     pr_summary_limit: int
     pr_summary_min_severity: str
     pr_summary_template: str
+    report_compact: bool
+    stream: bool
+    max_diagnostics: int | None
 
 
 def apply_output_overrides(
@@ -86,7 +89,7 @@ def collect_output_overrides(
 
     tool_filters = resolve_tool_filters(
         current.tool_filters,
-        DEFAULT_TOOL_FILTERS,
+        default_tool_filters(),
         options,
         has_option,
     )
@@ -162,6 +165,24 @@ def collect_output_overrides(
             LintOptionKey.PR_SUMMARY_TEMPLATE,
             provided,
         ),
+        "report_compact": select_flag(
+            summary.report_compact,
+            current.report_compact,
+            LintOptionKey.REPORT_COMPACT,
+            provided,
+        ),
+        "stream": select_flag(
+            summary.stream,
+            current.stream,
+            LintOptionKey.STREAM,
+            provided,
+        ),
+        "max_diagnostics": select_value(
+            summary.max_diagnostics,
+            current.max_diagnostics,
+            LintOptionKey.MAX_DIAGNOSTICS,
+            provided,
+        ),
     }
     return overrides
 
@@ -208,7 +229,7 @@ def parse_filters(specs: Iterable[str]) -> ToolFilters:
         ValueError: If a specification omits the tool identifier or separator.
     """
 
-    filters: ToolFilters = {tool: list(patterns) for tool, patterns in DEFAULT_TOOL_FILTERS.items()}
+    filters: ToolFilters = {tool: list(patterns) for tool, patterns in default_tool_filters().items()}
     for spec in specs:
         if FILTER_SPEC_SEPARATOR not in spec:
             raise ValueError(f"Invalid filter '{spec}'. Expected {FILTER_SPEC_FORMAT}")
@@ -7,7 +7,7 @@ from __future__ import annotations
 from collections.abc import Callable, Collection, Sequence
 from functools import partial
 from pathlib import Path
-from typing import Final, cast
+from typing import cast
 
 from pyqa.core.config.loader import ConfigLoader
 
@@ -24,15 +24,13 @@ from ...config import (
 from ...interfaces.config import ConfigSource
 from ._config_builder_constants import (
     DEDUPE_SECTION,
-)
-from ._config_builder_constants import DEFAULT_TOOL_FILTERS as _DEFAULT_TOOL_FILTERS
-from ._config_builder_constants import (
     EXECUTION_SECTION,
     FILE_DISCOVERY_SECTION,
     OUTPUT_SECTION,
     SEVERITY_RULES_KEY,
     TOOL_SETTINGS_KEY,
     LintOptionKey,
+    default_tool_filters,
 )
 from ._config_builder_execution import (
     apply_execution_overrides,
@@ -55,7 +53,23 @@ from ._config_builder_overrides import (
 from .options import LintOptions
 from .python_version_resolver import resolve_python_version
 
-DEFAULT_TOOL_FILTERS: Final = _DEFAULT_TOOL_FILTERS
+
+def __getattr__(name: str) -> dict[str, list[str]]:
+    """Expose ``DEFAULT_TOOL_FILTERS`` without building it at import time.
+
+    Args:
+        name: Attribute requested from the module.
+
+    Returns:
+        dict[str, list[str]]: Default tool filters for ``DEFAULT_TOOL_FILTERS``.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily computed attribute.
+    """
+
+    if name == "DEFAULT_TOOL_FILTERS":
+        return default_tool_filters()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def build_config(options: LintOptions, *, sources: Sequence[ConfigSource] | None = None) -> Config:
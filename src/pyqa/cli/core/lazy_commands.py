@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Typer group that imports command implementations only when dispatched."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from importlib import import_module
+from types import MappingProxyType
+from typing import ClassVar, Protocol, cast
+
+import click
+import typer.main
+from typer.core import TyperCommand
+
+from pyqa.cli.protocols import TyperAdapter, TyperLike
+
+from .typer_ext import SortedTyperGroup, create_typer
+
+
+@dataclass(frozen=True, slots=True)
+class LazyCommandSpec:
+    """Describe a built-in command registered on first use.
+
+    Attributes:
+        name: Command name exposed on the CLI.
+        module: Dotted path of the command package exposing ``register(app)``.
+        help_text: One-line summary shown in the parent's help listing.
+    """
+
+    name: str
+    module: str
+    help_text: str
+
+
+class _CommandPackage(Protocol):
+    """Command package exposing the standard ``register`` hook."""
+
+    def register(self, app: TyperLike) -> None:
+        """Register the package's command(s) on ``app``.
+
+        Args:
+            app: Typer-compatible application receiving the registration.
+        """
+
+
+class LazyTyperGroup(SortedTyperGroup):
+    """Sorted Typer group resolving built-in commands on demand.
+
+    Help listings render lightweight placeholders built from each
+    :class:`LazyCommandSpec`; the command package is imported only when the
+    command is resolved for dispatch (including ``<command> --help`` and shell
+    completion).
+    """
+
+    lazy_commands: ClassVar[Mapping[str, LazyCommandSpec]] = MappingProxyType({})
+    _load_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eager commands followed by lazily registered ones.
+
+        Args:
+            ctx: Click context of the group.
+
+        Returns:
+            list[str]: Command names in registration order.
+        """
+
+        eager = super().list_commands(ctx)
+        return [*self.lazy_commands, *(name for name in eager if name not in self.lazy_commands)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the loaded command, or a help placeholder for an unloaded one.
+
+        Args:
+            ctx: Click context of the group.
+            cmd_name: Requested command name.
+
+        Returns:
+            click.Command | None: Command or placeholder; ``None`` when unknown.
+        """
+
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return None
+        return TyperCommand(name=spec.name, help=spec.help_text)
+
+    def resolve_command(self, ctx: click.Context, args: list[str]) -> tuple[str, click.Command, list[str]]:
+        """Import the requested command before Click dispatches to it.
+
+        Args:
+            ctx: Click context of the group.
+            args: Remaining command-line arguments, starting with the command name.
+
+        Returns:
+            tuple[str, click.Command, list[str]]: Click's resolution of the
+            command name, command and remaining arguments.
+        """
+
+        if args:
+            self.load_command(ctx, args[0])
+        return cast(tuple[str, click.Command, list[str]], super().resolve_command(ctx, args))
+
+    def load_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Import and attach the command registered under ``cmd_name``.
+
+        Args:
+            ctx: Click context of the group.
+            cmd_name: Command name to load.
+
+        Returns:
+            click.Command | None: Loaded command, or ``None`` when ``cmd_name``
+            is not a lazy command.
+        """
+
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return self.commands.get(cmd_name)
+        with self._load_lock:
+            loaded = self.commands.get(cmd_name)
+            if loaded is not None:
+                return loaded
+            package = cast(_CommandPackage, import_module(spec.module))
+            staging = create_typer()
+            package.register(TyperAdapter(staging))
+            command = typer.main.get_group(staging).get_command(ctx, cmd_name)
+            if command is not None:
+                self.add_command(command, cmd_name)
+            return command
+
+
+def lazy_group_class(specs: Sequence[LazyCommandSpec]) -> type[LazyTyperGroup]:
+    """Return a :class:`LazyTyperGroup` subclass bound to ``specs``.
+
+    Args:
+        specs: Built-in commands, in help-listing order.
+
+    Returns:
+        type[LazyTyperGroup]: Group class suitable for ``create_typer(group_cls=...)``.
+    """
+
+    mapping = MappingProxyType({spec.name: spec for spec in specs})
+    return type("BoundLazyTyperGroup", (LazyTyperGroup,), {"lazy_commands": mapping})
+
+
+__all__ = ["LazyCommandSpec", "LazyTyperGroup", "lazy_group_class"]
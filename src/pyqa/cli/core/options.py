@@ -39,6 +39,8 @@ class LintGitOptions:
     include_untracked: bool
     base_branch: str | None
     no_lint_tests: bool
+    incremental: bool = False
+    with_dependents: bool = False
 
 
 @dataclass(slots=True)
@@ -81,6 +83,9 @@ class LintSummaryOptions:
     pr_summary_limit: int
     pr_summary_min_severity: PRSummarySeverityLiteral
     pr_summary_template: str
+    report_compact: bool = False
+    stream: bool = False
+    max_diagnostics: int | None = None
 
 
 @dataclass(slots=True)
@@ -101,6 +106,9 @@ class ExecutionRuntimeOptions:
     cache_dir: Path
     use_local_linters: bool
     strict_config: bool
+    remote_cache: str | None = None
+    tool_servers: bool = False
+    python_workers: bool = False
 
 
 @dataclass(slots=True)
@@ -181,6 +189,8 @@ _OPTION_ATTRIBUTE_MAP: Final[dict[str, tuple[str, ...]]] = {
     "include_untracked": ("_git", "include_untracked"),
     "base_branch": ("_git", "base_branch"),
     "no_lint_tests": ("_git", "no_lint_tests"),
+    "incremental": ("_git", "incremental"),
+    "with_dependents": ("_git", "with_dependents"),
     "filters": ("_selection", "filters"),
     "only": ("_selection", "only"),
     "language": ("_selection", "language"),
@@ -231,6 +241,21 @@ _OPTION_ATTRIBUTE_MAP: Final[dict[str, tuple[str, ...]]] = {
         "summary",
         "pr_summary_out",
     ),
+    "report_compact": (
+        "_output",
+        "summary",
+        "report_compact",
+    ),
+    "stream": (
+        "_output",
+        "summary",
+        "stream",
+    ),
+    "max_diagnostics": (
+        "_output",
+        "summary",
+        "max_diagnostics",
+    ),
     "pr_summary_limit": (
         "_output",
         "summary",
@@ -266,6 +291,21 @@ _OPTION_ATTRIBUTE_MAP: Final[dict[str, tuple[str, ...]]] = {
         "runtime",
         "cache_dir",
     ),
+    "remote_cache": (
+        "_execution",
+        "runtime",
+        "remote_cache",
+    ),
+    "tool_servers": (
+        "_execution",
+        "runtime",
+        "tool_servers",
+    ),
+    "python_workers": (
+        "_execution",
+        "runtime",
+        "python_workers",
+    ),
     "use_local_linters": (
         "_execution",
         "runtime",
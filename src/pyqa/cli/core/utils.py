@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
+import os
 import shutil
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -15,6 +16,7 @@ from pyqa.core.config.constants import PYQA_LINT_DIR_NAME
 from pyqa.core.environment.tool_env import VersionResolver
 from pyqa.platform.workspace import is_pyqa_lint_workspace
 
+from ...cache.version_probes import VersionProbeCache, VersionProbeResult, version_probe_key
 from ...core.runtime.process import CommandOptions, run_command
 from ...filesystem.paths import display_relative_path, ensure_absolute_path
 from ...tools.base import Tool
@@ -49,6 +51,7 @@ class ToolExecutionDetails:
 
 
 BINARY_RUNTIME: Final[str] = "binary"
+DEFAULT_PROBE_TIMEOUT: Final[float] = 10.0
 
 
 @dataclass(slots=True)
@@ -63,11 +66,67 @@ class ToolStatus:
     raw_output: str | None
 
 
-def check_tool_status(tool: Tool) -> ToolStatus:
+def run_version_probe(
+    command: Sequence[str],
+    *,
+    cache: VersionProbeCache | None = None,
+    timeout: float | None = DEFAULT_PROBE_TIMEOUT,
+    env: Mapping[str, str] | None = None,
+) -> VersionProbeResult:
+    """Execute a version command, reusing cached output for unchanged executables.
+
+    Args:
+        command: Version command to execute.
+        cache: Optional probe cache keyed by executable identity.
+        timeout: Seconds after which the probe is abandoned.
+        env: Environment for the probe; defaults to the current process environment.
+
+    Returns:
+        VersionProbeResult: Exit status and captured output. Timed-out probes
+        report :data:`TIMEOUT_RETURNCODE`; only successful probes are cached.
+
+    Raises:
+        FileNotFoundError: If the executable cannot be resolved on the probe's ``PATH``.
+    """
+
+    probe = list(command)
+    if probe:
+        # Resolve against the probe's own PATH so the cache key and the executed binary agree.
+        executable = shutil.which(probe[0], path=os.pathsep.join(os.get_exec_path(env)))
+        if executable is None:
+            raise FileNotFoundError(f"Executable '{probe[0]}' was not found on PATH")
+        probe[0] = executable
+    key = version_probe_key(command, env=env) if cache is not None else None
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    completed = run_command(
+        probe,
+        options=CommandOptions(capture_output=True, check=False, timeout=timeout, discard_stdin=True, env=env),
+    )
+    result = VersionProbeResult(
+        returncode=completed.returncode,
+        stdout=completed.stdout or "",
+        stderr=completed.stderr or "",
+    )
+    if cache is not None and key is not None:
+        cache.put(key, result)
+    return result
+
+
+def check_tool_status(
+    tool: Tool,
+    *,
+    cache: VersionProbeCache | None = None,
+    timeout: float | None = DEFAULT_PROBE_TIMEOUT,
+) -> ToolStatus:
     """Return ``ToolStatus`` describing availability and version information for a tool.
 
     Args:
         tool: Tool instance describing the command to probe.
+        cache: Optional probe cache reused across invocations.
+        timeout: Seconds after which the version command is abandoned.
 
     Returns:
         ToolStatus: Collected status, version, and execution metadata.
@@ -95,10 +154,7 @@ def check_tool_status(tool: Tool) -> ToolStatus:
         )
 
     try:
-        completed = run_command(
-            list(version_cmd),
-            options=CommandOptions(capture_output=True, check=False),
-        )
+        completed = run_version_probe(version_cmd, cache=cache, timeout=timeout)
     except FileNotFoundError:
         availability = ToolAvailability.VENDORED if tool.runtime != BINARY_RUNTIME else ToolAvailability.UNINSTALLED
         runtime_note = (
@@ -3,7 +3,7 @@
 
 """Compliance services: banned word scanning, quality policies, and security checks."""
 
-from .banned import BannedWordChecker
+from .banned import BannedTermMatcher, BannedWordChecker, BannedWordHit
 from .quality import (
     QualityChecker,
     QualityCheckerOptions,
@@ -17,7 +17,9 @@ from .quality import (
 from .security import SecurityScanner, SecurityScanResult, get_staged_files
 
 __all__ = (
+    "BannedTermMatcher",
     "BannedWordChecker",
+    "BannedWordHit",
     "QualityCheckResult",
     "QualityChecker",
     "QualityCheckerOptions",
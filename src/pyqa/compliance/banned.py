@@ -4,10 +4,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
+from hashlib import sha256
 from pathlib import Path
-from typing import Final
+from typing import Final, TypedDict, cast
+
+from ..cache.in_memory import memoize
 
 DEFAULT_BANNED_TERMS: Final[set[str]] = {
     "password123",
@@ -44,6 +49,216 @@ DEFAULT_BANNED_TERMS: Final[set[str]] = {
     "pdb.set_trace()",
 }
 
+BANNED_WORDS_FILENAME: Final[str] = ".banned-words"
+_MATCHER_CACHE_SUBDIR: Final[Path] = Path(".lint-cache") / "banned-words"
+_MATCHER_CACHE_VERSION: Final[int] = 1
+_MATCHER_MEMO_SIZE: Final[int] = 8
+_ROOT_STATE: Final[int] = 0
+
+
+class _MatcherPayload(TypedDict):
+    """JSON payload persisted for a compiled :class:`BannedTermMatcher`."""
+
+    version: int
+    terms: list[str]
+    transitions: list[dict[str, int]]
+    failures: list[int]
+    outputs: list[list[int]]
+
+
+@dataclass(frozen=True, slots=True)
+class BannedWordHit:
+    """Banned term occurrence reported with its 1-based line number."""
+
+    term: str
+    line: int
+
+
+@dataclass(frozen=True, slots=True)
+class _SourceState:
+    """Filesystem identity of a term list used to key compiled matchers."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True, slots=True)
+class _TermsFingerprint:
+    """Hashable description of every input contributing banned terms."""
+
+    sources: tuple[_SourceState, ...]
+    default_terms: tuple[str, ...]
+
+    def digest(self) -> str:
+        """Return a stable digest suitable for naming on-disk cache entries.
+
+        Returns:
+            str: Hex digest derived from the source states and default terms.
+        """
+
+        hasher = sha256(usedforsecurity=False)
+        hasher.update(str(_MATCHER_CACHE_VERSION).encode("utf-8"))
+        for source in self.sources:
+            hasher.update(f"{source.path}\0{source.mtime_ns}\0{source.size}\n".encode())
+        for term in self.default_terms:
+            hasher.update(term.encode("utf-8") + b"\n")
+        return hasher.hexdigest()
+
+
+class BannedTermMatcher:
+    """Aho–Corasick automaton matching every banned term in a single pass.
+
+    Terms are matched case-insensitively as substrings, mirroring a
+    ``term.lower() in text.lower()`` check for each term, but each line is
+    traversed once regardless of how many terms are configured.
+    """
+
+    __slots__ = ("_failures", "_outputs", "_terms", "_transitions")
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        transitions: list[dict[str, int]],
+        failures: list[int],
+        outputs: list[tuple[int, ...]],
+    ) -> None:
+        """Initialise the matcher from a compiled automaton.
+
+        Args:
+            terms: Banned terms in reporting order.
+            transitions: Goto function mapping characters to successor states.
+            failures: Failure link for each state.
+            outputs: Indices into ``terms`` completed at each state, including
+                those inherited through failure links.
+        """
+
+        self._terms = tuple(terms)
+        self._transitions = transitions
+        self._failures = failures
+        self._outputs = outputs
+
+    @classmethod
+    def build(cls, terms: Sequence[str]) -> BannedTermMatcher:
+        """Compile ``terms`` into an Aho–Corasick automaton.
+
+        Args:
+            terms: Banned terms in reporting order.
+
+        Returns:
+            BannedTermMatcher: Matcher recognising every term.
+        """
+
+        transitions: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for index, term in enumerate(terms):
+            state = _ROOT_STATE
+            for char in term.lower():
+                successor = transitions[state].get(char)
+                if successor is None:
+                    successor = len(transitions)
+                    transitions[state][char] = successor
+                    transitions.append({})
+                    outputs.append([])
+                state = successor
+            if state != _ROOT_STATE:
+                outputs[state].append(index)
+
+        failures = [_ROOT_STATE] * len(transitions)
+        queue: deque[int] = deque(transitions[_ROOT_STATE].values())
+        while queue:
+            state = queue.popleft()
+            for char, successor in transitions[state].items():
+                queue.append(successor)
+                fallback = failures[state]
+                while fallback != _ROOT_STATE and char not in transitions[fallback]:
+                    fallback = failures[fallback]
+                target = transitions[fallback].get(char, _ROOT_STATE)
+                failures[successor] = target if target != successor else _ROOT_STATE
+                outputs[successor].extend(outputs[failures[successor]])
+        return cls(terms, transitions, failures, [tuple(sorted(set(indices))) for indices in outputs])
+
+    @classmethod
+    def from_payload(cls, payload: _MatcherPayload) -> BannedTermMatcher:
+        """Rehydrate a matcher previously persisted with :meth:`to_payload`.
+
+        Args:
+            payload: JSON payload describing the compiled automaton.
+
+        Returns:
+            BannedTermMatcher: Matcher equivalent to the persisted automaton.
+        """
+
+        return cls(
+            payload["terms"],
+            payload["transitions"],
+            payload["failures"],
+            [tuple(indices) for indices in payload["outputs"]],
+        )
+
+    def to_payload(self) -> _MatcherPayload:
+        """Return a JSON-serialisable representation of the automaton.
+
+        Returns:
+            _MatcherPayload: Payload accepted by :meth:`from_payload`.
+        """
+
+        return _MatcherPayload(
+            version=_MATCHER_CACHE_VERSION,
+            terms=list(self._terms),
+            transitions=self._transitions,
+            failures=self._failures,
+            outputs=[list(indices) for indices in self._outputs],
+        )
+
+    @property
+    def terms(self) -> tuple[str, ...]:
+        """Return the banned terms recognised by the matcher.
+
+        Returns:
+            tuple[str, ...]: Terms in reporting order.
+        """
+
+        return self._terms
+
+    def match_line(self, line: str) -> list[int]:
+        """Return indices of every term occurring in ``line``.
+
+        Args:
+            line: Single line of text without embedded newlines.
+
+        Returns:
+            list[int]: Term indices in the order their occurrences end.
+        """
+
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+        matched: list[int] = []
+        state = _ROOT_STATE
+        for char in line.lower():
+            while state != _ROOT_STATE and char not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(char, _ROOT_STATE)
+            if outputs[state]:
+                matched.extend(outputs[state])
+        return matched
+
+    def iter_hits(self, lines: Iterable[str]) -> Iterator[BannedWordHit]:
+        """Yield each distinct term found per line while streaming ``lines``.
+
+        Args:
+            lines: Text lines to evaluate; newline terminators are ignored.
+
+        Yields:
+            BannedWordHit: Term occurrences in line order.
+        """
+
+        for number, line in enumerate(lines, start=1):
+            matched = self.match_line(line.rstrip("\r\n"))
+            for index in dict.fromkeys(matched):
+                yield BannedWordHit(term=self._terms[index], line=number)
+
 
 @dataclass
 class BannedWordChecker:
@@ -53,6 +268,7 @@ class BannedWordChecker:
     personal_list: Path | None = None
     repo_list: Path | None = None
     default_terms: Iterable[str] = field(default_factory=lambda: DEFAULT_BANNED_TERMS)
+    cache_dir: Path | None = None
 
     def load_terms(self) -> list[str]:
         """Collect banned terms from personal, repo, and default lists.
@@ -63,14 +279,29 @@ class BannedWordChecker:
         """
 
         terms: set[str] = set()
-        for source in (
-            self.personal_list or Path.home() / ".banned-words",
-            self.repo_list or self.root / ".banned-words",
-        ):
+        for source in self._term_sources():
             terms.update(_read_terms(source))
         terms.update(term.strip() for term in self.default_terms if term.strip())
         return sorted(terms, key=lambda s: s.lower())
 
+    def matcher(self) -> BannedTermMatcher:
+        """Return the compiled matcher for the current term lists.
+
+        The automaton is built once per process for a given set of term list
+        states and persisted beneath :attr:`cache_dir`, so unchanged lists are
+        never re-read or recompiled.
+
+        Returns:
+            BannedTermMatcher: Matcher covering every configured banned term.
+        """
+
+        fingerprint = _TermsFingerprint(
+            sources=tuple(_source_state(source) for source in self._term_sources() if source.is_file()),
+            default_terms=tuple(sorted({term.strip() for term in self.default_terms if term.strip()})),
+        )
+        cache_dir = self.cache_dir if self.cache_dir is not None else self.root / _MATCHER_CACHE_SUBDIR
+        return _compile_matcher(fingerprint, cache_dir)
+
     def scan(self, lines: Sequence[str]) -> list[str]:
         """Identify banned terms discovered within ``lines``.
 
@@ -82,14 +313,124 @@ class BannedWordChecker:
 
         """
 
-        terms = self.load_terms()
-        matches: list[str] = []
-        joined = "\n".join(lines)
-        lower_text = joined.lower()
-        for term in terms:
-            if term.lower() in lower_text:
-                matches.append(term)
-        return matches
+        matcher = self.matcher()
+        found = {hit.term for hit in matcher.iter_hits(lines)}
+        return [term for term in matcher.terms if term in found]
+
+    def scan_hits(self, lines: Iterable[str]) -> list[BannedWordHit]:
+        """Return every banned term occurrence in ``lines`` with line numbers.
+
+        Args:
+            lines: Text lines to evaluate; consumed lazily in a single pass.
+
+        Returns:
+            list[BannedWordHit]: Term occurrences ordered by line.
+        """
+
+        return list(self.matcher().iter_hits(lines))
+
+    def scan_file(self, path: Path) -> list[BannedWordHit]:
+        """Stream ``path`` line by line and return banned term occurrences.
+
+        Args:
+            path: Text file to scan.
+
+        Returns:
+            list[BannedWordHit]: Term occurrences ordered by line.
+        """
+
+        with path.open(encoding="utf-8") as handle:
+            return self.scan_hits(handle)
+
+    def _term_sources(self) -> tuple[Path, Path]:
+        """Return the personal and repository term list locations.
+
+        Returns:
+            tuple[Path, Path]: Personal list followed by the repository list.
+        """
+
+        return (
+            self.personal_list or Path.home() / BANNED_WORDS_FILENAME,
+            self.repo_list or self.root / BANNED_WORDS_FILENAME,
+        )
+
+
+def _source_state(path: Path) -> _SourceState:
+    """Return the filesystem identity of the term list at ``path``.
+
+    Args:
+        path: Existing term list file.
+
+    Returns:
+        _SourceState: Path, modification time and size of the file.
+    """
+
+    stat = path.stat()
+    return _SourceState(path=path.resolve(), mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+
+@memoize(maxsize=_MATCHER_MEMO_SIZE)
+def _compile_matcher(fingerprint: _TermsFingerprint, cache_dir: Path) -> BannedTermMatcher:
+    """Return a matcher for ``fingerprint`` loading or persisting it on disk.
+
+    Args:
+        fingerprint: Term list states and default terms identifying the matcher.
+        cache_dir: Directory holding persisted automata.
+
+    Returns:
+        BannedTermMatcher: Compiled matcher for the fingerprinted term lists.
+    """
+
+    cache_path = cache_dir / f"{fingerprint.digest()}.json"
+    cached = _load_cached_matcher(cache_path)
+    if cached is not None:
+        return cached
+
+    terms: set[str] = set(fingerprint.default_terms)
+    for source in fingerprint.sources:
+        terms.update(_read_terms(source.path))
+    matcher = BannedTermMatcher.build(sorted(terms, key=lambda s: s.lower()))
+    _store_cached_matcher(cache_path, matcher)
+    return matcher
+
+
+def _load_cached_matcher(path: Path) -> BannedTermMatcher | None:
+    """Return the matcher persisted at ``path`` when it is present and valid.
+
+    Args:
+        path: Candidate cache entry.
+
+    Returns:
+        BannedTermMatcher | None: Cached matcher, or ``None`` on a miss.
+    """
+
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != _MATCHER_CACHE_VERSION:
+        return None
+    try:
+        return BannedTermMatcher.from_payload(cast(_MatcherPayload, raw))
+    except (KeyError, TypeError):
+        return None
+
+
+def _store_cached_matcher(path: Path, matcher: BannedTermMatcher) -> None:
+    """Persist ``matcher`` to ``path`` atomically, ignoring unwritable caches.
+
+    Args:
+        path: Destination cache entry.
+        matcher: Compiled matcher to persist.
+    """
+
+    temp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(matcher.to_payload(), separators=(",", ":")), encoding="utf-8")
+        temp_path.replace(path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
 
 
 def _read_terms(path: Path) -> set[str]:
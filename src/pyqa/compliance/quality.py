@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 from collections.abc import Iterable, Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Final, cast
@@ -20,6 +21,7 @@ from pyqa.interfaces.licensing import LicensePolicy as LicensePolicyProtocol
 from ..config import FileDiscoveryConfig as FileDiscoveryConfigModel
 from ..config import (
     LicenseConfig,
+    default_parallel_jobs,
 )
 from ..config import QualityConfigSection as QualityConfigSectionModel
 from ..config.types import ConfigFragment
@@ -32,6 +34,12 @@ from .banned import BannedWordChecker
 from .checks.license_fixer import LicenseFixError, LicenseHeaderFixer
 from .checks.licenses import load_license_policy, normalise_notice, verify_file_license
 from .quality_components import QualityCheck, QualityCheckResult, QualityContext, QualityIssue, QualityIssueLevel
+from .quality_components.engine import (
+    FileCheckPass,
+    FusedQualityEngine,
+    QualityFileSnapshot,
+    run_file_check,
+)
 from .quality_components.hygiene import (
     PythonHygieneCheck,
 )
@@ -59,24 +67,19 @@ class FileSizeCheck:
             result: Aggregated result used to record issues.
         """
 
-        for path in ctx.files:
-            try:
-                size = path.stat().st_size
-            except OSError as exc:
-                result.add_warning(f"Could not stat file {path}: {exc}", path, check=self.name)
-                continue
-            if size > ctx.quality.max_file_size:
-                result.add_error(
-                    f"File exceeds maximum size ({size} bytes > {ctx.quality.max_file_size} bytes)",
-                    path,
-                    check=self.name,
-                )
-            elif size > ctx.quality.warn_file_size:
-                result.add_warning(
-                    f"File close to size limit ({size} bytes)",
-                    path,
-                    check=self.name,
-                )
+        run_file_check(self, ctx, result)
+
+    def start(self, ctx: QualityContext) -> FileCheckPass:
+        """Return the per-file pass used by the fused quality engine.
+
+        Args:
+            ctx: Quality context containing candidate files and configuration.
+
+        Returns:
+            FileCheckPass: Pass comparing each file's size with the thresholds.
+        """
+
+        return _FileSizePass(name=self.name, quality=ctx.quality)
 
     def supports_fix(self) -> bool:
         """Report that this check cannot modify offending files.
@@ -115,41 +118,49 @@ class LicenseCheck:
             result: Result collector used to record findings.
         """
 
-        policy = ctx.license_policy
-        if not policy:
-            return
+        run_file_check(self, ctx, result)
 
-        fixer = LicenseHeaderFixer(policy) if ctx.fix else None
-        options = self.EvaluationOptions(
-            policy=policy,
-            root=ctx.root,
-            fixer=fixer,
-            current_year=fixer.current_year if fixer else None,
-            result=result,
-        )
-        observed_notices: set[str] = set()
+    def start(self, ctx: QualityContext) -> FileCheckPass:
+        """Return the per-file pass used by the fused quality engine.
 
-        for path in ctx.files:
-            if not _is_textual_candidate(path):
-                continue
-            content = self._read_text(path, result)
-            if content is None:
-                continue
+        Args:
+            ctx: Quality context describing files and settings.
 
-            issues, final_content = self._evaluate_license(path, content, options)
-            for issue in issues:
-                category = self._classify_issue(issue)
-                result.add_error(issue, path, check=category)
+        Returns:
+            FileCheckPass: Pass verifying each file's license header.
+        """
 
-            notice = policy.match_notice(final_content)
-            if notice:
-                observed_notices.add(normalise_notice(notice))
+        policy = ctx.license_policy
+        fixer = LicenseHeaderFixer(policy) if policy and ctx.fix else None
+        return _LicensePass(check=self, policy=policy, root=ctx.root, fixer=fixer)
 
-        if policy.canonical_notice and len(observed_notices) > 1:
-            result.add_warning(
-                "Multiple copyright notices detected across files; ensure headers use a consistent notice.",
-                check=COPYRIGHT_CATEGORY,
-            )
+    def inspect_file(
+        self,
+        snapshot: QualityFileSnapshot,
+        options: EvaluationOptions,
+    ) -> str | None:
+        """Verify the license header of one file, fixing it when enabled.
+
+        Args:
+            snapshot: Shared view of the file under evaluation.
+            options: Evaluation settings; ``options.result`` receives findings.
+
+        Returns:
+            str | None: Copyright notice found in the final content, if any.
+        """
+
+        path = snapshot.path
+        if not _is_textual_candidate(path):
+            return None
+        content = self._read_text(snapshot, options.result)
+        if content is None:
+            return None
+        issues, final_content = self._evaluate_license(path, content, options)
+        if final_content is not content:
+            snapshot.replace_text(final_content)
+        for issue in issues:
+            options.result.add_error(issue, path, check=self._classify_issue(issue))
+        return options.policy.match_notice(final_content)
 
     def supports_fix(self) -> bool:
         """Report that license headers can be auto-corrected.
@@ -160,11 +171,11 @@ class LicenseCheck:
 
         return True
 
-    def _read_text(self, path: Path, result: QualityCheckResult) -> str | None:
+    def _read_text(self, snapshot: QualityFileSnapshot, result: QualityCheckResult) -> str | None:
         """Read file contents or record an access warning.
 
         Args:
-            path: File to read from disk.
+            snapshot: Shared view of the file to read.
             result: Result collector used to record warnings.
 
         Returns:
@@ -172,11 +183,11 @@ class LicenseCheck:
         """
 
         try:
-            return path.read_text(encoding="utf-8", errors="replace")
+            return snapshot.read_text()
         except OSError as exc:
             result.add_warning(
                 f"Unable to read file for license check: {exc}",
-                path,
+                snapshot.path,
                 check=LICENSE_HEADER_CATEGORY,
             )
             return None
@@ -278,6 +289,97 @@ class LicenseCheck:
         return LICENSE_HEADER_CATEGORY
 
 
+@dataclass(frozen=True, slots=True)
+class _FileSizePass:
+    """Compare individual file sizes on behalf of :class:`FileSizeCheck`."""
+
+    name: str
+    quality: QualityConfigSectionProtocol
+
+    def check_file(self, snapshot: QualityFileSnapshot, result: QualityCheckResult) -> None:
+        """Record size findings for ``snapshot``.
+
+        Args:
+            snapshot: Shared view of the file under evaluation.
+            result: Collector receiving findings for this file.
+        """
+
+        path = snapshot.path
+        try:
+            size = snapshot.size()
+        except OSError as exc:
+            result.add_warning(f"Could not stat file {path}: {exc}", path, check=self.name)
+            return
+        if size > self.quality.max_file_size:
+            result.add_error(
+                f"File exceeds maximum size ({size} bytes > {self.quality.max_file_size} bytes)",
+                path,
+                check=self.name,
+            )
+        elif size > self.quality.warn_file_size:
+            result.add_warning(
+                f"File close to size limit ({size} bytes)",
+                path,
+                check=self.name,
+            )
+
+    def finish(self, result: QualityCheckResult) -> None:
+        """File size checks have no run-level findings.
+
+        Args:
+            result: Aggregated result for the whole run.
+        """
+
+        _ = result
+
+
+@dataclass(slots=True)
+class _LicensePass:
+    """Verify individual files on behalf of :class:`LicenseCheck`."""
+
+    check: LicenseCheck
+    policy: LicensePolicyProtocol | None
+    root: Path
+    fixer: LicenseHeaderFixer | None
+    observed_notices: set[str] = field(default_factory=set)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def check_file(self, snapshot: QualityFileSnapshot, result: QualityCheckResult) -> None:
+        """Verify the license header of ``snapshot``.
+
+        Args:
+            snapshot: Shared view of the file under evaluation.
+            result: Collector receiving findings for this file.
+        """
+
+        if not self.policy:
+            return
+        options = LicenseCheck.EvaluationOptions(
+            policy=self.policy,
+            root=self.root,
+            fixer=self.fixer,
+            current_year=self.fixer.current_year if self.fixer else None,
+            result=result,
+        )
+        notice = self.check.inspect_file(snapshot, options)
+        if notice:
+            with self.lock:
+                self.observed_notices.add(normalise_notice(notice))
+
+    def finish(self, result: QualityCheckResult) -> None:
+        """Warn when files disagree on the copyright notice.
+
+        Args:
+            result: Aggregated result for the whole run.
+        """
+
+        if self.policy and self.policy.canonical_notice and len(self.observed_notices) > 1:
+            result.add_warning(
+                "Multiple copyright notices detected across files; ensure headers use a consistent notice.",
+                check=COPYRIGHT_CATEGORY,
+            )
+
+
 class SchemaCheck:
     """Validate that exported schema documentation matches tool metadata."""
 
@@ -396,6 +498,7 @@ class QualityCheckerOptions:
     checks: Iterable[str] | None = None
     staged: bool = False
     collector: QualityFileCollector | None = None
+    workers: int | None = None
 
 
 class QualityChecker:
@@ -452,10 +555,9 @@ class QualityChecker:
             license_policy=self.license_policy,
             fix=fix,
         )
-        for name, check in self._available_checks.items():
-            if name not in self._selected_checks:
-                continue
-            check.run(context, result)
+        selected = [check for name, check in self._available_checks.items() if name in self._selected_checks]
+        workers = self._options.workers or default_parallel_jobs()
+        FusedQualityEngine(selected, workers=workers).run(context, result)
         return result
 
     def available_checks(self) -> Mapping[str, QualityCheck]:
@@ -9,11 +9,16 @@ from .base import (
     QualityIssue,
     QualityIssueLevel,
 )
+from .engine import FileCheckPass, FileQualityCheck, FusedQualityEngine, QualityFileSnapshot
 
 __all__ = [
+    "FileCheckPass",
+    "FileQualityCheck",
+    "FusedQualityEngine",
     "QualityCheck",
     "QualityCheckResult",
     "QualityContext",
+    "QualityFileSnapshot",
     "QualityIssue",
     "QualityIssueLevel",
 ]
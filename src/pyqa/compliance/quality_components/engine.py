@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Single-pass evaluation of per-file quality checks."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final, Protocol, runtime_checkable
+
+from .base import QualityCheck, QualityCheckResult, QualityContext, QualityIssue
+
+PARALLEL_FILE_THRESHOLD: Final[int] = 64
+
+
+@dataclass(slots=True)
+class QualityFileSnapshot:
+    """Lazily populated view of one file shared by every per-file check.
+
+    The file is stat-ed and read at most once regardless of how many checks
+    inspect it; failures are cached and re-raised to each caller.
+    """
+
+    path: Path
+    _size: int | None = field(default=None, init=False, repr=False)
+    _text: str | None = field(default=None, init=False, repr=False)
+    _stat_error: OSError | None = field(default=None, init=False, repr=False)
+    _read_error: OSError | None = field(default=None, init=False, repr=False)
+
+    def size(self) -> int:
+        """Return the file size in bytes.
+
+        Returns:
+            int: Size reported by ``stat``.
+
+        Raises:
+            OSError: If the file cannot be stat-ed.
+        """
+
+        if self._stat_error is not None:
+            raise self._stat_error
+        if self._size is None:
+            try:
+                self._size = self.path.stat().st_size
+            except OSError as exc:
+                self._stat_error = exc
+                raise
+        return self._size
+
+    def read_text(self) -> str:
+        """Return the decoded file content, reading it on first use.
+
+        Returns:
+            str: UTF-8 decoded content with undecodable bytes replaced.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+
+        if self._read_error is not None:
+            raise self._read_error
+        if self._text is None:
+            try:
+                self._text = self.path.read_text(encoding="utf-8", errors="replace")
+            except OSError as exc:
+                self._read_error = exc
+                raise
+        return self._text
+
+    def replace_text(self, content: str) -> None:
+        """Record ``content`` as the file's text after a check rewrote it.
+
+        Args:
+            content: Content that has been written back to :attr:`path`.
+        """
+
+        self._text = content
+        self._read_error = None
+        self._size = None
+
+
+class FileCheckPass(Protocol):
+    """Per-run state of a :class:`FileQualityCheck` evaluated file by file."""
+
+    @abstractmethod
+    def check_file(self, snapshot: QualityFileSnapshot, result: QualityCheckResult) -> None:
+        """Evaluate one file and record findings.
+
+        Implementations may be called concurrently for different files.
+
+        Args:
+            snapshot: Shared view of the file under evaluation.
+            result: Collector receiving findings for this file only.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def finish(self, result: QualityCheckResult) -> None:
+        """Record run-level findings once every file has been evaluated.
+
+        Args:
+            result: Aggregated result for the whole run.
+        """
+
+        raise NotImplementedError
+
+
+@runtime_checkable
+class FileQualityCheck(QualityCheck, Protocol):
+    """Quality check that can be fused into a single pass over the files."""
+
+    @abstractmethod
+    def start(self, ctx: QualityContext) -> FileCheckPass:
+        """Return the per-run pass used to evaluate files for ``ctx``.
+
+        Args:
+            ctx: Shared context describing the files and configuration.
+
+        Returns:
+            FileCheckPass: Pass receiving each file in turn.
+        """
+
+        raise NotImplementedError
+
+
+class FusedQualityEngine:
+    """Evaluate several quality checks while visiting each file once.
+
+    Per-file checks share a :class:`QualityFileSnapshot` so a file is stat-ed
+    and read at most once, and files are spread across a thread pool. Issues
+    are merged back in check order, then file order, so the output matches
+    running the checks one after another.
+    """
+
+    def __init__(self, checks: Sequence[QualityCheck], *, workers: int = 1) -> None:
+        """Initialise the engine.
+
+        Args:
+            checks: Checks to evaluate, in reporting order.
+            workers: Maximum number of threads used to evaluate files.
+        """
+
+        self._checks = tuple(checks)
+        self._workers = max(workers, 1)
+
+    def run(self, ctx: QualityContext, result: QualityCheckResult) -> None:
+        """Evaluate every check for ``ctx`` and append findings to ``result``.
+
+        Args:
+            ctx: Shared context describing the files and configuration.
+            result: Aggregated result receiving findings.
+        """
+
+        passes: dict[int, FileCheckPass] = {
+            index: check.start(ctx) for index, check in enumerate(self._checks) if isinstance(check, FileQualityCheck)
+        }
+        per_file = self._evaluate_files(ctx.files, tuple(passes.values()))
+        positions = {index: position for position, index in enumerate(passes)}
+        for index, check in enumerate(self._checks):
+            position = positions.get(index)
+            if position is None:
+                check.run(ctx, result)
+                continue
+            issues = [issue for file_issues in per_file for issue in file_issues[position]]
+            if issues:
+                result.issues = [*result.issues, *issues]
+            passes[index].finish(result)
+
+    def _evaluate_files(
+        self,
+        files: Sequence[Path],
+        passes: tuple[FileCheckPass, ...],
+    ) -> list[tuple[list[QualityIssue], ...]]:
+        """Return per-file, per-pass issues in file order.
+
+        Args:
+            files: Files to evaluate.
+            passes: Passes evaluated against each file, in check order.
+
+        Returns:
+            list[tuple[list[QualityIssue], ...]]: Issues indexed by file then pass.
+        """
+
+        if not passes or not files:
+            return []
+        evaluator = _FileEvaluator(passes)
+        if self._workers == 1 or len(files) < PARALLEL_FILE_THRESHOLD:
+            return [evaluator(path) for path in files]
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="pyqa-quality") as pool:
+            return list(pool.map(evaluator, files))
+
+
+@dataclass(frozen=True, slots=True)
+class _FileEvaluator:
+    """Run every pass against one file using a shared snapshot."""
+
+    passes: tuple[FileCheckPass, ...]
+
+    def __call__(self, path: Path) -> tuple[list[QualityIssue], ...]:
+        """Evaluate ``path`` against each pass.
+
+        Args:
+            path: File to evaluate.
+
+        Returns:
+            tuple[list[QualityIssue], ...]: Issues recorded by each pass.
+        """
+
+        snapshot = QualityFileSnapshot(path)
+        collected: list[list[QualityIssue]] = []
+        for file_pass in self.passes:
+            local = QualityCheckResult()
+            file_pass.check_file(snapshot, local)
+            collected.append(local.issues)
+        return tuple(collected)
+
+
+def run_file_check(check: FileQualityCheck, ctx: QualityContext, result: QualityCheckResult) -> None:
+    """Evaluate a single per-file check sequentially.
+
+    Args:
+        check: Check to evaluate.
+        ctx: Shared context describing the files and configuration.
+        result: Aggregated result receiving findings.
+    """
+
+    file_pass = check.start(ctx)
+    collector = _FileEvaluator((file_pass,))
+    issues = [issue for path in ctx.files for issue in collector(path)[0]]
+    if issues:
+        result.issues = [*result.issues, *issues]
+    file_pass.finish(result)
+
+
+__all__ = [
+    "PARALLEL_FILE_THRESHOLD",
+    "FileCheckPass",
+    "FileQualityCheck",
+    "FusedQualityEngine",
+    "QualityFileSnapshot",
+    "run_file_check",
+]
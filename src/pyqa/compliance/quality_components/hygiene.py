@@ -5,12 +5,12 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
 from .base import QualityCheckResult, QualityContext
+from .engine import FileCheckPass, QualityFileSnapshot, run_file_check
 
 PYTHON_HYGIENE_CATEGORY: Final[str] = "python-hygiene"
 PYTHON_HYGIENE_BREAKPOINT: Final[str] = f"{PYTHON_HYGIENE_CATEGORY}:debug-breakpoint"
@@ -81,15 +81,38 @@ class PythonHygieneCheck:
             result: Aggregated result used to record hygiene findings.
         """
 
-        for path in self._target_files(ctx.files):
-            content = self._load_content(path, result)
-            if content is None:
-                continue
-            relative_parts = self._relative_parts(path, ctx.root)
-            if self._should_skip_file(relative_parts):
-                continue
-            is_cli_module = self._is_cli_module(relative_parts)
-            self._scan_lines(path, content, is_cli_module, result)
+        run_file_check(self, ctx, result)
+
+    def start(self, ctx: QualityContext) -> FileCheckPass:
+        """Return the per-file pass used by the fused quality engine.
+
+        Args:
+            ctx: Quality execution context describing files and configuration.
+
+        Returns:
+            FileCheckPass: Pass scanning each Python file for hygiene violations.
+        """
+
+        return _HygienePass(check=self, root=ctx.root)
+
+    def scan_file(self, snapshot: QualityFileSnapshot, root: Path, result: QualityCheckResult) -> None:
+        """Scan a single file when it is a Python source file.
+
+        Args:
+            snapshot: Shared view of the file under evaluation.
+            root: Repository root used to classify the file's location.
+            result: Collector receiving findings for this file.
+        """
+
+        if not self._is_target(snapshot.path):
+            return
+        content = self._load_content(snapshot, result)
+        if content is None:
+            return
+        relative_parts = self._relative_parts(snapshot.path, root)
+        if self._should_skip_file(relative_parts):
+            return
+        self._scan_lines(snapshot.path, content, self._is_cli_module(relative_parts), result)
 
     def supports_fix(self) -> bool:
         """Report that hygiene issues require manual review.
@@ -100,23 +123,23 @@ class PythonHygieneCheck:
 
         return False
 
-    def _target_files(self, files: Sequence[Path]) -> list[Path]:
-        """Return files eligible for hygiene scanning.
+    def _is_target(self, path: Path) -> bool:
+        """Return whether ``path`` is eligible for hygiene scanning.
 
         Args:
-            files: Candidate file list supplied by the orchestrator.
+            path: Candidate file supplied by the orchestrator.
 
         Returns:
-            list[Path]: Subset containing Python source files.
+            bool: ``True`` for Python source files.
         """
 
-        return [path for path in files if path.suffix in PYTHON_FILE_SUFFIXES]
+        return path.suffix in PYTHON_FILE_SUFFIXES
 
-    def _load_content(self, path: Path, result: QualityCheckResult) -> str | None:
+    def _load_content(self, snapshot: QualityFileSnapshot, result: QualityCheckResult) -> str | None:
         """Return decoded file content or ``None`` when reading fails.
 
         Args:
-            path: File being read from disk.
+            snapshot: Shared view of the file being read.
             result: Result collector used to record read failures.
 
         Returns:
@@ -124,11 +147,11 @@ class PythonHygieneCheck:
         """
 
         try:
-            return path.read_text(encoding="utf-8", errors="replace")
+            return snapshot.read_text()
         except OSError as exc:
             result.add_warning(
                 f"Unable to read Python file: {exc}",
-                path,
+                snapshot.path,
                 check=PYTHON_HYGIENE_CATEGORY,
             )
             return None
@@ -314,6 +337,33 @@ class PythonHygieneCheck:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _HygienePass:
+    """Scan individual files on behalf of :class:`PythonHygieneCheck`."""
+
+    check: PythonHygieneCheck
+    root: Path
+
+    def check_file(self, snapshot: QualityFileSnapshot, result: QualityCheckResult) -> None:
+        """Scan ``snapshot`` when it is a Python source file.
+
+        Args:
+            snapshot: Shared view of the file under evaluation.
+            result: Collector receiving findings for this file.
+        """
+
+        self.check.scan_file(snapshot, self.root, result)
+
+    def finish(self, result: QualityCheckResult) -> None:
+        """Hygiene checks have no run-level findings.
+
+        Args:
+            result: Aggregated result for the whole run.
+        """
+
+        _ = result
+
+
 def _contains_system_exit(line: str) -> bool:
     """Return ``True`` when ``line`` contains a system-exit invocation.
 
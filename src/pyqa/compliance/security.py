@@ -5,16 +5,20 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import re
 import shutil
 import tempfile
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import cached_property, partial
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Final
 
+from ..config import default_parallel_jobs
 from ..core.logging import fail, info, ok, warn
 from ..core.runtime.process import CommandOptions, run_command
 
@@ -61,6 +65,19 @@ _PII_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
 ]
 
+# Entropy matching has always been evaluated case-insensitively.
+_ENTROPY_SCAN_PATTERN = re.compile(_ENTROPY_PATTERN.pattern, re.IGNORECASE)
+
+# Single alternation covering every secret, entropy, and PII pattern. It acts as a
+# prefilter so each file and each line is traversed once; only lines it accepts
+# are evaluated against the individual patterns to attribute findings.
+_COMBINED_PATTERN = re.compile(
+    "|".join(
+        [f"(?i:{pattern.pattern})" for pattern in (*_SECRET_PATTERNS, _ENTROPY_SCAN_PATTERN)]
+        + [f"(?:{pattern.pattern})" for pattern in _PII_PATTERNS],
+    ),
+)
+
 _DOC_ENV_PATTERNS = re.compile(
     r"os\.environ|process\.env|ENV\[|getenv\(|-e [A-Z_]+=|export [A-Z_]+=|\$\{?[A-Z_]+\}?",
 )
@@ -88,6 +105,12 @@ _TMP_FILE_SUFFIXES = (
     ".env",
 )
 
+_GLOB_CHARACTERS: Final[frozenset[str]] = frozenset("*?[")
+_EXCLUDES_FILENAME: Final[str] = ".security-check-excludes"
+_MAX_FINDINGS_PER_PATTERN: Final[int] = 3
+_PARALLEL_MIN_FILES: Final[int] = 32
+_PARALLEL_CHUNK_SIZE: Final[int] = 16
+_FORK_START_METHOD: Final[str] = "fork"
 _BANDIT_SUCCESS_CODES: Final[set[int]] = {0, 1}
 _BANDIT_REPORT_SUFFIX: Final[str] = ".json"
 _BINARY_SNIFF_BYTES: Final[int] = 4096
@@ -155,6 +178,65 @@ class SecurityScanResult:
         self.findings += max(sum(metrics.values()), 1)
 
 
+@dataclass(frozen=True, slots=True)
+class _ExcludeMatcher:
+    """Compiled view of the ``.security-check-excludes`` patterns."""
+
+    names: frozenset[str] = frozenset()
+    globs: tuple[str, ...] = ()
+
+    @classmethod
+    def load(cls, path: Path) -> _ExcludeMatcher:
+        """Parse ``path`` once into literal-name and glob matchers.
+
+        Args:
+            path: Excludes file to parse.
+
+        Returns:
+            _ExcludeMatcher: Matcher describing the configured exclusions.
+        """
+
+        try:
+            text = path.read_text()
+        except OSError:
+            return cls()
+        names: set[str] = set()
+        globs: list[str] = []
+        for raw in text.splitlines():
+            pattern = raw.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            if "/" in pattern or _GLOB_CHARACTERS.intersection(pattern):
+                globs.append(pattern)
+            else:
+                names.add(pattern)
+        return cls(names=frozenset(names), globs=tuple(dict.fromkeys(globs)))
+
+    def matches(self, relative: Path) -> bool:
+        """Return whether ``relative`` is excluded.
+
+        Args:
+            relative: Path relative to the scan root.
+
+        Returns:
+            bool: ``True`` when a literal name or glob pattern matches.
+        """
+
+        if relative.name in self.names:
+            return True
+        return any(relative.match(pattern) or relative.name == pattern for pattern in self.globs)
+
+
+@dataclass(slots=True)
+class _FileFindings:
+    """Findings gathered for a single file, independent of the aggregate result."""
+
+    relative_path: Path
+    secrets: list[str] = field(default_factory=list)
+    pii: list[str] = field(default_factory=list)
+    temporary: bool = False
+
+
 @dataclass
 class SecurityScanner:
     """Perform static secret and vulnerability scanning for a project."""
@@ -163,6 +245,7 @@ class SecurityScanner:
     use_emoji: bool = True
     use_bandit: bool = True
     excludes_file: Path | None = None
+    jobs: int | None = None
 
     def run(self, files: Sequence[Path]) -> SecurityScanResult:
         """Run configured security checks against ``files``.
@@ -175,11 +258,12 @@ class SecurityScanner:
         """
 
         result = SecurityScanResult()
-        resolved_files = self._resolve_files(files)
+        resolved_files = [path for path in self._resolve_files(files) if not self._should_exclude(path)]
 
         info("🔍 Scanning files for secrets and credentials...", use_emoji=self.use_emoji)
-        for path in resolved_files:
-            self._scan_file(path, result)
+        for findings in self._scan_files(resolved_files):
+            if findings is not None:
+                self._record_findings(findings, result)
 
         if self.use_bandit:
             self._run_bandit(result)
@@ -204,6 +288,19 @@ class SecurityScanner:
                 resolved.append(candidate)
         return resolved
 
+    @cached_property
+    def _excludes(self) -> _ExcludeMatcher:
+        """Return the exclude matcher, loading the excludes file only once.
+
+        Returns:
+            _ExcludeMatcher: Compiled exclusion patterns for this scanner.
+        """
+
+        excludes_path = self.excludes_file or (self.root / _EXCLUDES_FILENAME)
+        if not excludes_path.exists():
+            return _ExcludeMatcher()
+        return _ExcludeMatcher.load(excludes_path)
+
     def _should_exclude(self, path: Path) -> bool:
         """Return whether ``path`` matches the exclude configuration.
 
@@ -214,207 +311,73 @@ class SecurityScanner:
             bool: ``True`` when the path should be skipped.
         """
 
-        excludes_path = self.excludes_file or (self.root / ".security-check-excludes")
-        if not excludes_path.exists():
+        excludes = self._excludes
+        if not excludes.names and not excludes.globs:
             return False
-        relative = path.relative_to(self.root)
-        patterns = [line.strip() for line in excludes_path.read_text().splitlines()]
-        for pattern in patterns:
-            if not pattern or pattern.startswith("#"):
-                continue
-            if relative.match(pattern) or relative.name == pattern:
-                return True
-        return False
+        return excludes.matches(path.relative_to(self.root))
 
-    def _is_binary(self, path: Path) -> bool:
-        """Return ``True`` when ``path`` appears to contain binary data.
+    def _worker_count(self, total: int) -> int:
+        """Return the number of scan processes to use for ``total`` files.
 
         Args:
-            path: File path to test for binary content.
+            total: Number of files queued for scanning.
 
         Returns:
-            bool: ``True`` when the file contains binary data.
+            int: Worker count; ``1`` selects the in-process serial path.
         """
 
-        try:
-            handle = path.open("rb")
-        except OSError:
-            return False
-        with handle:
-            chunk = handle.read(_BINARY_SNIFF_BYTES)
-        return _NULL_BYTE in chunk
+        if total < _PARALLEL_MIN_FILES:
+            return 1
+        jobs = self.jobs if self.jobs is not None else default_parallel_jobs()
+        return max(1, min(jobs, total // _PARALLEL_CHUNK_SIZE or 1))
 
-    def _read_text(self, path: Path) -> str:
-        """Return the textual contents of ``path`` or an empty string on failure.
+    def _scan_files(self, paths: Sequence[Path]) -> Iterator[_FileFindings | None]:
+        """Yield per-file findings for ``paths`` in input order.
 
         Args:
-            path: File path to read.
+            paths: Files that survived exclusion filtering.
 
-        Returns:
-            str: File contents when accessible; otherwise an empty string.
+        Yields:
+            _FileFindings | None: Findings for each file, or ``None`` when the
+            file was not eligible for scanning.
         """
 
-        try:
-            return path.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
-            return ""
+        scan = partial(_scan_path, self.root)
+        workers = self._worker_count(len(paths))
+        if workers <= 1 or _FORK_START_METHOD not in multiprocessing.get_all_start_methods():
+            yield from map(scan, paths)
+            return
+        # Forked workers inherit the compiled patterns without re-importing pyqa.
+        context = multiprocessing.get_context(_FORK_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            yield from executor.map(scan, paths, chunksize=_PARALLEL_CHUNK_SIZE)
 
-    def _scan_file(self, path: Path, result: SecurityScanResult) -> None:
-        """Scan ``path`` for secrets, PII, temp files, and aggregate findings.
+    def _record_findings(self, findings: _FileFindings, result: SecurityScanResult) -> None:
+        """Merge ``findings`` into ``result`` and emit per-file log messages.
 
         Args:
-            path: File being scanned.
+            findings: Findings gathered for a single file.
             result: Result aggregator used to record findings.
         """
 
-        if not self._is_scan_candidate(path):
-            return
-
-        text = self._read_text(path)
-        if not text:
-            return
-
-        relative_path = path.relative_to(self.root)
-        lines = text.splitlines()
-
-        secrets = self._scan_secret_patterns(path, relative_path, lines, result)
-        entropy = self._scan_entropy(relative_path, lines, result)
-        temp_flag = self._scan_temp_files(relative_path, result)
-        pii_flag = self._scan_pii(path, relative_path, lines, result)
+        relative_path = findings.relative_path
+        for message in findings.secrets:
+            result.register_secret(relative_path, message)
+        if findings.temporary:
+            result.register_temp(relative_path)
+        for message in findings.pii:
+            result.register_pii(relative_path, message)
 
-        if secrets or entropy:
+        if findings.secrets:
             fail(f"Potential secrets found in {relative_path}", use_emoji=self.use_emoji)
-        if temp_flag:
+        if findings.temporary:
             warn(
                 f"Temporary/backup file should not be committed: {relative_path}",
                 use_emoji=self.use_emoji,
             )
-        if pii_flag:
+        if findings.pii:
             warn(f"Potential PII found in {relative_path}", use_emoji=self.use_emoji)
 
-    def _is_scan_candidate(self, path: Path) -> bool:
-        """Return ``True`` when ``path`` is eligible for scanning.
-
-        Args:
-            path: Candidate file path to evaluate.
-
-        Returns:
-            bool: ``True`` when the file should be inspected.
-        """
-
-        if not path.is_file() or self._should_exclude(path):
-            return False
-        if path.suffix in {".lock", ".json"} and path.name.endswith("lock.json"):
-            return False
-        if self._is_binary(path):
-            return False
-        return True
-
-    def _scan_secret_patterns(
-        self,
-        path: Path,
-        relative_path: Path,
-        lines: Sequence[str],
-        result: SecurityScanResult,
-    ) -> bool:
-        """Scan ``lines`` for secret patterns and record findings.
-
-        Args:
-            path: Filesystem path under analysis.
-            relative_path: Path relative to the repository root.
-            lines: File contents split into lines.
-            result: Aggregated scan results.
-
-        Returns:
-            bool: ``True`` when at least one secret was detected.
-        """
-
-        found = False
-        for pattern in _SECRET_PATTERNS:
-            matches = _match_pattern(pattern, lines)
-            if not matches or _should_skip_markdown(pattern, path, matches):
-                continue
-            for line_no, snippet in matches[:3]:
-                result.register_secret(relative_path, f"line {line_no}: {snippet.strip()}")
-            found = True
-        return found
-
-    def _scan_entropy(
-        self,
-        relative_path: Path,
-        lines: Sequence[str],
-        result: SecurityScanResult,
-    ) -> bool:
-        """Scan ``lines`` for high-entropy strings indicative of secrets.
-
-        Args:
-            relative_path: Path relative to the repository root.
-            lines: File contents split into lines.
-            result: Aggregated scan results.
-
-        Returns:
-            bool: ``True`` when entropy-based findings were recorded.
-        """
-
-        matches = _match_pattern(_ENTROPY_PATTERN, lines)
-        filtered = _filter_entropy(matches)
-        if not filtered:
-            return False
-        for line_no, snippet in filtered[:3]:
-            result.register_secret(
-                relative_path,
-                f"high entropy string at line {line_no}: {snippet.strip()}",
-            )
-        return True
-
-    def _scan_temp_files(self, relative_path: Path, result: SecurityScanResult) -> bool:
-        """Identify temporary or backup files that should not be committed.
-
-        Args:
-            relative_path: Path relative to the repository root.
-            result: Aggregated scan results.
-
-        Returns:
-            bool: ``True`` when the file is considered temporary.
-        """
-
-        if relative_path.suffix in _TMP_FILE_SUFFIXES or relative_path.name.endswith("~"):
-            result.register_temp(relative_path)
-            return True
-        return False
-
-    def _scan_pii(
-        self,
-        path: Path,
-        relative_path: Path,
-        lines: Sequence[str],
-        result: SecurityScanResult,
-    ) -> bool:
-        """Scan ``lines`` for PII matches and record potential findings.
-
-        Args:
-            path: Absolute file path under analysis.
-            relative_path: Path relative to the repository root.
-            lines: File contents split into lines.
-            result: Aggregated scan results.
-
-        Returns:
-            bool: ``True`` when PII-like content is detected.
-        """
-
-        if _should_skip_pii(path):
-            return False
-        found = False
-        for pattern in _PII_PATTERNS:
-            matches = _match_pattern(pattern, lines, case_sensitive=True)
-            matches = _filter_comments(matches)
-            if not matches:
-                continue
-            for line_no, snippet in matches[:3]:
-                result.register_pii(relative_path, f"line {line_no}: {snippet.strip()}")
-            found = True
-        return found
-
     # ------------------------------------------------------------------
     def _run_bandit(self, result: SecurityScanResult) -> None:
         """Execute Bandit against the project when enabled.
@@ -545,29 +508,161 @@ class SecurityScanner:
         info(f"\n  {BANDIT_GUIDANCE}", use_emoji=self.use_emoji)
 
 
-def _match_pattern(
-    pattern: re.Pattern[str],
-    lines: Sequence[str],
-    *,
-    case_sensitive: bool = False,
-) -> list[tuple[int, str]]:
-    """Return matches for ``pattern`` within ``lines``.
+def _scan_path(root: Path, path: Path) -> _FileFindings | None:
+    """Scan ``path`` for secrets, PII, and temporary file markers.
+
+    This function runs inside worker processes and therefore only returns data;
+    logging and result aggregation happen in the parent.
+
+    Args:
+        root: Repository root used to compute relative paths.
+        path: File being scanned.
+
+    Returns:
+        _FileFindings | None: Findings for ``path`` or ``None`` when the file is
+        not a scan candidate or has no readable content.
+    """
+
+    if not _is_scan_candidate(path):
+        return None
+    text = _read_text(path)
+    if not text:
+        return None
+
+    findings = _FileFindings(relative_path=path.relative_to(root))
+    secret_hits, entropy_hits, pii_hits = _collect_matches(text)
+    for pattern, matches in zip(_SECRET_PATTERNS, secret_hits, strict=True):
+        if not matches or _should_skip_markdown(pattern, path, matches):
+            continue
+        findings.secrets.extend(_format_matches(matches, "line {line_no}: {snippet}"))
+    findings.secrets.extend(
+        _format_matches(_filter_entropy(entropy_hits), "high entropy string at line {line_no}: {snippet}"),
+    )
+    findings.temporary = _is_temporary_file(findings.relative_path)
+    if not _should_skip_pii(path):
+        for matches in pii_hits:
+            findings.pii.extend(_format_matches(_filter_comments(matches), "line {line_no}: {snippet}"))
+    return findings
+
+
+def _collect_matches(
+    text: str,
+) -> tuple[list[list[tuple[int, str]]], list[tuple[int, str]], list[list[tuple[int, str]]]]:
+    """Return per-pattern matches for ``text`` using a single traversal.
+
+    The combined alternation first rejects files without any candidate match,
+    then rejects individual lines, so individual patterns are only consulted for
+    lines that are known to match at least one of them.
+
+    Args:
+        text: File contents to scan.
+
+    Returns:
+        tuple[list[list[tuple[int, str]]], list[tuple[int, str]], list[list[tuple[int, str]]]]:
+        Secret matches per pattern, entropy matches, and PII matches per pattern.
+    """
+
+    secret_hits: list[list[tuple[int, str]]] = [[] for _ in _SECRET_PATTERNS]
+    entropy_hits: list[tuple[int, str]] = []
+    pii_hits: list[list[tuple[int, str]]] = [[] for _ in _PII_PATTERNS]
+    if _COMBINED_PATTERN.search(text) is None:
+        return secret_hits, entropy_hits, pii_hits
+    search = _COMBINED_PATTERN.search
+    for idx, line in enumerate(text.splitlines(), start=1):
+        if search(line) is None:
+            continue
+        entry = (idx, line)
+        for slot, pattern in enumerate(_SECRET_PATTERNS):
+            if pattern.search(line):
+                secret_hits[slot].append(entry)
+        if _ENTROPY_SCAN_PATTERN.search(line):
+            entropy_hits.append(entry)
+        for slot, pattern in enumerate(_PII_PATTERNS):
+            if pattern.search(line):
+                pii_hits[slot].append(entry)
+    return secret_hits, entropy_hits, pii_hits
+
+
+def _format_matches(matches: Sequence[tuple[int, str]], template: str) -> Iterable[str]:
+    """Return formatted messages for the first few ``matches``.
+
+    Args:
+        matches: Matched line numbers with the original line text.
+        template: Message template receiving ``line_no`` and ``snippet``.
+
+    Returns:
+        Iterable[str]: Messages for at most three matches.
+    """
+
+    return [
+        template.format(line_no=line_no, snippet=snippet.strip())
+        for line_no, snippet in matches[:_MAX_FINDINGS_PER_PATTERN]
+    ]
+
+
+def _is_scan_candidate(path: Path) -> bool:
+    """Return ``True`` when ``path`` is eligible for scanning.
+
+    Args:
+        path: Candidate file path to evaluate.
+
+    Returns:
+        bool: ``True`` when the file should be inspected.
+    """
+
+    if not path.is_file():
+        return False
+    if path.suffix in {".lock", ".json"} and path.name.endswith("lock.json"):
+        return False
+    return not _is_binary(path)
+
+
+def _is_binary(path: Path) -> bool:
+    """Return ``True`` when ``path`` appears to contain binary data.
+
+    Args:
+        path: File path to test for binary content.
+
+    Returns:
+        bool: ``True`` when the file contains binary data.
+    """
+
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return False
+    with handle:
+        chunk = handle.read(_BINARY_SNIFF_BYTES)
+    return _NULL_BYTE in chunk
+
+
+def _read_text(path: Path) -> str:
+    """Return the textual contents of ``path`` or an empty string on failure.
+
+    Args:
+        path: File path to read.
+
+    Returns:
+        str: File contents when accessible; otherwise an empty string.
+    """
+
+    try:
+        return path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return ""
+
+
+def _is_temporary_file(relative_path: Path) -> bool:
+    """Return ``True`` when ``relative_path`` names a temporary or backup file.
 
     Args:
-        pattern: Compiled regular expression to match.
-        lines: Source lines scanned for matches.
-        case_sensitive: When ``True``, avoid lowercasing the content.
+        relative_path: Path relative to the repository root.
 
     Returns:
-        list[tuple[int, str]]: Matched line numbers with the original line text.
+        bool: ``True`` when the file should not be committed.
     """
 
-    matches: list[tuple[int, str]] = []
-    compiled = pattern if case_sensitive else re.compile(pattern.pattern, re.IGNORECASE)
-    for idx, line in enumerate(lines, start=1):
-        if compiled.search(line):
-            matches.append((idx, line))
-    return matches
+    return relative_path.suffix in _TMP_FILE_SUFFIXES or relative_path.name.endswith("~")
 
 
 def _should_skip_pii(path: Path) -> bool:
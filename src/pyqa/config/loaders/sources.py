@@ -6,27 +6,31 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import os
 import tomllib
 from collections.abc import Iterable, Mapping, MutableMapping
 from pathlib import Path
 from typing import Final
 
-from ...interfaces.config import ConfigSource
+from ...interfaces.config import FingerprintedConfigSource, SourceFingerprint
 from ..defaults import default_config_payload
 from ..models import ConfigError
 from ..types import ConfigFragment, ConfigValue
-from ..utils import _deep_merge, _expand_env, _normalise_pyproject_payload
+from ..utils import _deep_merge, _env_references, _expand_env, _normalise_pyproject_payload
 
 DEFAULT_INCLUDE_KEY: Final[str] = "include"
 PYPROJECT_TOOL_KEY: Final[str] = "tool"
 PYPROJECT_SECTION_KEY: Final[str] = "pyqa"
 CONFIG_KEY: Final[str] = "config"
+_FILE_INPUT_PREFIX: Final[str] = "file:"
+_ENV_INPUT_PREFIX: Final[str] = "env:"
+_DEFAULTS_FINGERPRINT: Final[SourceFingerprint] = (("defaults", None),)
 
-_TOML_CACHE: dict[tuple[Path, int], ConfigFragment] = {}
+_TOML_CACHE: dict[tuple[Path, int], tuple[ConfigFragment, str]] = {}
 
 
-class DefaultConfigSource(ConfigSource):
+class DefaultConfigSource(FingerprintedConfigSource):
     """Return the built-in defaults as a configuration fragment."""
 
     def __init__(self) -> None:
@@ -43,6 +47,27 @@ class DefaultConfigSource(ConfigSource):
 
         return default_config_payload()
 
+    def fingerprint(self) -> SourceFingerprint:
+        """Return the constant fingerprint of the built-in defaults.
+
+        Returns:
+            SourceFingerprint: Marker identifying the defaults source.
+        """
+
+        return _DEFAULTS_FINGERPRINT
+
+    def is_current(self, fingerprint: SourceFingerprint) -> bool:
+        """Return whether ``fingerprint`` describes the built-in defaults.
+
+        Args:
+            fingerprint: Previously recorded fingerprint.
+
+        Returns:
+            bool: ``True`` because defaults never change within a process.
+        """
+
+        return fingerprint == _DEFAULTS_FINGERPRINT
+
     def describe(self) -> str:
         """Return a human-readable description of this source.
 
@@ -53,7 +78,7 @@ class DefaultConfigSource(ConfigSource):
         return "Built-in defaults"
 
 
-class TomlConfigSource(ConfigSource):
+class TomlConfigSource(FingerprintedConfigSource):
     """Provide configuration data from a TOML document with include support."""
 
     def __init__(
@@ -77,6 +102,8 @@ class TomlConfigSource(ConfigSource):
         self.name = name or str(path)
         self._include_key = include_key
         self._env = env or os.environ
+        self._consulted: dict[Path, str | None] = {}
+        self._env_names: set[str] = set()
 
     def load(self) -> ConfigFragment:
         """Use this source to load configuration data from the root TOML document.
@@ -85,8 +112,44 @@ class TomlConfigSource(ConfigSource):
             Mapping representing the merged configuration result.
         """
 
+        self._consulted = {}
+        self._env_names = set()
         return self._load(self._root_path, ())
 
+    def fingerprint(self) -> SourceFingerprint:
+        """Return digests of every document and environment variable consulted.
+
+        Returns:
+            SourceFingerprint: Content digests of the root document and its
+            includes (``None`` when absent) plus referenced environment values.
+        """
+
+        consulted = self._consulted or {self._root_path: _file_digest(self._root_path)}
+        files = tuple((f"{_FILE_INPUT_PREFIX}{path}", digest) for path, digest in consulted.items())
+        env = tuple((f"{_ENV_INPUT_PREFIX}{name}", self._env.get(name)) for name in sorted(self._env_names))
+        return files + env
+
+    def is_current(self, fingerprint: SourceFingerprint) -> bool:
+        """Return whether the documents and variables in ``fingerprint`` are unchanged.
+
+        Args:
+            fingerprint: Value previously returned by :meth:`fingerprint`.
+
+        Returns:
+            bool: ``True`` when every recorded input still has the same content.
+        """
+
+        for identifier, recorded in fingerprint:
+            if identifier.startswith(_FILE_INPUT_PREFIX):
+                current = _file_digest(Path(identifier.removeprefix(_FILE_INPUT_PREFIX)))
+            elif identifier.startswith(_ENV_INPUT_PREFIX):
+                current = self._env.get(identifier.removeprefix(_ENV_INPUT_PREFIX))
+            else:
+                return False
+            if current != recorded:
+                return False
+        return True
+
     def _load(self, path: Path, stack: tuple[Path, ...]) -> dict[str, ConfigValue]:
         """Return merged configuration for ``path`` while tracking recursion.
 
@@ -99,6 +162,7 @@ class TomlConfigSource(ConfigSource):
         """
 
         if not path.exists():
+            self._consulted.setdefault(path, None)
             return {}
         if path in stack:
             include_chain = " -> ".join(str(entry) for entry in (*stack, path))
@@ -107,11 +171,14 @@ class TomlConfigSource(ConfigSource):
         stat = resolved.stat()
         cache_key = (resolved, stat.st_mtime_ns)
         if cached := _TOML_CACHE.get(cache_key):
-            data = copy.deepcopy(cached)
+            cached_data, digest = cached
+            data = copy.deepcopy(cached_data)
         else:
-            with resolved.open("rb") as handle:
-                data = tomllib.load(handle)
-            _TOML_CACHE[cache_key] = copy.deepcopy(data)
+            raw = resolved.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            data = tomllib.loads(raw.decode("utf-8"))
+            _TOML_CACHE[cache_key] = (copy.deepcopy(data), digest)
+        self._consulted[path] = digest
         if not isinstance(data, MutableMapping):
             raise ConfigError(f"Configuration at {path} must be a table")
         document: dict[str, ConfigValue] = dict(data)
@@ -121,6 +188,7 @@ class TomlConfigSource(ConfigSource):
             fragment = self._load(include_path, stack + (path,))
             merged = _deep_merge(merged, fragment)
         merged = _deep_merge(merged, document)
+        self._env_names.update(_env_references(merged))
         return _expand_env(merged, self._env)
 
     def _coerce_includes(self, raw: ConfigValue, base_dir: Path) -> Iterable[Path]:
@@ -224,6 +292,22 @@ class PyProjectConfigSource(TomlConfigSource):
         return f"pyproject.toml ({self.name})"
 
 
+def _file_digest(path: Path) -> str | None:
+    """Return the SHA-256 digest of ``path`` or ``None`` when it cannot be read.
+
+    Args:
+        path: Configuration document to hash.
+
+    Returns:
+        str | None: Hex digest of the file contents.
+    """
+
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
 __all__ = [
     "CONFIG_KEY",
     "DEFAULT_INCLUDE_KEY",
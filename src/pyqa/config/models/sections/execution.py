@@ -42,8 +42,13 @@ class ExecutionConfig(BaseModel):
     respect_config: bool = False
     cache_enabled: bool = True
     cache_dir: Path = Field(default_factory=lambda: Path(".lint-cache"))
+    remote_cache_url: str | None = None
+    cache_max_size_mb: int = Field(default=2048, ge=0)
+    cache_max_age_days: int = Field(default=30, ge=0)
     bail: bool = False
     use_local_linters: bool = False
+    tool_servers: bool = False
+    python_workers: bool = False
     line_length: int = 120
     sql_dialect: str = "postgresql"
     python_version: str | None = None
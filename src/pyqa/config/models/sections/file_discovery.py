@@ -21,6 +21,8 @@ class FileDiscoveryConfig(BaseModel):
     diff_ref: str = "HEAD"
     include_untracked: bool = True
     base_branch: str | None = None
+    incremental: bool = False
+    with_dependents: bool = False
     pre_commit: bool = False
     respect_gitignore: bool = False
     explicit_files: list[Path] = Field(default_factory=list)
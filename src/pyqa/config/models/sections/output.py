@@ -26,6 +26,7 @@ class OutputConfig(BaseModel):
     report: Literal["json"] | None = None
     report_out: Path | None = None
     report_include_raw: bool = False
+    report_compact: bool = False
     sarif_out: Path | None = None
     pr_summary_out: Path | None = None
     pr_summary_limit: int = 100
@@ -36,6 +37,8 @@ class OutputConfig(BaseModel):
     quiet: bool = False
     tool_filters: dict[str, list[str]] = Field(default_factory=dict)
     advice: bool = False
+    stream: bool = False
+    max_diagnostics: int | None = Field(default=None, ge=1)
 
 
 __all__ = ["OutputConfig"]
@@ -9,6 +9,8 @@ from typing import Final
 from pydantic import BaseModel, ConfigDict, Field
 
 DEFAULT_UPDATE_SKIP_PATTERNS: Final[list[str]] = ["pyreadstat", ".git/modules"]
+# Package managers sharing a global store or registry lock run with bounded concurrency.
+DEFAULT_MANAGER_CONCURRENCY: Final[dict[str, int]] = {"pnpm": 1, "yarn": 1, "npm": 2, "rust": 1}
 
 
 class UpdateConfig(BaseModel):
@@ -18,6 +20,7 @@ class UpdateConfig(BaseModel):
 
     skip_patterns: list[str] = Field(default_factory=lambda: list(DEFAULT_UPDATE_SKIP_PATTERNS))
     enabled_managers: list[str] = Field(default_factory=list)
+    manager_concurrency: dict[str, int] = Field(default_factory=lambda: dict(DEFAULT_MANAGER_CONCURRENCY))
 
 
-__all__ = ["DEFAULT_UPDATE_SKIP_PATTERNS", "UpdateConfig"]
+__all__ = ["DEFAULT_MANAGER_CONCURRENCY", "DEFAULT_UPDATE_SKIP_PATTERNS", "UpdateConfig"]
@@ -26,6 +26,7 @@ CLEAN_PATTERNS_KEY = "patterns"
 CLEAN_TREES_KEY = "trees"
 UPDATE_SKIP_PATTERNS_KEY = "skip_patterns"
 UPDATE_ENABLED_MANAGERS_KEY = "enabled_managers"
+UPDATE_MANAGER_CONCURRENCY_KEY = "manager_concurrency"
 DEDUPE_PREFER_KEY = "dedupe_prefer"
 GENERIC_VALUE_TYPES_ENABLED_KEY = "enabled"
 GENERIC_VALUE_TYPES_RULES_KEY = "rules"
@@ -57,6 +58,7 @@ __all__ = [
     "QUALITY_SCHEMA_TARGETS_KEY",
     "QUALITY_SKIP_GLOBS_KEY",
     "UPDATE_ENABLED_MANAGERS_KEY",
+    "UPDATE_MANAGER_CONCURRENCY_KEY",
     "UPDATE_SKIP_PATTERNS_KEY",
 ]
 
@@ -29,6 +29,7 @@ from ..types import ConfigValue
 from ..utils import (
     _coerce_iterable,
     _coerce_optional_int,
+    _coerce_optional_positive_int,
     _coerce_string_sequence,
     _existing_unique_paths,
     _normalize_min_severity,
@@ -62,6 +63,7 @@ from .constants import (
     QUALITY_SCHEMA_TARGETS_KEY,
     QUALITY_SKIP_GLOBS_KEY,
     UPDATE_ENABLED_MANAGERS_KEY,
+    UPDATE_MANAGER_CONCURRENCY_KEY,
     UPDATE_SKIP_PATTERNS_KEY,
 )
 from .merge_utils import (
@@ -118,6 +120,8 @@ class _FileDiscoverySection(_SectionMerger[FileDiscoveryConfig]):
             "diff_ref": data.get("diff_ref", current.diff_ref),
             "include_untracked": data.get("include_untracked", current.include_untracked),
             "base_branch": data.get("base_branch", current.base_branch),
+            "incremental": data.get("incremental", current.incremental),
+            "with_dependents": data.get("with_dependents", current.with_dependents),
             "pre_commit": data.get("pre_commit", current.pre_commit),
             "respect_gitignore": data.get("respect_gitignore", current.respect_gitignore),
             "limit_to": limit_to,
@@ -246,10 +250,12 @@ class _OutputSection(_SectionMerger[OutputConfig]):
         ("show_stats", "output.show_stats"),
         ("group_by_code", "output.group_by_code"),
         ("report_include_raw", "output.report_include_raw"),
+        ("report_compact", "output.report_compact"),
         ("gha_annotations", "output.gha_annotations"),
         ("annotations_use_json", "output.annotations_use_json"),
         ("quiet", "output.quiet"),
         ("advice", "output.advice"),
+        ("stream", "output.stream"),
     )
     _PATH_FIELDS: ClassVar[tuple[tuple[str, str, str], ...]] = (
         (OUTPUT_PR_SUMMARY_OUT_KEY, "pr_summary_out", "output.pr_summary_out"),
@@ -307,6 +313,11 @@ class _OutputSection(_SectionMerger[OutputConfig]):
             data.get("pr_summary_template", current.pr_summary_template),
             "output.pr_summary_template",
         )
+        updates["max_diagnostics"] = _coerce_optional_positive_int(
+            data.get("max_diagnostics"),
+            current.max_diagnostics,
+            "output.max_diagnostics",
+        )
         updated = _model_replace(current, updates=updates)
         return updated, self._diff_model(current, updated)
 
@@ -437,6 +448,8 @@ class _ExecutionSection(_SectionMerger[ExecutionConfig]):
         ("respect_config", "execution.respect_config"),
         ("cache_enabled", "execution.cache_enabled"),
         ("use_local_linters", "execution.use_local_linters"),
+        ("tool_servers", "execution.tool_servers"),
+        ("python_workers", "execution.python_workers"),
     )
 
     def __init__(self, resolver: PathResolver) -> None:
@@ -466,13 +479,25 @@ class _ExecutionSection(_SectionMerger[ExecutionConfig]):
         }
 
         updates["cache_dir"] = self._resolve_cache_dir(data.get("cache_dir"), current.cache_dir)
+        updates["remote_cache_url"] = _coerce_optional_str_value(
+            data.get("remote_cache_url"),
+            current.remote_cache_url,
+            "execution.remote_cache_url",
+        )
 
         bail = _coerce_optional_bool(data.get("bail"), current.bail, "execution.bail")
-        jobs = _coerce_optional_int(data.get("jobs"), current.jobs, "execution.jobs")
-        if bail:
-            jobs = 1
         updates["bail"] = bail
-        updates["jobs"] = jobs
+        updates["jobs"] = _coerce_optional_int(data.get("jobs"), current.jobs, "execution.jobs")
+        updates["cache_max_size_mb"] = _coerce_optional_int(
+            data.get("cache_max_size_mb"),
+            current.cache_max_size_mb,
+            "execution.cache_max_size_mb",
+        )
+        updates["cache_max_age_days"] = _coerce_optional_int(
+            data.get("cache_max_age_days"),
+            current.cache_max_age_days,
+            "execution.cache_max_age_days",
+        )
 
         for attr, context in self._BOOLEAN_FIELDS:
             updates[attr] = _coerce_optional_bool(data.get(attr), getattr(current, attr), context)
@@ -805,13 +830,42 @@ class _UpdateSection(_SectionMerger[UpdateConfig]):
                 "update.enabled_managers",
             )
 
+        manager_concurrency = dict(current.manager_concurrency)
+        if UPDATE_MANAGER_CONCURRENCY_KEY in data:
+            manager_concurrency.update(self._coerce_concurrency(data[UPDATE_MANAGER_CONCURRENCY_KEY]))
+
         updates: dict[str, ModelUpdateValue] = {
             "skip_patterns": skip_patterns,
             "enabled_managers": enabled_managers,
+            "manager_concurrency": manager_concurrency,
         }
         updated = _model_replace(current, updates=updates)
         return updated, self._diff_model(current, updated)
 
+    @staticmethod
+    def _coerce_concurrency(value: ConfigValue) -> dict[str, int]:
+        """Validate per-manager concurrency limits.
+
+        Args:
+            value: Raw mapping of manager names to worker limits.
+
+        Returns:
+            dict[str, int]: Normalised manager names mapped to positive limits.
+
+        Raises:
+            ConfigError: If ``value`` is not a mapping of names to positive integers.
+
+        """
+
+        if not isinstance(value, Mapping):
+            raise ConfigError("update.manager_concurrency must be a table")
+        limits: dict[str, int] = {}
+        for name, limit in value.items():
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+                raise ConfigError(f"update.manager_concurrency.{name} must be a positive integer")
+            limits[str(name).lower()] = limit
+        return limits
+
 
 class _DedupeSection(_SectionMerger[DedupeConfig]):
     """Merge dedupe configuration sections."""
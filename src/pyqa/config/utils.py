@@ -65,6 +65,29 @@ def _coerce_optional_int(value: ConfigValue, current: int, context: str) -> int:
     raise ConfigError(f"{context} must be an integer")
 
 
+def _coerce_optional_positive_int(value: ConfigValue, current: int | None, context: str) -> int | None:
+    """Return a positive integer configuration value or ``None``.
+
+    Args:
+        value: Raw configuration payload supplied by the caller.
+        current: Baseline value to use when ``value`` is ``None``.
+        context: Dot-delimited configuration key for error reporting.
+
+    Returns:
+        int | None: Positive integer, or ``current`` when ``value`` is ``None``.
+
+    Raises:
+        ConfigError: If ``value`` is not an integer of at least ``1``.
+    """
+
+    if value is None:
+        return current
+    coerced = _coerce_optional_int(value, 0, context)
+    if coerced < 1:
+        raise ConfigError(f"{context} must be a positive integer")
+    return coerced
+
+
 def _coerce_string_sequence(value: ConfigValue, context: str) -> list[str]:
     """Return a normalised list of non-empty strings.
 
@@ -439,6 +462,25 @@ def _expand_env_string(value: str, env: Mapping[str, str]) -> str:
     return _ENV_VAR_PATTERN.sub(_replace, value)
 
 
+def _env_references(value: ConfigValue) -> set[str]:
+    """Return the environment variable names referenced within ``value``.
+
+    Args:
+        value: Configuration value that might contain environment references.
+
+    Returns:
+        set[str]: Names that :func:`_expand_env` would look up.
+    """
+
+    if isinstance(value, str):
+        return {match.group(1) or match.group(2) for match in _ENV_VAR_PATTERN.finditer(value)}
+    if isinstance(value, Mapping):
+        return {name for entry in value.values() for name in _env_references(entry)}
+    if isinstance(value, list):
+        return {name for entry in value for name in _env_references(entry)}
+    return set()
+
+
 def generate_config_schema() -> dict[str, ConfigValue]:
     """Return a JSON-serialisable schema describing configuration sections.
 
@@ -522,6 +564,7 @@ __all__ = [
     "_KNOWN_SECTIONS",
     "_coerce_iterable",
     "_coerce_optional_int",
+    "_coerce_optional_positive_int",
     "_coerce_string_sequence",
     "_deep_merge",
     "_existing_unique_paths",
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from operator import attrgetter
@@ -29,7 +31,7 @@ from pyqa.config.utils import (
     _normalise_fragment,
     generate_config_schema,
 )
-from pyqa.interfaces.config import ConfigSource
+from pyqa.interfaces.config import ConfigSource, FingerprintedConfigSource, SourceFingerprint
 from pyqa.tools.settings import TOOL_SETTING_SCHEMA
 from tooling_spec.catalog.types import JSONValue as _CatalogJSONValue
 
@@ -96,6 +98,79 @@ class ConfigLoadResult(BaseModel):
     snapshots: dict[str, dict[str, ConfigValue]] = Field(default_factory=dict)
 
 
+type _CompiledConfigKey = tuple[Path, tuple[tuple[str, str], ...]]
+MAX_COMPILED_CONFIGS: Final[int] = 32
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledConfig:
+    """Merged configuration together with the inputs it was built from."""
+
+    fingerprints: tuple[SourceFingerprint, ...]
+    auto_config_files: frozenset[str]
+    result: ConfigLoadResult
+
+
+class _CompiledConfigCache:
+    """Bounded, thread-safe store of merged configurations keyed by project and sources."""
+
+    def __init__(self, max_entries: int = MAX_COMPILED_CONFIGS) -> None:
+        """Initialise an empty cache.
+
+        Args:
+            max_entries: Number of project/source combinations retained.
+        """
+
+        self._entries: OrderedDict[_CompiledConfigKey, _CompiledConfig] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def get(self, key: _CompiledConfigKey) -> _CompiledConfig | None:
+        """Return the entry stored for ``key`` and mark it recently used.
+
+        Args:
+            key: Project root and source identities.
+
+        Returns:
+            _CompiledConfig | None: Stored entry when present.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: _CompiledConfigKey, entry: _CompiledConfig) -> None:
+        """Store ``entry`` under ``key`` evicting the least recently used entry.
+
+        Args:
+            key: Project root and source identities.
+            entry: Merged configuration and its inputs.
+        """
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every stored configuration."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+_COMPILED_CONFIGS: Final[_CompiledConfigCache] = _CompiledConfigCache()
+
+
+def clear_config_cache() -> None:
+    """Forget every memoised configuration so the next load merges from scratch."""
+
+    _COMPILED_CONFIGS.clear()
+
+
 class ConfigLoader:
     """Apply layered configuration sources with predictable precedence."""
 
@@ -170,9 +245,85 @@ class ConfigLoader:
     def load_with_trace(self, *, strict: bool = False) -> ConfigLoadResult:
         """Return the resolved configuration with trace metadata.
 
+        When every source can fingerprint its inputs the merged result is
+        memoised. It is reused only while the content of every consulted
+        document and include, the referenced environment variables and the set
+        of auto-discovered tool configuration files are unchanged; callers
+        always receive an independent copy.
+
         Args:
             strict: When ``True`` raise if warnings were emitted during merge.
 
+        Returns:
+            ConfigLoadResult: Resolved configuration and provenance details.
+
+        Raises:
+            ConfigError: If ``strict`` is set and the merge produced warnings.
+        """
+
+        auto_config_files = _present_auto_config_files(self._project_root)
+        key = self._cache_key()
+        if key is not None:
+            cached = _COMPILED_CONFIGS.get(key)
+            if cached is not None and self._is_current(cached, auto_config_files):
+                result = cached.result.model_copy(deep=True)
+                if strict and result.warnings:
+                    raise ConfigError("; ".join(result.warnings))
+                return result
+
+        result = self._merge(auto_config_files)
+        if key is not None:
+            fingerprinted = cast(Sequence[FingerprintedConfigSource], self._sources)
+            _COMPILED_CONFIGS.put(
+                key,
+                _CompiledConfig(
+                    fingerprints=tuple(source.fingerprint() for source in fingerprinted),
+                    auto_config_files=auto_config_files,
+                    result=result.model_copy(deep=True),
+                ),
+            )
+        if strict and result.warnings:
+            raise ConfigError("; ".join(result.warnings))
+        return result
+
+    def _cache_key(self) -> _CompiledConfigKey | None:
+        """Return the memoisation key for this loader, if its sources allow it.
+
+        Returns:
+            _CompiledConfigKey | None: Project root and source identities, or
+            ``None`` when a source cannot fingerprint its inputs.
+        """
+
+        if not all(isinstance(source, FingerprintedConfigSource) for source in self._sources):
+            return None
+        identities = tuple((type(source).__qualname__, source.name) for source in self._sources)
+        return self._project_root, identities
+
+    def _is_current(self, cached: _CompiledConfig, auto_config_files: frozenset[str]) -> bool:
+        """Return whether ``cached`` still reflects every configuration input.
+
+        Args:
+            cached: Previously merged configuration.
+            auto_config_files: Auto-discoverable tool configuration files present now.
+
+        Returns:
+            bool: ``True`` when no consulted input changed since ``cached`` was built.
+        """
+
+        if cached.auto_config_files != auto_config_files:
+            return False
+        fingerprinted = cast(Sequence[FingerprintedConfigSource], self._sources)
+        return all(
+            source.is_current(fingerprint)
+            for source, fingerprint in zip(fingerprinted, cached.fingerprints, strict=True)
+        )
+
+    def _merge(self, auto_config_files: frozenset[str]) -> ConfigLoadResult:
+        """Merge every source into a fresh configuration.
+
+        Args:
+            auto_config_files: Auto-discoverable tool configuration files present in the project.
+
         Returns:
             ConfigLoadResult: Resolved configuration and provenance details.
         """
@@ -190,12 +341,10 @@ class ConfigLoader:
             updates.extend(changed)
             warnings.extend(new_warnings)
             snapshots[source.name] = _config_to_snapshot(config)
-        if auto_updates := _auto_discover_tool_settings(config, self._project_root):
+        if auto_updates := _auto_discover_tool_settings(config, auto_config_files):
             updates.extend(auto_updates)
             snapshots["auto"] = _config_to_snapshot(config)
         snapshots["final"] = _config_to_snapshot(config)
-        if strict and warnings:
-            raise ConfigError("; ".join(warnings))
         return ConfigLoadResult(
             config=config,
             updates=updates,
@@ -468,12 +617,26 @@ def _config_to_snapshot(config: Config) -> dict[str, ConfigValue]:
     return snapshot
 
 
-def _auto_discover_tool_settings(config: Config, root: Path) -> list[FieldUpdate]:
+def _present_auto_config_files(root: Path) -> frozenset[str]:
+    """Return the auto-discoverable tool configuration files present under ``root``.
+
+    Args:
+        root: Project root to inspect for tool-specific configuration files.
+
+    Returns:
+        frozenset[str]: Names from :data:`AUTO_TOOL_CONFIG_FILES` that exist.
+    """
+
+    candidates = {name for filenames in AUTO_TOOL_CONFIG_FILES.values() for name in filenames}
+    return frozenset(name for name in candidates if (root / name).exists())
+
+
+def _auto_discover_tool_settings(config: Config, present: frozenset[str]) -> list[FieldUpdate]:
     """Populate tool settings with auto-discovered config file references.
 
     Args:
         config: Configuration model to mutate in place.
-        root: Project root to inspect for tool-specific configuration files.
+        present: Auto-discoverable configuration files found in the project root.
 
     Returns:
         list[FieldUpdate]: Field updates recording discovered tool settings.
@@ -485,15 +648,7 @@ def _auto_discover_tool_settings(config: Config, root: Path) -> list[FieldUpdate
         current_settings = dict(existing) if existing else {}
         if CONFIG_KEY in current_settings:
             continue
-        selected: str | None = None
-        for name in filenames:
-            candidate = root / name
-            if candidate.exists():
-                try:
-                    selected = str(candidate.relative_to(root))
-                except ValueError:
-                    selected = str(candidate)
-                break
+        selected = next((name for name in filenames if name in present), None)
         if selected is None:
             continue
         current_settings[CONFIG_KEY] = selected
@@ -551,6 +706,7 @@ __all__ = [
     "ConfigLoader",
     "ConfigError",
     "FieldUpdate",
+    "clear_config_cache",
     "generate_config_schema",
     "load_config",
 ]
@@ -9,6 +9,7 @@ from pyqa.platform.paths import get_pyqa_root
 from .constants import PROJECT_MARKER_FILENAME, ToolCacheLayout, cache_layout
 from .models import PreparedCommand
 from .preparer import CommandPreparationRequest, CommandPreparer, LegacyCommandMapping
+from .pruning import RuntimePruneResult, prune_runtime_cache
 from .runtimes.go import GoRuntime
 from .runtimes.lua import LuaRuntime
 from .runtimes.npm import NpmRuntime
@@ -30,6 +31,8 @@ __all__ = [
     "NpmRuntime",
     "PerlRuntime",
     "PreparedCommand",
+    "RuntimePruneResult",
+    "prune_runtime_cache",
     "get_pyqa_root",
     "PythonRuntime",
     "RustRuntime",
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -91,6 +91,24 @@ class CommandPreparer:
 
         return tuple(self._handlers)
 
+    def cache_slugs(self, tools: Iterable[Tool]) -> dict[str, frozenset[str]]:
+        """Return the runtime cache slugs ``tools`` install into.
+
+        Args:
+            tools: Catalog tools whose cached installations are still wanted.
+
+        Returns:
+            dict[str, frozenset[str]]: Slugs keyed by runtime identifier.
+        """
+
+        slugs: dict[str, set[str]] = {}
+        for tool in tools:
+            handler = self._handlers.get(tool.runtime, self._handlers["binary"])
+            slug = handler.cache_slug(tool)
+            if slug is not None:
+                slugs.setdefault(handler.kind, set()).add(slug)
+        return {runtime: frozenset(values) for runtime, values in slugs.items()}
+
     def prepare(
         self,
         request: CommandPreparationRequest | None = None,
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Remove cached runtime installs that no catalog tool references any more."""
+
+from __future__ import annotations
+
+import shutil
+from collections.abc import Collection, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from pyqa.cache.maintenance import path_size
+
+from .constants import RuntimeCachePaths, ToolCacheLayout
+
+_NPM_RUNTIME: Final[str] = "npm"
+_META_SUFFIX: Final[str] = ".json"
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimePruneResult:
+    """Summarise a runtime cache prune.
+
+    Attributes:
+        removed: Install prefixes and metadata files removed (or that would be).
+        freed_bytes: Bytes held by those paths.
+    """
+
+    removed: tuple[Path, ...] = ()
+    freed_bytes: int = 0
+
+
+def prune_runtime_cache(
+    layout: ToolCacheLayout,
+    referenced: Mapping[str, Collection[str]],
+    *,
+    dry_run: bool = False,
+) -> RuntimePruneResult:
+    """Remove per-tool runtime installs whose slug is not in ``referenced``.
+
+    npm prefixes and the Go, Lua, Rust and Perl install prefixes and metadata
+    files are considered. Shared package caches (uv, npm) and binaries copied
+    into shared ``bin`` directories are left alone; removing the metadata is
+    enough to make the runtime reinstall a tool that becomes referenced again.
+
+    Args:
+        layout: Tool cache layout to prune.
+        referenced: Slugs still in use keyed by runtime, as returned by
+            :meth:`CommandPreparer.cache_slugs`.
+        dry_run: When ``True`` report stale paths without deleting them.
+
+    Returns:
+        RuntimePruneResult: Paths removed and the space they held.
+    """
+
+    runtimes: dict[str, RuntimeCachePaths] = {
+        "go": layout.go,
+        "lua": layout.lua,
+        "rust": layout.rust,
+        "perl": layout.perl,
+    }
+    stale = list(_stale_children(layout.node_cache_dir, referenced.get(_NPM_RUNTIME, ()), reserved=()))
+    for runtime, paths in runtimes.items():
+        stale.extend(_stale_runtime_paths(paths, referenced.get(runtime, ())))
+    freed = sum(path_size(path) for path in stale)
+    if not dry_run:
+        for path in stale:
+            _remove(path)
+    return RuntimePruneResult(removed=tuple(stale), freed_bytes=freed)
+
+
+def _stale_runtime_paths(paths: RuntimeCachePaths, slugs: Collection[str]) -> Iterator[Path]:
+    """Yield install prefixes and metadata files of ``paths`` not named in ``slugs``.
+
+    Args:
+        paths: Cache paths of one runtime.
+        slugs: Slugs still referenced by the catalog.
+
+    Yields:
+        Path: Stale metadata files and install prefixes.
+    """
+
+    if paths.meta_dir.is_dir():
+        for meta_file in sorted(paths.meta_dir.iterdir()):
+            if meta_file.suffix == _META_SUFFIX and meta_file.stem not in slugs:
+                yield meta_file
+    yield from _stale_children(paths.cache_dir, slugs, reserved=paths.directories())
+
+
+def _stale_children(directory: Path, slugs: Collection[str], *, reserved: Collection[Path]) -> Iterator[Path]:
+    """Yield subdirectories of ``directory`` that are neither reserved nor in ``slugs``.
+
+    Args:
+        directory: Directory holding one install prefix per slug.
+        slugs: Slugs still referenced by the catalog.
+        reserved: Layout directories that must never be removed.
+
+    Yields:
+        Path: Stale install prefixes.
+    """
+
+    if not directory.is_dir():
+        return
+    for child in sorted(directory.iterdir()):
+        if child.is_dir() and not child.is_symlink() and child not in reserved and child.name not in slugs:
+            yield child
+
+
+def _remove(path: Path) -> None:
+    """Delete the file or tree at ``path``, ignoring filesystem errors.
+
+    Args:
+        path: File or directory to delete.
+    """
+
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        return
+
+
+__all__ = ["RuntimePruneResult", "prune_runtime_cache"]
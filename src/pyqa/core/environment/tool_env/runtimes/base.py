@@ -235,6 +235,20 @@ class RuntimeHandler(ABC):
 
         return self.__class__.__name__.removesuffix("Runtime").lower()
 
+    def cache_slug(self, tool: Tool) -> str | None:
+        """Return the slug naming ``tool``'s installation in the runtime cache.
+
+        Args:
+            tool: Tool metadata describing the runtime requirement.
+
+        Returns:
+            str | None: Slug of the cached installation, or ``None`` when the
+            runtime does not install tools into per-tool cache directories.
+        """
+
+        _ = tool
+        return None
+
     def _try_system(self, context: RuntimeContext) -> PreparedCommand | None:
         """Return a system-level command when available.
 
@@ -65,10 +65,7 @@ class GoRuntime(RuntimeHandler):
             RuntimeError: If installation fails to produce the expected binary.
         """
         tool = context.tool
-        module, version_spec = self._module_spec(tool)
-        if not version_spec:
-            version_spec = "latest"
-        requirement = f"{module}@{version_spec}"
+        requirement = self._requirement(tool)
         slug = _slugify(requirement)
         layout = context.cache_layout
         meta_file = layout.go.meta_dir / f"{slug}.json"
@@ -107,6 +104,32 @@ class GoRuntime(RuntimeHandler):
         binary.chmod(binary.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
         return binary
 
+    def cache_slug(self, tool: Tool) -> str | None:
+        """Return the slug naming ``tool``'s Go install metadata.
+
+        Args:
+            tool: Tool metadata describing the Go package requirement.
+
+        Returns:
+            str | None: Slug derived from the ``module@version`` requirement.
+        """
+
+        return _slugify(self._requirement(tool))
+
+    @staticmethod
+    def _requirement(tool: Tool) -> str:
+        """Return the ``go install`` requirement for ``tool``.
+
+        Args:
+            tool: Tool metadata describing the Go package requirement.
+
+        Returns:
+            str: Requirement in ``module@version`` form, defaulting to ``latest``.
+        """
+
+        module, version_spec = GoRuntime._module_spec(tool)
+        return f"{module}@{version_spec or 'latest'}"
+
     @staticmethod
     def _module_spec(tool: Tool) -> tuple[str, str | None]:
         """Return the module and version specifiers derived from tool metadata.
@@ -104,7 +104,7 @@ class LuaRuntime(RuntimeHandler):
         if not shutil.which("luarocks"):
             raise RuntimeError("luarocks is required to install Lua-based linters")
 
-        slug = _slugify(f"{package}@{version or 'latest'}")
+        slug = self._slug(package, version)
         lua_paths = _lua_install_paths(context.cache_layout.lua, slug, binary_name)
 
         if lua_paths.binary.exists() and lua_paths.meta_file.exists():
@@ -144,6 +144,33 @@ class LuaRuntime(RuntimeHandler):
         )
         return lua_paths.binary
 
+    def cache_slug(self, tool: Tool) -> str:
+        """Return the slug naming ``tool``'s LuaRocks tree in the cache.
+
+        Args:
+            tool: Tool metadata describing the Lua package requirement.
+
+        Returns:
+            str: Slug derived from the ``package@version`` requirement.
+        """
+
+        package, version = self._package_spec(tool)
+        return self._slug(package, version)
+
+    @staticmethod
+    def _slug(package: str, version: str | None) -> str:
+        """Return the cache slug for ``package`` at ``version``.
+
+        Args:
+            package: LuaRocks package name.
+            version: Optional pinned version.
+
+        Returns:
+            str: Filesystem-safe slug, using ``latest`` for unpinned packages.
+        """
+
+        return _slugify(f"{package}@{version or 'latest'}")
+
     @staticmethod
     def _package_spec(tool: Tool) -> tuple[str, str | None]:
         """Return the LuaRocks package and version tuple derived from the tool.
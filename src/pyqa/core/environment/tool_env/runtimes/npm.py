@@ -8,7 +8,7 @@ import json
 import os
 import shlex
 import shutil as _shutil
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 
 from pyqa.core.environment import inject_node_defaults
@@ -99,7 +99,7 @@ class NpmRuntime(RuntimeHandler):
         packages = shlex.split(requirement)
         if not packages:
             raise RuntimeError("No npm packages specified for tool")
-        slug = _slugify(" ".join(packages))
+        slug = self._slug(packages)
         prefix = layout.node_cache_dir / slug
         meta_path = prefix / self.META_FILE
         bin_dir = prefix / "node_modules" / ".bin"
@@ -237,6 +237,33 @@ class NpmRuntime(RuntimeHandler):
             "npm_config_prefix": str(prefix),
         }
 
+    def cache_slug(self, tool: Tool) -> str | None:
+        """Return the slug naming ``tool``'s npm prefix in the cache.
+
+        Args:
+            tool: Tool metadata describing npm package requirements.
+
+        Returns:
+            str | None: Slug derived from the package list, or ``None`` when the
+            tool declares no packages.
+        """
+
+        packages = shlex.split(self._npm_requirement(tool))
+        return self._slug(packages) if packages else None
+
+    @staticmethod
+    def _slug(packages: Sequence[str]) -> str:
+        """Return the cache slug for an npm install of ``packages``.
+
+        Args:
+            packages: Package specifiers passed to ``npm install``.
+
+        Returns:
+            str: Filesystem-safe slug.
+        """
+
+        return _slugify(" ".join(packages))
+
     def _npm_requirement(self, tool: Tool) -> str:
         """Return the npm requirement string derived from ``tool`` metadata.
 
@@ -11,6 +11,7 @@ import stat
 from pathlib import Path
 
 from pyqa.core.runtime.process import CommandOptions, run_command
+from pyqa.tools.base import Tool
 
 from ..models import PreparedCommand
 from ..utils import _slugify
@@ -57,6 +58,18 @@ class PerlRuntime(RuntimeHandler):
             self._perl_env,
         )
 
+    def cache_slug(self, tool: Tool) -> str:
+        """Return the slug naming ``tool``'s cpanm local library in the cache.
+
+        Args:
+            tool: Tool metadata describing the Perl distribution.
+
+        Returns:
+            str: Slug derived from the distribution requirement.
+        """
+
+        return _slugify(tool.package or tool.name)
+
     def _ensure_local_tool(self, context: RuntimeContext, binary_name: str) -> Path:
         """Ensure the binary ``binary_name`` is installed for the requested tool via cpanm.
 
@@ -74,7 +87,7 @@ class PerlRuntime(RuntimeHandler):
         tool = context.tool
         layout = context.cache_layout
         requirement = tool.package or tool.name
-        slug = _slugify(requirement)
+        slug = self.cache_slug(tool)
         prefix = layout.perl.cache_dir / slug
         meta_file = layout.perl.meta_dir / f"{slug}.json"
         binary = layout.perl.bin_dir / binary_name
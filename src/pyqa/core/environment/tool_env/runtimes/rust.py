@@ -118,7 +118,7 @@ class RustRuntime(RuntimeHandler):
             return self._ensure_rustup_tool(layout, component)
 
         requirement = f"{crate}@{version_spec}" if version_spec else crate
-        plan = RustInstallPlan(layout=layout, slug=_slugify(requirement), binary_name=binary_name)
+        plan = RustInstallPlan(layout=layout, slug=self.cache_slug(tool), binary_name=binary_name)
         if self._is_existing_binary(plan, requirement):
             return plan.binary
 
@@ -131,6 +131,21 @@ class RustRuntime(RuntimeHandler):
         self._install_cargo_tool(plan, spec)
         return plan.binary
 
+    def cache_slug(self, tool: Tool) -> str:
+        """Return the slug naming ``tool``'s cargo install or rustup marker.
+
+        Args:
+            tool: Tool metadata describing the Rust crate requirement.
+
+        Returns:
+            str: Slug derived from the crate requirement or rustup component.
+        """
+
+        crate, version_spec = self._crate_spec(tool)
+        if crate.startswith("rustup:"):
+            return _slugify(crate)
+        return _slugify(f"{crate}@{version_spec}" if version_spec else crate)
+
     @staticmethod
     def _crate_spec(tool: Tool) -> tuple[str, str | None]:
         """Return the crate name and version derived from tool metadata.
@@ -4,16 +4,19 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import signal
 
 # Bandit: subprocess usage is intentional—we provide a controlled wrapper around
 # external tool execution, normalising arguments and disabling ``shell=True``.
 import subprocess  # nosec B404 suppression_valid: Shell-free subprocess wrapper enforces safe execution.
+import threading
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import Final, Literal
+from typing import Final, Literal, Protocol
 
 CommandOverrideValue = Path | Mapping[str, str] | bool | float | int | None
 CommandOptionKey = Literal["cwd", "env", "check", "capture_output", "text", "timeout", "discard_stdin"]
@@ -29,6 +32,115 @@ _CAPTURE_OUTPUT_KEY: Final[CommandOptionKey] = "capture_output"
 _TEXT_KEY: Final[CommandOptionKey] = "text"
 _TIMEOUT_KEY: Final[CommandOptionKey] = "timeout"
 _DISCARD_STDIN_KEY: Final[CommandOptionKey] = "discard_stdin"
+TIMEOUT_RETURNCODE: Final[int] = 124
+_POSIX: Final[bool] = os.name == "posix"
+DEFAULT_CANCEL_REASON: Final[str] = "cancelled"
+
+
+class ProcessHandle(Protocol):
+    """Running process that a :class:`CancellationToken` can kill."""
+
+    @property
+    def pid(self) -> int:
+        """Return the process identifier, which also leads its process group.
+
+        Returns:
+            int: Operating system process identifier.
+        """
+        ...
+
+    @property
+    def returncode(self) -> int | None:
+        """Return the exit status, or ``None`` while the process is running.
+
+        Returns:
+            int | None: Exit status of the finished process.
+        """
+        ...
+
+    def kill(self) -> None:
+        """Kill the process on platforms without process groups."""
+        ...
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag shared by the commands of a single run.
+
+    Commands started with a token register their process while it runs.
+    Cancelling the token kills the process group of every registered
+    command, so children spawned by a tool (daemons, worker pools) stop too.
+    Commands started after cancellation are never launched.
+    """
+
+    def __init__(self) -> None:
+        """Create an uncancelled token with no registered processes."""
+
+        self._lock = threading.Lock()
+        self._reason: str | None = None
+        self._processes: set[ProcessHandle] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Return whether :meth:`cancel` has been called.
+
+        Returns:
+            bool: ``True`` once the token has been cancelled.
+        """
+
+        return self._reason is not None
+
+    @property
+    def reason(self) -> str | None:
+        """Return the reason supplied to :meth:`cancel`.
+
+        Returns:
+            str | None: Cancellation reason, or ``None`` while the token is active.
+        """
+
+        return self._reason
+
+    def cancel(self, reason: str = DEFAULT_CANCEL_REASON) -> None:
+        """Cancel the token and kill every registered process group.
+
+        Subsequent calls are ignored so the first reason is preserved.
+
+        Args:
+            reason: Short description of why the run was cancelled.
+        """
+
+        with self._lock:
+            if self._reason is not None:
+                return
+            self._reason = reason
+            processes = tuple(self._processes)
+        for process in processes:
+            kill_process_group(process)
+
+    def attach(self, process: ProcessHandle) -> bool:
+        """Register ``process`` so that cancellation terminates it.
+
+        Args:
+            process: Running process started in its own process group.
+
+        Returns:
+            bool: ``False`` when the token was cancelled before registration.
+        """
+
+        with self._lock:
+            if self._reason is not None:
+                return False
+            self._processes.add(process)
+            return True
+
+    def detach(self, process: ProcessHandle) -> None:
+        """Forget ``process`` once it has exited.
+
+        Args:
+            process: Process previously passed to :meth:`attach`.
+        """
+
+        with self._lock:
+            self._processes.discard(process)
 
 
 @dataclass(slots=True)
@@ -42,6 +154,7 @@ class CommandOptions:
     text: bool = True
     timeout: float | None = None
     discard_stdin: bool = False
+    cancellation: CancellationToken | None = None
 
     def with_overrides(self, overrides: CommandOverrideMapping) -> CommandOptions:
         """Return a new options instance with ``overrides`` applied.
@@ -96,6 +209,7 @@ class CommandOptions:
             text=text,
             timeout=timeout,
             discard_stdin=discard_stdin,
+            cancellation=self.cancellation,
         )
 
     @staticmethod
@@ -212,6 +326,59 @@ class SubprocessExecutionError(RuntimeError):
         self.stderr = stderr
 
 
+class CommandCancelledError(RuntimeError):
+    """Raised when a command is skipped or killed through its cancellation token."""
+
+    def __init__(self, command: Sequence[str], reason: str | None) -> None:
+        """Initialise the error with the cancelled command.
+
+        Args:
+            command: Normalised command sequence that was cancelled.
+            reason: Reason recorded on the cancellation token.
+        """
+
+        super().__init__(f"Command '{command[0]}' was cancelled: {reason or DEFAULT_CANCEL_REASON}")
+        self.command = tuple(command)
+        self.reason = reason
+
+
+def kill_process_group(process: ProcessHandle) -> None:
+    """Kill ``process`` together with every child sharing its process group.
+
+    Args:
+        process: Process leading its own session on POSIX platforms.
+    """
+
+    if process.returncode is not None:
+        return
+    try:
+        if _POSIX:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        return
+
+
+def _terminate(process: ProcessHandle, *, grouped: bool) -> None:
+    """Kill ``process`` and, when it leads its own session, its process group.
+
+    Args:
+        process: Process started by :func:`run_command`.
+        grouped: Whether ``process`` was started in its own session.
+    """
+
+    if grouped:
+        kill_process_group(process)
+        return
+    if process.returncode is not None:
+        return
+    try:
+        process.kill()
+    except (ProcessLookupError, PermissionError):
+        return
+
+
 def _ensure_text(value: str | bytes | None) -> str | None:
     """Return ``value`` decoded to text when supplied as ``bytes``.
 
@@ -274,6 +441,8 @@ def run_command(
 
     Raises:
         FileNotFoundError: If the executable cannot be resolved on ``PATH``.
+        CommandCancelledError: When ``options.cancellation`` is cancelled before
+            the command starts or while it is running.
         SubprocessExecutionError: When ``check`` is true and the process exits
             with a non-zero status.
         TypeError: If an unknown override key is supplied.
@@ -283,33 +452,61 @@ def run_command(
     overrides_mapping: dict[CommandOptionKey, CommandOverrideValue] = dict(overrides or {})
     resolved_options = (options or CommandOptions()).with_overrides(overrides_mapping)
 
-    try:
-        # Bandit: commands originate from vetted tool configurations; we pass
-        # argument lists directly without shell expansion.
-        completed: CompletedProcess[str] = subprocess.run(  # nosec B603 - controlled arguments, not user supplied
-            normalized,
-            cwd=str(resolved_options.cwd) if resolved_options.cwd is not None else None,
-            env=dict(resolved_options.env) if resolved_options.env is not None else None,
-            check=False,
-            capture_output=resolved_options.capture_output,
-            text=resolved_options.text,
-            timeout=resolved_options.timeout,
-            stdin=subprocess.DEVNULL if resolved_options.discard_stdin else None,
-        )
-    except subprocess.TimeoutExpired as exc:
-        stdout = _ensure_text(exc.stdout) or ""
-        stderr = _ensure_text(exc.stderr)
-        timeout_value = resolved_options.timeout
-        timeout_msg = (
-            f"Command timed out after {timeout_value:.1f}s" if timeout_value is not None else "Command timed out"
-        )
-        combined_stderr = f"{stderr}\n{timeout_msg}" if stderr else timeout_msg
-        completed = subprocess.CompletedProcess(
-            args=(list(exc.cmd) if isinstance(exc.cmd, (list, tuple)) else list(normalized)),
-            returncode=124,
-            stdout=stdout,
-            stderr=combined_stderr,
-        )
+    token = resolved_options.cancellation
+    if token is not None and token.cancelled:
+        raise CommandCancelledError(normalized, token.reason)
+    stream = subprocess.PIPE if resolved_options.capture_output else None
+    # Only cancellable commands get their own session so the token can kill
+    # the whole process group. Other commands stay in the caller's process
+    # group and keep receiving terminal signals such as Ctrl-C.
+    grouped = _POSIX and token is not None
+
+    # Bandit: commands originate from vetted tool configurations; we pass
+    # argument lists directly without shell expansion.
+    with subprocess.Popen(  # nosec B603 - controlled arguments, not user supplied
+        normalized,
+        cwd=str(resolved_options.cwd) if resolved_options.cwd is not None else None,
+        env=dict(resolved_options.env) if resolved_options.env is not None else None,
+        stdin=subprocess.DEVNULL if resolved_options.discard_stdin else None,
+        stdout=stream,
+        stderr=stream,
+        text=resolved_options.text,
+        start_new_session=grouped,
+    ) as process:
+        if token is not None and not token.attach(process):
+            kill_process_group(process)
+        try:
+            stdout, stderr = process.communicate(timeout=resolved_options.timeout)
+        except subprocess.TimeoutExpired:
+            _terminate(process, grouped=grouped)
+            stdout, stderr = process.communicate()
+            timeout_value = resolved_options.timeout
+            timeout_msg = (
+                f"Command timed out after {timeout_value:.1f}s" if timeout_value is not None else "Command timed out"
+            )
+            stderr_text = _ensure_text(stderr)
+            completed = subprocess.CompletedProcess(
+                args=list(normalized),
+                returncode=TIMEOUT_RETURNCODE,
+                stdout=_ensure_text(stdout) or "",
+                stderr=f"{stderr_text}\n{timeout_msg}" if stderr_text else timeout_msg,
+            )
+        except BaseException:
+            _terminate(process, grouped=grouped)
+            raise
+        else:
+            completed = subprocess.CompletedProcess(
+                args=list(normalized),
+                returncode=process.returncode,
+                stdout=stdout,
+                stderr=stderr,
+            )
+        finally:
+            if token is not None:
+                token.detach(process)
+
+    if token is not None and token.cancelled and completed.returncode != 0:
+        raise CommandCancelledError(normalized, token.reason)
 
     if resolved_options.check and completed.returncode != 0:
         raise SubprocessExecutionError(
@@ -323,10 +520,16 @@ def run_command(
 
 
 __all__ = [
+    "DEFAULT_CANCEL_REASON",
+    "TIMEOUT_RETURNCODE",
+    "CancellationToken",
+    "CommandCancelledError",
     "CommandOptionKey",
     "CommandOptions",
     "CommandOverrideMapping",
     "CommandOverrideValue",
+    "ProcessHandle",
     "SubprocessExecutionError",
+    "kill_process_group",
     "run_command",
 ]
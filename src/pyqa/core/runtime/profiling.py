@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Lightweight span profiler emitting Chrome/Perfetto trace data."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+PHASE_CATEGORY: Final[str] = "phase"
+TOOL_CATEGORY: Final[str] = "tool"
+_NS_PER_US: Final[int] = 1_000
+_NS_PER_MS: Final[float] = 1_000_000.0
+_EMPTY_ARGS: Final[Mapping[str, str]] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class TraceSpan:
+    """Completed timing span recorded by :class:`Profiler`.
+
+    Attributes:
+        name: Span label (phase name or ``tool:action``).
+        category: Grouping used by the summary, e.g. ``phase`` or ``tool``.
+        start_ns: Start offset relative to the profiler origin.
+        duration_ns: Wall-clock duration of the span.
+        self_ns: Duration not covered by nested spans on the same thread.
+        thread_id: Identifier of the thread that recorded the span.
+        args: Additional key/value details exported with the trace event.
+    """
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    self_ns: int
+    thread_id: int
+    args: Mapping[str, str] = _EMPTY_ARGS
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileSummaryRow:
+    """Aggregated timing for all spans sharing a category and name."""
+
+    category: str
+    name: str
+    count: int
+    total_ms: float
+    self_ms: float
+
+
+@dataclass(slots=True)
+class _OpenSpan:
+    """Span currently executing on a thread."""
+
+    start_ns: int
+    child_ns: int = 0
+
+
+class _ThreadStack(threading.local):
+    """Per-thread stack of open spans used to derive self time."""
+
+    def __init__(self) -> None:
+        """Initialise the empty stack (run once per thread on first access)."""
+
+        self.frames: list[_OpenSpan] = []
+
+
+class Profiler:
+    """Collect nested timing spans from any thread of a single run."""
+
+    def __init__(self) -> None:
+        """Initialise an empty profiler anchored at the current instant."""
+
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._spans: list[TraceSpan] = []
+        self._stack = _ThreadStack()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        category: str = PHASE_CATEGORY,
+        args: Mapping[str, str] | None = None,
+    ) -> Iterator[None]:
+        """Record the duration of the enclosed block.
+
+        Args:
+            name: Span label.
+            category: Summary grouping for the span.
+            args: Optional details exported with the trace event.
+
+        Yields:
+            None: Control returns to the caller while the span is open.
+        """
+
+        frames = self._stack.frames
+        frame = _OpenSpan(start_ns=time.perf_counter_ns())
+        frames.append(frame)
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - frame.start_ns
+            frames.pop()
+            if frames:
+                frames[-1].child_ns += duration
+            span = TraceSpan(
+                name=name,
+                category=category,
+                start_ns=frame.start_ns - self._origin_ns,
+                duration_ns=duration,
+                self_ns=max(duration - frame.child_ns, 0),
+                thread_id=threading.get_ident(),
+                args=MappingProxyType(dict(args)) if args else _EMPTY_ARGS,
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    @property
+    def spans(self) -> tuple[TraceSpan, ...]:
+        """Return completed spans ordered by start time.
+
+        Returns:
+            tuple[TraceSpan, ...]: Snapshot of recorded spans.
+        """
+
+        with self._lock:
+            return tuple(sorted(self._spans, key=lambda span: span.start_ns))
+
+    def summary(self) -> tuple[ProfileSummaryRow, ...]:
+        """Return spans aggregated per category and name, slowest self time first.
+
+        Returns:
+            tuple[ProfileSummaryRow, ...]: Aggregated timing rows.
+        """
+
+        totals: dict[tuple[str, str], list[int]] = {}
+        for span in self.spans:
+            bucket = totals.setdefault((span.category, span.name), [0, 0, 0])
+            bucket[0] += 1
+            bucket[1] += span.duration_ns
+            bucket[2] += span.self_ns
+        rows = (
+            ProfileSummaryRow(
+                category=category,
+                name=name,
+                count=count,
+                total_ms=total_ns / _NS_PER_MS,
+                self_ms=self_ns / _NS_PER_MS,
+            )
+            for (category, name), (count, total_ns, self_ns) in totals.items()
+        )
+        return tuple(sorted(rows, key=lambda row: (-row.self_ms, row.category, row.name)))
+
+    def chrome_trace(self) -> dict[str, object]:
+        """Return the recorded spans in Chrome trace-event format.
+
+        Returns:
+            dict[str, object]: Payload loadable by ``chrome://tracing`` and Perfetto.
+        """
+
+        pid = os.getpid()
+        events: list[dict[str, object]] = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / _NS_PER_US,
+                "dur": span.duration_ns / _NS_PER_US,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": dict(span.args),
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the Chrome trace JSON for this profiler to ``path``.
+
+        Args:
+            path: Destination file; parent directories are created as needed.
+        """
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+class _ActiveProfilerSlot:
+    """Process-wide holder for the active profiler, visible to worker threads."""
+
+    __slots__ = ("current",)
+
+    def __init__(self) -> None:
+        """Initialise the slot with profiling disabled."""
+
+        self.current: Profiler | None = None
+
+
+_ACTIVE = _ActiveProfilerSlot()
+
+
+def active_profiler() -> Profiler | None:
+    """Return the profiler collecting spans for the current run, if any.
+
+    Returns:
+        Profiler | None: Active profiler or ``None`` when profiling is disabled.
+    """
+
+    return _ACTIVE.current
+
+
+@contextmanager
+def profiling(profiler: Profiler) -> Iterator[Profiler]:
+    """Activate ``profiler`` for every thread until the block exits.
+
+    Args:
+        profiler: Profiler receiving spans recorded via :func:`profile_span`.
+
+    Yields:
+        Profiler: The activated profiler.
+    """
+
+    previous = _ACTIVE.current
+    _ACTIVE.current = profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE.current = previous
+
+
+def profile_span(
+    name: str,
+    *,
+    category: str = PHASE_CATEGORY,
+    args: Mapping[str, str] | None = None,
+) -> AbstractContextManager[None]:
+    """Return a span on the active profiler, or a no-op when profiling is off.
+
+    Args:
+        name: Span label.
+        category: Summary grouping for the span.
+        args: Optional details exported with the trace event.
+
+    Returns:
+        AbstractContextManager[None]: Context manager timing the enclosed block.
+    """
+
+    profiler = _ACTIVE.current
+    if profiler is None:
+        return nullcontext()
+    return profiler.span(name, category=category, args=args)
+
+
+__all__ = [
+    "PHASE_CATEGORY",
+    "TOOL_CATEGORY",
+    "ProfileSummaryRow",
+    "Profiler",
+    "TraceSpan",
+    "active_profiler",
+    "profile_span",
+    "profiling",
+]
@@ -10,12 +10,14 @@ from ..interfaces.discovery import FileDiscoveryConfig
 from .base import DiscoveryService, DiscoveryStrategy
 from .filesystem import FilesystemDiscovery
 from .git import GitDiscovery
+from .inventory import FileInventory
 from .planners import build_project_scanner
 from .rules import compile_exclude_arguments, is_under_any, normalize_path_requirement, path_matches_requirements
 
 __all__ = [
     "DiscoveryService",
     "DiscoveryStrategy",
+    "FileInventory",
     "FilesystemDiscovery",
     "GitDiscovery",
     "build_default_discovery",
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
+from typing import Final
 
 from ..core.runtime.process import CommandOptions, run_command
 from ..interfaces.discovery import FileDiscoveryConfig
@@ -13,6 +14,11 @@ from .base import DiscoveryStrategy, is_within_limits, resolve_limit_paths
 
 GitRunner = Callable[[Sequence[str], Path], list[str]]
 
+_DELETED_STATUS: Final[str] = "D"
+_RENAMED_STATUS: Final[str] = "R"
+_PORCELAIN_RENAME_SEPARATOR: Final[str] = " -> "
+_PORCELAIN_STATUS_WIDTH: Final[int] = 3
+
 
 class GitDiscovery(DiscoveryStrategy):
     """Collect files reported as changed by Git."""
@@ -50,13 +56,13 @@ class GitDiscovery(DiscoveryStrategy):
         """
 
         limits = tuple(resolve_limit_paths(config.limit_to, root))
-        if not (config.changed_only or config.pre_commit or config.base_branch):
+        if not (config.changed_only or config.incremental or config.pre_commit or config.base_branch):
             return []
         candidates: set[Path] = set()
         diff_targets = list(self._diff_names(config, root))
         candidates.update(diff_targets)
         if config.include_untracked:
-            candidates.update(self._untracked(root))
+            candidates.update(self.discover_untracked(root))
         bounded: set[Path] = set()
         for candidate in candidates:
             if not candidate.exists():
@@ -96,7 +102,7 @@ class GitDiscovery(DiscoveryStrategy):
         if config.pre_commit:
             cmd = ["git", "diff", "--name-only", "--cached"]
         else:
-            diff_ref = self._resolve_diff_ref(config, root)
+            diff_ref = self.resolve_diff_ref(config, root)
             cmd = ["git", "diff", "--name-only", diff_ref, "--"] if diff_ref else ["git", "status", "--short"]
             if not diff_ref:
                 for raw in self._runner(cmd, root):
@@ -112,7 +118,35 @@ class GitDiscovery(DiscoveryStrategy):
                 continue
             yield (root / stripped).resolve()
 
-    def _untracked(self, root: Path) -> Iterator[Path]:
+    def discover_removed(self, config: FileDiscoveryConfig, root: Path) -> Iterator[Path]:
+        """Yield files the diff deletes, including the old side of renames.
+
+        The paths no longer exist on disk, so :meth:`discover` drops them;
+        callers use them to find the modules that still import them.
+
+        Args:
+            config: Discovery configuration controlling diff behaviour.
+            root: Repository root directory.
+
+        Yields:
+            Path: Absolute paths of deleted or renamed-away files.
+        """
+
+        if config.pre_commit:
+            diff_ref: str | None = None
+            cmd = ["git", "diff", "--name-status", "-M", "--cached"]
+        else:
+            diff_ref = self.resolve_diff_ref(config, root)
+            cmd = (
+                ["git", "diff", "--name-status", "-M", diff_ref, "--"] if diff_ref else ["git", "status", "--porcelain"]
+            )
+        porcelain = not config.pre_commit and not diff_ref
+        for raw in self._runner(cmd, root):
+            removed = _parse_porcelain_removal(raw) if porcelain else _parse_name_status_removal(raw)
+            if removed is not None:
+                yield root.resolve() / removed
+
+    def discover_untracked(self, root: Path) -> Iterator[Path]:
         """Yield untracked files from git ls-files output.
 
         Args:
@@ -132,7 +166,7 @@ class GitDiscovery(DiscoveryStrategy):
                 continue
             yield (root / stripped).resolve()
 
-    def _resolve_diff_ref(self, config: FileDiscoveryConfig, root: Path) -> str | None:
+    def resolve_diff_ref(self, config: FileDiscoveryConfig, root: Path) -> str | None:
         """Return the git reference to diff against based on ``config``.
 
         Args:
@@ -172,6 +206,44 @@ class GitDiscovery(DiscoveryStrategy):
         return (cp.stdout or "").splitlines()
 
 
+def _parse_name_status_removal(line: str) -> str | None:
+    """Return the removed path recorded by one ``git diff --name-status`` line.
+
+    Args:
+        line: Raw output line such as ``D\tpkg/mod.py`` or ``R097\told.py\tnew.py``.
+
+    Returns:
+        str | None: Deleted or renamed-away path, or ``None`` for other statuses.
+    """
+
+    fields = line.rstrip("\n").split("\t")
+    if len(fields) < 2 or not fields[0]:
+        return None
+    if fields[0].startswith((_DELETED_STATUS, _RENAMED_STATUS)):
+        return fields[1]
+    return None
+
+
+def _parse_porcelain_removal(line: str) -> str | None:
+    """Return the removed path recorded by one ``git status --porcelain`` line.
+
+    Args:
+        line: Raw output line such as `` D pkg/mod.py`` or ``R  old.py -> new.py``.
+
+    Returns:
+        str | None: Deleted or renamed-away path, or ``None`` for other statuses.
+    """
+
+    status, path = line[: _PORCELAIN_STATUS_WIDTH - 1], line[_PORCELAIN_STATUS_WIDTH:].strip()
+    if not path:
+        return None
+    if _RENAMED_STATUS in status:
+        return path.split(_PORCELAIN_RENAME_SEPARATOR, 1)[0]
+    if _DELETED_STATUS in status:
+        return path
+    return None
+
+
 def list_tracked_files(root: Path) -> list[Path]:
     """Return tracked files for the git repository rooted at ``root``.
 
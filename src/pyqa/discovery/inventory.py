@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Shared, pre-filtered inventory of the files discovered for a lint run."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class FileInventory:
+    """Immutable set of discovered files indexed by lowercase suffix."""
+
+    root: Path
+    files: tuple[Path, ...]
+    _by_suffix: Mapping[str, tuple[Path, ...]] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_paths(cls, root: Path, paths: Iterable[Path]) -> FileInventory:
+        """Build an inventory from already-resolved discovery results.
+
+        Args:
+            root: Resolved project root the files were discovered beneath.
+            paths: Resolved file paths produced by discovery.
+
+        Returns:
+            FileInventory: Sorted inventory with a per-suffix index.
+        """
+
+        files = tuple(sorted(set(paths)))
+        buckets: dict[str, list[Path]] = {}
+        for path in files:
+            buckets.setdefault(path.suffix.lower(), []).append(path)
+        index = MappingProxyType({suffix: tuple(members) for suffix, members in buckets.items()})
+        return cls(root=root, files=files, _by_suffix=index)
+
+    def select(self, extensions: Iterable[str] | None = None) -> tuple[Path, ...]:
+        """Return discovered files, optionally restricted to ``extensions``.
+
+        Args:
+            extensions: Optional file suffixes; matching is case-insensitive.
+                ``None`` returns every discovered file.
+
+        Returns:
+            tuple[Path, ...]: Sorted, resolved file paths.
+        """
+
+        if extensions is None:
+            return self.files
+        suffixes = {ext.lower() for ext in extensions}
+        if len(suffixes) == 1:
+            return self._by_suffix.get(next(iter(suffixes)), ())
+        return tuple(sorted(path for suffix in suffixes for path in self._by_suffix.get(suffix, ())))
+
+    def __len__(self) -> int:
+        """Return the number of discovered files.
+
+        Returns:
+            int: Count of files held by the inventory.
+        """
+
+        return len(self.files)
+
+
+__all__ = ["FileInventory"]
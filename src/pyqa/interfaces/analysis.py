@@ -173,6 +173,42 @@ class FunctionScaleEstimator(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class ChangeScopeView(Protocol):
+    """Describe the files and lines touched by an incremental diff."""
+
+    @property
+    @abstractmethod
+    def root(self) -> Path:
+        """Return the repository root the scope is anchored to.
+
+        Returns:
+            Path: Root directory used to resolve relative diff paths.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def paths(self) -> tuple[Path, ...]:
+        """Return absolute paths for every file touched by the diff.
+
+        Returns:
+            tuple[Path, ...]: Sorted absolute paths covered by the scope.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def contains(self, path: Path | str) -> bool:
+        """Return whether ``path`` was touched by the diff.
+
+        Args:
+            path: Absolute or root-relative path to check.
+
+        Returns:
+            bool: ``True`` when the file appears in the diff.
+        """
+        raise NotImplementedError
+
+
 @dataclass(frozen=True, slots=True)
 class SimpleMessageSpan(MessageSpan):
     """Represent a message span implementing :class:`MessageSpan`."""
@@ -245,6 +281,7 @@ class DiagnosticAnnotation:
 
 __all__ = [
     "AnnotationProvider",
+    "ChangeScopeView",
     "ContextResolver",
     "FunctionScaleEstimator",
     "HighlightKind",
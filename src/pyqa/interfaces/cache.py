@@ -10,6 +10,7 @@ from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Generic, Protocol, TypeVar, runtime_checkable
 
+from pyqa.cache.codec import DiagnosticCandidate
 from pyqa.cache.result_store import CachedEntry, CacheRequest
 from pyqa.core.models import ToolOutcome
 from pyqa.interfaces.metrics import FileMetricsProtocol
@@ -102,6 +103,43 @@ class ResultCacheProtocol(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class BufferedResultCache(ResultCacheProtocol, Protocol):
+    """Result cache that defers some writes until :meth:`flush` is called."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Block until every buffered write has been delivered or dropped."""
+        raise NotImplementedError
+
+
+@runtime_checkable
+class CandidateCache(ResultCacheProtocol, Protocol):
+    """Result cache that also persists parser candidates natively."""
+
+    @abstractmethod
+    def load_candidates(self, request: CacheRequest) -> tuple[DiagnosticCandidate, ...] | None:
+        """Return parser candidates cached for ``request`` when available.
+
+        Args:
+            request: Cache request identifying the parser invocation.
+
+        Returns:
+            tuple[DiagnosticCandidate, ...] | None: Cached candidates; otherwise ``None``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def store_candidates(self, request: CacheRequest, candidates: Sequence[DiagnosticCandidate]) -> None:
+        """Persist parser ``candidates`` for ``request``.
+
+        Args:
+            request: Cache request identifying the parser invocation.
+            candidates: Raw and structured diagnostics produced by the parser.
+        """
+        raise NotImplementedError
+
+
 class ResultCacheFactory(Protocol):
     """Construct result cache instances bound to a directory."""
 
@@ -233,9 +271,11 @@ class CacheContextFactory(Protocol):
 
 
 __all__ = [
+    "BufferedResultCache",
     "CacheContextProtocol",
     "CacheContextFactory",
     "CacheProvider",
+    "CandidateCache",
     "CacheTokenBuilder",
     "CacheVersionStore",
     "ResultCacheFactory",
@@ -18,6 +18,7 @@ from pyqa.interfaces.discovery import FileDiscoveryConfig
 
 SharedKnobValue: TypeAlias = ConfigValue | str
 SensitivityLevelLiteral: TypeAlias = Literal["low", "medium", "high", "maximum"]
+type SourceFingerprint = tuple[tuple[str, str | None], ...]
 
 
 @runtime_checkable
@@ -155,6 +156,26 @@ class OutputDisplayOptions(Protocol):
 
         return cast(dict[str, list[str]], NotImplemented)
 
+    @property
+    def stream(self) -> bool:
+        """Return whether concise diagnostics are printed as each tool finishes.
+
+        Returns:
+            bool: ``True`` when concise output streams during the run.
+        """
+
+        return cast(bool, NotImplemented)
+
+    @property
+    def max_diagnostics(self) -> int | None:
+        """Return the maximum number of concise diagnostics printed.
+
+        Returns:
+            int | None: Display cap, or ``None`` when every diagnostic is shown.
+        """
+
+        return cast(int | None, NotImplemented)
+
     @property
     def advice(self) -> bool:
         """Return whether advice panels should be rendered.
@@ -199,6 +220,16 @@ class OutputArtifactOptions(Protocol):
 
         return cast(bool, NotImplemented)
 
+    @property
+    def report_compact(self) -> bool:
+        """Return whether JSON/SARIF reports should omit indentation.
+
+        Returns:
+            bool: ``True`` when machine-readable reports use compact encoding.
+        """
+
+        return cast(bool, NotImplemented)
+
     @property
     def sarif_out(self) -> Path | None:
         """Return the SARIF output path.
@@ -342,6 +373,33 @@ class ExecutionConfig(Protocol):
         """
         return cast(Path, NotImplemented)
 
+    @property
+    def remote_cache_url(self) -> str | None:
+        """Return the base URL of the shared remote result cache.
+
+        Returns:
+            str | None: the remote cache URL when configured.
+        """
+        return cast(str | None, NotImplemented)
+
+    @property
+    def cache_max_size_mb(self) -> int:
+        """Return the local cache size budget in megabytes.
+
+        Returns:
+            int: the size budget, where ``0`` disables size-based eviction.
+        """
+        return cast(int, NotImplemented)
+
+    @property
+    def cache_max_age_days(self) -> int:
+        """Return the age after which unused cache entries are evicted.
+
+        Returns:
+            int: the age budget in days, where ``0`` disables age-based eviction.
+        """
+        return cast(int, NotImplemented)
+
     @property
     def jobs(self) -> int:
         """Return the maximum number of concurrent jobs.
@@ -414,6 +472,24 @@ class ExecutionConfig(Protocol):
         """
         return cast(bool, NotImplemented)
 
+    @property
+    def tool_servers(self) -> bool:
+        """Return whether supported tools run through persistent daemon clients.
+
+        Returns:
+            bool: whether tool server mode is enabled.
+        """
+        return cast(bool, NotImplemented)
+
+    @property
+    def python_workers(self) -> bool:
+        """Return whether Python tools run in pre-imported forked workers.
+
+        Returns:
+            bool: whether Python worker mode is enabled.
+        """
+        return cast(bool, NotImplemented)
+
     @property
     def line_length(self) -> int:
         """Return the canonical line length for tools.
@@ -719,6 +795,31 @@ class ConfigSource(Protocol):
         """
 
 
+@runtime_checkable
+class FingerprintedConfigSource(ConfigSource, Protocol):
+    """Configuration source able to describe the inputs consulted while loading."""
+
+    @abstractmethod
+    def fingerprint(self) -> SourceFingerprint:
+        """Return the inputs consulted by the most recent :meth:`load`.
+
+        Returns:
+            SourceFingerprint: Pairs of input identifiers and their content
+            digests (or values); ``None`` marks an absent input.
+        """
+
+    @abstractmethod
+    def is_current(self, fingerprint: SourceFingerprint) -> bool:
+        """Return whether the inputs recorded in ``fingerprint`` are unchanged.
+
+        Args:
+            fingerprint: Value previously returned by :meth:`fingerprint`.
+
+        Returns:
+            bool: ``True`` when loading again would produce the same fragment.
+        """
+
+
 @runtime_checkable
 class ConfigResolver(Protocol):
     """Resolve layered configuration values into a final mapping."""
@@ -799,11 +900,13 @@ __all__ = [
     "ConfigSource",
     "ComplexityConfig",
     "ExecutionConfig",
+    "FingerprintedConfigSource",
     "OutputConfig",
     "QualityConfig",
     "SeverityConfig",
     "SharedKnobSnapshot",
     "SharedKnobValue",
+    "SourceFingerprint",
     "StrictnessConfig",
     "SupportsModelCopy",
 ]
@@ -28,6 +28,8 @@ class FileDiscoveryConfig(Protocol):
     diff_ref: str | None
     include_untracked: bool
     base_branch: str | None
+    incremental: bool
+    with_dependents: bool
     pre_commit: bool
 
     def model_copy(
@@ -151,6 +153,36 @@ class DiscoveryStrategy(Protocol):
         ...
 
 
+@runtime_checkable
+class FileInventoryView(Protocol):
+    """Expose the files discovered for a run so consumers never re-walk the tree."""
+
+    @property
+    @abstractmethod
+    def root(self) -> Path:
+        """Return the project root the inventory was discovered beneath.
+
+        Returns:
+            Path: Resolved project root.
+        """
+
+        ...
+
+    @abstractmethod
+    def select(self, extensions: Iterable[str] | None = None) -> tuple[Path, ...]:
+        """Return discovered files, optionally restricted to ``extensions``.
+
+        Args:
+            extensions: Optional file suffixes (for example ``".py"``); matching
+                is case-insensitive. ``None`` returns every discovered file.
+
+        Returns:
+            tuple[Path, ...]: Sorted, resolved file paths.
+        """
+
+        ...
+
+
 @runtime_checkable
 class DiscoveryOptions(PathSelectionOptions, Protocol):
     """Target discovery options propagated to tooling layers."""
@@ -160,6 +192,7 @@ __all__ = [
     "DiscoveryStrategy",
     "ExcludePolicy",
     "FileDiscoveryConfig",
+    "FileInventoryView",
     "TargetPlanner",
     "DiscoveryOptions",
 ]
@@ -33,19 +33,24 @@ from .options import (
     LintTargetOptions,
 )
 from .state import (
+    ChangeScopedLintState,
+    InventoryScopedLintState,
     LintOutputArtifacts,
     LintRunArtifacts,
     LintStateOptions,
     MissingFinding,
     PreparedLintState,
+    RunCachedLintState,
     SuppressionDirective,
     SuppressionRegistry,
 )
 from .types import LintOptionValue, OutputModeLiteral, PRSummarySeverityLiteral
 
 __all__: Final[list[str]] = [
+    "ChangeScopedLintState",
     "CLIDisplayOptions",
     "CLILogger",
+    "InventoryScopedLintState",
     "LintComplexityOptionsView",
     "LintExecutionOptions",
     "LintGitOptionsView",
@@ -71,6 +76,7 @@ __all__: Final[list[str]] = [
     "OutputModeLiteral",
     "PRSummarySeverityLiteral",
     "PreparedLintState",
+    "RunCachedLintState",
     "RuntimeAdditionalChecksView",
     "RuntimeCoreChecksView",
     "RuntimeInterfaceChecksView",
@@ -74,6 +74,24 @@ class LintGitOptionsView(Protocol):
             bool: ``True`` when test files should be excluded.
         """
 
+    @property
+    @abstractmethod
+    def incremental(self) -> bool:
+        """Return ``True`` when linting should be limited to changed files.
+
+        Returns:
+            bool: ``True`` when incremental linting is requested.
+        """
+
+    @property
+    @abstractmethod
+    def with_dependents(self) -> bool:
+        """Return ``True`` when changed files should be expanded to their importers.
+
+        Returns:
+            bool: ``True`` when transitive importers of changed files are linted.
+        """
+
 
 @runtime_checkable
 class LintSelectionOptionsView(Protocol):
@@ -169,6 +187,33 @@ class LintSummaryOptionsView(Protocol):
             int: Maximum number of findings included in summaries.
         """
 
+    @property
+    @abstractmethod
+    def report_compact(self) -> bool:
+        """Return ``True`` when JSON/SARIF reports should omit indentation.
+
+        Returns:
+            bool: ``True`` when machine-readable reports use compact encoding.
+        """
+
+    @property
+    @abstractmethod
+    def stream(self) -> bool:
+        """Return ``True`` when concise diagnostics print as each tool finishes.
+
+        Returns:
+            bool: ``True`` when streaming concise output is requested.
+        """
+
+    @property
+    @abstractmethod
+    def max_diagnostics(self) -> int | None:
+        """Return the maximum number of concise diagnostics to print.
+
+        Returns:
+            int | None: Display cap, or ``None`` when every diagnostic is printed.
+        """
+
     @property
     @abstractmethod
     def pr_summary_min_severity(self) -> PRSummarySeverityLiteral:
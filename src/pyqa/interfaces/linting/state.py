@@ -5,11 +5,13 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import MutableMapping, Sequence
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+from ..analysis import ChangeScopeView
 from ..common import RepositoryRootProvider
+from ..discovery import FileInventoryView
 from .logger import CLIDisplayOptions, CLILogger
 from .meta import LintMetaParams
 from .options import LintOptions, LintOptionsView
@@ -45,6 +47,14 @@ class LintOutputArtifacts(Protocol):
             Path | None: Path to the PR summary file when configured.
         """
 
+    @property
+    def profile_out(self) -> Path | None:
+        """Return the optional path storing the run's Chrome trace.
+
+        Returns:
+            Path | None: Path to the profiling trace file when profiling is enabled.
+        """
+
     def as_tuple(self) -> tuple[Path | None, Path | None, Path | None]:
         """Return the artefact paths as a tuple ordered by creation priority.
 
@@ -236,12 +246,96 @@ class PreparedLintState(RepositoryRootProvider, LintStateOptions, LintRunArtifac
     __slots__ = ()
 
 
+@runtime_checkable
+class ChangeScopedLintState(Protocol):
+    """Capability of lint states that can be narrowed to the files touched by a diff."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def change_scope(self) -> ChangeScopeView | None:
+        """Return the incremental change scope linters are restricted to.
+
+        Returns:
+            ChangeScopeView | None: Change scope, or ``None`` for full runs.
+        """
+
+    @abstractmethod
+    def with_change_scope(self, change_scope: ChangeScopeView) -> PreparedLintState:
+        """Return a copy of the state restricted to ``change_scope``.
+
+        The receiver is left untouched so concurrent linters sharing it are
+        unaffected.
+
+        Args:
+            change_scope: Change scope the copy should carry.
+
+        Returns:
+            PreparedLintState: Scoped copy of the state.
+        """
+
+
+@runtime_checkable
+class InventoryScopedLintState(Protocol):
+    """Capability of lint states that can reuse the orchestrator's file inventory."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def file_inventory(self) -> FileInventoryView | None:
+        """Return the file inventory linters select their targets from.
+
+        Returns:
+            FileInventoryView | None: Shared inventory, or ``None`` when linters
+            should discover files themselves.
+        """
+
+    @abstractmethod
+    def with_file_inventory(self, file_inventory: FileInventoryView) -> PreparedLintState:
+        """Return a copy of the state carrying ``file_inventory``.
+
+        The receiver is left untouched so concurrent linters sharing it are
+        unaffected.
+
+        Args:
+            file_inventory: Inventory the copy should carry.
+
+        Returns:
+            PreparedLintState: Copy of the state.
+        """
+
+
+@runtime_checkable
+class RunCachedLintState(Protocol):
+    """Capability of lint states carrying values shared by the linters of one run."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def run_cache(self) -> MutableMapping[str, object]:
+        """Return the mapping shared by every linter invoked for this state.
+
+        Scoped copies of the state share the same mapping, so expensive
+        intermediate results (module indexes, fused quality passes) are
+        computed once per run and released together with the state.
+
+        Returns:
+            MutableMapping[str, object]: Run-scoped values keyed by owner.
+        """
+
+
 __all__ = [
+    "ChangeScopedLintState",
+    "InventoryScopedLintState",
     "LintOutputArtifacts",
     "LintRunArtifacts",
     "LintStateOptions",
     "MissingFinding",
     "PreparedLintState",
+    "RunCachedLintState",
     "SuppressionDirective",
     "SuppressionRegistry",
 ]
@@ -0,0 +1,498 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Project-wide index of importable modules shared by import-aware linters."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+from pyqa.core.config.constants import ALWAYS_EXCLUDE_DIRS
+from pyqa.interfaces.linting import InventoryScopedLintState, PreparedLintState, RunCachedLintState
+
+from ._module_utils import module_name_from_path, module_name_from_relative
+
+PYTHON_FILE_SUFFIXES: Final[tuple[str, ...]] = (".py", ".pyi")
+PYTHON_FILE_SUFFIX_SET: Final[frozenset[str]] = frozenset(PYTHON_FILE_SUFFIXES)
+MODULE_INDEX_FILE: Final[str] = "module-index.json"
+_INDEX_FORMAT_VERSION: Final[int] = 2
+_INIT_STEM: Final[str] = "__init__"
+_DOTFILE_PREFIX: Final[str] = "."
+_RUN_CACHE_KEY: Final[str] = "linting.module-index"
+# Directories modified this recently may still change within the same mtime
+# tick, so an index covering them is not persisted (git's "racy" entries).
+_RACY_MTIME_WINDOW_NS: Final[int] = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleIndex:
+    """Immutable mapping of dotted module names to the project files defining them.
+
+    A module name is importable when a ``.py``/``.pyi`` file or a directory
+    holding Python sources exists for it beneath any module search root, which
+    mirrors how the import-aware linters previously probed the filesystem.
+    """
+
+    root: Path
+    modules: frozenset[str]
+    names_by_path: Mapping[Path, str]
+
+    def contains(self, module: str) -> bool:
+        """Return whether ``module`` resolves to a module or package in the project.
+
+        Args:
+            module: Absolute dotted module name.
+
+        Returns:
+            bool: ``True`` when the module is defined by a project file or package.
+        """
+
+        return module in self.modules
+
+    def module_name(self, path: Path, root: Path) -> str:
+        """Return the fully-qualified module name of ``path``.
+
+        Args:
+            path: Source file whose module name is requested.
+            root: Workspace root used when ``path`` is not indexed.
+
+        Returns:
+            str: Module name as computed by :func:`module_name_from_path`.
+        """
+
+        name = self.names_by_path.get(path)
+        if name is not None and root == self.root:
+            return name
+        return module_name_from_path(path, root)
+
+
+@dataclass(frozen=True, slots=True)
+class _WalkedLayout:
+    """Python files found by a directory walk plus the walked directories' mtimes."""
+
+    files: tuple[str, ...]
+    directories: Mapping[str, int]
+
+
+def module_index_for(state: PreparedLintState) -> ModuleIndex:
+    """Return the module index for the run ``state`` belongs to.
+
+    Orchestrated runs build the index once from the shared file inventory and
+    store it on the state's run cache, so every import-aware linter of the run
+    receives the same instance. Runs that cannot use the inventory walk the
+    project instead; that walk is persisted under the cache directory and
+    reused while none of the walked directories changed.
+
+    Args:
+        state: Prepared lint state describing the repository.
+
+    Returns:
+        ModuleIndex: Index shared by every caller holding ``state``.
+    """
+
+    inventory = state.file_inventory if isinstance(state, InventoryScopedLintState) else None
+    run_cache = state.run_cache if isinstance(state, RunCachedLintState) else None
+    if run_cache is not None:
+        entry = run_cache.get(_RUN_CACHE_KEY)
+        if isinstance(entry, tuple) and entry[0] is inventory:
+            return entry[1]
+    index = _load_or_build_index(state)
+    if run_cache is not None:
+        run_cache[_RUN_CACHE_KEY] = (inventory, index)
+    return index
+
+
+def _load_or_build_index(state: PreparedLintState) -> ModuleIndex:
+    """Return an index built from the inventory, the persisted walk, or a fresh walk.
+
+    Args:
+        state: Prepared lint state describing the repository.
+
+    Returns:
+        ModuleIndex: Index matching the current Python file layout.
+    """
+
+    root = _safe_resolve(state.root) or state.root
+    search_roots = discover_module_search_roots(state)
+    inventory = state.file_inventory if isinstance(state, InventoryScopedLintState) else None
+    if inventory is not None and getattr(state, "change_scope", None) is None and not _has_explicit_targets(state):
+        files = _relative_python_files(root, inventory.select(PYTHON_FILE_SUFFIXES))
+        return _build_index(root, search_roots, files)
+    cache_dir = _index_cache_dir(state, root)
+    if cache_dir is not None:
+        cached = _load_index(cache_dir, root, search_roots)
+        if cached is not None:
+            return cached
+    layout = _walk_layout(root, search_roots)
+    index = _build_index(root, search_roots, layout.files)
+    if cache_dir is not None:
+        _save_index(cache_dir, index, search_roots, layout)
+    return index
+
+
+def _has_explicit_targets(state: PreparedLintState) -> bool:
+    """Return whether discovery was narrowed to user-supplied paths.
+
+    Args:
+        state: Prepared lint state exposing target options.
+
+    Returns:
+        bool: ``True`` when explicit paths or directories were requested.
+    """
+
+    options = getattr(state, "options", None)
+    target_options = getattr(options, "target_options", None)
+    if target_options is None:
+        return False
+    return bool(getattr(target_options, "paths", ())) or bool(getattr(target_options, "dirs", ()))
+
+
+def _is_nested(candidate: Path, other: Path) -> bool:
+    """Return whether ``candidate`` lies strictly beneath ``other``.
+
+    Args:
+        candidate: Directory being tested.
+        other: Potential ancestor directory.
+
+    Returns:
+        bool: ``True`` when ``candidate`` is a proper descendant of ``other``.
+    """
+
+    return candidate != other and candidate.is_relative_to(other)
+
+
+def _walk_layout(root: Path, search_roots: tuple[Path, ...]) -> _WalkedLayout:
+    """Walk ``root`` and the search roots outside it, pruning excluded and hidden directories.
+
+    Args:
+        root: Resolved repository root.
+        search_roots: Module search roots that must be covered.
+
+    Returns:
+        _WalkedLayout: Root-relative Python files and the mtime of every walked directory.
+    """
+
+    tops = [candidate for candidate in search_roots if not any(_is_nested(candidate, other) for other in search_roots)]
+    if root not in tops:
+        tops.append(root)
+    files: list[Path] = []
+    directories: dict[str, int] = {}
+    for top in tops:
+        for directory, dirnames, filenames in os.walk(top):
+            dirnames[:] = [
+                name for name in dirnames if name not in ALWAYS_EXCLUDE_DIRS and not name.startswith(_DOTFILE_PREFIX)
+            ]
+            base = Path(directory)
+            try:
+                directories[_relative_key(root, base)] = base.stat().st_mtime_ns
+            except OSError:
+                continue
+            files.extend(base / name for name in filenames if os.path.splitext(name)[1] in PYTHON_FILE_SUFFIX_SET)
+    return _WalkedLayout(files=_relative_python_files(root, files), directories=MappingProxyType(directories))
+
+
+def _relative_key(root: Path, path: Path) -> str:
+    """Return the POSIX path of ``path`` relative to ``root`` (absolute when outside).
+
+    Args:
+        root: Resolved repository root.
+        path: Path to express relative to ``root``.
+
+    Returns:
+        str: Root-relative or absolute POSIX path.
+    """
+
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _relative_python_files(root: Path, files: Iterable[Path]) -> tuple[str, ...]:
+    """Return POSIX paths of ``files`` relative to ``root`` (absolute when outside).
+
+    Args:
+        root: Resolved repository root.
+        files: Resolved Python files.
+
+    Returns:
+        tuple[str, ...]: Sorted, de-duplicated path strings.
+    """
+
+    return tuple(sorted({_relative_key(root, path) for path in files}))
+
+
+def _build_index(root: Path, search_roots: tuple[Path, ...], relative_files: tuple[str, ...]) -> ModuleIndex:
+    """Build the module index for ``relative_files``.
+
+    Args:
+        root: Resolved repository root.
+        search_roots: Module search roots used for resolution.
+        relative_files: Root-relative Python file paths.
+
+    Returns:
+        ModuleIndex: Freshly built index.
+    """
+
+    modules: set[str] = set()
+    names: dict[Path, str] = {}
+    for relative in relative_files:
+        path = root / relative
+        for search_root in search_roots:
+            if path.is_relative_to(search_root):
+                modules.update(_module_names(path.relative_to(search_root)))
+        if not Path(relative).is_absolute():
+            names[path] = module_name_from_relative(Path(relative))
+    return ModuleIndex(root=root, modules=frozenset(modules), names_by_path=MappingProxyType(names))
+
+
+def _module_names(relative: Path) -> Iterable[str]:
+    """Yield the module and package names defined by a search-root-relative file.
+
+    Args:
+        relative: Python file path relative to a module search root.
+
+    Yields:
+        str: Dotted name of the module itself and of its containing package.
+    """
+
+    package_parts = relative.parent.parts
+    if package_parts:
+        yield ".".join(package_parts)
+    if relative.stem != _INIT_STEM:
+        yield ".".join((*package_parts, relative.stem))
+
+
+def _index_cache_dir(state: PreparedLintState, root: Path) -> Path | None:
+    """Return the directory used to persist the index, or ``None`` when caching is off.
+
+    Args:
+        state: Prepared lint state exposing runtime cache options.
+        root: Resolved repository root.
+
+    Returns:
+        Path | None: Absolute cache directory.
+    """
+
+    options = getattr(state, "options", None)
+    execution_options = getattr(options, "execution_options", None)
+    runtime = getattr(execution_options, "runtime", None)
+    if runtime is None or getattr(runtime, "no_cache", False):
+        return None
+    cache_dir = Path(runtime.cache_dir)
+    return cache_dir if cache_dir.is_absolute() else root / cache_dir
+
+
+def _load_index(cache_dir: Path, root: Path, search_roots: tuple[Path, ...]) -> ModuleIndex | None:
+    """Return the persisted index when none of the directories it walked changed.
+
+    Adding, removing or renaming an entry updates the containing directory's
+    mtime, so one ``stat`` per directory replaces a full walk of the tree.
+
+    Args:
+        cache_dir: Directory holding the persisted index.
+        root: Resolved repository root.
+        search_roots: Module search roots of the current run.
+
+    Returns:
+        ModuleIndex | None: Persisted index, or ``None`` when absent or stale.
+    """
+
+    try:
+        data = json.loads((cache_dir / MODULE_INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _INDEX_FORMAT_VERSION:
+        return None
+    if data.get("search_roots") != [_relative_key(root, search_root) for search_root in search_roots]:
+        return None
+    directories = data.get("directories")
+    modules = data.get("modules")
+    names = data.get("names")
+    if not isinstance(directories, dict) or not isinstance(modules, list) or not isinstance(names, dict):
+        return None
+    for relative, mtime_ns in directories.items():
+        try:
+            if (root / str(relative)).stat().st_mtime_ns != mtime_ns:
+                return None
+        except OSError:
+            return None
+    return ModuleIndex(
+        root=root,
+        modules=frozenset(str(module) for module in modules),
+        names_by_path=MappingProxyType({root / str(relative): str(name) for relative, name in names.items()}),
+    )
+
+
+def _save_index(cache_dir: Path, index: ModuleIndex, search_roots: tuple[Path, ...], layout: _WalkedLayout) -> None:
+    """Persist ``index`` with the walked directory mtimes, ignoring write failures.
+
+    Args:
+        cache_dir: Directory receiving the index file.
+        index: Index to persist.
+        search_roots: Module search roots used to build ``index``.
+        layout: Walk the index was built from.
+    """
+
+    racy_after = time.time_ns() - _RACY_MTIME_WINDOW_NS
+    if any(mtime_ns >= racy_after for mtime_ns in layout.directories.values()):
+        return
+    payload = {
+        "version": _INDEX_FORMAT_VERSION,
+        "search_roots": [_relative_key(index.root, search_root) for search_root in search_roots],
+        "directories": dict(layout.directories),
+        "modules": sorted(index.modules),
+        "names": {path.relative_to(index.root).as_posix(): name for path, name in index.names_by_path.items()},
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / MODULE_INDEX_FILE).write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        return
+
+
+def discover_module_search_roots(state: PreparedLintState) -> tuple[Path, ...]:
+    """Return directories that may contain importable modules for the repository.
+
+    Args:
+        state: Prepared lint state describing repository metadata.
+
+    Returns:
+        tuple[Path, ...]: Sorted tuple of candidate directories inspected for modules.
+    """
+
+    roots = _collect_base_roots(state.root)
+    roots.update(_collect_target_roots(state))
+    return tuple(sorted(roots))
+
+
+def _collect_base_roots(base_root: Path) -> set[Path]:
+    """Return root directories derived from the repository root.
+
+    Args:
+        base_root: Repository root directory discovered from the lint state.
+
+    Returns:
+        set[Path]: Existing directories that should be consulted for module discovery.
+    """
+
+    roots: set[Path] = set()
+    if not base_root.exists():
+        return roots
+    resolved_root = _safe_resolve(base_root)
+    if resolved_root is None:
+        return roots
+    roots.add(resolved_root)
+    roots.update(_collect_child_directories(resolved_root))
+    return roots
+
+
+def _safe_resolve(path: Path) -> Path | None:
+    """Return ``path.resolve()`` while tolerating platform-specific failures.
+
+    Args:
+        path: Path instance being resolved.
+
+    Returns:
+        Path | None: Resolved path or ``None`` when the resolution fails.
+    """
+
+    try:
+        return path.resolve()
+    except OSError:
+        return None
+
+
+def _collect_child_directories(root: Path) -> set[Path]:
+    """Return resolved directories directly beneath ``root``.
+
+    Excluded and hidden directories are skipped; the index never contains
+    modules beneath them, and the cache directory must not perturb the
+    fingerprint.
+
+    Args:
+        root: Directory whose immediate children should be resolved.
+
+    Returns:
+        set[Path]: Child directories that resolved successfully.
+    """
+
+    try:
+        entries = tuple(root.iterdir())
+    except OSError:
+        return set()
+    resolved_children: set[Path] = set()
+    for entry in entries:
+        if entry.name in ALWAYS_EXCLUDE_DIRS or entry.name.startswith(_DOTFILE_PREFIX) or not entry.is_dir():
+            continue
+        resolved = _safe_resolve(entry)
+        if resolved is not None:
+            resolved_children.add(resolved)
+    return resolved_children
+
+
+def _collect_target_roots(state: PreparedLintState) -> set[Path]:
+    """Return root directories derived from lint target options.
+
+    Args:
+        state: Lint state providing optional discovery metadata.
+
+    Returns:
+        set[Path]: Additional directories referenced by the lint options.
+    """
+
+    options = getattr(state, "options", None)
+    target_options = getattr(options, "target_options", None) if options is not None else None
+    if target_options is None:
+        return set()
+    roots: set[Path] = set()
+    resolved_root = _resolve_existing_path(getattr(target_options, "root", None), treat_file_parent=False)
+    if resolved_root is not None:
+        roots.add(resolved_root)
+    for path in getattr(target_options, "paths", ()):
+        resolved_path = _resolve_existing_path(path, treat_file_parent=True)
+        if resolved_path is not None:
+            roots.add(resolved_path)
+    for directory in getattr(target_options, "dirs", ()):
+        resolved_dir = _resolve_existing_path(directory, treat_file_parent=False)
+        if resolved_dir is not None:
+            roots.add(resolved_dir)
+    return roots
+
+
+def _resolve_existing_path(value: Path | str | None, *, treat_file_parent: bool) -> Path | None:
+    """Return a resolved path for ``value`` when an existing directory is found.
+
+    Args:
+        value: Candidate path supplied by lint configuration.
+        treat_file_parent: Flag indicating whether regular files should resolve to their parent directory.
+
+    Returns:
+        Path | None: Resolved directory path or ``None`` when the candidate does not exist.
+    """
+
+    if value is None:
+        return None
+    candidate_path = value if isinstance(value, Path) else Path(value)
+    if not candidate_path.exists():
+        return None
+    candidate = candidate_path if candidate_path.is_dir() or not treat_file_parent else candidate_path.parent
+    if not candidate.exists():
+        return None
+    return _safe_resolve(candidate)
+
+
+__all__ = [
+    "MODULE_INDEX_FILE",
+    "PYTHON_FILE_SUFFIXES",
+    "PYTHON_FILE_SUFFIX_SET",
+    "ModuleIndex",
+    "discover_module_search_roots",
+    "module_index_for",
+]
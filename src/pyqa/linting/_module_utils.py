@@ -39,12 +39,42 @@ def module_name_from_path(path: Path, root: Path) -> str:
         else:
             module_parts = path.with_suffix("").parts
     else:
-        module_parts = relative.with_suffix("").parts
-        if _PACKAGE_SENTINEL in module_parts:
-            index = module_parts.index(_PACKAGE_SENTINEL)
-            module_parts = module_parts[index:]
-        else:
-            module_parts = (_PACKAGE_SENTINEL, *module_parts)
+        return module_name_from_relative(relative)
+    return _join_module_parts(module_parts)
+
+
+def module_name_from_relative(relative: Path) -> str:
+    """Return the fully-qualified module name for a root-relative source path.
+
+    Unlike :func:`module_name_from_path` this performs no filesystem access,
+    which lets callers holding already-resolved inventories name every file
+    cheaply.
+
+    Args:
+        relative: Source file path relative to the workspace root.
+
+    Returns:
+        Fully-qualified module path (``pyqa.foo.bar``).
+    """
+
+    module_parts = relative.with_suffix("").parts
+    if _PACKAGE_SENTINEL in module_parts:
+        index = module_parts.index(_PACKAGE_SENTINEL)
+        module_parts = module_parts[index:]
+    else:
+        module_parts = (_PACKAGE_SENTINEL, *module_parts)
+    return _join_module_parts(module_parts)
+
+
+def _join_module_parts(module_parts: tuple[str, ...]) -> str:
+    """Return the dotted module name for ``module_parts``.
+
+    Args:
+        module_parts: Path components of the module, without suffix.
+
+    Returns:
+        Dotted module name with any trailing ``__init__`` removed.
+    """
 
     if module_parts and module_parts[-1] == _INIT_SENTINEL:
         module_parts = module_parts[:-1]
@@ -53,4 +83,4 @@ def module_name_from_path(path: Path, root: Path) -> str:
     return ".".join(module_parts)
 
 
-__all__ = ["module_name_from_path"]
+__all__ = ["module_name_from_path", "module_name_from_relative"]
@@ -13,14 +13,13 @@ from pyqa.interfaces.core import JsonValue
 from pyqa.interfaces.linting import PreparedLintState
 
 from ._ast_visitors import BaseAstLintVisitor, VisitorMetadata, run_ast_linter
+from ._module_index import module_index_for
 from .base import InternalLintReport
 
 DEFAULT_INTERFACES_ROOT: Final[str] = "src/pyqa/interfaces"
 _MODULE_SCOPE_DEPTH: Final[int] = 2
 _TYPE_CHECKING_SENTINEL: Final[str] = "TYPE_CHECKING"
 _RELATIVE_PREFIX_SENTINEL: Final[str] = "."
-PYTHON_FILE_SUFFIXES: Final[tuple[str, ...]] = (".py", ".pyi")
-PYTHON_FILE_SUFFIX_SET: Final[frozenset[str]] = frozenset(PYTHON_FILE_SUFFIXES)
 
 
 class ImportKind(str, Enum):
@@ -63,133 +62,6 @@ def _resolve_interfaces_hint(state: PreparedLintState) -> str | None:
     return str(candidate)
 
 
-def _discover_module_search_roots(state: PreparedLintState) -> tuple[Path, ...]:
-    """Return directories that may contain importable modules for the repository.
-
-    Args:
-        state: Prepared lint state describing repository metadata.
-
-    Returns:
-        tuple[Path, ...]: Sorted tuple of candidate directories inspected for modules.
-    """
-
-    roots = _collect_base_roots(state.root)
-    roots.update(_collect_target_roots(state))
-    return tuple(sorted(roots))
-
-
-def _collect_base_roots(base_root: Path) -> set[Path]:
-    """Return root directories derived from the repository root.
-
-    Args:
-        base_root: Repository root directory discovered from the lint state.
-
-    Returns:
-        set[Path]: Existing directories that should be consulted for module discovery.
-    """
-
-    roots: set[Path] = set()
-    if not base_root.exists():
-        return roots
-    resolved_root = _safe_resolve(base_root)
-    if resolved_root is None:
-        return roots
-    roots.add(resolved_root)
-    roots.update(_collect_child_directories(resolved_root))
-    return roots
-
-
-def _safe_resolve(path: Path) -> Path | None:
-    """Return ``path.resolve()`` while tolerating platform-specific failures.
-
-    Args:
-        path: Path instance being resolved.
-
-    Returns:
-        Path | None: Resolved path or ``None`` when the resolution fails.
-    """
-
-    try:
-        return path.resolve()
-    except OSError:
-        return None
-
-
-def _collect_child_directories(root: Path) -> set[Path]:
-    """Return resolved directories directly beneath ``root``.
-
-    Args:
-        root: Directory whose immediate children should be resolved.
-
-    Returns:
-        set[Path]: Child directories that resolved successfully.
-    """
-
-    try:
-        entries = tuple(root.iterdir())
-    except OSError:
-        return set()
-    resolved_children: set[Path] = set()
-    for entry in entries:
-        if not entry.is_dir():
-            continue
-        resolved = _safe_resolve(entry)
-        if resolved is not None:
-            resolved_children.add(resolved)
-    return resolved_children
-
-
-def _collect_target_roots(state: PreparedLintState) -> set[Path]:
-    """Return root directories derived from lint target options.
-
-    Args:
-        state: Lint state providing optional discovery metadata.
-
-    Returns:
-        set[Path]: Additional directories referenced by the lint options.
-    """
-
-    options = getattr(state, "options", None)
-    target_options = getattr(options, "target_options", None) if options is not None else None
-    if target_options is None:
-        return set()
-    roots: set[Path] = set()
-    resolved_root = _resolve_existing_path(getattr(target_options, "root", None), treat_file_parent=False)
-    if resolved_root is not None:
-        roots.add(resolved_root)
-    for path in getattr(target_options, "paths", ()):
-        resolved_path = _resolve_existing_path(path, treat_file_parent=True)
-        if resolved_path is not None:
-            roots.add(resolved_path)
-    for directory in getattr(target_options, "dirs", ()):
-        resolved_dir = _resolve_existing_path(directory, treat_file_parent=False)
-        if resolved_dir is not None:
-            roots.add(resolved_dir)
-    return roots
-
-
-def _resolve_existing_path(value: Path | str | None, *, treat_file_parent: bool) -> Path | None:
-    """Return a resolved path for ``value`` when an existing directory is found.
-
-    Args:
-        value: Candidate path supplied by lint configuration.
-        treat_file_parent: Flag indicating whether regular files should resolve to their parent directory.
-
-    Returns:
-        Path | None: Resolved directory path or ``None`` when the candidate does not exist.
-    """
-
-    if value is None:
-        return None
-    candidate_path = value if isinstance(value, Path) else Path(value)
-    if not candidate_path.exists():
-        return None
-    candidate = candidate_path if candidate_path.is_dir() or not treat_file_parent else candidate_path.parent
-    if not candidate.exists():
-        return None
-    return _safe_resolve(candidate)
-
-
 def run_conditional_import_linter(
     state: PreparedLintState,
     *,
@@ -233,8 +105,7 @@ class _ConditionalImportVisitor(BaseAstLintVisitor):
         self._node_stack: list[ast.AST] = []
         self._interfaces_hint = _resolve_interfaces_hint(state)
         self._has_interfaces_module = self._interfaces_hint is not None
-        self._module_roots = _discover_module_search_roots(state)
-        self._module_cache: dict[str, bool] = {}
+        self._module_index = module_index_for(state)
 
     # The base class does not hook into visit dispatch, so we override `visit`
     # to push/pop the ancestor stack while delegating to the standard visitor.
@@ -383,74 +254,9 @@ class _ConditionalImportVisitor(BaseAstLintVisitor):
             bool: ``True`` when the module resolves to a package or module within the repository root.
         """
 
-        cached = self._module_cache.get(module)
-        if cached is not None:
-            return cached
         if module.startswith(_RELATIVE_PREFIX_SENTINEL) or not module:
-            self._module_cache[module] = True
-            return True
-        parts = [segment for segment in module.split(".") if segment]
-        result = any(self._module_exists(root, parts) for root in self._module_roots)
-        self._module_cache[module] = result
-        return result
-
-    def _module_exists(self, root: Path, parts: list[str]) -> bool:
-        """Return whether ``parts`` resolves to a module or package beneath ``root``.
-
-        Args:
-            root: Directory considered as the root for module resolution.
-            parts: Sequence of path components derived from the import name.
-
-        Returns:
-            bool: ``True`` when a corresponding module or package exists, otherwise ``False``.
-        """
-
-        if not parts:
-            return False
-        module_dir = root.joinpath(*parts)
-        if _package_contains_python(module_dir):
             return True
-        parent = root.joinpath(*parts[:-1]) if len(parts) > 1 else root
-        return _module_file_exists(parent, parts[-1])
-
-
-def _package_contains_python(directory: Path) -> bool:
-    """Return whether ``directory`` hosts a Python package or module files.
-
-    Args:
-        directory: Candidate package directory.
-
-    Returns:
-        bool: ``True`` when the directory contains package metadata or Python sources.
-    """
-
-    if not directory.is_dir():
-        return False
-    init_file = directory / "__init__.py"
-    if init_file.is_file():
-        return True
-    try:
-        return any(entry.is_file() and entry.suffix in PYTHON_FILE_SUFFIX_SET for entry in directory.iterdir())
-    except OSError:
-        return False
-
-
-def _module_file_exists(parent: Path, module_name: str) -> bool:
-    """Return whether ``parent`` contains a module implementation or type-hint file.
-
-    Args:
-        parent: Directory inspected for module files.
-        module_name: Module name extracted from the import statement.
-
-    Returns:
-        bool: ``True`` when a Python source or type-hint file exists for the module.
-    """
-
-    for suffix in PYTHON_FILE_SUFFIXES:
-        candidate = parent / f"{module_name}{suffix}"
-        if candidate.is_file():
-            return True
-    return False
+        return self._module_index.contains(".".join(segment for segment in module.split(".") if segment))
 
 
 def _uses_type_checking_guard(node: ast.If) -> bool:
@@ -13,7 +13,7 @@ from pyqa.core.models import JsonValue
 from pyqa.interfaces.linting import PreparedLintState
 
 from ._ast_visitors import BaseAstLintVisitor, VisitorMetadata, run_ast_linter
-from ._module_utils import module_name_from_path
+from ._module_index import module_index_for
 from .base import InternalLintReport
 
 _ALLOWED_SERVICE_REGISTERERS: Final[frozenset[str]] = frozenset(
@@ -86,7 +86,7 @@ class _DiVisitor(BaseAstLintVisitor):
         """
 
         super().__init__(path, state, metadata)
-        self._module = module_name_from_path(path, state.options.target_options.root)
+        self._module = module_index_for(state).module_name(path, state.options.target_options.root)
 
     def visit_call(self, node: ast.Call) -> None:
         """Record violations for forbidden service registration calls.
@@ -13,7 +13,7 @@ from typing import ClassVar, Final, cast
 from pyqa.interfaces.linting import PreparedLintState
 
 from ._ast_visitors import BaseAstLintVisitor, VisitorMetadata, run_ast_linter
-from ._module_utils import module_name_from_path
+from ._module_index import module_index_for
 from .base import InternalLintReport
 
 _INTERFACES_KEYWORD: Final[str] = "interfaces"
@@ -188,7 +188,7 @@ class _InterfaceVisitor(BaseAstLintVisitor):
         """
 
         super().__init__(path, state, metadata)
-        self._module = module_name_from_path(path, state.options.target_options.root)
+        self._module = module_index_for(state).module_name(path, state.options.target_options.root)
         parts = self._module.split(".") if self._module else []
         self._namespace_root = parts[0] if parts else ""
         self._namespace_prefix = f"{self._namespace_root}." if self._namespace_root else ""
@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final, cast
 
@@ -34,7 +35,7 @@ from pyqa.core.models import Diagnostic, ToolExitCategory, ToolOutcome
 from pyqa.core.severity import Severity
 from pyqa.filesystem.paths import normalize_path_key
 from pyqa.interfaces.config import Config as ConfigProtocol
-from pyqa.interfaces.linting import PreparedLintState
+from pyqa.interfaces.linting import InventoryScopedLintState, PreparedLintState, RunCachedLintState
 
 from .base import InternalLintReport
 from .utils import collect_python_files, collect_target_files
@@ -66,6 +67,98 @@ class QualitySubsetRequest:
 
 
 _ENFORCEMENT_SENSITIVITY: Final[frozenset[str]] = frozenset({"high", "maximum"})
+_FUSED_CHECKS_BY_META_FLAG: Final[tuple[tuple[str, str], ...]] = (
+    ("check_file_size", "file-size"),
+    ("check_license_header", "license"),
+    ("check_copyright", "license"),
+    ("check_python_hygiene", "python"),
+    ("check_pyqa_python_hygiene", "python"),
+)
+_SHARED_RUN_KEY: Final[str] = "quality.shared-run"
+
+
+@dataclass(slots=True)
+class _SharedQualityRun:
+    """Quality results computed once per orchestrated run and shared by the quality linters.
+
+    The first quality linter to run evaluates its checks together with every
+    other quality check the CLI flags request, in a single pass over the
+    files; later linters read their categories from the stored results.
+    """
+
+    state: PreparedLintState
+    config: ConfigProtocol
+    inventory: object
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    results: dict[str, QualityCheckResult] = field(default_factory=dict)
+
+    def result_for(self, checks: tuple[str, ...]) -> QualityCheckResult:
+        """Return findings covering ``checks``, evaluating missing checks once.
+
+        Args:
+            checks: Quality check names required by the calling linter.
+
+        Returns:
+            QualityCheckResult: Findings for ``checks``; issues from other checks
+            evaluated in the same pass may also be present.
+        """
+
+        with self.lock:
+            missing = [name for name in checks if name not in self.results]
+            if missing:
+                batch = tuple(dict.fromkeys((*missing, *self._anticipated_checks())))
+                result = evaluate_quality_checks(
+                    QualityCheckRequest(
+                        root=self.state.root,
+                        config=self.config,
+                        checks=batch,
+                        files=tuple(collect_target_files(self.state)),
+                    )
+                )
+                for name in batch:
+                    self.results[name] = result
+            unique = list({id(result): result for result in (self.results[name] for name in checks)}.values())
+        if len(unique) == 1:
+            return unique[0]
+        return QualityCheckResult(issues=[issue for result in unique for issue in result.issues])
+
+    def _anticipated_checks(self) -> tuple[str, ...]:
+        """Return not-yet-evaluated checks requested for this run via CLI flags.
+
+        Returns:
+            tuple[str, ...]: Check names worth folding into the current pass.
+        """
+
+        meta = getattr(self.state, "meta", None)
+        run_all = bool(getattr(meta, "normal", False))
+        return tuple(
+            check
+            for flag, check in _FUSED_CHECKS_BY_META_FLAG
+            if check not in self.results and (run_all or getattr(meta, flag, False) is True)
+        )
+
+
+def _shared_quality_run(state: PreparedLintState, config: ConfigProtocol) -> _SharedQualityRun | None:
+    """Return the shared quality run stored on the run-scoped cache of ``state``.
+
+    Args:
+        state: Prepared lint state; orchestrated runs attach a file inventory.
+        config: Active configuration used by the quality linters.
+
+    Returns:
+        _SharedQualityRun | None: Shared run, or ``None`` for standalone invocations.
+    """
+
+    inventory = state.file_inventory if isinstance(state, InventoryScopedLintState) else None
+    if inventory is None or not isinstance(state, RunCachedLintState):
+        return None
+    candidate = _SharedQualityRun(state=state, config=config, inventory=inventory)
+    shared = state.run_cache.setdefault(_SHARED_RUN_KEY, candidate)
+    if isinstance(shared, _SharedQualityRun) and shared.config is config and shared.inventory is inventory:
+        return shared
+    # The state was reused for another run; its previous pass no longer applies.
+    state.run_cache[_SHARED_RUN_KEY] = candidate
+    return candidate
 
 
 def _should_enforce_quality(config: ConfigProtocol) -> bool:
@@ -328,14 +421,18 @@ def _run_quality_subset(request: QualitySubsetRequest) -> InternalLintReport:
         )
         return InternalLintReport(outcome=outcome, files=tuple(files))
 
-    quality_request = QualityCheckRequest(
-        root=request.state.root,
-        config=request.config,
-        checks=request.checks,
-        files=tuple(files),
-        fix=False,
-    )
-    result = evaluate_quality_checks(quality_request)
+    shared = _shared_quality_run(request.state, request.config)
+    if shared is not None:
+        result = shared.result_for(request.checks)
+    else:
+        quality_request = QualityCheckRequest(
+            root=request.state.root,
+            config=request.config,
+            checks=request.checks,
+            files=tuple(files),
+            fix=False,
+        )
+        result = evaluate_quality_checks(quality_request)
 
     diagnostics: list[Diagnostic] = []
     stdout_lines: list[str] = []
@@ -12,7 +12,7 @@ from typing import cast
 from pyqa.core.models import ToolOutcome
 from pyqa.interfaces.config import Config as ConfigProtocol
 from pyqa.interfaces.internal_linting import INTERNAL_LINTER_TOOL_NAMES
-from pyqa.interfaces.linting import PreparedLintState
+from pyqa.interfaces.linting import ChangeScopedLintState, InventoryScopedLintState, PreparedLintState
 from pyqa.platform.workspace import is_pyqa_lint_workspace
 from pyqa.testing.suppressions import build_internal_test_suppression_pattern
 from pyqa.tools.base import DeferredCommand, PhaseLiteral, Tool, ToolAction, ToolContext
@@ -75,17 +75,24 @@ class _InternalRunnerAction:
     state: PreparedLintState
     runner: InternalLintRunner
 
-    def __call__(self, _context: ToolContext) -> ToolOutcome:
+    def __call__(self, context: ToolContext) -> ToolOutcome:
         """Execute the bound runner and annotate the resulting outcome.
 
         Args:
-            _context: Tool context provided by orchestrator execution.
+            context: Tool context provided by orchestrator execution. Its
+                change scope, when present, narrows the runner to the diff
+                and its file inventory replaces per-linter tree walks.
 
         Returns:
             ToolOutcome: Deep-copied outcome associated with ``definition``.
         """
 
-        report: InternalLintReport = self.runner(self.state, emit_to_logger=False)
+        state = self.state
+        if context.file_inventory is not None and isinstance(state, InventoryScopedLintState):
+            state = state.with_file_inventory(context.file_inventory)
+        if context.change_scope is not None and isinstance(state, ChangeScopedLintState):
+            state = state.with_change_scope(context.change_scope)
+        report: InternalLintReport = self.runner(state, emit_to_logger=False)
         outcome = report.outcome.model_copy(deep=True)
         outcome.tool = self.definition.name
         outcome.action = "check"
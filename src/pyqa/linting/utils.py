@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Final
 
 from pyqa.core.config.constants import ALWAYS_EXCLUDE_DIRS
-from pyqa.interfaces.linting import PreparedLintState
+from pyqa.interfaces.linting import InventoryScopedLintState, PreparedLintState
 
 _PYTHON_EXTENSIONS: Final[tuple[str, ...]] = (".py", ".pyi")
 _CACHE_SEGMENT_INDICATOR: Final[str] = "cache"
@@ -41,7 +41,8 @@ def collect_target_files(
     Returns:
         Sorted list of resolved file paths matching the requested filters.
         Dot-prefixed files and directories are excluded unless the caller
-        opts into ``include_dotfiles``.
+        opts into ``include_dotfiles``. When the orchestrator shared its file
+        inventory the result is selected from it instead of walking the tree.
     """
 
     options = state.options.target_options
@@ -60,6 +61,15 @@ def collect_target_files(
         include_dotfiles=include_dotfiles,
     )
 
+    change_scope = getattr(state, "change_scope", None)
+    if change_scope is not None:
+        targets = [*paths, *(_resolve_within_root(directory, root) for directory in options.dirs)]
+        return _collect_scoped_files(change_scope.paths(), targets, context)
+    file_inventory = state.file_inventory if isinstance(state, InventoryScopedLintState) else None
+    if file_inventory is not None:
+        targets = [*paths, *(_resolve_within_root(directory, root) for directory in options.dirs)]
+        return _collect_inventory_files(file_inventory.select(extension_filter), targets, context)
+
     for path in paths:
         _include_candidate(
             candidates,
@@ -92,6 +102,70 @@ def collect_python_files(state: PreparedLintState) -> list[Path]:
     return collect_target_files(state, extensions=_PYTHON_EXTENSIONS)
 
 
+def _collect_scoped_files(
+    changed: Iterable[Path],
+    targets: Iterable[Path | None],
+    context: _DiscoveryContext,
+) -> list[Path]:
+    """Return changed files that fall beneath the requested lint targets.
+
+    Args:
+        changed: Absolute paths touched by the incremental diff.
+        targets: Resolved target files or directories (``None`` entries are skipped).
+        context: Discovery context describing exclusion lists and options.
+
+    Returns:
+        list[Path]: Sorted changed files eligible for linting.
+    """
+
+    anchors = [target for target in targets if target is not None]
+    excluded = [path.resolve() for path in context.excluded]
+    results: set[Path] = set()
+    for candidate in changed:
+        if not candidate.is_file():
+            continue
+        if not any(candidate == anchor or candidate.is_relative_to(anchor) for anchor in anchors):
+            continue
+        if _is_excluded(candidate, excluded, context.root, context.include_dotfiles):
+            continue
+        if context.extension_filter and candidate.suffix.lower() not in context.extension_filter:
+            continue
+        results.add(candidate)
+    return sorted(results)
+
+
+def _collect_inventory_files(
+    inventory: Iterable[Path],
+    targets: Iterable[Path | None],
+    context: _DiscoveryContext,
+) -> list[Path]:
+    """Return inventory files that fall beneath the requested lint targets.
+
+    Inventory entries are resolved, existing files produced by discovery, so
+    only the target, exclusion, and root checks are applied here.
+
+    Args:
+        inventory: Resolved files already filtered by extension.
+        targets: Resolved target files or directories (``None`` entries are skipped).
+        context: Discovery context describing exclusion lists and options.
+
+    Returns:
+        list[Path]: Sorted inventory files eligible for linting.
+    """
+
+    anchors = [target for target in targets if target is not None]
+    if not anchors:
+        return []
+    covers_root = context.root in anchors
+    excluded = [path.resolve() for path in context.excluded]
+    return [
+        candidate
+        for candidate in inventory
+        if (covers_root or any(candidate == anchor or candidate.is_relative_to(anchor) for anchor in anchors))
+        and not _is_excluded_resolved(candidate, excluded, context.root, context.include_dotfiles)
+    ]
+
+
 def _walk_files(directory: Path, context: _DiscoveryContext) -> set[Path]:
     """Collect files beneath ``directory`` while applying exclusions.
 
@@ -131,7 +205,22 @@ def _is_excluded(path: Path, excluded: Iterable[Path], root: Path, include_dotfi
         ``True`` if the path should be skipped by internal linters.
     """
 
-    path = path.resolve()
+    return _is_excluded_resolved(path.resolve(), excluded, root, include_dotfiles)
+
+
+def _is_excluded_resolved(path: Path, excluded: Iterable[Path], root: Path, include_dotfiles: bool) -> bool:
+    """Return ``True`` when the already-resolved ``path`` should be ignored.
+
+    Args:
+        path: Resolved file or directory under consideration.
+        excluded: Paths explicitly excluded by user configuration.
+        root: Repository root for default exclusion checks.
+        include_dotfiles: Whether dot-prefixed segments should be retained.
+
+    Returns:
+        ``True`` if the path should be skipped by internal linters.
+    """
+
     for skip in excluded:
         try:
             path.relative_to(skip)
@@ -11,6 +11,7 @@ from types import MappingProxyType
 from pyqa.core.environment.tool_env import CommandPreparationRequest, PreparedCommand
 
 from ..cache.context import update_tool_version
+from ..core.runtime.profiling import profile_span
 from ..interfaces.config import Config as ConfigProtocol
 from ..tools import Tool, ToolAction, ToolContext
 from ._pipeline_components import (
@@ -72,12 +73,13 @@ class _OrchestratorActionMixin:
             _ActionPlanOutcome: Outcome describing whether orchestration should continue.
         """
 
-        preparation = self._prepare_action(
-            tool=loop_context.tool,
-            action=action,
-            context=loop_context.tool_context,
-            inputs=loop_context.preparation,
-        )
+        with profile_span("prepare", args={"tool": f"{loop_context.tool.name}:{action.name}"}):
+            preparation = self._prepare_action(
+                tool=loop_context.tool,
+                action=action,
+                context=loop_context.tool_context,
+                inputs=loop_context.preparation,
+            )
         if preparation.error is not None or preparation.prepared is None:
             raise RuntimeError(preparation.error or "Failed to prepare command")
 
@@ -93,6 +95,13 @@ class _OrchestratorActionMixin:
             f"internal={invocation.internal_runner is not None}"
         )
         update_tool_version(loop_context.environment.cache, loop_context.tool.name, preparation.prepared.version)
+        if invocation.internal_runner is None:
+            loop_context.environment.cache.remember_prepared_command(
+                tool_name=loop_context.tool.name,
+                action_name=action.name,
+                cmd=preparation.base_command,
+                prepared=invocation.command,
+            )
 
         cache_decision = self._handle_cached_outcome(
             loop_context.cfg,
@@ -107,7 +116,7 @@ class _OrchestratorActionMixin:
             self._debug(f"skipping {loop_context.tool.name}:{action.name} due to cache hit")
             return _ActionPlanOutcome.CONTINUE
 
-        if self._requires_immediate_execution(loop_context.cfg, action):
+        if self._requires_immediate_execution(action):
             self._debug(
                 f"executing {loop_context.tool.name}:{action.name} immediately "
                 f"(is_fix={action.is_fix}, bail={loop_context.cfg.execution.bail})"
@@ -125,6 +134,53 @@ class _OrchestratorActionMixin:
         self._debug(f'queued {loop_context.tool.name}:{action.name} command="{queued_cmd}"')
         return _ActionPlanOutcome.CONTINUE
 
+    def _precheck_cached_action(
+        self,
+        *,
+        action: ToolAction,
+        loop_context: _ActionLoopContext,
+    ) -> ActionDecision:
+        """Serve ``action`` from the result cache without provisioning the tool.
+
+        The catalog command is built without touching the runtime layer and
+        mapped to the prepared command recorded on a previous run. Installers
+        and command preparation only run when this lookup misses.
+
+        Args:
+            action: Action being planned.
+            loop_context: Immutable context describing the active tool, config, and state.
+
+        Returns:
+            ActionDecision: ``"skip"`` or ``"bail"`` on a cache hit, otherwise ``"execute"``.
+        """
+
+        if action.internal_runner is not None:
+            return _DECISION_EXECUTE
+        try:
+            command = tuple(action.build_command(loop_context.tool_context))
+        except RuntimeError:
+            return _DECISION_EXECUTE
+        prepared = loop_context.environment.cache.resolve_prepared_command(
+            tool_name=loop_context.tool.name,
+            action_name=action.name,
+            cmd=command,
+        )
+        if prepared is None:
+            return _DECISION_EXECUTE
+        invocation = ActionInvocation(
+            tool_name=loop_context.tool.name,
+            action=action,
+            context=loop_context.tool_context,
+            command=prepared,
+            env_overrides={},
+        )
+        return self._handle_cached_outcome(
+            loop_context.cfg,
+            environment=loop_context.environment,
+            state=loop_context.state,
+            invocation=invocation,
+        )
+
     def _format_skip_reason(self, tool_name: str, action: ToolAction, cfg: ConfigProtocol) -> str:
         """Return a formatted skip reason for debug logging.
 
@@ -188,6 +244,8 @@ class _OrchestratorActionMixin:
             root=environment.root,
             files=tuple(tool_files),
             settings=settings,
+            change_scope=environment.change_scope,
+            file_inventory=environment.file_inventory,
         )
 
     def _build_preparation_inputs(
@@ -274,18 +332,21 @@ class _OrchestratorActionMixin:
         return _DECISION_SKIP
 
     @staticmethod
-    def _requires_immediate_execution(cfg: ConfigProtocol, action: ToolAction) -> bool:
+    def _requires_immediate_execution(action: ToolAction) -> bool:
         """Return whether ``action`` should execute synchronously.
 
+        Fix actions rewrite files, so they run in plan order. Checks are
+        scheduled even in bail mode; the executor cancels in-flight checks
+        once one of them fails.
+
         Args:
-            cfg: Configuration providing execution hints such as ``bail``.
             action: Tool action evaluated for immediate execution.
 
         Returns:
             bool: ``True`` when the action should execute immediately.
         """
 
-        return action.is_fix or cfg.execution.bail
+        return action.is_fix
 
     def _execute_immediate_action(
         self,
@@ -546,4 +607,10 @@ class _OrchestratorActionMixin:
             prepared = self._invoke_preparer(request)
         except RuntimeError as exc:
             return PreparationResult(tool=tool.name, action=action.name, prepared=None, error=str(exc))
-        return PreparationResult(tool=tool.name, action=action.name, prepared=prepared, error=None)
+        return PreparationResult(
+            tool=tool.name,
+            action=action.name,
+            prepared=prepared,
+            error=None,
+            base_command=command,
+        )
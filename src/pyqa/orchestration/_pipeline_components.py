@@ -128,6 +128,7 @@ class PreparationResult:
     action: str
     prepared: PreparedCommand | None
     error: str | None
+    base_command: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
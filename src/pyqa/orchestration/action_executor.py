@@ -25,20 +25,23 @@ from ..cache.result_store import CacheRequest
 from ..core.logging import warn
 from ..core.metrics import FileMetrics, compute_file_metrics
 from ..core.models import Diagnostic, JsonValue, RawDiagnostic, ToolExitCategory, ToolOutcome
-from ..core.runtime.process import CommandOptions, CommandOverrideMapping
+from ..core.runtime.process import CancellationToken, CommandCancelledError, CommandOptions, CommandOverrideMapping
+from ..core.runtime.profiling import TOOL_CATEGORY, profile_span
 from ..diagnostics.pipeline import DiagnosticPipeline as DiagnosticPipelineImpl
 from ..filesystem.paths import normalize_path_key
-from ..interfaces.analysis import ContextResolver
-from ..interfaces.cache import ResultCacheProtocol
+from ..interfaces.analysis import ChangeScopeView, ContextResolver
+from ..interfaces.cache import CandidateCache, ResultCacheProtocol
 from ..interfaces.config import Config as ConfigProtocol
 from ..interfaces.diagnostics import DiagnosticPipeline as DiagnosticPipelineProtocol
 from ..interfaces.diagnostics import DiagnosticPipelineRequest
+from ..interfaces.discovery import FileInventoryView
 from ..parsers.base import JsonParser
 from ..tools import InternalActionRunner, ToolAction, ToolContext
 
 _DIAGNOSTIC_PIPELINE: Final[DiagnosticPipelineProtocol] = DiagnosticPipelineImpl()
 _SERIALISED_KIND_RAW: Final[str] = "raw"
 _SERIALISED_KIND_DIAGNOSTIC: Final[str] = "diagnostic"
+_INTERRUPTED_REASON: Final[str] = "interrupted"
 
 
 @runtime_checkable
@@ -143,6 +146,9 @@ class ExecutionEnvironment:
     root: Path
     severity_rules: SeverityRuleView
     cache: CacheContext
+    change_scope: ChangeScopeView | None = None
+    file_inventory: FileInventoryView | None = None
+    cancellation: CancellationToken = field(default_factory=CancellationToken)
 
 
 @dataclass(frozen=True, slots=True)
@@ -332,7 +338,7 @@ class ActionExecutor:
 
         cache_ctx = environment.cache
         cache = cache_ctx.cache
-        token = cache_ctx.token
+        token = cache_ctx.token_for(record.invocation.tool_name)
         if cache is None or token is None or record.from_cache or record.invocation.internal_runner is not None:
             return
         request = CacheRequest(
@@ -341,6 +347,7 @@ class ActionExecutor:
             command=record.invocation.command,
             files=tuple(Path(path) for path in record.invocation.context.files),
             token=token,
+            version=cache_ctx.version_for(record.invocation.tool_name),
         )
         cache.store(request, outcome=record.outcome, file_metrics=metrics_map)
         self._debug(f"stored cache entry for {record.invocation.tool_name}:{record.invocation.action.name}")
@@ -407,63 +414,69 @@ class ActionExecutor:
             ToolOutcome: Normalized tool output with diagnostics populated.
         """
 
-        command_str = " ".join(invocation.command).replace('"', '\\"')
-        self._debug(
-            f"running {invocation.tool_name}:{invocation.action.name} "
-            f'command="{command_str}" internal={invocation.internal_runner is not None}'
-        )
-        filters = tuple(invocation.context.cfg.output.tool_filters.get(invocation.tool_name, []))
-
-        (
-            stdout_lines,
-            stderr_lines,
-            raw_candidates,
-            base_returncode,
-            completed,
-        ) = self._execute_invocation(invocation, environment, filters)
-
-        pipeline_request = DiagnosticPipelineRequest(
-            tool_name=invocation.tool_name,
-            candidates=tuple(raw_candidates),
-            severity_rules=environment.severity_rules,
-            suppression_patterns=filters,
-            project_root=environment.root,
-        )
-        diagnostics = _DIAGNOSTIC_PIPELINE.run(pipeline_request)
-        evaluation = self._evaluate_exit_status(invocation, base_returncode, diagnostics)
+        with profile_span(
+            f"{invocation.tool_name}:{invocation.action.name}",
+            category=TOOL_CATEGORY,
+        ):
+            command_str = " ".join(invocation.command).replace('"', '\\"')
+            self._debug(
+                f"running {invocation.tool_name}:{invocation.action.name} "
+                f'command="{command_str}" internal={invocation.internal_runner is not None}'
+            )
+            filters = tuple(invocation.context.cfg.output.tool_filters.get(invocation.tool_name, []))
 
-        if diagnostics:
-            self.context_resolver.annotate(diagnostics, root=environment.root)
-        should_log_failure = evaluation.category == ToolExitCategory.TOOL_FAILURE or (
-            evaluation.returncode != 0 and not invocation.action.ignore_exit and not diagnostics
-        )
-        if should_log_failure and completed is not None:
-            _log_action_failure(
-                invocation=invocation,
-                completed=completed,
-                diagnostics=diagnostics,
-                root=environment.root,
-                from_cache=False,
+            (
+                stdout_lines,
+                stderr_lines,
+                raw_candidates,
+                base_returncode,
+                completed,
+            ) = self._execute_invocation(invocation, environment, filters)
+
+            pipeline_request = DiagnosticPipelineRequest(
+                tool_name=invocation.tool_name,
+                candidates=tuple(raw_candidates),
+                severity_rules=environment.severity_rules,
+                suppression_patterns=filters,
+                project_root=environment.root,
             )
-            self._debug(
-                f"{invocation.tool_name}:{invocation.action.name} returned failure "
-                f"returncode={evaluation.returncode}"
+            with profile_span("diagnostics"):
+                diagnostics = _DIAGNOSTIC_PIPELINE.run(pipeline_request)
+            evaluation = self._evaluate_exit_status(invocation, base_returncode, diagnostics)
+
+            if diagnostics:
+                with profile_span("tree-sitter"):
+                    self.context_resolver.annotate(diagnostics, root=environment.root)
+            should_log_failure = evaluation.category == ToolExitCategory.TOOL_FAILURE or (
+                evaluation.returncode != 0 and not invocation.action.ignore_exit and not diagnostics
             )
+            if should_log_failure and completed is not None:
+                _log_action_failure(
+                    invocation=invocation,
+                    completed=completed,
+                    diagnostics=diagnostics,
+                    root=environment.root,
+                    from_cache=False,
+                )
+                self._debug(
+                    f"{invocation.tool_name}:{invocation.action.name} returned failure "
+                    f"returncode={evaluation.returncode}"
+                )
 
-        self._debug(
-            f"completed {invocation.tool_name}:{invocation.action.name} returncode="
-            f"{evaluation.returncode} diagnostics={len(diagnostics)}"
-        )
+            self._debug(
+                f"completed {invocation.tool_name}:{invocation.action.name} returncode="
+                f"{evaluation.returncode} diagnostics={len(diagnostics)}"
+            )
 
-        return ToolOutcome(
-            tool=invocation.tool_name,
-            action=invocation.action.name,
-            returncode=evaluation.returncode,
-            stdout=stdout_lines,
-            stderr=stderr_lines,
-            diagnostics=list(diagnostics),
-            exit_category=evaluation.category,
-        )
+            return ToolOutcome(
+                tool=invocation.tool_name,
+                action=invocation.action.name,
+                returncode=evaluation.returncode,
+                stdout=stdout_lines,
+                stderr=stderr_lines,
+                diagnostics=list(diagnostics),
+                exit_category=evaluation.category,
+            )
 
     def _execute_invocation(
         self,
@@ -485,7 +498,8 @@ class ActionExecutor:
         """
 
         if invocation.internal_runner is not None:
-            outcome = invocation.internal_runner(invocation.context)
+            with profile_span("internal-runner"):
+                outcome = invocation.internal_runner(invocation.context)
             return (
                 list(outcome.stdout),
                 list(outcome.stderr),
@@ -495,24 +509,27 @@ class ActionExecutor:
             )
 
         env = self._compose_environment(invocation)
-        completed = self.runner(
-            list(invocation.command),
-            options=CommandOptions(
-                cwd=environment.root,
-                env=env,
-                timeout=invocation.action.timeout_s,
-                capture_output=True,
-                discard_stdin=True,
-                check=False,
-            ),
-        )
-        stdout_lines, stderr_lines = self._filter_outputs(invocation, completed, filters)
-        raw_candidates = self._parse_diagnostics(
-            invocation,
-            stdout_lines,
-            stderr_lines,
-            cache_context=environment.cache,
-        )
+        with profile_span("subprocess"):
+            completed = self.runner(
+                list(invocation.command),
+                options=CommandOptions(
+                    cwd=environment.root,
+                    env=env,
+                    timeout=invocation.action.timeout_s,
+                    capture_output=True,
+                    discard_stdin=True,
+                    check=False,
+                    cancellation=environment.cancellation,
+                ),
+            )
+        with profile_span("parse"):
+            stdout_lines, stderr_lines = self._filter_outputs(invocation, completed, filters)
+            raw_candidates = self._parse_diagnostics(
+                invocation,
+                stdout_lines,
+                stderr_lines,
+                cache_context=environment.cache,
+            )
         return (
             stdout_lines,
             stderr_lines,
@@ -524,29 +541,43 @@ class ActionExecutor:
     def _execute_in_parallel(self, environment: ExecutionEnvironment, state: ExecutionState) -> None:
         """Execute scheduled actions concurrently when permitted.
 
+        The first failing action in bail mode cancels ``environment.cancellation``,
+        which kills every in-flight subprocess and drops actions that have not
+        started. Interrupts and unexpected errors cancel outstanding work too.
+
         Args:
             environment: Execution environment describing runtime parameters.
             state: Mutable execution state accumulating outcomes.
         """
         action_runner = partial(self.run_action, environment=environment)
-        with ThreadPoolExecutor(max_workers=environment.config.execution.jobs) as executor:
+        token = environment.cancellation
+        executor = ThreadPoolExecutor(max_workers=environment.config.execution.jobs)
+        try:
             future_map = {
                 executor.submit(action_runner, scheduled.invocation): scheduled for scheduled in state.scheduled
             }
             for future in as_completed(future_map):
                 scheduled = future_map[future]
-                outcome = future.result()
-                record = OutcomeRecord(
-                    order=scheduled.order,
-                    invocation=scheduled.invocation,
-                    outcome=outcome,
-                    file_metrics=None,
-                    from_cache=False,
-                )
-                self.record_outcome(state, environment, record)
+                if future.cancelled():
+                    continue
+                try:
+                    outcome = future.result()
+                except CommandCancelledError:
+                    self._debug(f"cancelled {scheduled.invocation.tool_name}:{scheduled.invocation.action.name}")
+                    continue
+                self._record_scheduled(environment, state, scheduled, outcome)
+                if state.bail_triggered and not token.cancelled:
+                    token.cancel(f"bail after {scheduled.invocation.tool_name}:{scheduled.invocation.action.name}")
+                    for pending in future_map:
+                        pending.cancel()
+        except BaseException:
+            token.cancel(_INTERRUPTED_REASON)
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def _execute_serial(self, environment: ExecutionEnvironment, state: ExecutionState) -> None:
-        """Execute scheduled actions sequentially.
+        """Execute scheduled actions sequentially, stopping at the first bail failure.
 
         Args:
             environment: Execution environment describing runtime parameters.
@@ -555,14 +586,41 @@ class ActionExecutor:
         action_runner = partial(self.run_action, environment=environment)
         for scheduled in state.scheduled:
             outcome = action_runner(scheduled.invocation)
-            record = OutcomeRecord(
-                order=scheduled.order,
-                invocation=scheduled.invocation,
-                outcome=outcome,
-                file_metrics=None,
-                from_cache=False,
+            self._record_scheduled(environment, state, scheduled, outcome)
+            if state.bail_triggered:
+                return
+
+    def _record_scheduled(
+        self,
+        environment: ExecutionEnvironment,
+        state: ExecutionState,
+        scheduled: ScheduledAction,
+        outcome: ToolOutcome,
+    ) -> None:
+        """Record ``outcome`` for ``scheduled`` and flag bail-worthy failures.
+
+        Args:
+            environment: Execution environment describing runtime parameters.
+            state: Mutable execution state accumulating outcomes.
+            scheduled: Scheduled action that produced ``outcome``.
+            outcome: Outcome returned by :meth:`run_action`.
+        """
+
+        record = OutcomeRecord(
+            order=scheduled.order,
+            invocation=scheduled.invocation,
+            outcome=outcome,
+            file_metrics=None,
+            from_cache=False,
+        )
+        self.record_outcome(state, environment, record)
+        action = scheduled.invocation.action
+        if environment.config.execution.bail and outcome.returncode != 0 and not action.ignore_exit:
+            state.bail_triggered = True
+            self._debug(
+                f"{scheduled.invocation.tool_name}:{action.name} failed with "
+                f"returncode={outcome.returncode}; bail active"
             )
-            self.record_outcome(state, environment, record)
 
     @staticmethod
     def _update_state_metrics(state: ExecutionState, metrics: Mapping[str, FileMetrics]) -> None:
@@ -684,12 +742,9 @@ class ActionExecutor:
             files=(),
             token=f"{cache_context.token}:parser",
         )
-        cached_entry = cache.load(request)
-        if cached_entry is not None:
-            cached_payload = cached_entry.outcome.stdout[0] if cached_entry.outcome.stdout else None
-            restored = ActionExecutor._deserialize_cached_candidates(cached_payload)
-            if restored is not None:
-                return restored
+        restored = ActionExecutor._load_parser_cache_entry(cache=cache, request=request)
+        if restored is not None:
+            return restored
 
         diagnostics = tuple(
             parser.parse(
@@ -705,6 +760,30 @@ class ActionExecutor:
         )
         return diagnostics
 
+    @staticmethod
+    def _load_parser_cache_entry(
+        *,
+        cache: ResultCacheProtocol,
+        request: CacheRequest,
+    ) -> tuple[RawDiagnostic | Diagnostic, ...] | None:
+        """Return parser diagnostics previously cached for ``request``.
+
+        Args:
+            cache: Result cache consulted for parser outcomes.
+            request: Cache request describing the parser invocation.
+
+        Returns:
+            tuple[RawDiagnostic | Diagnostic, ...] | None: Cached candidates when available.
+        """
+
+        if isinstance(cache, CandidateCache):
+            return cache.load_candidates(request)
+        cached_entry = cache.load(request)
+        if cached_entry is None:
+            return None
+        cached_payload = cached_entry.outcome.stdout[0] if cached_entry.outcome.stdout else None
+        return ActionExecutor._deserialize_cached_candidates(cached_payload)
+
     @staticmethod
     def _store_parser_cache_entry(
         *,
@@ -720,6 +799,9 @@ class ActionExecutor:
             diagnostics: Diagnostics generated by the parser.
         """
 
+        if isinstance(cache, CandidateCache):
+            cache.store_candidates(request, diagnostics)
+            return
         serialised = ActionExecutor._serialise_candidates(diagnostics)
         outcome = ToolOutcome(
             tool=request.tool,
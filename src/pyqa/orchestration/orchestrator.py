@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import glob
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,7 +15,8 @@ from pyqa.core.environment.tool_env import CommandPreparer, PreparedCommand
 from pyqa.interfaces.analysis import AnnotationProvider
 
 from ..analysis.bootstrap import register_analysis_services
-from ..analysis.change_impact import apply_change_impact
+from ..analysis.change_impact import ChangeScope, apply_change_impact, build_change_scope
+from ..analysis.import_graph import expand_with_dependents
 from ..analysis.navigator import build_refactor_navigator
 from ..analysis.services import (
     resolve_annotation_provider,
@@ -23,17 +25,25 @@ from ..analysis.services import (
 )
 from ..analysis.suppression import apply_suppression_hints
 from ..cache.context import CacheContext, build_cache_context
+from ..cache.incremental import IncrementalBaseline
+from ..cache.tool_inputs import ToolInputFingerprints, ToolInputSpec
+from ..config.loaders.sources import CONFIG_KEY
 from ..core.logging import warn
 from ..core.models import RunResult
 from ..core.runtime import ServiceContainer, ServiceResolutionError, register_default_services
+from ..core.runtime.profiling import profile_span
 from ..diagnostics import build_severity_rules, dedupe_outcomes
 from ..discovery.base import SupportsDiscovery
+from ..discovery.git import GitDiscovery
+from ..discovery.inventory import FileInventory
 from ..interfaces.config import Config as ConfigProtocol
 from ..interfaces.orchestration import OrchestratorHooks
 from ..interfaces.runtime import ServiceRegistryProtocol
 from ..tools.registry import ToolRegistry
 from ._orchestrator_mixins import _OrchestratorActionMixin
 from ._pipeline_components import (
+    _DECISION_BAIL,
+    _DECISION_SKIP,
     _FETCH_EVENT_COMPLETED,
     _FETCH_EVENT_ERROR,
     _TOOL_DECISION_SKIP,
@@ -57,12 +67,45 @@ from .action_executor import (
     RunnerCallable,
     wrap_runner,
 )
-from .runtime import discover_files, prepare_runtime
+from .python_workers import PythonWorkerRunner, python_entry_points
+from .runtime import discover_files, discover_project_files, prepare_runtime
 from .tool_selection import SelectionResult, ToolDecision, ToolSelector
+from .tool_servers import ToolServerRunner, tool_server_clients
 
 FetchCallback = Callable[[FetchEvent, str, str, int, int, str | None], None]
 
 
+def _tool_input_fingerprints(
+    registry: ToolRegistry,
+    cfg: ConfigProtocol,
+    root: Path,
+    linted: Sequence[Path],
+) -> ToolInputFingerprints:
+    """Return fingerprints of the configuration inputs read by registered tools.
+
+    Each tool contributes its catalog ``configFiles`` and ``cacheInputs`` plus
+    any configuration file selected explicitly through its tool settings.
+
+    Args:
+        registry: Registry providing the tool definitions.
+        cfg: Configuration supplying per-tool settings.
+        root: Project root that relative inputs are resolved against.
+        linted: Files linted in this run, whose directories may hold nested configs.
+
+    Returns:
+        ToolInputFingerprints: Lazily evaluated per-tool fingerprints.
+    """
+
+    specs: dict[str, ToolInputSpec] = {}
+    for tool in registry.tools():
+        files = [*tool.config_files, *tool.cache_input_files]
+        selected = cfg.tool_settings.get(tool.name, {}).get(CONFIG_KEY)
+        if isinstance(selected, str) and selected:
+            files.append(glob.escape(selected))
+        specs[tool.name] = ToolInputSpec(files=tuple(files), env=tool.cache_input_env)
+    return ToolInputFingerprints(root, specs, files=linted)
+
+
 def _noop_debug(message: str) -> None:
     """Default debug logger used when debugging is disabled.
 
@@ -187,6 +230,7 @@ class Orchestrator(_OrchestratorActionMixin):
         self._debug: Callable[[str], None] = debug_fn
         self._analysis = self._create_analysis_providers()
         self._pipeline = self._create_pipeline(final_preparer)
+        self._python_workers: PythonWorkerRunner | None = None
 
     def _ensure_bootstrap_services(self) -> None:
         """Ensure core analysis/default services exist on the container."""
@@ -248,6 +292,30 @@ class Orchestrator(_OrchestratorActionMixin):
 
         return self._analysis.annotation
 
+    def _runner_for(self, cfg: ConfigProtocol) -> RunnerCallable:
+        """Return the runner used to execute external commands for ``cfg``.
+
+        Args:
+            cfg: Configuration describing the requested run.
+
+        Returns:
+            RunnerCallable: Runner routing commands to pre-imported Python
+            workers when ``execution.python_workers`` is enabled and to daemon
+            clients when ``execution.tool_servers`` is enabled, otherwise the
+            base runner.
+        """
+
+        runner = self._runner
+        if cfg.execution.python_workers:
+            if self._python_workers is None:
+                self._python_workers = PythonWorkerRunner(runner, python_entry_points(self._context.registry.tools()))
+            if self._python_workers.available:
+                runner = self._python_workers
+        if not cfg.execution.tool_servers:
+            return runner
+        clients = tool_server_clients(self._context.registry.tools())
+        return ToolServerRunner(runner, clients) if clients else runner
+
     def run(self, cfg: ConfigProtocol, *, root: Path | None = None) -> RunResult:
         """Execute configured tools and aggregate their outcomes.
 
@@ -259,13 +327,16 @@ class Orchestrator(_OrchestratorActionMixin):
             RunResult: Aggregated results, outcomes, and metadata for the run.
         """
 
-        environment, matched_files = self._build_environment(cfg, root)
+        with profile_span("discovery"):
+            environment, matched_files = self._build_environment(cfg, root)
         state = ExecutionState()
         self._pipeline.executor.after_tool_hook = self._hooks.after_tool
+        self._pipeline.executor.runner = self._runner_for(cfg)
         self._debug(f"execution root={environment.root} matched_files={len(matched_files)}")
         self._notify_discovery(len(matched_files))
 
-        selection = self._plan_from_environment(cfg, environment, matched_files)
+        with profile_span("selection"):
+            selection = self._plan_from_environment(cfg, environment, matched_files)
         tool_names = list(selection.run_names)
         self._notify_plan(tool_names, cfg)
 
@@ -278,9 +349,11 @@ class Orchestrator(_OrchestratorActionMixin):
             ):
                 break
 
-        self._pipeline.executor.execute_scheduled(environment, state)
+        with profile_span("execution"):
+            self._pipeline.executor.execute_scheduled(environment, state)
         outcomes = [state.outcomes[index] for index in sorted(state.outcomes)]
-        self._pipeline.executor.populate_missing_metrics(state, matched_files)
+        with profile_span("metrics"):
+            self._pipeline.executor.populate_missing_metrics(state, matched_files)
         result = RunResult(
             root=environment.root,
             files=matched_files,
@@ -288,20 +361,34 @@ class Orchestrator(_OrchestratorActionMixin):
             tool_versions=environment.cache.versions,
             file_metrics=dict(state.file_metrics),
         )
-        dedupe_outcomes(
-            result,
-            cfg.dedupe,
-            annotation_provider=self._analysis.annotation,
-        )
-        self._analysis.annotation.annotate_run(result)
-        apply_suppression_hints(result, self._analysis.annotation)
-        apply_change_impact(result, context_resolver=self._analysis.context_resolver)
-        build_refactor_navigator(
-            result,
-            self._analysis.annotation,
-            function_scale=self._analysis.function_scale,
-        )
-        environment.cache.persist_versions()
+        self._sync_incremental_baseline(cfg, environment, result)
+        with profile_span("dedupe"):
+            dedupe_outcomes(
+                result,
+                cfg.dedupe,
+                annotation_provider=self._analysis.annotation,
+            )
+        with profile_span("annotation"):
+            self._analysis.annotation.annotate_run(result)
+            apply_suppression_hints(result, self._analysis.annotation)
+        with profile_span("change-impact"):
+            apply_change_impact(
+                result,
+                context_resolver=self._analysis.context_resolver,
+                scope=environment.change_scope if isinstance(environment.change_scope, ChangeScope) else None,
+            )
+        with profile_span("refactor-navigator"):
+            build_refactor_navigator(
+                result,
+                self._analysis.annotation,
+                function_scale=self._analysis.function_scale,
+            )
+        with profile_span("cache-persist"):
+            environment.cache.persist_versions()
+            environment.cache.persist_prepared_commands()
+            environment.cache.flush()
+            environment.cache.persist_usage()
+            environment.cache.collect_garbage()
         if self._hooks.after_execution:
             self._hooks.after_execution(result)
         return result
@@ -386,17 +473,93 @@ class Orchestrator(_OrchestratorActionMixin):
 
         root_path = prepare_runtime(root)
         matched_files = discover_files(self._context.discovery, cfg, root_path)
-        severity_rules = build_severity_rules(cfg.severity_rules)
+        change_scope: ChangeScope | None = None
+        if cfg.file_discovery.incremental:
+            change_scope = build_change_scope(cfg.file_discovery, root_path)
+            matched_files = [path for path in matched_files if change_scope.contains(path)]
         cache_builder = _resolve_cache_builder(self._services)
         cache_ctx = cache_builder(cfg, root_path)
+        if cfg.file_discovery.with_dependents:
+            matched_files = self._expand_dependents(cfg, root_path, matched_files, cache_ctx)
+        if cache_ctx.token is not None and cache_ctx.tool_inputs is None:
+            cache_ctx.tool_inputs = _tool_input_fingerprints(self._context.registry, cfg, root_path, matched_files)
+        file_inventory = FileInventory.from_paths(root_path, matched_files)
+        severity_rules = build_severity_rules(cfg.severity_rules)
         environment = ExecutionEnvironment(
             config=cfg,
             root=root_path,
             severity_rules=severity_rules,
             cache=cache_ctx,
+            change_scope=change_scope,
+            file_inventory=file_inventory,
         )
         return environment, matched_files
 
+    def _expand_dependents(
+        self,
+        cfg: ConfigProtocol,
+        root: Path,
+        changed: list[Path],
+        cache_ctx: CacheContext,
+    ) -> list[Path]:
+        """Return ``changed`` extended with the project files that import them.
+
+        Args:
+            cfg: Configuration describing the requested run.
+            root: Resolved project root.
+            changed: Files selected by change-aware discovery.
+            cache_ctx: Cache context whose directory persists the import graph.
+
+        Returns:
+            list[Path]: Changed files plus their transitive importers.
+        """
+
+        project_files = discover_project_files(self._context.discovery, cfg, root)
+        removed = list(GitDiscovery().discover_removed(cfg.file_discovery, root))
+        cache_dir = cache_ctx.cache_dir if cache_ctx.cache is not None else None
+        expanded = expand_with_dependents(changed, project_files, root, cache_dir=cache_dir, removed=removed)
+        self._debug(f"import graph added {len(expanded) - len(changed)} dependent files")
+        return expanded
+
+    def _sync_incremental_baseline(
+        self,
+        cfg: ConfigProtocol,
+        environment: ExecutionEnvironment,
+        result: RunResult,
+    ) -> None:
+        """Merge or refresh the incremental diagnostics baseline for ``result``.
+
+        Incremental runs inherit baseline diagnostics for files outside the
+        diff. Unrestricted full runs refresh the baseline so later incremental
+        runs stay accurate; partially scoped runs leave it untouched.
+
+        Args:
+            cfg: Configuration describing the current run.
+            environment: Execution environment carrying cache and scope data.
+            result: Run result assembled from executed outcomes.
+        """
+
+        if environment.cache.cache is None:
+            return
+        discovery = cfg.file_discovery
+        baseline = IncrementalBaseline.load(environment.cache.cache_dir)
+        if environment.change_scope is not None:
+            carried = baseline.merge_into(result, environment.change_scope)
+            self._debug(f"incremental baseline carried {carried} diagnostics")
+            return
+        scoped = (
+            discovery.changed_only
+            or discovery.pre_commit
+            or discovery.base_branch
+            or discovery.explicit_files
+            or discovery.limit_to
+            or discovery.paths_from_stdin
+        )
+        if scoped:
+            return
+        baseline.record(result.outcomes)
+        baseline.save()
+
     def _plan_from_environment(
         self,
         cfg: ConfigProtocol,
@@ -561,7 +724,6 @@ class Orchestrator(_OrchestratorActionMixin):
             f"fix_only={cfg.execution.fix_only} check_only={cfg.execution.check_only} "
             f"settings={settings_snapshot}"
         )
-        self._apply_installers(tool, context, state.installed_tools)
         if self._hooks.before_tool:
             self._hooks.before_tool(tool.name)
 
@@ -591,6 +753,15 @@ class Orchestrator(_OrchestratorActionMixin):
                 self._debug(skip_reason)
                 continue
 
+            precheck = self._precheck_cached_action(action=action, loop_context=loop_context)
+            if precheck == _DECISION_BAIL:
+                self._debug(f"bailing after pre-provisioning cache hit for {tool.name}:{action.name}")
+                return True
+            if precheck == _DECISION_SKIP:
+                self._debug(f"served {tool.name}:{action.name} from cache without provisioning")
+                continue
+
+            self._apply_installers(tool, context, state.installed_tools)
             outcome = self._handle_tool_action(
                 action=action,
                 loop_context=loop_context,
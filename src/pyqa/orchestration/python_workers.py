@@ -0,0 +1,512 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Run Python console tools inside forked workers that have pre-imported them."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import locale
+import multiprocessing
+import os
+import shutil
+import subprocess  # nosec B404 suppression_valid: Only used for result and timeout types.
+import sys
+import sysconfig
+import tempfile
+import threading
+import traceback
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from multiprocessing.context import ForkServerContext
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from subprocess import CompletedProcess
+from typing import Final, cast
+
+from ..core.runtime.process import (
+    TIMEOUT_RETURNCODE,
+    CommandCancelledError,
+    CommandOptions,
+    CommandOverrideMapping,
+    SubprocessExecutionError,
+    kill_process_group,
+)
+from ..tools.base import Tool
+from .action_executor import RunnerCallable
+
+_START_METHOD: Final[str] = "forkserver"
+_PATH_KEY: Final[str] = "PATH"
+_ENTRY_SEPARATOR: Final[str] = ":"
+_STDOUT_FD: Final[int] = 1
+_STDERR_FD: Final[int] = 2
+_STDIN_FD: Final[int] = 0
+_MAIN_MODULE: Final[str] = "__main__"
+_INTERPRETER_ENV_PREFIX: Final[str] = "PYTHON"
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerRequest:
+    """Picklable description of a single entry point invocation."""
+
+    entry_point: str
+    argv: tuple[str, ...]
+    script_dir: str
+    cwd: str | None
+    env: Mapping[str, str]
+    stdout_path: str
+    stderr_path: str
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerHandle:
+    """Expose a worker process through the cancellation token protocol."""
+
+    process: BaseProcess
+
+    @property
+    def pid(self) -> int:
+        """Return the worker process identifier.
+
+        Returns:
+            int: Process identifier, which also leads the worker's session.
+        """
+
+        return self.process.pid or 0
+
+    @property
+    def returncode(self) -> int | None:
+        """Return the worker exit status.
+
+        Returns:
+            int | None: Exit status, or ``None`` while the worker is running.
+        """
+
+        return self.process.exitcode
+
+    def kill(self) -> None:
+        """Kill the worker process."""
+
+        self.process.kill()
+
+
+class PythonWorkerRunner:
+    """Runner that executes Python console tools in pre-imported forked workers.
+
+    Catalog runtimes declare ``entryPoints`` such as
+    ``{"pylint": "pylint:run_pylint"}``. When a command's executable is the
+    console script of that entry point in pyqa's own environment, the command
+    runs in a child of a ``forkserver`` process that imported the tool once,
+    so the interpreter start-up and import cost is not paid per action. The
+    child sets ``sys.argv``, working directory and environment exactly as the
+    console script would, writes to the same file descriptors and exits with
+    the same status, so output capture and exit-code evaluation are unchanged.
+    Any other command is passed to the wrapped runner.
+    """
+
+    def __init__(
+        self,
+        delegate: RunnerCallable,
+        entry_points: Mapping[str, str],
+        *,
+        scripts_dir: Path | None = None,
+    ) -> None:
+        """Wrap ``delegate`` with in-process execution for ``entry_points``.
+
+        Args:
+            delegate: Runner used for commands without an eligible entry point.
+            entry_points: ``module:callable`` targets keyed by executable name.
+            scripts_dir: Directory whose console scripts belong to this
+                interpreter; defaults to the interpreter's ``scripts`` path.
+        """
+
+        self._delegate = delegate
+        self._entry_points = {
+            name: target
+            for name, target in entry_points.items()
+            if importlib.util.find_spec(_entry_module(target).partition(".")[0]) is not None
+        }
+        self._scripts_dir = _real_directory(
+            str(scripts_dir) if scripts_dir is not None else sysconfig.get_path("scripts")
+        )
+        self._context = _worker_context(self._entry_points.values()) if self._entry_points else None
+        self._resolved: dict[tuple[str, str | None], str | None] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Return whether any entry point can run in a pre-imported worker.
+
+        Returns:
+            bool: ``True`` when forked workers are supported and a tool is importable.
+        """
+
+        return self._context is not None and bool(self._entry_points)
+
+    def __call__(
+        self,
+        cmd: Sequence[str],
+        *,
+        options: CommandOptions | None = None,
+        overrides: CommandOverrideMapping | None = None,
+    ) -> CompletedProcess[str]:
+        """Execute ``cmd`` in a pre-imported worker when it is eligible.
+
+        Args:
+            cmd: Command to execute including executable and arguments.
+            options: Optional command execution configuration.
+            overrides: Additional keyword overrides applied to ``options``.
+
+        Returns:
+            CompletedProcess[str]: Completed worker or delegate process.
+        """
+
+        resolved_options = (options or CommandOptions()).with_overrides(dict(overrides or {}))
+        command = list(cmd)
+        target = self._eligible_entry_point(command, resolved_options)
+        if target is None or self._context is None or not _worker_compatible(resolved_options):
+            return self._delegate(cmd, options=options, overrides=overrides)
+        return self._run_worker(self._context, target, command, resolved_options)
+
+    def __repr__(self) -> str:
+        """Return a diagnostic representation of the runner.
+
+        Returns:
+            str: Readable description including the wrapped runner.
+        """
+
+        return f"PythonWorkerRunner({self._delegate!r}, entry_points={sorted(self._entry_points)!r})"
+
+    def _eligible_entry_point(self, command: Sequence[str], options: CommandOptions) -> tuple[str, str] | None:
+        """Return the entry point and script directory serving ``command``.
+
+        Args:
+            command: Command whose executable may be a known console script.
+            options: Resolved command options providing ``PATH``.
+
+        Returns:
+            tuple[str, str] | None: Entry point target and the directory holding
+            its console script, or ``None`` when the command must run externally.
+        """
+
+        if not command or self._scripts_dir is None:
+            return None
+        head = Path(command[0])
+        target = self._entry_points.get(head.name) or self._entry_points.get(head.stem)
+        if target is None:
+            return None
+        search_path = options.env.get(_PATH_KEY) if options.env is not None else None
+        key = (command[0], search_path)
+        with self._lock:
+            if key in self._resolved:
+                script_dir = self._resolved[key]
+                return None if script_dir is None else (target, script_dir)
+        located = shutil.which(command[0], path=search_path)
+        script_dir = _real_directory(os.path.dirname(located)) if located is not None else None
+        eligible = script_dir if script_dir is not None and script_dir == self._scripts_dir else None
+        with self._lock:
+            self._resolved[key] = eligible
+        return None if eligible is None else (target, eligible)
+
+    def _run_worker(
+        self,
+        context: ForkServerContext,
+        target: tuple[str, str],
+        command: Sequence[str],
+        options: CommandOptions,
+    ) -> CompletedProcess[str]:
+        """Run ``command`` through its entry point in a forked worker.
+
+        Args:
+            context: Multiprocessing context whose server pre-imported the tools.
+            target: Entry point target and console script directory.
+            command: Command being replaced, used for ``sys.argv``.
+            options: Resolved command options.
+
+        Returns:
+            CompletedProcess[str]: Completed process mirroring :func:`run_command`.
+
+        Raises:
+            CommandCancelledError: When ``options.cancellation`` is cancelled before
+                the worker starts or while it is running.
+            SubprocessExecutionError: When ``check`` is true and the worker exits
+                with a non-zero status.
+        """
+
+        token = options.cancellation
+        if token is not None and token.cancelled:
+            raise CommandCancelledError(command, token.reason)
+        entry_point, script_dir = target
+        with tempfile.TemporaryDirectory(prefix="pyqa-worker-") as scratch:
+            stdout_path = os.path.join(scratch, "stdout")
+            stderr_path = os.path.join(scratch, "stderr")
+            request = _WorkerRequest(
+                entry_point=entry_point,
+                argv=tuple(command),
+                script_dir=script_dir,
+                cwd=str(options.cwd) if options.cwd is not None else None,
+                env=dict(options.env) if options.env is not None else dict(os.environ),
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+            )
+            process = context.Process(target=_run_entry_point, args=(request,), daemon=False)
+            process.start()
+            handle = _WorkerHandle(process)
+            if token is not None and not token.attach(handle):
+                kill_process_group(handle)
+            timed_out = False
+            try:
+                process.join(options.timeout)
+                if process.exitcode is None:
+                    timed_out = True
+                    kill_process_group(handle)
+                    process.join()
+            except BaseException:
+                kill_process_group(handle)
+                process.join()
+                raise
+            finally:
+                if token is not None:
+                    token.detach(handle)
+            stdout = _read_output(stdout_path)
+            stderr = _read_output(stderr_path)
+        returncode = TIMEOUT_RETURNCODE if timed_out else (process.exitcode or 0)
+        if timed_out:
+            timeout_msg = (
+                f"Command timed out after {options.timeout:.1f}s"
+                if options.timeout is not None
+                else "Command timed out"
+            )
+            stderr = f"{stderr}\n{timeout_msg}" if stderr else timeout_msg
+        completed = subprocess.CompletedProcess(args=list(command), returncode=returncode, stdout=stdout, stderr=stderr)
+        if token is not None and token.cancelled and completed.returncode != 0:
+            raise CommandCancelledError(command, token.reason)
+        if options.check and completed.returncode != 0:
+            raise SubprocessExecutionError(command, completed.returncode, stdout, stderr)
+        return completed
+
+
+def _run_entry_point(request: _WorkerRequest) -> None:
+    """Execute ``request`` inside a forked worker exactly like a console script.
+
+    Args:
+        request: Invocation description sent by :class:`PythonWorkerRunner`.
+
+    Raises:
+        SystemExit: Always, carrying the tool's exit status.
+    """
+
+    if hasattr(os, "setsid"):
+        os.setsid()
+    _redirect_streams(request)
+    if request.cwd is not None:
+        os.chdir(request.cwd)
+    os.environ.clear()
+    os.environ.update(request.env)
+    sys.argv = list(request.argv)
+    if sys.path:
+        sys.path[0] = request.script_dir
+    code: object
+    try:
+        code = _load_entry_point(request.entry_point)()
+    except SystemExit as exc:
+        code = exc.code
+    except Exception:  # noqa: BLE001 - mirror the interpreter's top-level exception handler
+        traceback.print_exc()
+        code = 1
+    raise SystemExit(code)
+
+
+def python_entry_points(tools: Iterable[Tool]) -> dict[str, str]:
+    """Return the Python console entry points declared by ``tools``.
+
+    Args:
+        tools: Registered tools whose runtimes may declare entry points.
+
+    Returns:
+        dict[str, str]: ``module:callable`` targets keyed by executable name.
+    """
+
+    entry_points: dict[str, str] = {}
+    for tool in tools:
+        entry_points.update(tool.entry_points)
+    return entry_points
+
+
+def _worker_compatible(options: CommandOptions) -> bool:
+    """Return whether ``options`` can be honoured by a forked worker.
+
+    Workers always capture output as text and read from ``/dev/null``, which
+    is how the action executor runs every tool. They also inherit the
+    interpreter state of the fork server, so ``PYTHONPATH`` and other
+    ``PYTHON*`` start-up variables must match pyqa's own environment.
+
+    Args:
+        options: Resolved command options.
+
+    Returns:
+        bool: ``True`` when the worker reproduces the requested stream handling
+        and interpreter configuration.
+    """
+
+    streams_match = options.capture_output and options.text and options.discard_stdin
+    return streams_match and _interpreter_env_matches(options.env)
+
+
+def _interpreter_env_matches(env: Mapping[str, str] | None) -> bool:
+    """Return whether ``env`` configures the interpreter like the current process.
+
+    Args:
+        env: Environment requested for the command; ``None`` inherits ``os.environ``.
+
+    Returns:
+        bool: ``True`` when every ``PYTHON*`` variable matches ``os.environ``.
+    """
+
+    if env is None:
+        return True
+    names = {name for name in (*env, *os.environ) if name.startswith(_INTERPRETER_ENV_PREFIX)}
+    return all(env.get(name) == os.environ.get(name) for name in names)
+
+
+def _worker_context(targets: Iterable[str]) -> ForkServerContext | None:
+    """Return the forkserver context preloading ``targets`` when supported.
+
+    Args:
+        targets: Iterable of ``module:callable`` entry point targets.
+
+    Returns:
+        ForkServerContext | None: Worker context, or ``None`` when the platform
+        cannot fork pre-imported workers.
+    """
+
+    if _START_METHOD not in multiprocessing.get_all_start_methods() or not _main_module_importable():
+        return None
+    context = cast(ForkServerContext, multiprocessing.get_context(_START_METHOD))
+    modules = sorted({_entry_module(target) for target in targets})
+    context.set_forkserver_preload([_MAIN_MODULE, __name__, *modules])
+    return context
+
+
+def _main_module_importable() -> bool:
+    """Return whether the server can import ``__main__`` once for all workers.
+
+    Workers skip re-running the main module only when the server preloaded it
+    from the same path, which is impossible for code read from stdin.
+
+    Returns:
+        bool: ``True`` when ``__main__`` is a module, a real file or absent.
+    """
+
+    main_module = sys.modules.get(_MAIN_MODULE)
+    if getattr(getattr(main_module, "__spec__", None), "name", None) is not None:
+        return True
+    main_path = getattr(main_module, "__file__", None)
+    return main_path is None or os.path.isfile(main_path)
+
+
+def _entry_module(target: str) -> str:
+    """Return the module component of a ``module:callable`` target.
+
+    Args:
+        target: Entry point target.
+
+    Returns:
+        str: Importable module name.
+    """
+
+    return target.partition(_ENTRY_SEPARATOR)[0]
+
+
+def _load_entry_point(target: str) -> Callable[[], object]:
+    """Import and return the callable named by ``target``.
+
+    Args:
+        target: Entry point target in ``module:callable`` form.
+
+    Returns:
+        Callable[[], object]: Callable implementing the console script.
+    """
+
+    module_name, _, attribute_path = target.partition(_ENTRY_SEPARATOR)
+    value: object = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."):
+        value = getattr(value, attribute)
+    return cast(Callable[[], object], value)
+
+
+def _redirect_streams(request: _WorkerRequest) -> None:
+    """Point the worker's standard streams at the files requested by the parent.
+
+    Args:
+        request: Invocation description holding the capture paths.
+    """
+
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, _STDIN_FD)
+    os.close(devnull)
+    for path, descriptor, name in (
+        (request.stdout_path, _STDOUT_FD, "stdout"),
+        (request.stderr_path, _STDERR_FD, "stderr"),
+    ):
+        current = getattr(sys, name)
+        handle = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(handle, descriptor)
+        os.close(handle)
+        replacement = open(  # noqa: SIM115 - stream lives for the rest of the worker
+            descriptor,
+            "w",
+            encoding=_stream_encoding(current),
+            errors=getattr(current, "errors", None) or "strict",
+            closefd=False,
+        )
+        setattr(sys, name, replacement)
+
+
+def _stream_encoding(stream: object) -> str:
+    """Return the encoding used by ``stream`` or UTF-8 when it is unavailable.
+
+    Args:
+        stream: Text stream inherited by the worker.
+
+    Returns:
+        str: Encoding name for the replacement stream.
+    """
+
+    encoding = getattr(stream, "encoding", None)
+    return encoding if isinstance(encoding, str) else "utf-8"
+
+
+def _read_output(path: str) -> str:
+    """Return the text captured at ``path``.
+
+    Args:
+        path: Capture file written by the worker.
+
+    Returns:
+        str: Captured text decoded like ``subprocess`` text mode.
+    """
+
+    try:
+        with open(path, encoding=locale.getpreferredencoding(False)) as handle:
+            return handle.read()
+    except FileNotFoundError:
+        return ""
+
+
+def _real_directory(path: str | None) -> str | None:
+    """Return the canonical form of directory ``path``.
+
+    Args:
+        path: Directory path, possibly containing symlinks.
+
+    Returns:
+        str | None: Resolved directory, or ``None`` when ``path`` is empty.
+    """
+
+    if not path:
+        return None
+    return os.path.realpath(path)
+
+
+__all__ = ["PythonWorkerRunner", "python_entry_points"]
@@ -41,6 +41,32 @@ def discover_files(discovery: SupportsDiscovery, cfg: ConfigProtocol, root: Path
     return sorted({path.resolve() for path in files if is_within_limits(path.resolve(), limits)})
 
 
+def discover_project_files(discovery: SupportsDiscovery, cfg: ConfigProtocol, root: Path) -> list[Path]:
+    """Return every project file, ignoring git change tracking.
+
+    Args:
+        discovery: Discovery strategy bundle used to gather candidate files.
+        cfg: Normalised configuration describing discovery options.
+        root: Repository root used for discovery resolution.
+
+    Returns:
+        list[Path]: Sorted list of unique, resolved file paths.
+    """
+
+    unscoped = cfg.file_discovery.model_copy(
+        update={
+            "changed_only": False,
+            "incremental": False,
+            "pre_commit": False,
+            "base_branch": None,
+            "with_dependents": False,
+        },
+    )
+    files = discovery.run(unscoped, root)
+    limits = resolve_limit_paths(unscoped.limit_to, root)
+    return sorted({path.resolve() for path in files if is_within_limits(path.resolve(), limits)})
+
+
 def filter_files_for_tool(extensions: Iterable[str], files: Sequence[Path]) -> list[Path]:
     """Return files matching the provided ``extensions``.
 
@@ -58,4 +84,4 @@ def filter_files_for_tool(extensions: Iterable[str], files: Sequence[Path]) -> l
     return [path for path in files if path.suffix.lower() in normalized]
 
 
-__all__ = ["discover_files", "filter_files_for_tool", "prepare_runtime"]
+__all__ = ["discover_files", "discover_project_files", "filter_files_for_tool", "prepare_runtime"]
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Route tool commands through persistent daemon clients when server mode is enabled."""
+
+from __future__ import annotations
+
+import shutil
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from subprocess import CompletedProcess
+from typing import Final
+
+from ..core.runtime.process import CommandOptions, CommandOverrideMapping
+from ..tools.base import Tool
+from .action_executor import RunnerCallable
+
+_PATH_KEY: Final[str] = "PATH"
+
+
+class ToolServerRunner:
+    """Runner that swaps tool executables for warm daemon clients.
+
+    Catalog runtimes declare ``serverClients`` such as ``{"eslint": "eslint_d"}``.
+    The client accepts the same arguments and prints the same output as the
+    executable it replaces, while the daemon behind it keeps the tool's
+    configuration and plugins loaded between invocations and between runs.
+    Clients are looked up next to the original executable first and then on
+    ``PATH``; commands fall back to the original executable when no client is
+    installed.
+    """
+
+    def __init__(self, delegate: RunnerCallable, clients: Mapping[str, str]) -> None:
+        """Wrap ``delegate`` with daemon client routing.
+
+        Args:
+            delegate: Runner that executes the (possibly rewritten) command.
+            clients: Daemon client names keyed by the executable they replace.
+        """
+
+        self._delegate = delegate
+        self._clients = dict(clients)
+        self._resolved: dict[tuple[str, str | None], str | None] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        cmd: Sequence[str],
+        *,
+        options: CommandOptions | None = None,
+        overrides: CommandOverrideMapping | None = None,
+    ) -> CompletedProcess[str]:
+        """Execute ``cmd`` through its daemon client when one is available.
+
+        Args:
+            cmd: Command to execute including executable and arguments.
+            options: Optional command execution configuration.
+            overrides: Additional keyword overrides forwarded to the delegate.
+
+        Returns:
+            CompletedProcess[str]: Completed process returned by the delegate.
+        """
+
+        return self._delegate(self.route(cmd, options), options=options, overrides=overrides)
+
+    def __repr__(self) -> str:
+        """Return a diagnostic representation of the runner.
+
+        Returns:
+            str: Readable description including the wrapped runner.
+        """
+
+        return f"ToolServerRunner({self._delegate!r}, clients={sorted(self._clients)!r})"
+
+    def route(self, cmd: Sequence[str], options: CommandOptions | None = None) -> list[str]:
+        """Return ``cmd`` with its executable replaced by an installed daemon client.
+
+        Args:
+            cmd: Command whose executable may be served by a daemon.
+            options: Command options whose ``PATH`` is searched for the client.
+
+        Returns:
+            list[str]: Rewritten command, or ``cmd`` unchanged when no client applies.
+        """
+
+        command = list(cmd)
+        if not command:
+            return command
+        head = Path(command[0])
+        client_name = self._clients.get(head.name) or self._clients.get(head.stem)
+        if client_name is None:
+            return command
+        search_path = options.env.get(_PATH_KEY) if options is not None and options.env is not None else None
+        client = self._resolve(head, client_name, search_path)
+        return command if client is None else [client, *command[1:]]
+
+    def _resolve(self, head: Path, client_name: str, search_path: str | None) -> str | None:
+        """Return the memoised location of ``client_name`` for ``head``.
+
+        Args:
+            head: Executable being replaced.
+            client_name: Name of the daemon client executable.
+            search_path: ``PATH`` value used by the command, if overridden.
+
+        Returns:
+            str | None: Path of the client, or ``None`` when it is not installed.
+        """
+
+        key = (str(head), search_path)
+        with self._lock:
+            if key in self._resolved:
+                return self._resolved[key]
+        located = None
+        if head.parent != Path():
+            located = shutil.which(client_name, path=str(head.parent))
+        if located is None:
+            located = shutil.which(client_name, path=search_path)
+        with self._lock:
+            self._resolved[key] = located
+        return located
+
+
+def tool_server_clients(tools: Iterable[Tool]) -> dict[str, str]:
+    """Return the daemon clients declared by ``tools``.
+
+    Args:
+        tools: Registered tools whose runtimes may declare server clients.
+
+    Returns:
+        dict[str, str]: Client names keyed by the executable they replace.
+    """
+
+    clients: dict[str, str] = {}
+    for tool in tools:
+        clients.update(tool.server_clients)
+    return clients
+
+
+__all__ = ["ToolServerRunner", "tool_server_clients"]
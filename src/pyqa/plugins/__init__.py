@@ -17,13 +17,15 @@ from functools import partial
 from importlib import import_module, metadata
 from importlib.metadata import EntryPoint, EntryPoints
 from types import ModuleType, SimpleNamespace
-from typing import TypeAlias, TypeVar, cast
+from typing import TYPE_CHECKING, TypeAlias, TypeVar, cast
 
 import typer
 
 from pyqa.interfaces.cli import TyperLike, TyperSubApplication
-from tooling_spec.catalog.plugins import CatalogContribution
-from tooling_spec.catalog.types import JSONValue as CatalogJSONValue
+
+if TYPE_CHECKING:  # pragma: no cover - the catalog package is costly to import on CLI start-up
+    from tooling_spec.catalog.plugins import CatalogContribution
+    from tooling_spec.catalog.types import JSONValue as CatalogJSONValue
 
 CommandResult = int | None
 CommandCallable: TypeAlias = Callable[..., CommandResult]
@@ -157,9 +159,9 @@ CATALOG_PLUGIN_GROUP = "pyqa.catalog.plugins"
 CLI_PLUGIN_GROUP = "pyqa.cli.plugins"
 DIAGNOSTICS_PLUGIN_GROUP = "pyqa.diagnostics.plugins"
 
-CatalogPluginFactory: TypeAlias = Callable[..., CatalogContribution]
+CatalogPluginFactory: TypeAlias = "Callable[..., CatalogContribution]"
 CLIPluginFactory: TypeAlias = Callable[[TyperLike], None]
-DiagnosticsPlugin: TypeAlias = Callable[..., None] | str | Mapping[str, CatalogJSONValue]
+DiagnosticsPlugin: TypeAlias = "Callable[..., None] | str | Mapping[str, CatalogJSONValue]"
 
 _EntryPointSource: TypeAlias = EntryPoints | Mapping[str, Sequence[EntryPoint]]
 _FactoryT = TypeVar("_FactoryT")
@@ -5,10 +5,14 @@
 
 from .emitters import PRSummaryOptions, write_json_report, write_pr_summary, write_sarif_report
 from .formatters import render
+from .profile import emit_profile_summary
 from .stats import emit_stats_panel
+from .streaming import StreamingConcisePresenter
 
 __all__ = (
     "PRSummaryOptions",
+    "StreamingConcisePresenter",
+    "emit_profile_summary",
     "emit_stats_panel",
     "render",
     "write_json_report",
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Incrementally encode large JSON documents straight to a file handle."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, TextIO
+
+from tooling_spec.catalog.types import JSONValue
+
+GZIP_SUFFIX: Final[str] = ".gz"
+_INDENT: Final[int] = 2
+_PRETTY_SEPARATORS: Final[tuple[str, str]] = (",", ": ")
+_COMPACT_SEPARATORS: Final[tuple[str, str]] = (",", ":")
+
+
+@dataclass(frozen=True, slots=True)
+class StreamArray:
+    """JSON array whose items are produced lazily while writing."""
+
+    items: Iterable[StreamValue]
+
+
+@dataclass(frozen=True, slots=True)
+class StreamObject:
+    """JSON object whose members are produced lazily while writing."""
+
+    members: Iterable[tuple[str, StreamValue]]
+
+
+type StreamValue = JSONValue | StreamArray | StreamObject
+
+
+@dataclass(slots=True)
+class JsonStreamWriter:
+    """Write JSON values to ``handle`` without materialising the whole document.
+
+    Pretty output is byte-for-byte identical to ``json.dumps(value, indent=2)``
+    while compact output matches ``separators=(",", ":")``.
+    """
+
+    handle: TextIO
+    compact: bool = False
+
+    def write(self, value: StreamValue) -> None:
+        """Encode ``value`` as a complete JSON document.
+
+        Args:
+            value: JSON value, optionally containing lazily produced containers.
+        """
+
+        self._write_value(value, 0)
+
+    def _write_value(self, value: StreamValue, depth: int) -> None:
+        """Encode ``value`` at nesting ``depth``.
+
+        Args:
+            value: Value to encode.
+            depth: Current indentation level.
+        """
+
+        if isinstance(value, StreamArray):
+            self._write_container("[", "]", ((None, item) for item in value.items), depth)
+        elif isinstance(value, StreamObject):
+            self._write_container("{", "}", value.members, depth)
+        else:
+            self.handle.write(self._encode(value, depth))
+
+    def _write_container(
+        self,
+        opener: str,
+        closer: str,
+        entries: Iterable[tuple[str | None, StreamValue]],
+        depth: int,
+    ) -> None:
+        """Encode a container whose entries are yielded lazily.
+
+        Args:
+            opener: Opening bracket.
+            closer: Closing bracket.
+            entries: Pairs of optional member keys and values.
+            depth: Indentation level of the container itself.
+        """
+
+        item_separator, key_separator = _COMPACT_SEPARATORS if self.compact else _PRETTY_SEPARATORS
+        self.handle.write(opener)
+        empty = True
+        for key, value in entries:
+            if not empty:
+                self.handle.write(item_separator)
+            self.handle.write(self._newline(depth + 1))
+            if key is not None:
+                self.handle.write(json.dumps(key) + key_separator)
+            self._write_value(value, depth + 1)
+            empty = False
+        if not empty:
+            self.handle.write(self._newline(depth))
+        self.handle.write(closer)
+
+    def _encode(self, value: JSONValue, depth: int) -> str:
+        """Return ``value`` encoded at ``depth`` using the active layout.
+
+        Args:
+            value: Fully materialised JSON value.
+            depth: Indentation level the value starts at.
+
+        Returns:
+            str: Encoded JSON fragment.
+        """
+
+        if self.compact:
+            return json.dumps(value, separators=_COMPACT_SEPARATORS)
+        text = json.dumps(value, indent=_INDENT)
+        if depth and "\n" in text:
+            text = text.replace("\n", self._newline(depth))
+        return text
+
+    def _newline(self, depth: int) -> str:
+        """Return the line break and indentation for ``depth``.
+
+        Args:
+            depth: Indentation level.
+
+        Returns:
+            str: Empty string in compact mode, otherwise newline plus spaces.
+        """
+
+        return "" if self.compact else "\n" + " " * (_INDENT * depth)
+
+
+@contextmanager
+def open_report(path: Path, *, compress: bool | None = None) -> Iterator[TextIO]:
+    """Open ``path`` for text output, gzip-compressing when requested.
+
+    Args:
+        path: Destination file.
+        compress: Force or disable gzip; ``None`` compresses when the path
+            ends in ``.gz``.
+
+    Yields:
+        TextIO: Buffered UTF-8 text handle.
+    """
+
+    use_gzip = path.suffix == GZIP_SUFFIX if compress is None else compress
+    if use_gzip:
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            yield handle
+    else:
+        with path.open("w", encoding="utf-8") as handle:
+            yield handle
+
+
+__all__ = ["GZIP_SUFFIX", "JsonStreamWriter", "StreamArray", "StreamObject", "StreamValue", "open_report"]
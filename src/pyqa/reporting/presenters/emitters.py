@@ -4,9 +4,9 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Final, TypeAlias, cast
 
@@ -14,14 +14,16 @@ from pyqa.core.severity import Severity, severity_to_sarif
 from tooling_spec.catalog.types import JSONValue as CatalogJSONValue
 
 from ...analysis.providers import NullAnnotationProvider
-from ...core.models import Diagnostic, RunResult
-from ...core.serialization import serialize_outcome
+from ...core.models import Diagnostic, RunResult, ToolOutcome
+from ...core.serialization import serialize_diagnostic, serialize_outcome
 from ...interfaces.analysis import AnnotationProvider, HighlightKind
 from ...utils.bool_utils import interpret_optional_bool
 from ..advice.builder import AdviceBuilder, AdviceEntry
+from ._json_stream import JsonStreamWriter, StreamArray, StreamObject, open_report
 
 SARIF_VERSION = "2.1.0"
 SARIF_SCHEMA = "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json"
+_DIAGNOSTICS_KEY: Final[str] = "diagnostics"
 
 
 @dataclass(slots=True)
@@ -235,71 +237,114 @@ def _coerce_section_builder(
     raise TypeError(f"{name} must be callable or None")
 
 
-def write_json_report(result: RunResult, path: Path) -> None:
-    """Write a JSON report summarising tool outcomes.
+def write_json_report(
+    result: RunResult,
+    path: Path,
+    *,
+    compact: bool = False,
+    compress: bool | None = None,
+) -> None:
+    """Stream a JSON report summarising tool outcomes to ``path``.
+
+    Diagnostics are encoded one at a time so memory stays flat regardless of
+    how many findings the run produced.
 
     Args:
         result: Completed orchestrator run result to serialise.
         path: Destination path that receives the JSON payload.
+        compact: Emit whitespace-free JSON instead of two-space indentation.
+        compress: Gzip the output; ``None`` compresses when ``path`` ends in ``.gz``.
     """
-    total_actions = len(result.outcomes)
-    failed_actions = sum(1 for outcome in result.outcomes if not outcome.ok)
-    cached_actions = sum(1 for outcome in result.outcomes if outcome.cached)
-
-    payload = {
-        "root": str(result.root),
-        "files": [str(p) for p in result.files],
-        "outcomes": [serialize_outcome(outcome) for outcome in result.outcomes],
-        "analysis": result.analysis,
-        "actions": {
-            "total": total_actions,
-            "failed": failed_actions,
-            "cached": cached_actions,
-        },
+
+    actions: SarifObject = {
+        "total": len(result.outcomes),
+        "failed": sum(1 for outcome in result.outcomes if not outcome.ok),
+        "cached": sum(1 for outcome in result.outcomes if outcome.cached),
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    document = StreamObject(
+        (
+            ("root", str(result.root)),
+            ("files", StreamArray(str(file_path) for file_path in result.files)),
+            ("outcomes", StreamArray(_stream_outcome(outcome) for outcome in result.outcomes)),
+            ("analysis", cast(CatalogJSONValue, result.analysis)),
+            ("actions", actions),
+        ),
+    )
+    with open_report(path, compress=compress) as handle:
+        JsonStreamWriter(handle, compact=compact).write(document)
+
+
+def _stream_outcome(outcome: ToolOutcome) -> StreamObject:
+    """Return a lazily encoded view of ``outcome`` for the JSON report.
+
+    Args:
+        outcome: Tool outcome to serialise.
+
+    Returns:
+        StreamObject: Members of :func:`serialize_outcome` with diagnostics
+        encoded on demand.
+    """
+
+    header = serialize_outcome(outcome.model_copy(update={"diagnostics": []}))
+    diagnostics = StreamArray(cast(CatalogJSONValue, dict(serialize_diagnostic(diag))) for diag in outcome.diagnostics)
+    return StreamObject(
+        (key, diagnostics if key == _DIAGNOSTICS_KEY else cast(CatalogJSONValue, value))
+        for key, value in header.items()
+    )
 
 
-def write_sarif_report(result: RunResult, path: Path) -> None:
-    """Emit a SARIF document compatible with GitHub and other tools.
+def write_sarif_report(
+    result: RunResult,
+    path: Path,
+    *,
+    compact: bool = False,
+    compress: bool | None = None,
+) -> None:
+    """Stream a SARIF document compatible with GitHub and other tools.
 
     Args:
         result: Completed orchestrator run result to serialise.
         path: Destination path that receives the SARIF document.
+        compact: Emit whitespace-free JSON instead of two-space indentation.
+        compress: Gzip the output; ``None`` compresses when ``path`` ends in ``.gz``.
     """
-    runs: list[SarifObject] = []
-    for tool_name, diagnostics in _group_diagnostics_by_tool(result):
-        version = result.tool_versions.get(tool_name)
-        run = _build_sarif_run(tool_name, diagnostics, version)
-        runs.append(run)
-
-    sarif_doc = {
-        "version": SARIF_VERSION,
-        "$schema": SARIF_SCHEMA,
-        "runs": runs,
-    }
-    path.write_text(json.dumps(sarif_doc, indent=2), encoding="utf-8")
+
+    runs = StreamArray(
+        _stream_sarif_run(tool_name, outcomes, result.tool_versions.get(tool_name))
+        for tool_name, outcomes in _group_outcomes_by_tool(result)
+    )
+    document = StreamObject(
+        (
+            ("version", SARIF_VERSION),
+            ("$schema", SARIF_SCHEMA),
+            ("runs", runs),
+        ),
+    )
+    with open_report(path, compress=compress) as handle:
+        JsonStreamWriter(handle, compact=compact).write(document)
 
 
-def _build_sarif_run(
+def _stream_sarif_run(
     tool_name: str,
-    diagnostics: Sequence[Diagnostic],
+    outcomes: Sequence[ToolOutcome],
     version: str | None,
-) -> SarifObject:
+) -> StreamObject:
     """Construct the SARIF run payload for a single tool.
 
+    Rules are deduplicated in a first pass over the diagnostics; results are
+    then encoded lazily in a second pass so they never exist as one list.
+
     Args:
-        tool_name: Name of the tool that emitted *diagnostics*.
-        diagnostics: Collection of diagnostics associated with *tool_name*.
+        tool_name: Name of the tool that emitted the diagnostics.
+        outcomes: Outcomes of every action run for *tool_name*.
         version: Optional tool version string recorded with the run.
 
     Returns:
-        SarifObject: SARIF-compliant run dictionary.
+        StreamObject: SARIF-compliant run object.
     """
-    rules: dict[str, SarifObject] = {}
-    results: list[SarifObject] = []
 
-    for diag in diagnostics:
+    rules: dict[str, SarifObject] = {}
+    for diag in _iter_diagnostics(outcomes):
         rule_id = diag.code or tool_name
         if rule_id not in rules:
             rules[rule_id] = {
@@ -307,36 +352,57 @@ def _build_sarif_run(
                 "name": rule_id,
                 "shortDescription": {"text": diag.message[:120]},
             }
+    driver: SarifObject = {
+        "name": tool_name,
+        "version": version or "unknown",
+        "rules": cast(list[SarifValue], list(rules.values())) or None,
+    }
+    results = StreamArray(_sarif_result(diag, tool_name) for diag in _iter_diagnostics(outcomes))
+    return StreamObject((("tool", {"driver": driver}), ("results", results)))
 
-        result_entry: SarifObject = {
-            "ruleId": rule_id,
-            "level": severity_to_sarif(diag.severity),
-            "message": {"text": diag.message},
-        }
-        if diag.file:
-            physical_location: SarifObject = {
-                "artifactLocation": {"uri": diag.file},
-            }
-            region: dict[str, int] = {}
-            if diag.line is not None:
-                region["startLine"] = int(diag.line)
-            if diag.column is not None:
-                region["startColumn"] = int(diag.column)
-            if region:
-                physical_location["region"] = region
-            result_entry["locations"] = [{"physicalLocation": physical_location}]
-        results.append(result_entry)
-
-    return {
-        "tool": {
-            "driver": {
-                "name": tool_name,
-                "version": version or "unknown",
-                "rules": list(rules.values()) or None,
-            },
-        },
-        "results": results,
+
+def _sarif_result(diag: Diagnostic, tool_name: str) -> SarifObject:
+    """Return the SARIF result entry describing ``diag``.
+
+    Args:
+        diag: Diagnostic to convert.
+        tool_name: Tool used as the rule identifier when ``diag`` has no code.
+
+    Returns:
+        SarifObject: SARIF result dictionary.
+    """
+
+    result_entry: SarifObject = {
+        "ruleId": diag.code or tool_name,
+        "level": severity_to_sarif(diag.severity),
+        "message": {"text": diag.message},
     }
+    if diag.file:
+        physical_location: SarifObject = {
+            "artifactLocation": {"uri": diag.file},
+        }
+        region: dict[str, SarifValue] = {}
+        if diag.line is not None:
+            region["startLine"] = int(diag.line)
+        if diag.column is not None:
+            region["startColumn"] = int(diag.column)
+        if region:
+            physical_location["region"] = region
+        result_entry["locations"] = [{"physicalLocation": physical_location}]
+    return result_entry
+
+
+def _iter_diagnostics(outcomes: Iterable[ToolOutcome]) -> Iterator[Diagnostic]:
+    """Yield diagnostics from ``outcomes`` without copying them into one list.
+
+    Args:
+        outcomes: Outcomes whose diagnostics should be chained.
+
+    Returns:
+        Iterator[Diagnostic]: Diagnostics in outcome order.
+    """
+
+    return chain.from_iterable(outcome.diagnostics for outcome in outcomes)
 
 
 def write_pr_summary(
@@ -604,22 +670,22 @@ def _format_location(diagnostic: Diagnostic) -> str:
     return location
 
 
-def _group_diagnostics_by_tool(
+def _group_outcomes_by_tool(
     result: RunResult,
-) -> Iterable[tuple[str, list[Diagnostic]]]:
-    """Group diagnostics by tool name.
+) -> Iterable[tuple[str, list[ToolOutcome]]]:
+    """Group outcomes that produced diagnostics by tool name.
 
     Args:
         result: Completed orchestrator run result containing diagnostics.
 
     Returns:
-        Iterable[tuple[str, list[Diagnostic]]]: Tool names paired with diagnostics.
+        Iterable[tuple[str, list[ToolOutcome]]]: Tool names paired with their outcomes.
     """
-    buckets: dict[str, list[Diagnostic]] = {}
+    buckets: dict[str, list[ToolOutcome]] = {}
     for outcome in result.outcomes:
         if not outcome.diagnostics:
             continue
-        buckets.setdefault(outcome.tool, []).extend(outcome.diagnostics)
+        buckets.setdefault(outcome.tool, []).append(outcome)
     return sorted(buckets.items(), key=lambda item: item[0])
 
 
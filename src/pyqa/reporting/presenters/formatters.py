@@ -54,6 +54,7 @@ ALLOWED_SYMBOL_CHARS: Final[frozenset[str]] = frozenset(
 SYMBOL_COMMENT_PREFIXES: Final[tuple[str, ...]] = ("#", '"""', "'''")
 DEFAULT_CONCISE_MESSAGE: Final[str] = "<no message provided>"
 DUPLICATE_CODE_TAG: Final[str] = "duplicate-code"
+TOOL_PALETTE: Final[tuple[int, ...]] = (255, 254, 253, 252, 251, 250, 249, 248)
 
 
 @dataclass(slots=True)
@@ -149,7 +150,8 @@ def render(
 
     provider = annotation_provider or NullAnnotationProvider()
     set_annotation_provider(provider)
-    provider.annotate_run(result)
+    if cfg.quiet or cfg.output != "concise" or cfg.advice:
+        provider.annotate_run(result)
     if cfg.quiet:
         render_quiet_mode(result, cfg)
         return
@@ -178,16 +180,42 @@ def _render_concise(
     Args:
         result: Completed orchestrator run result to display.
         cfg: Output configuration describing formatting preferences.
+        annotation_provider: Provider used for advice highlighting.
     """
 
     root_path = _resolve_root_path(result.root)
-    total_actions = len(result.outcomes)
-    failed_actions = sum(1 for outcome in result.outcomes if outcome.indicates_failure())
-
     raw_entries = _collect_concise_entries(result, root_path)
     entries = _group_similar_entries(raw_entries)
-    _print_concise_entries(entries, result, cfg)
+    hidden = _print_concise_entries(entries, result, cfg)
+    render_concise_footer(result, cfg, entries, hidden=hidden, annotation_provider=annotation_provider)
+
+
+def render_concise_footer(
+    result: RunResult,
+    cfg: OutputConfigProtocol,
+    entries: Sequence[ConciseDiagnostic],
+    *,
+    hidden: int,
+    annotation_provider: AnnotationProvider,
+) -> None:
+    """Render everything that follows the concise diagnostic lines.
+
+    This covers the truncation notice, advice, statistics and the summary line,
+    and is shared by the batch and streaming concise presenters.
+
+    Args:
+        result: Completed orchestrator run result to summarise.
+        cfg: Output configuration describing formatting preferences.
+        entries: Every concise diagnostic of the run, including hidden ones.
+        hidden: Number of entries withheld by ``max_diagnostics``.
+        annotation_provider: Provider used for advice highlighting.
+    """
 
+    total_actions = len(result.outcomes)
+    failed_actions = sum(1 for outcome in result.outcomes if outcome.indicates_failure())
+    if hidden:
+        console = get_console_manager().get(color=cfg.color, emoji=cfg.emoji)
+        console.print(truncation_notice(hidden, cfg))
     diagnostics_count = len(entries)
     if getattr(cfg, "advice", False):
         advice_input = [entry.as_advice_tuple() for entry in entries]
@@ -489,27 +517,49 @@ def _print_concise_entries(
     entries: Sequence[ConciseDiagnostic],
     result: RunResult,
     cfg: OutputConfigProtocol,
-) -> None:
-    """Emit concise diagnostics to stdout.
+) -> int:
+    """Emit concise diagnostics to stdout, honouring ``max_diagnostics``.
+
+    Highlighting is only computed for the lines that are printed.
 
     Args:
         entries: Concise diagnostics ready for printing.
         result: Completed run result containing additional metadata.
         cfg: Output configuration describing formatting preferences.
+
+    Returns:
+        int: Number of entries withheld by the ``max_diagnostics`` cap.
     """
 
     if not entries:
-        return
+        return 0
 
-    tool_width = 0
-    tool_names = [entry.tool for entry in entries]
-    if tool_names:
-        raw_tool_width = max(len(tool) for tool in tool_names)
-        tool_width = min(raw_tool_width, TOOL_PADDING_LIMIT)
+    shown = sort_concise_entries(entries)
+    limit = cfg.max_diagnostics
+    if limit is not None:
+        shown = shown[:limit]
+    raw_tool_width = max(len(entry.tool) for entry in shown) if shown else 0
+    tool_width = min(raw_tool_width, TOOL_PADDING_LIMIT)
 
     tint_tool = _tool_tinter(result, cfg)
     console = get_console_manager().get(color=cfg.color, emoji=cfg.emoji)
-    for entry in sorted(
+    for entry in shown:
+        line = render_concise_entry(entry, tool_width, tint_tool, cfg)
+        console.print(line)
+    return len(entries) - len(shown)
+
+
+def sort_concise_entries(entries: Sequence[ConciseDiagnostic]) -> list[ConciseDiagnostic]:
+    """Return ``entries`` ordered by location, tool, code and message.
+
+    Args:
+        entries: Concise diagnostics to order.
+
+    Returns:
+        list[ConciseDiagnostic]: Entries in display order.
+    """
+
+    return sorted(
         entries,
         key=lambda item: (
             item.file_path,
@@ -519,12 +569,25 @@ def _print_concise_entries(
             item.code,
             item.message,
         ),
-    ):
-        line = _render_concise_entry(entry, tool_width, tint_tool, cfg)
-        console.print(line)
+    )
+
+
+def truncation_notice(hidden: int, cfg: OutputConfigProtocol) -> Text:
+    """Return the line reporting diagnostics withheld by ``max_diagnostics``.
+
+    Args:
+        hidden: Number of concise diagnostics that were not printed.
+        cfg: Output configuration describing formatting preferences.
+
+    Returns:
+        Text: Notice naming the hidden count and the active limit.
+    """
 
+    message = f"… {hidden} more diagnostic(s) not shown (--max-diagnostics {cfg.max_diagnostics})"
+    return Text(message, style="dim" if cfg.color else "")
 
-def _render_concise_entry(
+
+def render_concise_entry(
     entry: ConciseDiagnostic,
     tool_width: int,
     tint_tool: Callable[[str], Text],
@@ -619,13 +682,25 @@ def _tool_tinter(result: RunResult, cfg: OutputConfigProtocol) -> Callable[[str]
         {diag.tool or outcome.tool for outcome in result.outcomes for diag in outcome.diagnostics},
     )
     tint_map: dict[str, Style] = {}
-    palette = [255, 254, 253, 252, 251, 250, 249, 248]
     for index, tool_name in enumerate(tools):
-        tint_map[tool_name or ""] = Style(color=f"color({palette[index % len(palette)]})")
+        tint_map[tool_name or ""] = tool_style(index)
 
     return _ToolTinter(tint_map)
 
 
+def tool_style(index: int) -> Style:
+    """Return the style assigned to the ``index``-th tool of a run.
+
+    Args:
+        index: Position of the tool among the tools that reported diagnostics.
+
+    Returns:
+        Style: Greyscale style cycling through :data:`TOOL_PALETTE`.
+    """
+
+    return Style(color=f"color({TOOL_PALETTE[index % len(TOOL_PALETTE)]})")
+
+
 def _normalise_symbol(value: str | None) -> str:
     """Return a compact symbol name for concise output.
 
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Rich rendering for ``--profile`` timing summaries."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Final
+
+from rich import box
+from rich.table import Table
+
+from pyqa.runtime.console.manager import get_console_manager
+
+from ...core.runtime.profiling import PHASE_CATEGORY, TOOL_CATEGORY, ProfileSummaryRow
+
+_MS_FORMAT: Final[str] = "{:,.1f}"
+
+
+def create_profile_table(
+    rows: Sequence[ProfileSummaryRow],
+    *,
+    category: str,
+    title: str,
+    color: bool,
+) -> Table | None:
+    """Return a table listing ``rows`` of ``category``, or ``None`` when empty.
+
+    Args:
+        rows: Aggregated profiler rows sorted by self time.
+        category: Span category rendered by the table.
+        title: Table title.
+        color: Whether Rich styling should be applied.
+
+    Returns:
+        Table | None: Rendered table, or ``None`` when no row matches ``category``.
+    """
+
+    selected = [row for row in rows if row.category == category]
+    if not selected:
+        return None
+    table = Table(title=title, box=box.SIMPLE, pad_edge=False, expand=False)
+    name_style = "cyan" if color else None
+    table.add_column("Name", style=name_style, no_wrap=True)
+    table.add_column("Calls", justify="right")
+    table.add_column("Self ms", justify="right")
+    table.add_column("Total ms", justify="right")
+    for row in selected:
+        table.add_row(
+            row.name,
+            str(row.count),
+            _MS_FORMAT.format(row.self_ms),
+            _MS_FORMAT.format(row.total_ms),
+        )
+    return table
+
+
+def emit_profile_summary(rows: Sequence[ProfileSummaryRow], *, color: bool) -> None:
+    """Print per-phase and per-tool timing tables.
+
+    Args:
+        rows: Aggregated profiler rows sorted by self time.
+        color: Whether Rich styling should be applied.
+    """
+
+    console = get_console_manager().get(color=color, emoji=False)
+    for category, title in ((PHASE_CATEGORY, "Profile: phases"), (TOOL_CATEGORY, "Profile: tools")):
+        table = create_profile_table(rows, category=category, title=title, color=color)
+        if table is not None:
+            console.print(table)
+
+
+__all__ = ["create_profile_table", "emit_profile_summary"]
@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Concise presenter printing diagnostics while the orchestrator is still running."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich.style import Style
+from rich.text import Text
+
+from ...analysis.providers import NullAnnotationProvider
+from ...core.models import RunResult, ToolOutcome
+from ...interfaces.analysis import AnnotationProvider
+from ...interfaces.config import OutputConfig as OutputConfigProtocol
+from ...interfaces.orchestration import OrchestratorHooks
+from ...runtime.console.manager import get_console_manager
+from ..output.highlighting import set_annotation_provider
+from .formatters import (
+    TOOL_PADDING_LIMIT,
+    ConciseDiagnostic,
+    _build_concise_entry,
+    _group_similar_entries,
+    _plain_tool_tinter,
+    _resolve_root_path,
+    _ToolTinter,
+    render_concise_entry,
+    render_concise_footer,
+    sort_concise_entries,
+    tool_style,
+)
+
+
+class StreamingConcisePresenter:
+    """Print each tool's concise diagnostics as soon as its outcome is recorded.
+
+    Lines are deduplicated and grouped per outcome exactly like the batch
+    concise presenter, but they are printed before cross-tool deduplication
+    runs. Highlighting is computed only for the lines that are printed;
+    entries beyond ``max_diagnostics`` are counted and reported by
+    :meth:`finish`.
+    """
+
+    def __init__(
+        self,
+        cfg: OutputConfigProtocol,
+        root: Path,
+        *,
+        annotation_provider: AnnotationProvider | None = None,
+    ) -> None:
+        """Prepare the presenter for a run rooted at ``root``.
+
+        Args:
+            cfg: Output configuration describing formatting preferences.
+            root: Project root used to render relative paths.
+            annotation_provider: Provider used to highlight printed messages.
+        """
+
+        self._cfg = cfg
+        self._root = _resolve_root_path(root)
+        self._provider = annotation_provider or NullAnnotationProvider()
+        self._lock = threading.Lock()
+        self._seen: set[tuple[str, int, str, str, str, str]] = set()
+        self._entries: list[ConciseDiagnostic] = []
+        self._shown = 0
+        self._tint_map: dict[str, Style] = {}
+        self._tint: Callable[[str], Text] = _ToolTinter(self._tint_map) if cfg.color else _plain_tool_tinter
+
+    @property
+    def shown(self) -> int:
+        """Return the number of diagnostics printed so far.
+
+        Returns:
+            int: Count of concise lines emitted.
+        """
+
+        return self._shown
+
+    @property
+    def hidden(self) -> int:
+        """Return the number of diagnostics withheld by ``max_diagnostics``.
+
+        Returns:
+            int: Count of concise entries that were not printed.
+        """
+
+        return len(self._entries) - self._shown
+
+    def install(self, hooks: OrchestratorHooks) -> None:
+        """Chain :meth:`on_outcome` after any existing ``after_tool`` callback.
+
+        Args:
+            hooks: Orchestrator hook container receiving lifecycle callbacks.
+        """
+
+        set_annotation_provider(self._provider)
+        hooks.after_tool = _ChainedOutcomeCallback(previous=hooks.after_tool, callback=self.on_outcome)
+
+    def on_outcome(self, outcome: ToolOutcome) -> None:
+        """Print the diagnostics carried by ``outcome``.
+
+        Args:
+            outcome: Tool outcome recorded by the orchestrator.
+        """
+
+        if not outcome.diagnostics:
+            return
+        with self._lock:
+            fresh: list[ConciseDiagnostic] = []
+            for diagnostic in outcome.diagnostics:
+                entry = _build_concise_entry(diagnostic, outcome.tool, self._root)
+                record_key = entry.as_advice_tuple()
+                if record_key in self._seen:
+                    continue
+                self._seen.add(record_key)
+                fresh.append(entry)
+            grouped = _group_similar_entries(fresh)
+            self._entries.extend(grouped)
+            printable = sort_concise_entries(grouped)
+            limit = self._cfg.max_diagnostics
+            if limit is not None:
+                printable = printable[: max(limit - self._shown, 0)]
+            if not printable:
+                return
+            console = get_console_manager().get(color=self._cfg.color, emoji=self._cfg.emoji)
+            for entry in printable:
+                if self._cfg.color and entry.tool not in self._tint_map:
+                    self._tint_map[entry.tool] = tool_style(len(self._tint_map))
+                console.print(render_concise_entry(entry, TOOL_PADDING_LIMIT, self._tint, self._cfg))
+            self._shown += len(printable)
+
+    def finish(self, result: RunResult) -> None:
+        """Render the truncation notice, advice, statistics and summary line.
+
+        Args:
+            result: Completed orchestrator run result.
+        """
+
+        if self._cfg.advice:
+            self._provider.annotate_run(result)
+        with self._lock:
+            entries = list(self._entries)
+            hidden = self.hidden
+        render_concise_footer(result, self._cfg, entries, hidden=hidden, annotation_provider=self._provider)
+
+
+@dataclass(frozen=True, slots=True)
+class _ChainedOutcomeCallback:
+    """Invoke an existing ``after_tool`` callback before the presenter callback."""
+
+    previous: Callable[[ToolOutcome], None] | None
+    callback: Callable[[ToolOutcome], None]
+
+    def __call__(self, outcome: ToolOutcome) -> None:
+        """Forward ``outcome`` to both callbacks.
+
+        Args:
+            outcome: Tool outcome recorded by the orchestrator.
+        """
+
+        if self.previous is not None:
+            self.previous(outcome)
+        self.callback(outcome)
+
+
+__all__ = ["StreamingConcisePresenter"]
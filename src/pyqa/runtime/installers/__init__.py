@@ -22,6 +22,7 @@ from .update import (
     UpdatePlan,
     UpdatePlanItem,
     UpdateResult,
+    UpdateStateStore,
     Workspace,
     WorkspaceDiscovery,
     WorkspaceKind,
@@ -46,6 +47,7 @@ __all__ = [
     "UpdatePlan",
     "UpdatePlanItem",
     "UpdateResult",
+    "UpdateStateStore",
     "Workspace",
     "WorkspaceDiscovery",
     "WorkspaceKind",
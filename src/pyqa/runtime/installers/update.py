@@ -7,7 +7,9 @@ from __future__ import annotations
 
 import os
 import shutil
+import threading
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Final, cast
@@ -30,6 +32,7 @@ from .update_models import (
     WorkspaceKind,
     WorkspaceStrategy,
 )
+from .update_state import UpdateStateStore
 
 CommandRunner = Callable[[Sequence[str], Path | None], CompletedProcess[str]]
 
@@ -41,6 +44,16 @@ NPM_MANIFEST: Final[str] = "package.json"
 GO_MANIFEST: Final[str] = "go.mod"
 CARGO_MANIFEST: Final[str] = "Cargo.toml"
 
+# Nested workspaces of the same ecosystem share lockfiles and must update serially.
+_ECOSYSTEMS: Final[Mapping[WorkspaceKind, str]] = {
+    WorkspaceKind.PYTHON: "python",
+    WorkspaceKind.PNPM: "node",
+    WorkspaceKind.YARN: "node",
+    WorkspaceKind.NPM: "node",
+    WorkspaceKind.GO: "go",
+    WorkspaceKind.RUST: "rust",
+}
+
 
 class PythonStrategy:
     """Update strategy for Python projects managed through uv."""
@@ -362,6 +375,8 @@ class WorkspaceDiscovery:
             if self._should_skip(directory, root):
                 dirnames[:] = []
                 continue
+            # Prune excluded children before descending so vendored trees are never listed.
+            dirnames[:] = [name for name in dirnames if not self._should_skip(directory / name, root)]
             names = set(filenames)
             for strategy in self._strategies:
                 if strategy.detect(directory, names):
@@ -466,6 +481,10 @@ class WorkspaceUpdater:
         runner: CommandRunner | None = None,
         dry_run: bool = False,
         use_emoji: bool = True,
+        jobs: int = 1,
+        manager_limits: Mapping[str, int] | None = None,
+        state: UpdateStateStore | None = None,
+        force: bool = False,
     ) -> None:
         """Initialise the updater.
 
@@ -473,11 +492,21 @@ class WorkspaceUpdater:
             runner: Callable used to execute shell commands.
             dry_run: When ``True`` commands are logged but not executed.
             use_emoji: When ``True`` rich logging includes emoji markers.
+            jobs: Maximum number of independent workspaces updated concurrently.
+            manager_limits: Optional per-manager concurrency caps keyed by
+                workspace kind (for example ``{"pnpm": 1}``).
+            state: Optional fingerprint store used to skip unchanged workspaces
+                and to record successful updates.
+            force: When ``True`` update every workspace regardless of ``state``.
         """
 
         self._runner = runner or _default_runner
         self._dry_run = dry_run
         self._use_emoji = use_emoji
+        self._jobs = max(1, jobs)
+        self._manager_limits = dict(manager_limits or {})
+        self._state = state
+        self._force = force
 
     def is_dry_run(self) -> bool:
         """Return ``True`` when the updater is operating in dry-run mode.
@@ -499,9 +528,57 @@ class WorkspaceUpdater:
             UpdateResult: Collected execution summary.
         """
 
+        groups = _group_dependent_items(plan.items)
+        if self._jobs == 1 or len(groups) <= 1:
+            result = UpdateResult()
+            for item in plan.items:
+                self._process_plan_item(item=item, root=root, result=result)
+        else:
+            result = self._execute_concurrently(plan.items, groups, root=root)
+        if self._state is not None and not self._dry_run:
+            self._state.save()
+        return result
+
+    def _execute_concurrently(
+        self,
+        items: Sequence[UpdatePlanItem],
+        groups: Sequence[Sequence[int]],
+        *,
+        root: Path,
+    ) -> UpdateResult:
+        """Execute independent item groups on a thread pool.
+
+        Each group runs serially on one worker while per-manager semaphores
+        cap how many workspaces of a kind update at once. Results are merged
+        back in plan order so summaries stay deterministic.
+
+        Args:
+            items: Plan items to execute.
+            groups: Indices of ``items`` partitioned into independent groups.
+            root: Project root used for relative path reporting.
+
+        Returns:
+            UpdateResult: Aggregated execution summary in plan order.
+        """
+
+        gates = {
+            kind: threading.BoundedSemaphore(min(self._jobs, self._manager_limits.get(kind.value, self._jobs)))
+            for kind in {item.workspace.kind for item in items}
+        }
+        partials = [UpdateResult() for _ in items]
+
+        def run_group(indices: Sequence[int]) -> None:
+            for index in indices:
+                item = items[index]
+                with gates[item.workspace.kind]:
+                    self._process_plan_item(item=item, root=root, result=partials[index])
+
+        with ThreadPoolExecutor(max_workers=min(self._jobs, len(groups))) as pool:
+            for future in [pool.submit(run_group, group) for group in groups]:
+                future.result()
         result = UpdateResult()
-        for item in plan.items:
-            self._process_plan_item(item=item, root=root, result=result)
+        for partial in partials:
+            result.extend(partial)
         return result
 
     def _process_plan_item(
@@ -521,6 +598,13 @@ class WorkspaceUpdater:
 
         workspace = item.workspace
         rel_path = _format_relative(workspace.directory, root)
+        if self._state is not None and not self._force and self._state.is_current(workspace):
+            info(
+                f"Skipping {workspace.kind.value} workspace at {rel_path} (manifests unchanged since last update)",
+                use_emoji=self._use_emoji,
+            )
+            result.register_unchanged(workspace)
+            return
         info(
             f"Updating {workspace.kind.value} workspace at {rel_path}",
             use_emoji=self._use_emoji,
@@ -556,6 +640,8 @@ class WorkspaceUpdater:
 
         ok("Workspace updated", use_emoji=self._use_emoji)
         result.register_success(workspace, executions)
+        if self._state is not None:
+            self._state.record(workspace)
 
     def _execute_command(
         self,
@@ -681,6 +767,44 @@ def _default_runner(args: Sequence[str], cwd: Path | None) -> CompletedProcess[s
     return run_command(args, options=options)
 
 
+def _group_dependent_items(items: Sequence[UpdatePlanItem]) -> list[list[int]]:
+    """Partition plan items into groups that may run concurrently.
+
+    Workspaces nested beneath another workspace of the same ecosystem share
+    lockfiles or stores with it, so they join the ancestor's group and run
+    serially after it.
+
+    Args:
+        items: Plan items in execution order.
+
+    Returns:
+        list[list[int]]: Groups of item indices, each sorted in plan order.
+    """
+
+    groups: list[list[int]] = []
+    anchors: list[tuple[str, Path, int]] = []
+    ordered = sorted(range(len(items)), key=lambda index: len(items[index].workspace.directory.parts))
+    for index in ordered:
+        workspace = items[index].workspace
+        ecosystem = _ECOSYSTEMS.get(workspace.kind, workspace.kind.value)
+        owner = next(
+            (
+                group
+                for anchor_ecosystem, directory, group in anchors
+                if anchor_ecosystem == ecosystem and workspace.directory.is_relative_to(directory)
+            ),
+            None,
+        )
+        if owner is None:
+            anchors.append((ecosystem, workspace.directory, len(groups)))
+            groups.append([index])
+        else:
+            groups[owner].append(index)
+    for group in groups:
+        group.sort()
+    return groups
+
+
 def _format_relative(path: Path, root: Path) -> str:
     """Return ``path`` relative to ``root`` when possible.
 
@@ -713,6 +837,7 @@ __all__ = [
     "WorkspaceDiscovery",
     "WorkspaceKind",
     "WorkspacePlanner",
+    "UpdateStateStore",
     "WorkspaceUpdater",
     "ensure_lint_install",
 ]
@@ -272,6 +272,7 @@ class UpdateResult(BaseModel):
     successes: list[Workspace] = Field(default_factory=list)
     failures: list[tuple[Workspace, str]] = Field(default_factory=list)
     skipped: list[Workspace] = Field(default_factory=list)
+    unchanged: list[Workspace] = Field(default_factory=list)
     details: list[tuple[Workspace, list[ExecutionDetail]]] = Field(default_factory=list)
 
     def register_success(self, workspace: Workspace, executions: list[ExecutionDetail]) -> None:
@@ -313,6 +314,28 @@ class UpdateResult(BaseModel):
         self.skipped = [*self.skipped, workspace]
         self.details = [*self.details, (workspace, executions)]
 
+    def register_unchanged(self, workspace: Workspace) -> None:
+        """Record a workspace skipped because its manifests are unchanged.
+
+        Args:
+            workspace: Workspace whose manifest fingerprint matched the last update.
+        """
+
+        self.unchanged = [*self.unchanged, workspace]
+
+    def extend(self, other: UpdateResult) -> None:
+        """Append every outcome recorded in ``other`` to this result.
+
+        Args:
+            other: Result collected for a subset of plan items.
+        """
+
+        self.successes = [*self.successes, *other.successes]
+        self.failures = [*self.failures, *other.failures]
+        self.skipped = [*self.skipped, *other.skipped]
+        self.unchanged = [*self.unchanged, *other.unchanged]
+        self.details = [*self.details, *other.details]
+
     def exit_code(self) -> int:
         """Return ``1`` when failures were observed, otherwise ``0``.
 
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Track manifest fingerprints so unchanged workspaces can skip updates."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Final
+
+from .update_models import Workspace, WorkspaceKind
+
+UPDATE_STATE_DIRNAME: Final[str] = "update"
+UPDATE_STATE_FILENAME: Final[str] = "state.json"
+_STATE_VERSION: Final[int] = 1
+_VERSION_KEY: Final[str] = "version"
+_ENTRIES_KEY: Final[str] = "workspaces"
+_FILE_SEPARATOR: Final[bytes] = b"\0"
+
+# Manifest and lockfile names whose content determines whether an update is due.
+_FINGERPRINT_FILES: Final[Mapping[WorkspaceKind, tuple[str, ...]]] = {
+    WorkspaceKind.PYTHON: ("pyproject.toml", "uv.lock", "requirements.txt"),
+    WorkspaceKind.PNPM: ("package.json", "pnpm-lock.yaml", "pnpm-workspace.yaml"),
+    WorkspaceKind.YARN: ("package.json", "yarn.lock"),
+    WorkspaceKind.NPM: ("package.json", "package-lock.json"),
+    WorkspaceKind.GO: ("go.mod", "go.sum"),
+    WorkspaceKind.RUST: ("Cargo.toml", "Cargo.lock"),
+}
+
+# Installed artefacts that must still exist for a recorded update to count.
+_REQUIRED_ARTIFACTS: Final[Mapping[WorkspaceKind, str]] = {
+    WorkspaceKind.PYTHON: ".venv",
+    WorkspaceKind.PNPM: "node_modules",
+    WorkspaceKind.YARN: "node_modules",
+    WorkspaceKind.NPM: "node_modules",
+}
+
+
+def workspace_fingerprint(workspace: Workspace) -> str | None:
+    """Return a content hash over the manifest and lockfiles of ``workspace``.
+
+    Args:
+        workspace: Workspace whose dependency inputs should be hashed.
+
+    Returns:
+        str | None: Hex digest of the manifest inputs, or ``None`` when an
+        installed artefact required by the workspace kind is missing.
+    """
+
+    artifact = _REQUIRED_ARTIFACTS.get(workspace.kind)
+    if artifact is not None and not (workspace.directory / artifact).exists():
+        return None
+    digest = hashlib.sha256(workspace.kind.value.encode("utf-8"))
+    for name in _FINGERPRINT_FILES.get(workspace.kind, (workspace.manifest.name,)):
+        try:
+            content = (workspace.directory / name).read_bytes()
+        except OSError:
+            continue
+        digest.update(_FILE_SEPARATOR + name.encode("utf-8") + _FILE_SEPARATOR)
+        digest.update(content)
+    return digest.hexdigest()
+
+
+class UpdateStateStore:
+    """Persist fingerprints of workspaces that were last updated successfully."""
+
+    def __init__(self, path: Path, root: Path, entries: Mapping[str, str] | None = None) -> None:
+        """Initialise the store.
+
+        Args:
+            path: JSON file holding the recorded fingerprints.
+            root: Project root used to key workspaces by relative directory.
+            entries: Previously recorded fingerprints keyed by workspace.
+        """
+
+        self._path = path
+        self._root = root
+        self._entries: dict[str, str] = dict(entries or {})
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, cache_dir: Path, *, root: Path) -> UpdateStateStore:
+        """Load recorded fingerprints from ``cache_dir``.
+
+        Args:
+            cache_dir: Cache directory configured for the project.
+            root: Project root used to key workspaces.
+
+        Returns:
+            UpdateStateStore: Store populated from disk, or empty when no
+            readable state exists.
+        """
+
+        path = cache_dir / UPDATE_STATE_DIRNAME / UPDATE_STATE_FILENAME
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, root)
+        if not isinstance(payload, Mapping) or payload.get(_VERSION_KEY) != _STATE_VERSION:
+            return cls(path, root)
+        raw_entries = payload.get(_ENTRIES_KEY)
+        if not isinstance(raw_entries, Mapping):
+            return cls(path, root)
+        entries = {str(key): value for key, value in raw_entries.items() if isinstance(value, str)}
+        return cls(path, root, entries)
+
+    def is_current(self, workspace: Workspace) -> bool:
+        """Return ``True`` when ``workspace`` is unchanged since its last update.
+
+        Args:
+            workspace: Workspace about to be updated.
+
+        Returns:
+            bool: ``True`` when the recorded fingerprint matches the current one.
+        """
+
+        fingerprint = workspace_fingerprint(workspace)
+        if fingerprint is None:
+            return False
+        with self._lock:
+            return self._entries.get(self._key(workspace)) == fingerprint
+
+    def record(self, workspace: Workspace) -> None:
+        """Record the post-update fingerprint of ``workspace``.
+
+        Args:
+            workspace: Workspace whose update completed successfully.
+        """
+
+        fingerprint = workspace_fingerprint(workspace)
+        key = self._key(workspace)
+        with self._lock:
+            if fingerprint is None:
+                self._dirty = self._entries.pop(key, None) is not None or self._dirty
+                return
+            if self._entries.get(key) != fingerprint:
+                self._entries[key] = fingerprint
+                self._dirty = True
+
+    def save(self) -> None:
+        """Atomically persist recorded fingerprints when they changed."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {_VERSION_KEY: _STATE_VERSION, _ENTRIES_KEY: dict(sorted(self._entries.items()))}
+            self._dirty = False
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self._path.with_suffix(".tmp")
+            staging.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            staging.replace(self._path)
+        except OSError:
+            return
+
+    def _key(self, workspace: Workspace) -> str:
+        """Return the state key identifying ``workspace``.
+
+        Args:
+            workspace: Workspace to identify.
+
+        Returns:
+            str: ``kind:relative/path`` key stable across checkouts.
+        """
+
+        try:
+            relative = workspace.directory.relative_to(self._root).as_posix() or "."
+        except ValueError:
+            relative = workspace.directory.as_posix()
+        return f"{workspace.kind.value}:{relative}"
+
+
+__all__ = [
+    "UPDATE_STATE_DIRNAME",
+    "UPDATE_STATE_FILENAME",
+    "UpdateStateStore",
+    "workspace_fingerprint",
+]
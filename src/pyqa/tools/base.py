@@ -15,6 +15,8 @@ from tooling_spec.catalog.types import JSONValue as _CatalogJSONValue
 
 from ..config.types import ConfigValue
 from ..core.models import Diagnostic, OutputFilter, RawDiagnostic
+from ..interfaces.analysis import ChangeScopeView
+from ..interfaces.discovery import FileInventoryView
 from ..interfaces.tools import ToolConfiguration
 from ..interfaces.tools import ToolContext as ToolContextProtocol
 from .interfaces import (
@@ -102,6 +104,8 @@ class ToolContext(BaseModel):
     root: Path
     files: tuple[Path, ...] = Field(default_factory=tuple)
     settings: ToolSettingsMap = Field(default_factory=dict)
+    change_scope: ChangeScopeView | None = None
+    file_inventory: FileInventoryView | None = None
 
     @model_validator(mode="before")
     @classmethod
@@ -590,6 +594,8 @@ class Tool(BaseModel):
     languages: tuple[str, ...] = Field(default_factory=tuple)
     file_extensions: tuple[str, ...] = Field(default_factory=tuple)
     config_files: tuple[str, ...] = Field(default_factory=tuple)
+    cache_input_files: tuple[str, ...] = Field(default_factory=tuple)
+    cache_input_env: tuple[str, ...] = Field(default_factory=tuple)
     description: str = ""
     tags: tuple[str, ...] = Field(default_factory=tuple)
     auto_install: bool = False
@@ -604,6 +610,8 @@ class Tool(BaseModel):
     suppressions_general: tuple[str, ...] = Field(default_factory=tuple)
     suppressions_duplicates: tuple[str, ...] = Field(default_factory=tuple)
     installers: tuple[InstallerCallable, ...] = Field(default_factory=tuple)
+    server_clients: dict[str, str] = Field(default_factory=dict)
+    entry_points: dict[str, str] = Field(default_factory=dict)
     documentation: ToolDocumentation | None = None
 
     _actions_by_name: dict[str, ToolAction] = PrivateAttr(default_factory=dict)
@@ -757,7 +765,14 @@ class Tool(BaseModel):
 
         return iter(self.actions)
 
-    @field_validator("languages", "file_extensions", "config_files", mode="before")
+    @field_validator(
+        "languages",
+        "file_extensions",
+        "config_files",
+        "cache_input_files",
+        "cache_input_env",
+        mode="before",
+    )
     @classmethod
     def _coerce_str_tuple(
         cls,
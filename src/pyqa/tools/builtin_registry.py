@@ -76,6 +76,8 @@ class _RuntimeConfig:
     min_version: str | None
     version_command: tuple[str, ...] | None
     installers: tuple[InstallerCallable, ...]
+    server_clients: dict[str, str]
+    entry_points: dict[str, str]
 
 
 def register_catalog_tools(
@@ -185,6 +187,8 @@ def _materialize_tool(
         languages=definition.languages,
         file_extensions=definition.file_extensions,
         config_files=definition.config_files,
+        cache_input_files=definition.cache_inputs.files,
+        cache_input_env=definition.cache_inputs.env,
         description=definition.description or "",
         auto_install=definition.auto_install,
         default_enabled=definition.default_enabled,
@@ -197,6 +201,8 @@ def _materialize_tool(
         suppressions_general=suppressions_tuple.general,
         suppressions_duplicates=suppressions_tuple.duplicates,
         installers=runtime_config.installers,
+        server_clients=runtime_config.server_clients,
+        entry_points=runtime_config.entry_points,
         tags=getattr(definition, "tags", ()),
         documentation=documentation_value,
     )
@@ -619,6 +625,8 @@ def _extract_runtime(
         min_version=min_version,
         version_command=version_command,
         installers=installers,
+        server_clients=dict(runtime.server_clients) if runtime is not None else {},
+        entry_points=dict(runtime.entry_points) if runtime is not None else {},
     )
 
 
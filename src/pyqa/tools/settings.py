@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from typing import TypeAlias
 
@@ -183,7 +183,45 @@ def _schema_cache() -> ToolSettingSchema:
     return schema
 
 
-TOOL_SETTING_SCHEMA: ToolSettingSchema = _schema_cache()
+class _LazyToolSettingSchema(Mapping[str, Mapping[str, SettingField]]):
+    """Read-only view that loads the catalog-derived schema on first access.
+
+    Building the schema loads the whole tool catalog, so deferring it keeps
+    importing this module (and every CLI command depending on it) cheap.
+    """
+
+    def __getitem__(self, tool: str) -> Mapping[str, SettingField]:
+        """Return the setting definitions for ``tool``.
+
+        Args:
+            tool: Tool name.
+
+        Returns:
+            Mapping[str, SettingField]: Settings keyed by option name.
+        """
+
+        return _schema_cache()[tool]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over tool names in schema order.
+
+        Returns:
+            Iterator[str]: Tool names.
+        """
+
+        return iter(_schema_cache())
+
+    def __len__(self) -> int:
+        """Return the number of tools with settings.
+
+        Returns:
+            int: Tool count.
+        """
+
+        return len(_schema_cache())
+
+
+TOOL_SETTING_SCHEMA: ToolSettingSchema = _LazyToolSettingSchema()
 
 
 def tool_setting_schema_as_dict() -> RawToolSettingSchema:
@@ -30,9 +30,17 @@ from .schema import SchemaRepository
 from .types import JSONValue
 from .utils import expect_mapping
 
-jsonschema_module = importlib.import_module("jsonschema")
-jsonschema_exceptions: ModuleType = cast(ModuleType, jsonschema_module.exceptions)
-JsonSchemaValidationError = cast(type[Exception], getattr(jsonschema_exceptions, "ValidationError"))
+
+def _json_schema_validation_error() -> type[Exception]:
+    """Return jsonschema's ``ValidationError`` type without importing jsonschema eagerly.
+
+    Returns:
+        type[Exception]: Exception raised by jsonschema validators.
+    """
+
+    jsonschema_exceptions = cast(ModuleType, importlib.import_module("jsonschema.exceptions"))
+    return cast(type[Exception], getattr(jsonschema_exceptions, "ValidationError"))
+
 
 ValidatorKind = Literal["tool", "strategy"]
 TOOL_VALIDATOR: Final[ValidatorKind] = "tool"
@@ -210,7 +218,7 @@ class ToolCatalogLoader:
             raise ValueError(f"unknown validator kind '{validator}'")
         try:
             schema_validator.validate(document)
-        except JsonSchemaValidationError as exc:
+        except _json_schema_validation_error() as exc:
             raise CatalogValidationError(f"{path}: {exc}") from exc
 
 
@@ -99,6 +99,8 @@ class RuntimeDefinition:
     version_command: tuple[str, ...]
     binaries: Mapping[str, str]
     install: RuntimeInstallDefinition | None
+    server_clients: Mapping[str, str]
+    entry_points: Mapping[str, str]
 
     @staticmethod
     def from_mapping(data: Mapping[str, JSONValue], *, context: str) -> RuntimeDefinition:
@@ -134,6 +136,8 @@ class RuntimeDefinition:
             context=context,
         )
         binaries_value = string_mapping(data.get("binaries"), key="binaries", context=context)
+        server_clients_value = string_mapping(data.get("serverClients"), key="serverClients", context=context)
+        entry_points_value = string_mapping(data.get("entryPoints"), key="entryPoints", context=context)
         install_data = data.get("install")
         install_value = (
             RuntimeInstallDefinition.from_mapping(
@@ -151,6 +155,8 @@ class RuntimeDefinition:
             version_command=version_command_value,
             binaries=binaries_value,
             install=install_value,
+            server_clients=server_clients_value,
+            entry_points=entry_points_value,
         )
 
 
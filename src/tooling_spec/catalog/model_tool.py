@@ -56,12 +56,21 @@ class ToolOrdering:
     after: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class ToolCacheInputs:
+    """Inputs beyond the linted files that influence a tool's output."""
+
+    files: tuple[str, ...] = ()
+    env: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True, slots=True)
 class ToolFiles:
     """File extension and config file metadata for a tool."""
 
     file_extensions: tuple[str, ...]
     config_files: tuple[str, ...]
+    cache_inputs: ToolCacheInputs = ToolCacheInputs()
 
 
 @dataclass(frozen=True, slots=True)
@@ -221,6 +230,15 @@ class ToolDefinition:
         """
         return self.metadata.files.config_files
 
+    @property
+    def cache_inputs(self) -> ToolCacheInputs:
+        """Return the configuration inputs fingerprinted into result cache keys.
+
+        Returns:
+            ToolCacheInputs: File patterns and environment variables read by the tool.
+        """
+        return self.metadata.files.cache_inputs
+
     @property
     def diagnostics_bundle(self) -> DiagnosticsBundle:
         """Return diagnostics metadata associated with the tool.
@@ -404,6 +422,7 @@ def parse_tool_metadata(
             key="configFiles",
             context=context,
         ),
+        cache_inputs=_parse_cache_inputs(data.get("cacheInputs"), context=context),
     )
     return ToolMetadata(
         schema_version=schema_version,
@@ -414,6 +433,29 @@ def parse_tool_metadata(
     )
 
 
+def _parse_cache_inputs(value: JSONValue | None, *, context: str) -> ToolCacheInputs:
+    """Return the cache inputs declared by a tool definition.
+
+    Args:
+        value: Raw ``cacheInputs`` value, or ``None`` when absent.
+        context: Human-readable context used in error messages.
+
+    Returns:
+        ToolCacheInputs: Declared file patterns and environment variables.
+
+    Raises:
+        CatalogIntegrityError: If ``cacheInputs`` is not an object of string arrays.
+    """
+
+    if value is None:
+        return ToolCacheInputs()
+    mapping = expect_mapping(value, key="cacheInputs", context=context)
+    return ToolCacheInputs(
+        files=string_array(mapping.get("files"), key="cacheInputs.files", context=context),
+        env=string_array(mapping.get("env"), key="cacheInputs.env", context=context),
+    )
+
+
 def parse_runtime_definition(
     data: Mapping[str, JSONValue],
     *,
@@ -477,6 +519,7 @@ def parse_documentation_bundle(
 
 TOOL_MODEL_EXPORTS: Final[tuple[str, ...]] = (
     "ToolBehaviour",
+    "ToolCacheInputs",
     "ToolComponents",
     "ToolDefinition",
     "ToolFiles",
@@ -602,6 +645,7 @@ class ToolMetadataParser(Protocol):
 
 ToolModelObject: TypeAlias = (
     type[ToolBehaviour]
+    | type[ToolCacheInputs]
     | type[ToolComponents]
     | type[ToolDefinition]
     | type[ToolFiles]
@@ -625,6 +669,7 @@ def _tool_model_objects() -> tuple[ToolModelObject, ...]:
         tuple[ToolModelObject, ...],
         (
             ToolBehaviour,
+            ToolCacheInputs,
             ToolComponents,
             ToolDefinition,
             ToolFiles,
@@ -51,6 +51,7 @@ StrategyReference = _model_references.StrategyReference
 StrategyType = _model_strategy.StrategyType
 SuppressionsDefinition = _model_diagnostics.SuppressionsDefinition
 ToolBehaviour = _model_tool.ToolBehaviour
+ToolCacheInputs = _model_tool.ToolCacheInputs
 ToolComponents = _model_tool.ToolComponents
 ToolDefinition = _model_tool.ToolDefinition
 ToolFiles = _model_tool.ToolFiles
@@ -65,6 +66,7 @@ parse_tool_metadata = _model_tool.parse_tool_metadata
 
 _EXPECTED_TOOL_MODEL_OBJECTS = {
     "ToolBehaviour": ToolBehaviour,
+    "ToolCacheInputs": ToolCacheInputs,
     "ToolComponents": ToolComponents,
     "ToolDefinition": ToolDefinition,
     "ToolFiles": ToolFiles,
@@ -136,6 +138,7 @@ __all__ = (
     "StrategyType",
     "SuppressionsDefinition",
     "ToolBehaviour",
+    "ToolCacheInputs",
     "ToolComponents",
     "ToolDefinition",
     "ToolFiles",
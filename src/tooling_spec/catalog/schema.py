@@ -85,8 +85,14 @@ class SchemaValidator(Protocol):
 SchemaValidatorFactory = Callable[[JSONValue], SchemaValidator]
 
 
-jsonschema_module = importlib.import_module("jsonschema")
-Draft202012Validator = cast(SchemaValidatorFactory, jsonschema_module.Draft202012Validator)
+def _draft_validator_factory() -> SchemaValidatorFactory:
+    """Return jsonschema's Draft 2020-12 validator, importing jsonschema on first use.
+
+    Returns:
+        SchemaValidatorFactory: Validator class used to compile catalog schemas.
+    """
+
+    return cast(SchemaValidatorFactory, importlib.import_module("jsonschema").Draft202012Validator)
 
 
 @dataclass(slots=True)
@@ -113,10 +119,11 @@ class SchemaRepository:
         strategy_schema_path = resolved_root / "strategy_definition.schema.json"
         tool_schema = load_schema(tool_schema_path)
         strategy_schema = load_schema(strategy_schema_path)
+        validator_factory = _draft_validator_factory()
         return cls(
             schema_root=resolved_root,
-            tool_validator=Draft202012Validator(tool_schema),
-            strategy_validator=Draft202012Validator(strategy_schema),
+            tool_validator=validator_factory(tool_schema),
+            strategy_validator=validator_factory(strategy_schema),
         )
 
 
@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the binary cache entry codec."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pyqa.cache.codec import (
+    CODEC_MAGIC,
+    CodecError,
+    decode_entry,
+    encode_candidates_entry,
+    encode_outcome_entry,
+)
+from pyqa.cache.result_store import CacheRequest, ResultCache
+from pyqa.core.metrics import FileMetrics
+from pyqa.core.models import Diagnostic, RawDiagnostic, ToolExitCategory, ToolOutcome
+from pyqa.core.severity import Severity
+
+
+def _diagnostic(**overrides: object) -> Diagnostic:
+    fields: dict[str, object] = {
+        "file": "src/app.py",
+        "line": 3,
+        "column": 7,
+        "severity": Severity.ERROR,
+        "message": "bad thing",
+        "tool": "demo",
+        "code": "E100",
+    }
+    fields.update(overrides)
+    return Diagnostic.model_validate(fields)
+
+
+def test_outcome_entry_roundtrip_preserves_every_field() -> None:
+    outcome = ToolOutcome(
+        tool="demo",
+        action="lint",
+        returncode=1,
+        stdout=["line one", "line two"],
+        stderr=["warning"],
+        diagnostics=[
+            _diagnostic(
+                group="imports",
+                function="main",
+                hints=("remove it",),
+                tags=("style", "fixable"),
+                meta={"url": "https://example.invalid", "fix": {"edits": [1, 2]}, "flag": None},
+            ),
+            _diagnostic(file=None, line=None, column=None, code=None, severity=Severity.NOTE),
+        ],
+        exit_category=ToolExitCategory.DIAGNOSTIC,
+    )
+    metrics = {"src/app.py": FileMetrics(line_count=12, suppressions={"noqa": 2})}
+
+    entry = decode_entry(encode_outcome_entry(outcome, files=[("/repo/src/app.py", 10, 20)], file_metrics=metrics))
+
+    assert entry.files == (("/repo/src/app.py", 10, 20),)
+    assert entry.file_metrics["src/app.py"].line_count == 12
+    assert entry.file_metrics["src/app.py"].suppressions["noqa"] == 2
+    assert entry.outcome().model_dump() == outcome.model_dump()
+
+
+def test_candidates_entry_roundtrip_preserves_order_and_severity_types() -> None:
+    candidates = (
+        RawDiagnostic(file="a.py", line=1, column=None, severity="warning", message="raw text", code="R1"),
+        _diagnostic(),
+        RawDiagnostic(file=None, line=None, column=None, severity=Severity.ERROR, message="enum", code=None),
+        RawDiagnostic(file="b.py", line=2, column=4, severity=None, message="none", code=None, tool="x"),
+    )
+
+    restored = decode_entry(encode_candidates_entry(candidates)).candidates()
+
+    assert [type(item) for item in restored] == [type(item) for item in candidates]
+    assert [item.model_dump() for item in restored] == [item.model_dump() for item in candidates]
+    assert isinstance(restored[0].severity, str) and not isinstance(restored[0].severity, Severity)
+    assert restored[2].severity is Severity.ERROR
+
+
+def test_decode_rejects_foreign_payloads() -> None:
+    payload = encode_candidates_entry(())
+
+    with pytest.raises(CodecError):
+        decode_entry(b'{"files": []}')
+    with pytest.raises(CodecError):
+        decode_entry(CODEC_MAGIC + bytes([payload[len(CODEC_MAGIC)] + 1]) + payload[len(CODEC_MAGIC) + 1 :])
+    with pytest.raises(CodecError):
+        decode_entry(payload).outcome()
+
+
+def test_result_cache_roundtrips_parser_candidates(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / ".cache")
+    request = CacheRequest(tool="demo:parser", action="lint", command=("demo", "digest"), files=(), token="t")
+    candidates = (_diagnostic(), RawDiagnostic(file="a.py", line=1, column=1, severity="error", message="m"))
+
+    assert cache.load_candidates(request) is None
+    cache.store_candidates(request, candidates)
+
+    restored = cache.load_candidates(request)
+    assert restored is not None
+    assert [item.model_dump() for item in restored] == [item.model_dump() for item in candidates]
+    assert cache.load(request) is None
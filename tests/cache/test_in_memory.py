@@ -3,9 +3,13 @@
 
 from __future__ import annotations
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from pyqa.cache import ttl_cache
+import pytest
+
+from pyqa.cache import memoize, ttl_cache
 
 
 def test_ttl_cache_caches_until_expiry(monkeypatch):
@@ -39,3 +43,83 @@ def test_ttl_cache_clear():
     compute.cache_clear()
     compute(3)
     assert calls["count"] == 2
+
+
+def test_memoize_single_flight_and_negative_caching():
+    """Concurrent misses share one computation and ``None`` results stay cached."""
+
+    calls = {"count": 0}
+    started = threading.Event()
+    release = threading.Event()
+
+    @memoize(maxsize=8)
+    def slow(value: int) -> int | None:
+        calls["count"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return None
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(slow, 1) for _ in range(4)]
+        started.wait(timeout=5)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [None] * 4
+    assert slow(1) is None
+    assert calls["count"] == 1
+    metadata = slow.cache_metadata()
+    assert metadata.misses == 1
+    assert metadata.hits >= 1
+
+
+def test_memoize_failures_are_not_cached():
+    """Exceptions propagate to the caller and the next call retries."""
+
+    calls = {"count": 0}
+
+    @memoize()
+    def flaky() -> str:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        flaky()
+    assert flaky() == "ok"
+    assert calls["count"] == 2
+
+
+def test_memoize_evicts_by_byte_budget():
+    """Entries beyond the approximate byte budget are evicted oldest first."""
+
+    @memoize(max_bytes=3000)
+    def payload(value: int) -> str:
+        return str(value) * 1000
+
+    for value in range(1, 5):
+        payload(value)
+
+    metadata = payload.cache_metadata()
+    assert metadata.current_bytes <= 3000
+    assert metadata.evictions == 2
+    assert metadata.current_size == 2
+
+
+def test_ttl_cache_sweeps_expired_entries():
+    """Inserting after the TTL elapses drops every expired entry."""
+
+    @ttl_cache(ttl_seconds=0.05)
+    def compute(value: int) -> int:
+        return value
+
+    compute(1)
+    compute(2)
+    time.sleep(0.06)
+    compute(3)
+
+    metadata = compute.cache_metadata()
+    assert metadata.current_size == 1
+    assert metadata.expirations == 2
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for result cache garbage collection and usage statistics."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pyqa.cache.maintenance import (
+    GC_MARKER_FILE,
+    CacheBudget,
+    ToolCacheUsage,
+    cache_stats,
+    collect_garbage,
+    load_usage,
+    maybe_collect_garbage,
+    record_usage,
+)
+from pyqa.cache.result_store import CacheRequest, ResultCache
+from pyqa.core.models import ToolOutcome
+
+_NOW = 1_000_000.0
+
+
+def _write_entry(directory: Path, index: int, *, size: int, age: float) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{index:064x}.bin"
+    path.write_bytes(b"x" * size)
+    os.utime(path, (_NOW - age, _NOW - age))
+    return path
+
+
+def test_collect_garbage_evicts_expired_then_least_recently_used(tmp_path: Path) -> None:
+    expired = _write_entry(tmp_path, 1, size=10, age=500)
+    oldest = _write_entry(tmp_path / "remote", 2, size=40, age=300)
+    newer = _write_entry(tmp_path, 3, size=40, age=100)
+    (tmp_path / "tools").mkdir()
+    tool_file = _write_entry(tmp_path / "tools", 4, size=10, age=900)
+
+    report = collect_garbage(tmp_path, CacheBudget(max_bytes=50, max_age_seconds=400), now=_NOW)
+
+    assert (report.scanned, report.removed, report.freed_bytes, report.remaining_bytes) == (3, 2, 50, 40)
+    assert not expired.exists() and not oldest.exists()
+    assert newer.exists() and tool_file.exists()
+
+
+def test_collect_garbage_dry_run_keeps_entries(tmp_path: Path) -> None:
+    entry = _write_entry(tmp_path, 1, size=10, age=500)
+
+    report = collect_garbage(tmp_path, CacheBudget(max_age_seconds=10), now=_NOW, dry_run=True)
+
+    assert report.removed == 1
+    assert entry.exists()
+
+
+def test_maybe_collect_garbage_is_throttled(tmp_path: Path) -> None:
+    _write_entry(tmp_path, 1, size=10, age=500)
+    budget = CacheBudget(max_age_seconds=10)
+
+    assert maybe_collect_garbage(tmp_path, budget, interval=3600) is not None
+    assert (tmp_path / GC_MARKER_FILE).exists()
+    assert maybe_collect_garbage(tmp_path, budget, interval=3600) is None
+
+
+def test_cache_stats_reports_entries_per_tool_and_hit_rates(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path)
+    for index, tool in enumerate(("ruff", "ruff", "mypy")):
+        request = CacheRequest(tool=tool, action="lint", command=(tool, str(index)), files=(), token="t")
+        cache.store(request, outcome=ToolOutcome(tool=tool, action="lint", returncode=0, stdout=[], stderr=[]))
+    record_usage(tmp_path, {"ruff": ToolCacheUsage(hits=3, misses=1)})
+    record_usage(tmp_path, {"ruff": ToolCacheUsage(hits=1, misses=3), "mypy": ToolCacheUsage(misses=2)})
+
+    stats = cache_stats(tmp_path)
+
+    assert stats.entries == 3
+    assert stats.entries_by_tool == {"ruff": 2, "mypy": 1}
+    assert load_usage(tmp_path)["ruff"].hit_rate == 0.5
+    assert stats.usage["mypy"].hit_rate == 0.0
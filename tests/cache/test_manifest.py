@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the bounded JSON manifests backing cache metadata."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pyqa.cache.manifest import load_manifest, record_recent, save_manifest
+
+
+def test_save_manifest_keeps_most_recently_recorded_entries(tmp_path: Path) -> None:
+    entries: dict[str, int] = {}
+    for index in range(5):
+        record_recent(entries, f"k{index}", index)
+    assert record_recent(entries, "k0", 0) is False
+    assert record_recent(entries, "k1", 10) is True
+
+    path = tmp_path / "nested" / "manifest.json"
+    save_manifest(path, entries, max_entries=3)
+
+    assert load_manifest(path) == {"k3": 3, "k4": 4, "k1": 10}
+
+
+def test_load_manifest_ignores_invalid_documents(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    assert load_manifest(path) == {}
+
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert load_manifest(path) == {}
+
+    path.write_text("{not json", encoding="utf-8")
+    assert load_manifest(path) == {}
@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the shared remote result cache client and server."""
+
+from __future__ import annotations
+
+import errno
+import gzip
+import http.client
+import threading
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from pyqa.cache.remote import RemoteCacheClient, RemoteCacheSettings, RemoteResultCache, remote_cache_key
+from pyqa.cache.result_store import CacheRequest, ResultCache
+from pyqa.cache.server import MAX_BODY_BYTES, RemoteCacheServer, create_server
+from pyqa.core.models import Diagnostic, ToolOutcome
+from pyqa.core.severity import Severity
+
+_TOKEN = "s3cret"
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[RemoteCacheServer]:
+    """Run a token-protected cache server on an ephemeral port."""
+
+    instance = create_server(tmp_path / "remote", port=0, token=_TOKEN)
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield instance
+    finally:
+        instance.shutdown()
+        instance.server_close()
+
+
+def _url(server: RemoteCacheServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host!s}:{port}"
+
+
+def _put(server: RemoteCacheServer, body: bytes, headers: dict[str, str]) -> int:
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(str(host), port, timeout=10)
+    try:
+        connection.putrequest("PUT", f"/v1/entries/{'a' * 64}", skip_accept_encoding=True)
+        connection.putheader("Authorization", f"Bearer {_TOKEN}")
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+def _checkout(base: Path, content: str) -> tuple[Path, CacheRequest]:
+    root = base.resolve()
+    source = root / "src" / "app.py"
+    source.parent.mkdir(parents=True)
+    source.write_text(content, encoding="utf-8")
+    request = CacheRequest(
+        tool="demo",
+        action="lint",
+        command=("demo", str(source)),
+        files=(source,),
+        token="token",
+        version="1.0",
+    )
+    return root, request
+
+
+def _layered(root: Path, url: str, *, token: str | None = _TOKEN) -> RemoteResultCache:
+    client = RemoteCacheClient(RemoteCacheSettings(url=url, token=token, max_failures=1))
+    return RemoteResultCache(ResultCache(root / ".lint-cache"), client, root=root)
+
+
+def _outcome() -> ToolOutcome:
+    return ToolOutcome(
+        tool="demo",
+        action="lint",
+        returncode=1,
+        stdout="",
+        stderr="",
+        diagnostics=[
+            Diagnostic(file="src/app.py", line=1, column=1, severity=Severity.ERROR, message="boom", tool="demo"),
+        ],
+    )
+
+
+def test_remote_cache_shares_outcomes_between_checkouts(tmp_path: Path, server: RemoteCacheServer) -> None:
+    """Entries uploaded from one checkout are hits for an identical checkout elsewhere."""
+
+    producer_root, producer_request = _checkout(tmp_path / "runner-a", "print('hi')\n")
+    consumer_root, consumer_request = _checkout(tmp_path / "runner-b", "print('hi')\n")
+    assert remote_cache_key(producer_request, producer_root) == remote_cache_key(consumer_request, consumer_root)
+
+    producer = _layered(producer_root, _url(server))
+    producer.store(producer_request, outcome=_outcome())
+    producer.flush()
+    assert producer.stats.uploads == 1
+
+    consumer = _layered(consumer_root, _url(server))
+    entry = consumer.load(consumer_request)
+
+    assert entry is not None
+    assert entry.outcome.cached is True
+    assert entry.outcome.diagnostics[0].message == "boom"
+    assert consumer.stats.hits == 1
+    assert ResultCache(consumer_root / ".lint-cache").load(consumer_request) is not None
+
+
+def test_remote_cache_key_covers_tool_version(tmp_path: Path) -> None:
+    """Runners resolving different tool versions never share entries."""
+
+    root, request = _checkout(tmp_path / "runner", "print('hi')\n")
+    upgraded = replace(request, version="2.0")
+
+    assert remote_cache_key(request, root) != remote_cache_key(upgraded, root)
+    assert remote_cache_key(replace(request, version=None), root) is None
+
+
+def test_remote_cache_key_strips_root_only_as_whole_path_prefix(tmp_path: Path) -> None:
+    """Sibling paths sharing the root as a string prefix are kept verbatim."""
+
+    root, request = _checkout(tmp_path / "repo", "print('hi')\n")
+    moved_root, moved = _checkout(tmp_path / "elsewhere", "print('hi')\n")
+    inside = replace(request, command=("demo", f"--config={root}/setup.cfg"))
+    moved_inside = replace(moved, command=("demo", f"--config={moved_root}/setup.cfg"))
+    sibling = replace(request, command=("demo", f"{root}x/setup.cfg"), files=())
+
+    assert remote_cache_key(inside, root) == remote_cache_key(moved_inside, moved_root)
+    assert remote_cache_key(sibling, root) == remote_cache_key(sibling, moved_root)
+
+
+def test_remote_cache_misses_when_content_differs(tmp_path: Path, server: RemoteCacheServer) -> None:
+    """Changing file contents yields a different key and therefore a miss."""
+
+    producer_root, producer_request = _checkout(tmp_path / "runner-a", "print('hi')\n")
+    consumer_root, consumer_request = _checkout(tmp_path / "runner-b", "print('bye')\n")
+
+    producer = _layered(producer_root, _url(server))
+    producer.store(producer_request, outcome=_outcome())
+    producer.flush()
+
+    consumer = _layered(consumer_root, _url(server))
+    assert consumer.load(consumer_request) is None
+    assert consumer.stats.misses == 1
+
+
+def test_remote_cache_disables_itself_after_rejected_requests(tmp_path: Path, server: RemoteCacheServer) -> None:
+    """Authentication failures degrade to local-only caching instead of failing."""
+
+    root, request = _checkout(tmp_path / "runner", "print('hi')\n")
+    cache = _layered(root, _url(server), token="wrong")
+
+    cache.store(request, outcome=_outcome())
+    cache.flush()
+
+    assert cache.stats.errors == 1
+    assert cache.stats.uploads == 0
+    assert cache.load(request) is not None
+
+
+def test_remote_server_rejects_gzip_bombs(server: RemoteCacheServer) -> None:
+    """Compressed bodies that inflate beyond the size limit are refused."""
+
+    bomb = gzip.compress(b"\0" * (MAX_BODY_BYTES + 1))
+
+    status = _put(server, bomb, {"Content-Length": str(len(bomb)), "Content-Encoding": "gzip"})
+
+    assert len(bomb) < MAX_BODY_BYTES
+    assert status == http.client.REQUEST_ENTITY_TOO_LARGE
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        pytest.param({}, http.client.LENGTH_REQUIRED, id="missing"),
+        pytest.param({"Content-Length": "lots"}, http.client.BAD_REQUEST, id="malformed"),
+        pytest.param({"Content-Length": "-1"}, http.client.BAD_REQUEST, id="negative"),
+    ],
+)
+def test_remote_server_validates_content_length(
+    server: RemoteCacheServer,
+    headers: dict[str, str],
+    expected: int,
+) -> None:
+    """Missing or unparsable ``Content-Length`` headers get a 4xx response."""
+
+    assert _put(server, b"", headers) == expected
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        pytest.param(errno.ENOSPC, http.client.INSUFFICIENT_STORAGE, id="disk-full"),
+        pytest.param(errno.EACCES, http.client.INTERNAL_SERVER_ERROR, id="other"),
+    ],
+)
+def test_remote_server_reports_store_write_failures(
+    server: RemoteCacheServer,
+    monkeypatch: pytest.MonkeyPatch,
+    error: int,
+    expected: int,
+) -> None:
+    """Write failures in the backing store surface as 5xx responses."""
+
+    def _fail(key: str, compressed: bytes) -> None:
+        raise OSError(error, "write failed")
+
+    monkeypatch.setattr(server.store, "write", _fail)
+
+    assert _put(server, b"{}", {"Content-Length": "2"}) == expected
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the project module index shared by import-aware linters."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from pyqa.discovery.inventory import FileInventory
+from pyqa.linting import _module_index
+from pyqa.linting._module_index import MODULE_INDEX_FILE, module_index_for
+
+
+def _project(tmp_path: Path) -> tuple[Path, list[Path]]:
+    root = tmp_path.resolve()
+    package = root / "src" / "pyqa"
+    (package / "interfaces").mkdir(parents=True)
+    files = [
+        package / "__init__.py",
+        package / "impl.py",
+        package / "interfaces" / "__init__.py",
+        root / "scripts" / "tool.pyi",
+    ]
+    (root / "scripts").mkdir()
+    for path in files:
+        path.write_text("", encoding="utf-8")
+    return root, files
+
+
+class _InventoryState(SimpleNamespace):
+    """Stand-in state handing out inventory-scoped copies like ``PreparedLintState``."""
+
+    def with_file_inventory(self, file_inventory: FileInventory) -> _InventoryState:
+        return _InventoryState(**{**vars(self), "file_inventory": file_inventory})
+
+
+def _state(root: Path, files: list[Path] | None) -> _InventoryState:
+    return _InventoryState(
+        root=root,
+        file_inventory=FileInventory.from_paths(root, files) if files is not None else None,
+        change_scope=None,
+        run_cache={},
+        options=SimpleNamespace(
+            target_options=SimpleNamespace(root=root, paths=[], dirs=[], exclude=[]),
+            execution_options=SimpleNamespace(runtime=SimpleNamespace(cache_dir=Path(".lint-cache"), no_cache=False)),
+        ),
+    )
+
+
+def test_module_index_resolves_modules_and_packages_from_inventory(tmp_path: Path) -> None:
+    """Module and package names resolve against every search root."""
+
+    root, files = _project(tmp_path)
+    index = module_index_for(_state(root, files))
+
+    assert index.contains("pyqa.impl")
+    assert index.contains("src.pyqa.interfaces")
+    assert index.contains("pyqa")
+    assert index.contains("tool")
+    assert not index.contains("pyqa.missing")
+    assert index.module_name(root / "src" / "pyqa" / "impl.py", root) == "pyqa.impl"
+    assert module_index_for(_state(root, files)) is not index
+
+
+def test_module_index_is_shared_through_the_run_cache(tmp_path: Path) -> None:
+    """Linters of one run share the index; a new inventory gets a fresh one."""
+
+    root, files = _project(tmp_path)
+    state = _state(root, files)
+    index = module_index_for(state)
+
+    assert module_index_for(state) is index
+    state.file_inventory = FileInventory.from_paths(root, files)
+    assert module_index_for(state) is not index
+
+
+def _backdate(root: Path) -> None:
+    for directory, _dirnames, _filenames in os.walk(root):
+        os.utime(directory, ns=(0, 1_000_000_000))
+
+
+def test_walked_module_index_is_persisted_until_a_directory_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without an inventory the walked index is reused while directory mtimes hold."""
+
+    root, _files = _project(tmp_path)
+    (root / ".lint-cache").mkdir()
+    _backdate(root)
+    first = module_index_for(_state(root, None))
+    assert (root / ".lint-cache" / MODULE_INDEX_FILE).is_file()
+
+    real_build = _module_index._build_index
+
+    def _fail_build(*args: object) -> None:
+        raise AssertionError("index rebuilt despite unchanged layout")
+
+    monkeypatch.setattr(_module_index, "_build_index", _fail_build)
+    second = module_index_for(_state(root, None))
+
+    assert second.modules == first.modules
+    assert dict(second.names_by_path) == dict(first.names_by_path)
+
+    monkeypatch.setattr(_module_index, "_build_index", real_build)
+    (root / "src" / "pyqa" / "added.py").write_text("", encoding="utf-8")
+    assert module_index_for(_state(root, None)).contains("pyqa.added")
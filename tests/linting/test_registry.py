@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the internal linter registry adapters."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from pyqa.config import Config
+from pyqa.core.models import ToolOutcome
+from pyqa.discovery.inventory import FileInventory
+from pyqa.linting.base import InternalLintReport, as_internal_runner
+from pyqa.linting.registry import INTERNAL_LINTERS, _wrap_internal_runner
+from pyqa.tools.base import ToolContext
+
+
+class _InventoryState(SimpleNamespace):
+    """Stand-in state handing out inventory-scoped copies like ``PreparedLintState``."""
+
+    def with_file_inventory(self, file_inventory: FileInventory) -> _InventoryState:
+        return _InventoryState(**{**vars(self), "file_inventory": file_inventory})
+
+
+def test_internal_runner_receives_scoped_inventory_copy(tmp_path: Path) -> None:
+    """The shared state is never mutated; each runner gets its own scoped copy."""
+
+    shared = _InventoryState(file_inventory=None)
+    seen: list[object] = []
+
+    def _record(state, emit_to_logger):
+        seen.append(state)
+        outcome = ToolOutcome(tool="x", action="check", returncode=0, stdout=[], stderr=[], diagnostics=[])
+        return InternalLintReport(outcome=outcome, files=())
+
+    action = _wrap_internal_runner(INTERNAL_LINTERS[0], shared, as_internal_runner("record", _record))
+    inventory = FileInventory.from_paths(tmp_path, [])
+
+    action(ToolContext(cfg=Config(), root=tmp_path, file_inventory=inventory))
+
+    assert shared.file_inventory is None
+    assert seen[0] is not shared
+    assert seen[0].file_inventory is inventory
@@ -14,6 +14,7 @@ from typing import cast
 
 import pytest
 
+from pyqa.discovery.inventory import FileInventory
 from pyqa.interfaces.linting import PreparedLintState
 
 
@@ -42,6 +43,13 @@ def _collect_target_files() -> Callable[[PreparedLintState], list[Path]]:
 collect_target_files = _collect_target_files()
 
 
+class _InventoryState(SimpleNamespace):
+    """Stand-in state handing out inventory-scoped copies like ``PreparedLintState``."""
+
+    def with_file_inventory(self, file_inventory: FileInventory) -> _InventoryState:
+        return _InventoryState(**{**vars(self), "file_inventory": file_inventory})
+
+
 def _build_state(
     *,
     root: Path,
@@ -49,6 +57,7 @@ def _build_state(
     dirs: list[Path] | None = None,
     exclude: list[Path] | None = None,
     include_dotfiles: bool = False,
+    file_inventory: FileInventory | None = None,
 ) -> PreparedLintState:
     """Build a minimal stand-in resembling :class:`PreparedLintState`.
 
@@ -57,6 +66,7 @@ def _build_state(
         paths: Optional list of user-specified paths.
         dirs: Optional list of directories supplied via CLI flags.
         exclude: Optional list of exclusion paths.
+        file_inventory: Optional inventory shared by the orchestrator.
 
     Returns:
         PreparedLintState: Stand-in object containing only the attributes required
@@ -72,7 +82,7 @@ def _build_state(
         include_dotfiles=include_dotfiles,
     )
     options = SimpleNamespace(target_options=target_options)
-    state = SimpleNamespace(options=options)
+    state = _InventoryState(options=options, file_inventory=file_inventory)
     return cast("PreparedLintState", state)
 
 
@@ -149,3 +159,32 @@ def test_collect_target_files_includes_dotfiles_when_requested(tmp_path: Path) -
     state = _build_state(root=root, paths=[hidden], include_dotfiles=True)
 
     assert collect_target_files(state) == [hidden.resolve()]
+
+
+def test_collect_target_files_selects_from_shared_inventory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure a shared inventory replaces directory walks while keeping filters."""
+
+    root = (tmp_path / "workspace").resolve()
+    (root / "pkg" / "build_cache").mkdir(parents=True)
+    (root / "other").mkdir()
+    kept = root / "pkg" / "module.py"
+    files = [
+        kept,
+        root / "pkg" / "notes.md",
+        root / "pkg" / "build_cache" / "generated.py",
+        root / "other" / "script.py",
+    ]
+    for file_path in files:
+        file_path.write_text("", encoding="utf-8")
+
+    def _fail_walk(self: Path, pattern: str) -> None:
+        raise AssertionError(f"unexpected tree walk of {self}")
+
+    monkeypatch.setattr(Path, "rglob", _fail_walk)
+    state = _build_state(
+        root=root,
+        dirs=[root / "pkg"],
+        file_inventory=FileInventory.from_paths(root, files),
+    )
+
+    assert collect_target_files(state, extensions={".py"}) == [kept]
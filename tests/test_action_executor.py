@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import sys
+import time
 from collections.abc import Iterable, Sequence
 from pathlib import Path
 from subprocess import CompletedProcess
@@ -21,7 +23,10 @@ from pyqa.orchestration.action_executor import (
     ExecutionEnvironment,
     ExecutionState,
     OutcomeRecord,
+    ScheduledAction,
+    wrap_runner,
 )
+from pyqa.orchestration.worker import run_command
 from pyqa.tools.base import ActionExitCodes, DeferredCommand, ToolAction, ToolContext
 
 
@@ -261,3 +266,46 @@ def test_tool_failure_category_overrides_diagnostics(tmp_path: Path) -> None:
     assert outcome.exit_category == ToolExitCategory.TOOL_FAILURE
     assert outcome.diagnostics
     assert outcome.indicates_failure()
+
+
+def _python_invocation(cfg: Config, root: Path, name: str, source: str) -> ActionInvocation:
+    command = (sys.executable, "-c", source)
+    action = ToolAction(name="lint", command=DeferredCommand(command), append_files=False)
+    return ActionInvocation(
+        tool_name=name,
+        action=action,
+        context=ToolContext(cfg=cfg, root=root),
+        command=command,
+        env_overrides={},
+    )
+
+
+def test_parallel_bail_cancels_in_flight_actions(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    cfg, environment = _build_environment(tmp_path)
+    cfg.execution.bail = True
+    cfg.execution.jobs = 2
+    monkeypatch.setattr("pyqa.orchestration.action_executor.warn", lambda *_args, **_kwargs: None)
+    state = ExecutionState(
+        scheduled=[
+            ScheduledAction(
+                order=0, invocation=_python_invocation(cfg, tmp_path, "slow", "import time; time.sleep(60)")
+            ),
+            ScheduledAction(order=1, invocation=_python_invocation(cfg, tmp_path, "broken", "raise SystemExit(3)")),
+            ScheduledAction(
+                order=2, invocation=_python_invocation(cfg, tmp_path, "queued", "import time; time.sleep(60)")
+            ),
+        ],
+    )
+    executor = ActionExecutor(
+        runner=wrap_runner(run_command),
+        after_tool_hook=None,
+        context_resolver=_NullContextResolver(),
+    )
+
+    started = time.monotonic()
+    executor.execute_scheduled(environment, state)
+
+    assert time.monotonic() - started < 30
+    assert state.bail_triggered
+    assert environment.cancellation.cancelled
+    assert [outcome.tool for outcome in state.outcomes.values()] == ["broken"]
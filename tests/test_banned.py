@@ -9,7 +9,7 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from pyqa.cli.app import app
-from pyqa.compliance.banned import BannedWordChecker
+from pyqa.compliance.banned import BannedTermMatcher, BannedWordChecker
 
 
 def test_checker_detects_terms(tmp_path: Path) -> None:
@@ -45,3 +45,37 @@ def test_check_banned_words_cli_ok(tmp_path: Path) -> None:
 
     assert result.exit_code == 0
     assert "No banned words" in result.stdout
+
+
+def test_checker_reports_line_numbers_for_each_hit(tmp_path: Path) -> None:
+    (tmp_path / ".banned-words").write_text("# comment\nLegacy Term\n", encoding="utf-8")
+    checker = BannedWordChecker(root=tmp_path, personal_list=tmp_path / "missing", default_terms=["quick hack"])
+
+    hits = checker.scan_hits(["first line", "a QUICK HACK around a legacy term", "legacy terms again"])
+
+    assert [(hit.term, hit.line) for hit in hits] == [
+        ("quick hack", 2),
+        ("Legacy Term", 2),
+        ("Legacy Term", 3),
+    ]
+
+
+def test_checker_persists_compiled_matcher(tmp_path: Path) -> None:
+    repo_list = tmp_path / ".banned-words"
+    repo_list.write_text("alpha\n", encoding="utf-8")
+    checker = BannedWordChecker(root=tmp_path, personal_list=tmp_path / "missing", default_terms=())
+
+    assert checker.scan(["alpha beta"]) == ["alpha"]
+    cache_entries = list((tmp_path / ".lint-cache" / "banned-words").glob("*.json"))
+    assert len(cache_entries) == 1
+
+    repo_list.write_text("alpha\nbeta-gamma\n", encoding="utf-8")
+    assert checker.scan(["alpha beta-gamma"]) == ["alpha", "beta-gamma"]
+
+
+def test_matcher_handles_overlapping_terms() -> None:
+    matcher = BannedTermMatcher.build(["he", "hers", "she"])
+
+    hits = list(matcher.iter_hits(["ushers"]))
+
+    assert sorted(hit.term for hit in hits) == ["he", "hers", "she"]
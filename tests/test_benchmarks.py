@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Smoke tests for the benchmark harness and synthetic repository generator."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.harness import compare_results, load_results, measure, write_results
+from benchmarks.suites import build_cases
+from benchmarks.synthetic import SIZES, generate_repository
+
+
+def test_generate_repository_is_deterministic(tmp_path: Path) -> None:
+    """Equal specs produce byte-identical trees and issue lists."""
+
+    spec = SIZES["tiny"]
+    first = generate_repository(tmp_path / "a", spec)
+    second = generate_repository(tmp_path / "b", spec)
+
+    assert len(first.python_files) == spec.python_files
+    assert len(first.issues) == spec.python_files * spec.issues_per_file
+    assert [path.read_text(encoding="utf-8") for path in first.files] == [
+        path.read_text(encoding="utf-8") for path in second.files
+    ]
+    assert first.ruff_payload() == second.ruff_payload()
+
+
+def test_benchmark_cases_run_and_round_trip(tmp_path: Path) -> None:
+    """Every case runs on a tiny repository and results survive persistence."""
+
+    repo = generate_repository(tmp_path / "repo", SIZES["tiny"])
+    results = [measure(case, rounds=1, warmup=0) for case in build_cases(repo, tmp_path / "work")]
+    assert {result.name for result in results} >= {"orchestrator.run", "result_cache.load", "dedupe_outcomes"}
+
+    destination = tmp_path / "results.json"
+    write_results(destination, results, metadata={"size": "tiny"})
+    loaded = load_results(destination)
+    assert loaded == {result.name: result for result in results}
+
+    slower = {name: replace(result, median_s=result.median_s * 2 + 1) for name, result in loaded.items()}
+    comparisons = compare_results(loaded, slower, threshold=0.1)
+    assert comparisons
+    assert all(comparison.regressed for comparison in comparisons)
+    assert not any(comparison.regressed for comparison in compare_results(loaded, loaded))
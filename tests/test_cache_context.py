@@ -14,7 +14,9 @@ from pyqa.cache.context import (
     DefaultCacheContextFactory,
     DefaultCacheTokenBuilder,
     FileSystemCacheVersionStore,
+    update_tool_version,
 )
+from pyqa.cache.tool_inputs import ToolInputFingerprints, ToolInputSpec
 from pyqa.config.models import Config
 from pyqa.interfaces.cache import CacheVersionStore, ResultCacheFactory, ResultCacheProtocol
 
@@ -150,6 +152,19 @@ def test_cache_context_loads_outcome(tmp_path: Path) -> None:
     assert request.action == "action"
     assert request.command == ("cmd", "arg")
     assert request.token == "token"
+    assert request.version is None
+
+
+def test_cache_context_requests_carry_version_resolved_this_run(tmp_path: Path) -> None:
+    cache = _RecordingCache(response=None)
+    context = CacheContext(cache=cache, token="token", cache_dir=tmp_path, versions={"tool": "1.0"})
+
+    context.load_cached_outcome(tool_name="tool", action_name="lint", cmd=("tool",), files=())
+    update_tool_version(context, "tool", "1.0")
+    context.load_cached_outcome(tool_name="tool", action_name="lint", cmd=("tool",), files=())
+
+    assert [request.version for request in cache.requests] == [None, "1.0"]
+    assert not context.versions_dirty
 
 
 def test_cache_context_load_without_token_returns_none(tmp_path: Path) -> None:
@@ -169,3 +184,67 @@ def test_cache_context_load_without_token_returns_none(tmp_path: Path) -> None:
         files=(),
     ) is None
     assert not cache.requests
+
+
+def test_cache_context_token_tracks_tool_config_inputs(tmp_path: Path) -> None:
+    config_file = tmp_path / "ruff.toml"
+    config_file.write_text("line-length = 88\n", encoding="utf-8")
+    specs = {
+        "ruff": ToolInputSpec(files=("ruff.toml", ".ruff*")),
+        "eslint": ToolInputSpec(env=("ESLINT_USE_FLAT_CONFIG",)),
+        "plain": ToolInputSpec(),
+    }
+
+    def _context(environ: Mapping[str, str]) -> CacheContext:
+        return CacheContext(
+            cache=_RecordingCache(),
+            token="token",
+            cache_dir=tmp_path,
+            versions={},
+            tool_inputs=ToolInputFingerprints(tmp_path, specs, environ=environ),
+        )
+
+    first = _context({})
+    ruff_token = first.token_for("ruff")
+    assert ruff_token is not None and ruff_token.startswith("token|")
+    assert first.token_for("plain") == "token"
+    assert first.token_for("ruff") == ruff_token
+
+    config_file.write_text("line-length = 100\n", encoding="utf-8")
+    assert first.token_for("ruff") == ruff_token  # fingerprinted once per run
+    edited = _context({})
+    assert edited.token_for("ruff") != ruff_token
+
+    (tmp_path / ".ruff.toml").write_text("", encoding="utf-8")
+    assert _context({}).token_for("ruff") != edited.token_for("ruff")
+
+    assert edited.token_for("eslint") != _context({"ESLINT_USE_FLAT_CONFIG": "false"}).token_for("eslint")
+
+    edited.load_cached_outcome(tool_name="ruff", action_name="lint", cmd=("ruff",), files=())
+    assert edited.cache.requests[0].token == edited.token_for("ruff")
+
+
+def test_tool_input_fingerprints_track_nested_configs_of_linted_files(tmp_path: Path) -> None:
+    package = tmp_path / "packages" / "web" / "src"
+    package.mkdir(parents=True)
+    linted = package / "index.js"
+    linted.write_text("", encoding="utf-8")
+    other = tmp_path / "packages" / "api"
+    other.mkdir()
+    specs = {"eslint": ToolInputSpec(files=(".eslintrc*",))}
+
+    def _digest() -> str | None:
+        return ToolInputFingerprints(tmp_path, specs, files=[linted]).digest("eslint")
+
+    baseline = _digest()
+    nested = tmp_path / "packages" / "web" / ".eslintrc.json"
+    nested.write_text("{}", encoding="utf-8")
+    with_nested = _digest()
+    assert with_nested != baseline
+
+    nested.write_text('{"root": true}', encoding="utf-8")
+    edited = _digest()
+    assert edited != with_nested
+
+    (other / ".eslintrc.json").write_text("{}", encoding="utf-8")
+    assert _digest() == edited  # configs beside unlinted files are ignored
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for incremental change scopes and the diagnostics baseline."""
+
+from __future__ import annotations
+
+import ast
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+from pyqa.analysis.change_impact import ChangeScope, build_change_scope
+from pyqa.cache.incremental import IncrementalBaseline
+from pyqa.config import FileDiscoveryConfig
+from pyqa.core.models import Diagnostic, RunResult, ToolExitCategory, ToolOutcome
+from pyqa.core.severity import Severity
+from pyqa.interfaces.linting import PreparedLintState
+from pyqa.linting._ast_visitors import BaseAstLintVisitor, VisitorMetadata, run_ast_linter
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command inside ``repo`` discarding stdout."""
+
+    subprocess.run(["git", *args], cwd=repo, check=True, stdout=subprocess.DEVNULL)
+
+
+def _init_repo(repo: Path) -> None:
+    """Initialise ``repo`` and commit its current contents."""
+
+    _git(repo, "init")
+    _git(repo, "config", "user.name", "PyQATest")
+    _git(repo, "config", "user.email", "pyqa@example.com")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "initial")
+
+
+def test_build_change_scope_tracks_hunks_and_untracked(tmp_path: Path) -> None:
+    """Verify the scope records changed hunks and treats untracked files as fully changed."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    module = repo / "module.py"
+    module.write_text("a = 1\nb = 2\nc = 3\n", encoding="utf-8")
+    (repo / "stable.py").write_text("x = 1\n", encoding="utf-8")
+    _init_repo(repo)
+
+    module.write_text("a = 1\nb = 20\nc = 3\n", encoding="utf-8")
+    (repo / "fresh.py").write_text("y = 1\n", encoding="utf-8")
+
+    cfg = FileDiscoveryConfig(incremental=True, include_untracked=True)
+    scope = build_change_scope(cfg, repo)
+
+    assert scope.contains(module)
+    assert scope.contains("fresh.py")
+    assert not scope.contains(repo / "stable.py")
+    assert scope.lines["module.py"] == frozenset({2})
+    assert "fresh.py" in scope.whole_files
+    assert [path.name for path in scope.paths()] == ["fresh.py", "module.py"]
+
+
+class _FunctionVisitor(BaseAstLintVisitor):
+    """Record one diagnostic per visited function definition."""
+
+    def visit_function_def(self, node: ast.FunctionDef) -> None:
+        """Record ``node`` as visited."""
+
+        self.record_issue(node, f"function {node.name}")
+
+
+def test_scoped_ast_linter_relints_changed_files_in_full(tmp_path: Path) -> None:
+    """Verify AST linters report pre-existing issues outside the changed hunks."""
+
+    source = tmp_path / "module.py"
+    source.write_text(
+        "import os\n\n\ndef untouched():\n    return 1\n\n\n@staticmethod\ndef touched():\n    return 2\n",
+        encoding="utf-8",
+    )
+    state = SimpleNamespace(
+        root=tmp_path,
+        options=SimpleNamespace(
+            target_options=SimpleNamespace(root=tmp_path, paths=[], dirs=[], exclude=[], include_dotfiles=False),
+        ),
+        suppressions=None,
+        change_scope=ChangeScope.from_changes(tmp_path, {"module.py": {8}}),
+    )
+
+    report = run_ast_linter(
+        cast(PreparedLintState, state),
+        metadata=VisitorMetadata(tool="demo", code="demo"),
+        visitor_factory=_FunctionVisitor,
+    )
+
+    assert [diag.message for diag in report.outcome.diagnostics] == ["function untouched", "function touched"]
+
+
+def test_incremental_baseline_merges_untouched_files(tmp_path: Path) -> None:
+    """Verify baseline diagnostics are carried over only for files outside the diff."""
+
+    (tmp_path / "old.py").write_text("", encoding="utf-8")
+    (tmp_path / "new.py").write_text("", encoding="utf-8")
+
+    def _diag(file: str, tool: str) -> Diagnostic:
+        return Diagnostic(file=file, line=1, column=None, severity=Severity.ERROR, message="boom", tool=tool)
+
+    baseline = IncrementalBaseline.load(tmp_path / ".lint-cache")
+    baseline.record(
+        [
+            ToolOutcome(tool="ruff", action="lint", returncode=1, diagnostics=[_diag("old.py", "ruff")]),
+            ToolOutcome(tool="eslint", action="lint", returncode=1, diagnostics=[_diag("old.py", "eslint")]),
+            ToolOutcome(tool="mypy", action="check", returncode=1, diagnostics=[_diag("new.py", "mypy")]),
+        ],
+    )
+    baseline.save()
+
+    reloaded = IncrementalBaseline.load(tmp_path / ".lint-cache")
+    result = RunResult(
+        root=tmp_path,
+        files=[tmp_path / "new.py"],
+        outcomes=[ToolOutcome(tool="ruff", action="lint", returncode=0, diagnostics=[_diag("new.py", "ruff")])],
+        tool_versions={},
+    )
+    carried = reloaded.merge_into(result, ChangeScope.from_changes(tmp_path, {"new.py": {1}}))
+
+    assert carried == 2
+    by_tool = {outcome.tool: outcome for outcome in result.outcomes}
+    assert [diag.file for diag in by_tool["ruff"].diagnostics] == ["new.py", "old.py"]
+    assert by_tool["eslint"].cached
+    assert "mypy" not in by_tool
+
+
+def test_incremental_baseline_marks_outcomes_with_carried_diagnostics_failed(tmp_path: Path) -> None:
+    """Verify carried diagnostics turn clean incremental outcomes into failures."""
+
+    (tmp_path / "old.py").write_text("", encoding="utf-8")
+    stored = Diagnostic(file="old.py", line=1, column=None, severity=Severity.ERROR, message="boom", tool="ruff")
+    baseline = IncrementalBaseline.load(tmp_path / ".lint-cache")
+    baseline.record(
+        [
+            ToolOutcome(tool="ruff", action="lint", returncode=1, diagnostics=[stored]),
+            ToolOutcome(tool="eslint", action="lint", returncode=0, diagnostics=[stored.model_copy(deep=True)]),
+        ],
+    )
+    result = RunResult(
+        root=tmp_path,
+        files=[tmp_path / "new.py"],
+        outcomes=[ToolOutcome(tool="ruff", action="lint", returncode=0, exit_category=ToolExitCategory.SUCCESS)],
+        tool_versions={},
+    )
+
+    baseline.merge_into(result, ChangeScope.from_changes(tmp_path, {"new.py": {1}}))
+
+    by_tool = {outcome.tool: outcome for outcome in result.outcomes}
+    assert not by_tool["ruff"].ok
+    assert by_tool["ruff"].exit_category is ToolExitCategory.DIAGNOSTIC
+    assert not by_tool["eslint"].ok
+    assert by_tool["eslint"].cached
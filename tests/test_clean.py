@@ -9,7 +9,7 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
-from pyqa.clean import sparkly_clean
+from pyqa.clean import CleanPlanner, sparkly_clean
 from pyqa.cli.app import app
 from pyqa.config import CleanConfig
 
@@ -92,3 +92,33 @@ def test_cli_warns_about_pyqa_lint_skip(tmp_path: Path) -> None:
     assert result.exit_code == 0
     assert "'pyqa_lint' directories are skipped" in result.stdout
     assert candidate.exists()
+
+
+def test_planner_does_not_descend_into_matched_directories(tmp_path: Path) -> None:
+    nested = tmp_path / "pkg" / ".venv" / "lib" / "__pycache__"
+    nested.mkdir(parents=True)
+    (nested / "mod.pyc").write_bytes(b"x" * 10)
+    (tmp_path / "pkg" / "reports").mkdir()
+    (tmp_path / "pkg" / "reports" / "run.log").write_bytes(b"y" * 5)
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "keep.log").write_bytes(b"z")
+    (tmp_path / "pkg" / "scratch").mkdir()
+    (tmp_path / "scratch").write_text("a file, not a directory", encoding="utf-8")
+    config = CleanConfig(patterns=["__pycache__", ".venv", "reports/*.log", "**/scratch/"], trees=[])
+
+    plan = CleanPlanner().plan(tmp_path, config)
+
+    root = tmp_path.resolve()
+    assert plan.paths == [
+        root / "pkg" / ".venv",
+        root / "pkg" / "reports" / "run.log",
+        root / "pkg" / "scratch",
+    ]
+    assert plan.total_bytes == 15
+
+
+def test_sparkly_clean_reports_reclaimed_bytes(tmp_path: Path) -> None:
+    _setup_repo(tmp_path)
+    result = sparkly_clean(tmp_path, config=CleanConfig(), dry_run=False, workers=4)
+    assert result.reclaimed_bytes == len("cache") + len("<coverage/>") + len("log")
+    assert len(result.removed) == 3
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Start-up cost guards for the lazily registered CLI."""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+import click
+import pytest
+import typer.main
+
+from pyqa.cli.commands import BUILTIN_COMMANDS
+from pyqa.cli.core.lazy_commands import LazyTyperGroup
+
+IMPORT_BUDGET_ENV = "PYQA_IMPORT_BUDGET_MS"
+DEFAULT_IMPORT_BUDGET_MS = 2500
+_IMPORT_TIME_REPEATS = 3
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(?P<cumulative>\d+) \| (?P<module>.+)$")
+_HEAVY_MODULES = (
+    "pyqa.cli.commands.lint.command",
+    "pyqa.config.models",
+    "tooling_spec.catalog.loader",
+    "jsonschema",
+    "spacy",
+    "tree_sitter",
+)
+
+
+def _run_cli(*args: str, importtime: bool = False) -> subprocess.CompletedProcess[str]:
+    script = "import sys\nfrom pyqa.cli import app\ntry:\n    app(sys.argv[1:])\nexcept SystemExit:\n    pass\n"
+    if not importtime:
+        script += "print('\\n'.join(sorted(sys.modules)))\n"
+    flags = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, "-c", script, *args],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "COLUMNS": "200"},
+        text=True,
+    )
+
+
+def test_root_help_does_not_import_command_implementations() -> None:
+    """``pyqa --help`` lists every command without importing heavy subsystems."""
+
+    result = _run_cli("--help")
+    loaded = set(result.stdout.splitlines())
+
+    for spec in BUILTIN_COMMANDS:
+        assert spec.name in result.stdout
+        assert spec.module not in loaded
+    assert not [name for name in loaded if name.startswith(_HEAVY_MODULES)]
+
+
+def test_lazy_help_text_matches_loaded_commands() -> None:
+    """Placeholder help stays in sync with each command's real summary."""
+
+    from pyqa.cli.app import app
+
+    group = typer.main.get_group(app)
+    assert isinstance(group, LazyTyperGroup)
+    ctx = click.Context(group)
+    for spec in BUILTIN_COMMANDS:
+        command = group.load_command(ctx, spec.name)
+        assert command is not None
+        assert command.get_short_help_str(limit=200) == spec.help_text, spec.name
+
+
+def _lint_help_import_us() -> int:
+    result = _run_cli("lint", "--help", importtime=True)
+    top_level_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match and not match.group("module").startswith(" "):
+            top_level_us += int(match.group("cumulative"))
+    return top_level_us
+
+
+def test_lint_help_import_time_within_budget() -> None:
+    """Cold-start imports for ``pyqa lint --help`` stay within the budget.
+
+    Each sample runs in a fresh interpreter and the fastest one is compared,
+    so a single slow run on a busy machine does not fail the guard.
+    """
+
+    budget_ms = int(os.environ.get(IMPORT_BUDGET_ENV, DEFAULT_IMPORT_BUDGET_MS))
+    fastest_us = min(_lint_help_import_us() for _ in range(_IMPORT_TIME_REPEATS))
+
+    if fastest_us == 0:
+        pytest.skip("interpreter did not report import timings")
+    assert fastest_us / 1000 <= budget_ms
@@ -9,7 +9,13 @@ from pathlib import Path
 import pytest
 
 from pyqa.config import ConfigError
-from pyqa.core.config.loader import ConfigLoader, generate_config_schema, load_config
+from pyqa.core.config.loader import (
+    ConfigLoader,
+    ConfigLoadResult,
+    clear_config_cache,
+    generate_config_schema,
+    load_config,
+)
 from pyqa.interfaces.config import ConfigSource
 
 
@@ -184,6 +190,32 @@ pretty_format = 123
         loader.load()
 
 
+@pytest.mark.parametrize("value", ["-3", "0", "true", '"many"'])
+def test_output_section_rejects_non_positive_max_diagnostics(tmp_path: Path, value: str) -> None:
+    project_root = tmp_path / "workspace"
+    project_root.mkdir()
+
+    project_config = project_root / ".pyqa_lint.toml"
+    project_config.write_text(f"[output]\nmax_diagnostics = {value}\n", encoding="utf-8")
+
+    loader = ConfigLoader.for_root(project_root, project_config=project_config)
+
+    with pytest.raises(ConfigError, match="max_diagnostics"):
+        loader.load()
+
+
+def test_output_section_accepts_positive_max_diagnostics(tmp_path: Path) -> None:
+    project_root = tmp_path / "workspace"
+    project_root.mkdir()
+
+    project_config = project_root / ".pyqa_lint.toml"
+    project_config.write_text("[output]\nmax_diagnostics = 25\n", encoding="utf-8")
+
+    loader = ConfigLoader.for_root(project_root, project_config=project_config)
+
+    assert loader.load().output.max_diagnostics == 25
+
+
 def test_execution_section_rejects_invalid_cache_dir(tmp_path: Path) -> None:
     project_root = tmp_path / "workspace"
     project_root.mkdir()
@@ -381,3 +413,47 @@ def test_auto_discover_tool_settings(tmp_path: Path) -> None:
 
     assert result.config.tool_settings["ruff"]["config"] == "ruff.toml"
     assert any(update.source == "auto" for update in result.updates)
+
+
+def test_config_loader_reuses_merge_until_an_input_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    project_root = tmp_path / "workspace"
+    project_root.mkdir()
+    user_config = tmp_path / "user.toml"
+    shared = tmp_path / "shared.toml"
+    shared.write_text('[execution]\njobs = 3\n[output]\nreport_out = "$REPORT_DIR/out.json"\n', encoding="utf-8")
+    project_config = project_root / ".pyqa_lint.toml"
+    project_config.write_text(f'include = ["{shared.as_posix()}"]\n', encoding="utf-8")
+    monkeypatch.setenv("REPORT_DIR", "first")
+
+    def _load() -> ConfigLoadResult:
+        return ConfigLoader.for_root(project_root, user_config=user_config).load_with_trace()
+
+    merges: list[int] = []
+    original_merge = ConfigLoader._merge
+
+    def _counting_merge(self: ConfigLoader, auto_config_files: frozenset[str]) -> ConfigLoadResult:
+        merges.append(1)
+        return original_merge(self, auto_config_files)
+
+    monkeypatch.setattr(ConfigLoader, "_merge", _counting_merge)
+    clear_config_cache()
+
+    first = _load()
+    first.config.execution.jobs = 99
+    second = _load()
+    assert len(merges) == 1
+    assert second.config.execution.jobs == 3
+
+    shared.write_text('[execution]\njobs = 4\n[output]\nreport_out = "$REPORT_DIR/out.json"\n', encoding="utf-8")
+    assert _load().config.execution.jobs == 4
+    assert len(merges) == 2
+
+    monkeypatch.setenv("REPORT_DIR", "second")
+    assert "second" in str(_load().config.output.report_out)
+    assert len(merges) == 3
+
+    (project_root / "ruff.toml").write_text("line-length = 100\n", encoding="utf-8")
+    assert _load().config.tool_settings["ruff"]["config"] == "ruff.toml"
+    assert len(merges) == 4
+    assert _load().config.tool_settings["ruff"]["config"] == "ruff.toml"
+    assert len(merges) == 4
@@ -68,7 +68,7 @@ def test_run_doctor_catalog_initializes_registry(monkeypatch, tmp_path: Path) ->
 
     monkeypatch.setattr("pyqa.cli.commands.doctor.command.initialize_registry", fake_initialize_registry)
 
-    def fake_check_tool_status(tool: Tool) -> ToolStatus:
+    def fake_check_tool_status(tool: Tool, **_kwargs: object) -> ToolStatus:
         return ToolStatus(
             name=tool.name,
             notes="",
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the reverse-dependency import graph."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from pyqa.analysis import import_graph
+from pyqa.analysis.import_graph import IMPORT_GRAPH_FILE, build_import_graph, expand_with_dependents
+from pyqa.config import FileDiscoveryConfig
+from pyqa.discovery.git import GitDiscovery
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _project(root: Path) -> dict[str, Path]:
+    return {
+        "init": _write(root / "src" / "app" / "__init__.py", ""),
+        "core": _write(root / "src" / "app" / "core.py", "VALUE = 1\n"),
+        "service": _write(root / "src" / "app" / "service.py", "from .core import VALUE\n"),
+        "api": _write(root / "src" / "app" / "api.py", "from app import service\n"),
+        "cli": _write(root / "tools" / "cli.py", "import app.api\n"),
+        "other": _write(root / "src" / "app" / "other.py", "import json\n"),
+        "readme": _write(root / "README.md", "docs\n"),
+    }
+
+
+def test_dependents_follow_relative_absolute_and_from_imports(tmp_path: Path) -> None:
+    """Transitive importers are found through every import form."""
+
+    root = tmp_path.resolve()
+    files = _project(root)
+    graph = build_import_graph(root, files.values())
+
+    assert graph.direct_importers(files["core"]) == frozenset({files["service"]})
+    assert graph.dependents([files["core"]]) == tuple(sorted((files["service"], files["api"], files["cli"])))
+    assert graph.dependents([files["other"]]) == ()
+
+
+def test_expand_with_dependents_reparses_only_changed_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The persisted graph is reused and only modified files are parsed again."""
+
+    root = tmp_path.resolve()
+    files = _project(root)
+    cache_dir = root / ".lint-cache"
+    expanded = expand_with_dependents([files["core"]], files.values(), root, cache_dir=cache_dir)
+    assert expanded == sorted((files["core"], files["service"], files["api"], files["cli"]))
+    assert (cache_dir / IMPORT_GRAPH_FILE).is_file()
+
+    _write(files["other"], "from app.core import VALUE\n")
+    parsed: list[str] = []
+    original = import_graph._collect_imports
+
+    def _tracking(source: str) -> tuple[str, ...]:
+        parsed.append(source)
+        return original(source)
+
+    monkeypatch.setattr(import_graph, "_collect_imports", _tracking)
+    expanded = expand_with_dependents([files["core"]], files.values(), root, cache_dir=cache_dir)
+
+    assert parsed == ["from app.core import VALUE\n"]
+    assert files["other"] in expanded
+    assert files["readme"] not in expanded
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, stdout=subprocess.DEVNULL)
+
+
+@pytest.mark.parametrize("staged", [False, True], ids=["worktree", "staged"])
+def test_deleted_module_expands_to_its_importers(tmp_path: Path, staged: bool) -> None:
+    """Deleting an imported module re-checks the files that still import it."""
+
+    root = tmp_path.resolve()
+    files = _project(root)
+    _git(root, "init")
+    _git(root, "config", "user.name", "PyQATest")
+    _git(root, "config", "user.email", "pyqa@example.com")
+    _git(root, "add", ".")
+    _git(root, "commit", "-m", "initial")
+    cache_dir = root / ".lint-cache"
+    build_import_graph(root, files.values(), cache_dir=cache_dir)
+
+    if staged:
+        _git(root, "mv", "src/app/core.py", "src/app/engine.py")
+    else:
+        files["core"].unlink()
+    cfg = FileDiscoveryConfig(changed_only=True, diff_ref="HEAD" if staged else "")
+    removed = list(GitDiscovery().discover_removed(cfg, root))
+    remaining = [path for path in root.rglob("*.py") if ".lint-cache" not in path.parts]
+
+    expanded = expand_with_dependents([], remaining, root, cache_dir=cache_dir, removed=removed)
+
+    assert removed == [files["core"]]
+    assert expanded == sorted((files["service"], files["api"], files["cli"]))
@@ -77,8 +77,19 @@ def test_handle_reporting_uses_injected_annotation_provider(tmp_path: Path) -> N
     provider = _StubAnnotationProvider()
     result = RunResult(root=tmp_path, files=[], outcomes=[], tool_versions={})
     config = Config()
+    config.output.advice = True
     artifacts = LintOutputArtifacts(report_json=None, sarif_out=None, pr_summary_out=None)
 
     handle_reporting(result, config, artifacts, annotation_provider=provider, logger=None)
 
     assert provider.annotate_calls == 1
+
+
+def test_handle_reporting_concise_skips_run_annotation(tmp_path: Path) -> None:
+    provider = _StubAnnotationProvider()
+    result = RunResult(root=tmp_path, files=[], outcomes=[], tool_versions={})
+    artifacts = LintOutputArtifacts(report_json=None, sarif_out=None, pr_summary_out=None)
+
+    handle_reporting(result, Config(), artifacts, annotation_provider=provider, logger=None)
+
+    assert provider.annotate_calls == 0
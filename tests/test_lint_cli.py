@@ -1266,7 +1266,8 @@ def test_concise_mode_renders_progress_status(monkeypatch, tmp_path: Path) -> No
 
 
 def test_lint_help_options_sorted() -> None:
-    lint_cmd = get_group(app).commands["lint"]
+    group = get_group(app)
+    lint_cmd = group.load_command(click.Context(group), "lint")
     ctx = click.Context(lint_cmd)
     formatter = _RecordingFormatter()
     lint_cmd.format_options(ctx, formatter)  # type: ignore[arg-type]
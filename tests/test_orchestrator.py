@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Blackcat Informatics® Inc.
 """Integration tests for orchestrator execution flow."""
 
+import os
 import subprocess
 from collections.abc import Sequence
 from pathlib import Path
@@ -12,6 +13,7 @@ from pyqa.config import Config
 from pyqa.core.environment.tool_env.models import PreparedCommand
 from pyqa.core.models import RawDiagnostic
 from pyqa.orchestration.orchestrator import Orchestrator, OrchestratorOverrides
+from pyqa.orchestration.python_workers import PythonWorkerRunner
 from pyqa.orchestration.selection_context import UnknownToolRequestedError
 from pyqa.orchestration.tool_selection import ToolSelector
 from pyqa.testing import flatten_test_suppressions
@@ -511,3 +513,130 @@ def test_installers_run_once(tmp_path: Path) -> None:
     )
     orchestrator_runtime.run(cfg, root=tmp_path)
     assert len(calls) == 2
+
+
+def test_cached_rerun_skips_installers_and_preparation(tmp_path: Path) -> None:
+    """A fully cached rerun must not install or prepare the tool again."""
+
+    target = tmp_path / "module.py"
+    target.write_text("print('ok')\n", encoding="utf-8")
+    installs: list[str] = []
+
+    def installer(_context: ToolContext) -> None:
+        installs.append("demo")
+
+    registry = ToolRegistry()
+    registry.register(
+        Tool(
+            name="demo",
+            actions=(ToolAction(name="lint", command=SettingsCommand()),),
+            file_extensions=(".py",),
+            runtime="binary",
+            installers=(installer,),
+        ),
+    )
+    cfg = Config()
+    cfg.execution.cache_enabled = True
+    cfg.execution.cache_dir = tmp_path / ".cache"
+    cfg.execution.jobs = 1
+
+    def runner(cmd, **_kwargs):
+        return subprocess.CompletedProcess(cmd, returncode=0, stdout="output", stderr="")
+
+    first_preparer = StubPreparer()
+    _create_orchestrator(
+        registry=registry,
+        discovery=FakeDiscovery([target]),
+        runner=runner,
+        cmd_preparer=first_preparer.prepare,
+    ).run(cfg, root=tmp_path)
+    assert first_preparer.calls == ["demo"]
+    assert installs == ["demo"]
+
+    def runner_fail(cmd, **_kwargs):
+        raise AssertionError(f"cache miss for {cmd}")
+
+    rerun_preparer = StubPreparer()
+    result = _create_orchestrator(
+        registry=registry,
+        discovery=FakeDiscovery([target]),
+        runner=runner_fail,
+        cmd_preparer=rerun_preparer.prepare,
+    ).run(cfg, root=tmp_path)
+
+    assert result.outcomes[0].stdout == ["output"]
+    assert rerun_preparer.calls == []
+    assert installs == ["demo"]
+
+    target.write_text("print('changed')\n", encoding="utf-8")
+    changed_preparer = StubPreparer()
+    _create_orchestrator(
+        registry=registry,
+        discovery=FakeDiscovery([target]),
+        runner=runner,
+        cmd_preparer=changed_preparer.prepare,
+    ).run(cfg, root=tmp_path)
+    assert changed_preparer.calls == ["demo"]
+
+
+def test_tool_servers_route_commands_to_daemon_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("print('ok')\n", encoding="utf-8")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    client = bin_dir / "dummy_d"
+    client.write_text("#!/bin/sh\n", encoding="utf-8")
+    client.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    registry = ToolRegistry()
+    registry.register(
+        Tool(
+            name="dummy",
+            actions=(ToolAction(name="lint", command=SettingsCommand()),),
+            file_extensions=(".py",),
+            runtime="binary",
+            server_clients={"dummy": "dummy_d"},
+        ),
+    )
+    commands: list[list[str]] = []
+
+    def runner(cmd, **_kwargs):
+        commands.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, returncode=0, stdout="", stderr="")
+
+    orchestrator = _create_orchestrator(registry=registry, discovery=FakeDiscovery([target]), runner=runner)
+
+    cfg = Config()
+    cfg.execution.cache_enabled = False
+    orchestrator.run(cfg, root=tmp_path)
+    cfg.execution.tool_servers = True
+    orchestrator.run(cfg, root=tmp_path)
+    client.unlink()
+    orchestrator.run(cfg, root=tmp_path)
+
+    assert [cmd[0] for cmd in commands] == ["dummy", str(client), "dummy"]
+    assert commands[1][1:] == commands[0][1:]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="forked workers require POSIX")
+def test_python_workers_are_enabled_independently_of_tool_servers(tmp_path: Path) -> None:
+    registry = ToolRegistry()
+    registry.register(
+        Tool(
+            name="jsontool",
+            actions=(ToolAction(name="lint", command=SettingsCommand()),),
+            file_extensions=(".json",),
+            runtime="python",
+            entry_points={"jsontool": "json.tool:main"},
+        ),
+    )
+    orchestrator = _create_orchestrator(registry=registry, discovery=FakeDiscovery([]), runner=subprocess.run)
+    cfg = Config()
+
+    assert not isinstance(orchestrator._runner_for(cfg), PythonWorkerRunner)
+    cfg.execution.tool_servers = True
+    assert not isinstance(orchestrator._runner_for(cfg), PythonWorkerRunner)
+    cfg.execution.tool_servers = False
+    cfg.execution.python_workers = True
+    assert isinstance(orchestrator._runner_for(cfg), PythonWorkerRunner)
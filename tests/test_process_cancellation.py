@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Tests for cancellation and timeouts in :mod:`pyqa.core.runtime.process`."""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import pyqa
+from pyqa.core.runtime.process import (
+    TIMEOUT_RETURNCODE,
+    CancellationToken,
+    CommandCancelledError,
+    CommandOptions,
+    run_command,
+)
+
+_SPAWN_GRANDCHILD = (
+    "import subprocess, sys, time; "
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+    "open(sys.argv[1], 'w').write(str(child.pid)); "
+    "time.sleep(60)"
+)
+
+_THREADED_RUNNER = """
+import sys
+import threading
+
+from pyqa.core.runtime.process import CommandOptions, run_command
+
+child = "import os, sys, time; open(sys.argv[1], 'w').write(str(os.getpid())); time.sleep(60)"
+worker = threading.Thread(
+    target=run_command,
+    args=([sys.executable, "-c", child, sys.argv[1]],),
+    kwargs={"options": CommandOptions(check=False)},
+    daemon=True,
+)
+worker.start()
+worker.join()
+"""
+
+
+def _wait_for(path: Path) -> int:
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        if path.exists() and path.read_text():
+            return int(path.read_text())
+        time.sleep(0.05)
+    raise AssertionError(f"{path} was never written")
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    stat = Path(f"/proc/{pid}/stat")
+    try:
+        return stat.read_text().rsplit(")", 1)[1].split()[0] != "Z"
+    except (OSError, IndexError):
+        return True
+
+
+def test_cancelled_token_skips_command() -> None:
+    token = CancellationToken()
+    token.cancel("bail")
+
+    with pytest.raises(CommandCancelledError, match="bail"):
+        run_command([sys.executable, "-c", "pass"], options=CommandOptions(cancellation=token))
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+def test_cancel_kills_command_and_its_children(tmp_path: Path) -> None:
+    token = CancellationToken()
+    pid_file = tmp_path / "grandchild.pid"
+    errors: list[BaseException] = []
+
+    def _run() -> None:
+        try:
+            run_command(
+                [sys.executable, "-c", _SPAWN_GRANDCHILD, str(pid_file)],
+                options=CommandOptions(check=False, capture_output=True, cancellation=token),
+            )
+        except CommandCancelledError as exc:
+            errors.append(exc)
+
+    worker = threading.Thread(target=_run)
+    worker.start()
+    grandchild = _wait_for(pid_file)
+    started = time.monotonic()
+    token.cancel("bail")
+    worker.join(timeout=20)
+
+    assert not worker.is_alive()
+    assert time.monotonic() - started < 10
+    assert len(errors) == 1
+    deadline = time.monotonic() + 5
+    while _is_running(grandchild) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _is_running(grandchild)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+def test_timeout_kills_process_group(tmp_path: Path) -> None:
+    pid_file = tmp_path / "grandchild.pid"
+
+    started = time.monotonic()
+    completed = run_command(
+        [sys.executable, "-c", _SPAWN_GRANDCHILD, str(pid_file)],
+        options=CommandOptions(check=False, capture_output=True, timeout=2, cancellation=CancellationToken()),
+    )
+
+    assert time.monotonic() - started < 15
+    assert completed.returncode == TIMEOUT_RETURNCODE
+    assert "timed out" in completed.stderr
+    grandchild = _wait_for(pid_file)
+    deadline = time.monotonic() + 5
+    while _is_running(grandchild) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _is_running(grandchild)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+def test_interrupt_reaches_tokenless_threaded_command(tmp_path: Path) -> None:
+    pid_file = tmp_path / "child.pid"
+    script = tmp_path / "runner.py"
+    script.write_text(_THREADED_RUNNER, encoding="utf-8")
+    env = {**os.environ, "PYTHONPATH": str(Path(pyqa.__file__).resolve().parents[1])}
+    runner = subprocess.Popen(
+        [sys.executable, str(script), str(pid_file)],
+        env=env,
+        start_new_session=True,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        child = _wait_for(pid_file)
+        os.killpg(runner.pid, signal.SIGINT)
+        runner.wait(timeout=20)
+    finally:
+        if runner.poll() is None:
+            os.killpg(runner.pid, signal.SIGKILL)
+
+    deadline = time.monotonic() + 5
+    while _is_running(child) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _is_running(child)
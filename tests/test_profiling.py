@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the span profiler behind ``pyqa lint --profile``."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from pyqa.core.runtime.profiling import (
+    TOOL_CATEGORY,
+    Profiler,
+    active_profiler,
+    profile_span,
+    profiling,
+)
+
+
+def test_nested_spans_report_self_time_per_thread() -> None:
+    """Nested spans subtract child time and worker threads keep separate stacks."""
+
+    profiler = Profiler()
+    with profiling(profiler):
+        with profile_span("execution"):
+            time.sleep(0.002)
+            with profile_span("parse"):
+                time.sleep(0.01)
+
+        def _worker() -> None:
+            with profile_span("ruff:lint", category=TOOL_CATEGORY), profile_span("subprocess"):
+                time.sleep(0.005)
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        thread.join()
+
+    assert active_profiler() is None
+    rows = {(row.category, row.name): row for row in profiler.summary()}
+    execution = rows[("phase", "execution")]
+    parse = rows[("phase", "parse")]
+    assert execution.total_ms >= parse.total_ms >= 10
+    assert execution.self_ms < execution.total_ms - parse.total_ms + 1
+    tool = rows[(TOOL_CATEGORY, "ruff:lint")]
+    assert tool.self_ms < tool.total_ms
+    thread_ids = {span.thread_id for span in profiler.spans}
+    assert len(thread_ids) == 2
+
+
+def test_chrome_trace_contains_complete_events(tmp_path: Path) -> None:
+    """The written trace uses complete ('X') events with microsecond timings."""
+
+    profiler = Profiler()
+    with profiling(profiler), profile_span("prepare", args={"tool": "ruff:lint"}):
+        pass
+    destination = tmp_path / "out" / "trace.json"
+    profiler.write_chrome_trace(destination)
+
+    payload = json.loads(destination.read_text(encoding="utf-8"))
+    (event,) = payload["traceEvents"]
+    assert event["ph"] == "X"
+    assert event["name"] == "prepare"
+    assert event["args"] == {"tool": "ruff:lint"}
+    assert event["dur"] >= 0
+
+
+def test_profile_span_is_noop_without_active_profiler() -> None:
+    """Spans recorded outside :func:`profiling` are discarded."""
+
+    profiler = Profiler()
+    with profile_span("discovery"):
+        pass
+    assert profiler.spans == ()
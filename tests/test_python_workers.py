@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Tests for pre-imported Python tool workers."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyqa.core.runtime.process import TIMEOUT_RETURNCODE, CommandOptions
+from pyqa.orchestration.python_workers import PythonWorkerRunner
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="forked workers require POSIX")
+
+
+def _script(directory: Path, name: str) -> Path:
+    directory.mkdir(exist_ok=True)
+    script = directory / name
+    script.write_text("#!/bin/sh\n", encoding="utf-8")
+    script.chmod(0o755)
+    return script
+
+
+def _options(tmp_path: Path, path: Path, **kwargs: object) -> CommandOptions:
+    env = dict(os.environ, PATH=str(path))
+    return CommandOptions(
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        discard_stdin=True,
+        check=False,
+        **kwargs,
+    )
+
+
+def _unexpected_delegate(cmd, **_kwargs):
+    raise AssertionError(f"delegate should not run {cmd}")
+
+
+@pytest.mark.parametrize("payload", ['{"b": 1, "a": [1, 2]}', "{not json"])
+def test_worker_matches_subprocess_output(tmp_path: Path, payload: str) -> None:
+    bin_dir = tmp_path / "bin"
+    _script(bin_dir, "jsontool")
+    document = tmp_path / "doc.json"
+    document.write_text(payload, encoding="utf-8")
+    runner = PythonWorkerRunner(_unexpected_delegate, {"jsontool": "json.tool:main"}, scripts_dir=bin_dir)
+
+    completed = runner(["jsontool", "--sort-keys", "doc.json"], options=_options(tmp_path, bin_dir))
+    expected = subprocess.run(
+        [sys.executable, "-m", "json.tool", "--sort-keys", "doc.json"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert runner.available
+    assert completed.returncode == expected.returncode
+    assert completed.stdout == expected.stdout
+    assert completed.stderr == expected.stderr
+
+
+def test_worker_times_out_like_run_command(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    _script(bin_dir, "timer")
+    runner = PythonWorkerRunner(_unexpected_delegate, {"timer": "timeit:main"}, scripts_dir=bin_dir)
+
+    completed = runner(
+        ["timer", "-n", "1", "-r", "1", "-s", "import time", "time.sleep(30)"],
+        options=_options(tmp_path, bin_dir, timeout=0.5),
+    )
+
+    assert completed.returncode == TIMEOUT_RETURNCODE
+    assert completed.stderr.endswith("Command timed out after 0.5s")
+
+
+def test_commands_outside_interpreter_scripts_use_delegate(tmp_path: Path) -> None:
+    scripts_dir = tmp_path / "scripts"
+    scripts_dir.mkdir()
+    other_dir = tmp_path / "other"
+    _script(other_dir, "jsontool")
+    calls: list[list[str]] = []
+
+    def delegate(cmd, **_kwargs):
+        calls.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    runner = PythonWorkerRunner(
+        delegate,
+        {"jsontool": "json.tool:main", "missing": "not_a_real_module_xyz:main"},
+        scripts_dir=scripts_dir,
+    )
+
+    runner(["jsontool", "doc.json"], options=_options(tmp_path, other_dir))
+
+    assert calls == [["jsontool", "doc.json"]]
+    assert "missing" not in repr(runner)
+
+
+@pytest.mark.parametrize("variable", ["PYTHONPATH", "PYTHONSAFEPATH"])
+def test_interpreter_env_overrides_use_delegate(tmp_path: Path, variable: str) -> None:
+    bin_dir = tmp_path / "bin"
+    _script(bin_dir, "jsontool")
+    calls: list[list[str]] = []
+
+    def delegate(cmd, **_kwargs):
+        calls.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    runner = PythonWorkerRunner(delegate, {"jsontool": "json.tool:main"}, scripts_dir=bin_dir)
+    options = _options(tmp_path, bin_dir)
+    env = {**(options.env or {}), variable: str(tmp_path / "override")}
+
+    runner(["jsontool", "doc.json"], options=options, overrides={"env": env})
+
+    assert calls == [["jsontool", "doc.json"]]
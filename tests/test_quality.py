@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
 from typer.testing import CliRunner
 
 from pyqa.cli.app import app
@@ -18,8 +19,17 @@ from pyqa.compliance.quality import (
     QualityCheckerOptions,
     check_commit_message,
 )
+from pyqa.compliance.quality_components.engine import PARALLEL_FILE_THRESHOLD
 from pyqa.core.config.loader import ConfigLoader
-from pyqa.linting.quality import evaluate_quality_checks, run_pyqa_python_hygiene_linter, run_python_hygiene_linter
+from pyqa.discovery.inventory import FileInventory
+from pyqa.linting import quality as linting_quality
+from pyqa.linting.quality import (
+    evaluate_quality_checks,
+    run_file_size_linter,
+    run_license_header_linter,
+    run_pyqa_python_hygiene_linter,
+    run_python_hygiene_linter,
+)
 from pyqa.linting.suppressions import SuppressionRegistry
 from pyqa.tools.settings import tool_setting_schema_as_dict
 
@@ -535,3 +545,85 @@ def test_check_quality_ignores_pyqa_lint_directory(tmp_path: Path) -> None:
     assert "'pyqa_lint' directories are skipped" in output
     assert "No files to check." in output
     assert "Missing SPDX" not in output
+
+
+def test_fused_quality_engine_matches_sequential_order(tmp_path: Path) -> None:
+    """Parallel single-pass evaluation reports the same issues in the same order."""
+
+    _write_repo_layout(tmp_path)
+    files: list[Path] = []
+    for index in range(PARALLEL_FILE_THRESHOLD + 8):
+        path = tmp_path / "pkg" / f"module_{index:03d}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = "breakpoint()\n" if index % 3 == 0 else "value = 1\n"
+        path.write_text(body + "x" * (index * 40), encoding="utf-8")
+        files.append(path)
+    config = _load_quality_config(tmp_path)
+    config.quality.warn_file_size = 1000
+    config.quality.max_file_size = 2500
+
+    def _issues(workers: int) -> list[tuple[str, str | None, str | None]]:
+        checker = QualityChecker(
+            root=tmp_path,
+            quality=config.quality,
+            options=QualityCheckerOptions(
+                license_overrides=config.license,
+                files=files,
+                checks={"file-size", "license", "python"},
+                workers=workers,
+            ),
+        )
+        return [(issue.message, str(issue.path), issue.check) for issue in checker.run().issues]
+
+    sequential = _issues(1)
+    assert sequential == _issues(4)
+    checks = [check for _, _, check in sequential]
+    assert checks.index("file-size") < checks.index("license-header")
+    assert any(check and check.startswith("python-hygiene") for check in checks)
+
+
+class _InventoryState(SimpleNamespace):
+    """Stand-in state handing out inventory-scoped copies like ``PreparedLintState``."""
+
+    def with_file_inventory(self, file_inventory: FileInventory) -> _InventoryState:
+        return _InventoryState(**{**vars(self), "file_inventory": file_inventory})
+
+
+def test_quality_linters_share_a_single_pass(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Quality linters in one orchestrated run evaluate their checks together."""
+
+    _write_repo_layout(tmp_path)
+    target = tmp_path / "module.py"
+    target.write_text("import pdb\n" + "x = 1\n" * 200, encoding="utf-8")
+    config = _load_quality_config(tmp_path)
+    config.severity.sensitivity = "maximum"
+    config.quality.enforce_in_lint = True
+    config.quality.warn_file_size = 100
+    state = _InventoryState(**vars(_build_hygiene_state(tmp_path, [target])))
+    state.meta = SimpleNamespace(show_valid_suppressions=False, normal=True)
+    state.file_inventory = FileInventory.from_paths(tmp_path.resolve(), [target.resolve()])
+    state.run_cache = {}
+
+    calls: list[tuple[str, ...]] = []
+    real_evaluate = linting_quality.evaluate_quality_checks
+
+    def _counting_evaluate(request):
+        calls.append(request.checks)
+        return real_evaluate(request)
+
+    monkeypatch.setattr(linting_quality, "evaluate_quality_checks", _counting_evaluate)
+
+    license_report = run_license_header_linter(state, emit_to_logger=False, config=config)
+    hygiene_report = run_python_hygiene_linter(state, emit_to_logger=False, config=config)
+    size_report = run_file_size_linter(state, emit_to_logger=False, config=config)
+
+    assert len(calls) == 1
+    assert set(calls[0]) == {"license", "python", "file-size"}
+    assert all(diag.tool == "license-header" for diag in license_report.outcome.diagnostics)
+    assert license_report.outcome.diagnostics
+    assert any("debug-import" in (diag.code or "") for diag in hygiene_report.outcome.diagnostics)
+    assert [diag.code for diag in size_report.outcome.diagnostics] == ["file-size:file-size"]
+
+    state.run_cache = {}
+    run_file_size_linter(state, emit_to_logger=False, config=config)
+    assert len(calls) == 2  # a new run starts from an empty run cache
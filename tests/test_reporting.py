@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Blackcat Informatics® Inc.
 """Tests for reporting emitters."""
 
+import gzip
 import json
 from collections.abc import Sequence
 from pathlib import Path
@@ -11,6 +12,7 @@ from pyqa.analysis import AnnotationEngine, MessageSpan
 from pyqa.config import OutputConfig
 from pyqa.core.models import Diagnostic, RunResult, ToolOutcome
 from pyqa.core.severity import Severity
+from pyqa.orchestration.orchestrator import OrchestratorHooks
 from pyqa.reporting import (
     AdviceBuilder,
     AdviceEntry,
@@ -20,6 +22,7 @@ from pyqa.reporting import (
     write_pr_summary,
     write_sarif_report,
 )
+from pyqa.reporting.presenters import StreamingConcisePresenter
 from pyqa.reporting.presenters.emitters import PRSummaryOptions
 
 
@@ -98,6 +101,46 @@ def test_write_sarif_report(tmp_path: Path) -> None:
     assert runs[0]["results"][0]["ruleId"] == "F401"
 
 
+def test_json_report_matches_indented_dump(tmp_path: Path) -> None:
+    """Streamed pretty output must stay identical to ``json.dumps(indent=2)``."""
+
+    result = _run_result(tmp_path)
+    result.analysis["nested"] = [{"values": [1, {}], "empty": []}]
+    dest = tmp_path / "report.json"
+    write_json_report(result, dest)
+
+    text = dest.read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), indent=2)
+
+
+def test_write_sarif_report_compact_gzip(tmp_path: Path) -> None:
+    """Compact SARIF written to a ``.gz`` path is compressed and deduplicates rules."""
+
+    result = _run_result(tmp_path)
+    result.outcomes.append(
+        ToolOutcome(
+            tool="ruff",
+            action="format",
+            returncode=1,
+            diagnostics=[result.outcomes[0].diagnostics[0].model_copy(update={"line": 30})],
+        ),
+    )
+    dest = tmp_path / "report.sarif.gz"
+    write_sarif_report(result, dest, compact=True)
+
+    with gzip.open(dest, "rt", encoding="utf-8") as handle:
+        text = handle.read()
+    assert "\n" not in text
+    data = json.loads(text)
+    (run,) = data["runs"]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["F401", "W000"]
+    assert [entry["locations"][0]["physicalLocation"]["region"]["startLine"] for entry in run["results"]] == [
+        10,
+        20,
+        30,
+    ]
+
+
 def test__write_summary(tmp_path: Path) -> None:
     result = _run_result(tmp_path)
     dest = tmp_path / "summary.md"
@@ -592,6 +635,45 @@ def test_render_concise_omits_stats_when_disabled(tmp_path: Path, capsys) -> Non
     assert output_lines[-1] == ("Failed — 2 diagnostic(s) across 1 file(s); 0 failing action(s) out of 1")
 
 
+def test_render_concise_caps_printed_diagnostics(tmp_path: Path, capsys) -> None:
+    result = _run_result(tmp_path)
+    config = OutputConfig(color=False, emoji=False, show_stats=False, max_diagnostics=1)
+    render(result, config)
+    output_lines = _captured_lines(capsys)
+    normalised = [", ".join(part.strip() for part in line.split(",")) for line in output_lines[:1]]
+    assert normalised == ["ruff, src/app.py:10, F401, bad things"]
+    assert output_lines[1] == "… 1 more diagnostic(s) not shown (--max-diagnostics 1)"
+    assert output_lines[-1] == ("Failed — 2 diagnostic(s) across 1 file(s); 0 failing action(s) out of 1")
+
+
+def test_streaming_presenter_prints_outcomes_as_recorded(tmp_path: Path, capsys) -> None:
+    result = _run_result(tmp_path)
+    config = OutputConfig(color=False, emoji=False, show_stats=False, max_diagnostics=1)
+    hooks = OrchestratorHooks()
+    recorded: list[str] = []
+    hooks.after_tool = lambda outcome: recorded.append(outcome.tool)
+    streamer = StreamingConcisePresenter(config, tmp_path)
+    streamer.install(hooks)
+
+    assert hooks.after_tool is not None
+    hooks.after_tool(result.outcomes[0])
+    streamed = _captured_lines(capsys)
+    assert recorded == ["ruff"]
+    assert [", ".join(part.strip() for part in line.split(",")) for line in streamed] == [
+        "ruff, src/app.py:10, F401, bad things",
+    ]
+    assert (streamer.shown, streamer.hidden) == (1, 1)
+
+    hooks.after_tool(result.outcomes[0])
+    assert _captured_lines(capsys) == []
+    assert streamer.hidden == 1
+
+    streamer.finish(result)
+    footer = _captured_lines(capsys)
+    assert footer[0] == "… 1 more diagnostic(s) not shown (--max-diagnostics 1)"
+    assert footer[-1] == ("Failed — 2 diagnostic(s) across 1 file(s); 0 failing action(s) out of 1")
+
+
 def test_render_concise_fallbacks_to_stderr(tmp_path: Path, capsys) -> None:
     outcome = ToolOutcome(
         tool="black",
@@ -9,6 +9,7 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from pyqa.cli.app import app
+from pyqa.compliance.security import SecurityScanner
 
 
 def test_security_scan_detects_secret(tmp_path: Path) -> None:
@@ -99,3 +100,26 @@ def test_security_scan_ignores_pyqa_lint_directory(tmp_path: Path) -> None:
     assert result.exit_code == 0
     assert "'pyqa_lint' directories are skipped" in result.stdout
     assert "No files to scan" in result.stdout
+
+
+def test_security_scanner_parallel_matches_serial(tmp_path: Path) -> None:
+    files: list[Path] = []
+    for index in range(48):
+        target = tmp_path / f"module_{index}.py"
+        lines = ["value = 1"]
+        if index % 3 == 0:
+            lines.append('api_key = "ABCDEFGHIJKLMNOPQRSTUV"')
+        if index % 5 == 0:
+            lines.append("contact = 'someone@example.com'")
+        target.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        files.append(target)
+    (tmp_path / ".security-check-excludes").write_text("# skip\nmodule_0.py\nmodule_4*.py\n", encoding="utf-8")
+
+    serial = SecurityScanner(root=tmp_path, use_bandit=False, use_emoji=False, jobs=1).run(files)
+    parallel = SecurityScanner(root=tmp_path, use_bandit=False, use_emoji=False, jobs=4).run(files)
+
+    assert parallel == serial
+    assert Path("module_0.py") not in serial.secret_files
+    assert Path("module_45.py") not in serial.pii_files
+    assert serial.secret_files[Path("module_3.py")] == ['line 2: api_key = "ABCDEFGHIJKLMNOPQRSTUV"']
+    assert serial.pii_files[Path("module_5.py")] == ["line 2: contact = 'someone@example.com'"]
@@ -16,6 +16,7 @@ from pyqa.core.environment.tool_env import (
     PreparedCommand,
     cache_layout,
     desired_version,
+    prune_runtime_cache,
 )
 from pyqa.core.environment.tool_env.runtimes import go as go_runtime
 from pyqa.core.environment.tool_env.runtimes import lua as lua_runtime
@@ -610,3 +611,40 @@ def test_rust_runtime_install_rustup_component(
 def _legacy_prepare(preparer: CommandPreparer, **kwargs: object) -> PreparedCommand:
     legacy_mapping: LegacyCommandMapping = cast(LegacyCommandMapping, kwargs)
     return preparer.prepare_from_mapping(legacy_mapping)
+
+
+def test_prune_runtime_cache_removes_unreferenced_installs(tmp_path: Path) -> None:
+    layout = cache_layout(tmp_path)
+    layout.ensure_directories()
+    tools = [
+        _make_tool(name="perlcritic", runtime="perl", package="Perl::Critic"),
+        _make_tool(name="gofumpt", runtime="go", package="mvdan.cc/gofumpt@v0.6.0"),
+    ]
+    referenced = CommandPreparer().cache_slugs(tools)
+    perl_slug = next(iter(referenced["perl"]))
+    go_slug = next(iter(referenced["go"]))
+    kept = [
+        layout.perl.cache_dir / perl_slug,
+        layout.perl.meta_dir / f"{perl_slug}.json",
+        layout.go.meta_dir / f"{go_slug}.json",
+    ]
+    stale = [
+        layout.perl.cache_dir / "old-tool",
+        layout.perl.meta_dir / "old-tool.json",
+        layout.node_cache_dir / "eslint-8.0.0",
+    ]
+    for path in (*kept, *stale):
+        if path.suffix == ".json":
+            path.write_text("{}", encoding="utf-8")
+        else:
+            (path / "bin").mkdir(parents=True)
+
+    preview = prune_runtime_cache(layout, referenced, dry_run=True)
+    assert sorted(preview.removed) == sorted(stale)
+    assert all(path.exists() for path in stale)
+
+    result = prune_runtime_cache(layout, referenced)
+    assert sorted(result.removed) == sorted(stale)
+    assert not any(path.exists() for path in stale)
+    assert all(path.exists() for path in kept)
+    assert all(path.exists() for path in layout.directories)
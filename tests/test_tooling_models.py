@@ -39,6 +39,7 @@ def test_tool_definition_parses_augmented_mapping(tmp_path: Path) -> None:
         "after": ["other-tool"],
         "fileExtensions": [".py"],
         "configFiles": ["pyproject.toml"],
+        "cacheInputs": {"files": [".example*"], "env": ["EXAMPLE_HOME"]},
         "defaultEnabled": True,
         "autoInstall": False,
         "automatically_fix": True,
@@ -47,6 +48,8 @@ def test_tool_definition_parses_augmented_mapping(tmp_path: Path) -> None:
             "package": "example",
             "versionCommand": ["example", "--version"],
             "binaries": {"example": "bin/example"},
+            "serverClients": {"example": "example_d"},
+            "entryPoints": {"example": "example.cli:main"},
             "install": {
                 "strategy": "pip",
                 "config": {"packages": ["example"]},
@@ -102,8 +105,12 @@ def test_tool_definition_parses_augmented_mapping(tmp_path: Path) -> None:
     assert tool.name == "example-tool"
     assert tool.aliases == ("example",)
     assert tool.metadata.files.file_extensions == (".py",)
+    assert tool.cache_inputs.files == (".example*",)
+    assert tool.cache_inputs.env == ("EXAMPLE_HOME",)
     assert tool.runtime is not None
     assert tool.runtime.kind == "python"
+    assert dict(tool.runtime.server_clients) == {"example": "example_d"}
+    assert dict(tool.runtime.entry_points) == {"example": "example.cli:main"}
     assert tool.actions[0].append_files is False
     assert tool.actions[0].is_fix is True
     assert tool.options[0].choices == ("info", "warning", "error")
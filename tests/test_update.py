@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from collections.abc import Sequence
 from pathlib import Path
 from subprocess import CompletedProcess
@@ -13,6 +15,8 @@ from typer.testing import CliRunner
 from pyqa.cli.app import app
 from pyqa.runtime.installers.update import (
     DEFAULT_STRATEGIES,
+    UpdateResult,
+    UpdateStateStore,
     WorkspaceDiscovery,
     WorkspaceKind,
     WorkspacePlanner,
@@ -108,3 +112,72 @@ def test_update_cli_dry_run(tmp_path: Path, monkeypatch) -> None:
 
     assert result.exit_code == 0
     assert "DRY RUN" in result.stdout
+
+
+def test_updater_skips_workspaces_with_unchanged_manifests(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "tooling").mkdir()
+    manifest = tmp_path / "tooling" / "go.mod"
+    manifest.write_text("module example.com/tooling\n", encoding="utf-8")
+    monkeypatch.setattr("shutil.which", lambda cmd: "/usr/bin/mock")
+    plan = WorkspacePlanner(DEFAULT_STRATEGIES).plan(WorkspaceDiscovery().discover(tmp_path))
+    cache_dir = tmp_path / ".lint-cache"
+
+    def run_once(*, force: bool = False) -> tuple[RecordingRunner, UpdateResult]:
+        runner = RecordingRunner()
+        state = UpdateStateStore.load(cache_dir, root=tmp_path)
+        updater = WorkspaceUpdater(runner=runner, use_emoji=False, state=state, force=force)
+        return runner, updater.execute(plan, root=tmp_path)
+
+    first_runner, first = run_once()
+    assert first_runner.calls and len(first.successes) == 1
+
+    second_runner, second = run_once()
+    assert second_runner.calls == []
+    assert [ws.directory for ws in second.unchanged] == [tmp_path / "tooling"]
+
+    forced_runner, _ = run_once(force=True)
+    assert forced_runner.calls
+
+    manifest.write_text("module example.com/tooling\n\ngo 1.22\n", encoding="utf-8")
+    changed_runner, changed = run_once()
+    assert changed_runner.calls and not changed.unchanged
+
+
+class ConcurrencyTrackingRunner:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def __call__(self, args: Sequence[str], cwd: Path | None) -> CompletedProcess[str]:
+        tool = args[0]
+        with self._lock:
+            self.active[tool] = self.active.get(tool, 0) + 1
+            self.peak[tool] = max(self.peak.get(tool, 0), self.active[tool])
+        time.sleep(0.05)
+        with self._lock:
+            self.active[tool] -= 1
+        return CompletedProcess(list(args), returncode=0)
+
+
+def test_updater_runs_workspaces_concurrently_within_manager_limits(tmp_path: Path, monkeypatch) -> None:
+    for index in range(4):
+        go_dir = tmp_path / f"go{index}"
+        go_dir.mkdir()
+        (go_dir / "go.mod").write_text(f"module example.com/go{index}\n", encoding="utf-8")
+        node_dir = tmp_path / f"ui{index}"
+        node_dir.mkdir()
+        (node_dir / "pnpm-lock.yaml").write_text("lockfileVersion: '9.0'\n", encoding="utf-8")
+    nested = tmp_path / "ui0" / "nested"
+    nested.mkdir()
+    (nested / "pnpm-lock.yaml").write_text("lockfileVersion: '9.0'\n", encoding="utf-8")
+    monkeypatch.setattr("shutil.which", lambda cmd: "/usr/bin/mock")
+
+    plan = WorkspacePlanner(DEFAULT_STRATEGIES).plan(WorkspaceDiscovery().discover(tmp_path))
+    runner = ConcurrencyTrackingRunner()
+    updater = WorkspaceUpdater(runner=runner, use_emoji=False, jobs=8, manager_limits={"pnpm": 1})
+    result = updater.execute(plan, root=tmp_path)
+
+    assert runner.peak["pnpm"] == 1
+    assert runner.peak["go"] > 1
+    assert result.successes == [item.workspace for item in plan.items]
@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+"""Tests for the persistent version-probe cache used by doctor and tool-info."""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyqa.cache.version_probes import VersionProbeCache, version_probe_key
+from pyqa.cli.core.utils import run_version_probe
+from pyqa.core.runtime.process import TIMEOUT_RETURNCODE
+
+
+def _install_fake_tool(bin_dir: Path, body: str) -> Path:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    script = bin_dir / "fake-tool"
+    script.write_text(f"#!/bin/sh\n{body}\n", encoding="utf-8")
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return script
+
+
+@pytest.mark.skipif(os.name == "nt", reason="requires a POSIX shell")
+def test_version_probe_is_cached_per_executable_identity(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    counter = tmp_path / "calls"
+    script = _install_fake_tool(tmp_path / "bin", f'echo run >> "{counter}"\necho "fake-tool 1.0"')
+    monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+    cache_dir = tmp_path / "cache"
+
+    first = VersionProbeCache(cache_dir)
+    assert run_version_probe(["fake-tool", "--version"], cache=first).stdout.strip() == "fake-tool 1.0"
+    first.save()
+
+    reloaded = VersionProbeCache(cache_dir)
+    assert run_version_probe(["fake-tool", "--version"], cache=reloaded).stdout.strip() == "fake-tool 1.0"
+    assert counter.read_text(encoding="utf-8").count("run") == 1
+
+    script.write_text(f'#!/bin/sh\necho run >> "{counter}"\necho "fake-tool 2.0"\n', encoding="utf-8")
+    stat_result = script.stat()
+    os.utime(script, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+    assert run_version_probe(["fake-tool", "--version"], cache=reloaded).stdout.strip() == "fake-tool 2.0"
+    assert counter.read_text(encoding="utf-8").count("run") == 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="requires a POSIX shell")
+def test_timed_out_probe_is_not_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    script = _install_fake_tool(tmp_path / "bin", "sleep 5")
+    monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+    cache = VersionProbeCache(tmp_path / "cache")
+
+    result = run_version_probe(["fake-tool", "--version"], cache=cache, timeout=0.2)
+
+    assert result.returncode == TIMEOUT_RETURNCODE
+    cache.save()
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="requires a POSIX shell")
+def test_failed_probe_is_retried(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    counter = tmp_path / "calls"
+    script = _install_fake_tool(tmp_path / "bin", f'echo run >> "{counter}"\nexit 3')
+    monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+    cache_dir = tmp_path / "cache"
+
+    first = VersionProbeCache(cache_dir)
+    assert run_version_probe(["fake-tool", "--version"], cache=first).returncode == 3
+    first.save()
+
+    assert run_version_probe(["fake-tool", "--version"], cache=VersionProbeCache(cache_dir)).returncode == 3
+    assert counter.read_text(encoding="utf-8").count("run") == 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="requires a POSIX shell")
+def test_probe_key_resolves_executable_on_probe_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    old = _install_fake_tool(tmp_path / "old", 'echo "fake-tool 1.0"')
+    new = _install_fake_tool(tmp_path / "new", 'echo "fake-tool 2.0"')
+    monkeypatch.setenv("PATH", f"{old.parent}{os.pathsep}{os.environ['PATH']}")
+    cache = VersionProbeCache(tmp_path / "cache")
+    command = ["fake-tool", "--version"]
+
+    process_path = run_version_probe(command, cache=cache)
+    probe_path = run_version_probe(command, cache=cache, env={"PATH": str(new.parent)})
+
+    assert process_path.stdout.strip() == "fake-tool 1.0"
+    assert probe_path.stdout.strip() == "fake-tool 2.0"
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        ["python3", "-c", "import importlib.metadata as im; print(im.version('pyupgrade'))"],
+        ["python", "-m", "mypy", "--version"],
+        ["node", "-e", "console.log(require('eslint/package.json').version)"],
+    ],
+)
+def test_interpreter_probes_are_not_cached(command: list[str]) -> None:
+    assert version_probe_key(command) is None
+
+
+def test_interpreter_version_probe_is_cached() -> None:
+    assert version_probe_key([sys.executable, "--version"]) is not None